@@ -39,14 +39,14 @@ def ensure_roi_img_stats(acq_image: AcqImage, *, _preflight: bool = True) -> boo
     (img_min, img_max, img_mean, img_std are None). Returns True if at least one ROI
     needs updating, False otherwise. Does not load image data.
     
-    When _preflight=False: Loads image data, calculates stats for each ROI via
-    roi.calculate_image_stats(), marks the acq_image as dirty (needs saving).
+    When _preflight=False: Calculates missing stats via
+    RoiSet.calculate_image_stats(), marks the acq_image as dirty (needs saving).
     Does NOT save; caller is responsible for calling acq_image.save_metadata().
     
     Args:
         acq_image: AcqImage instance to process.
         _preflight: If True, only check and return needs_update flag. If False,
-            load image, calculate stats, mark dirty (no save).
+            calculate stats, mark dirty (no save).
         
     Returns:
         True if at least one ROI has undefined stats (needs updating), False otherwise.
@@ -54,7 +54,6 @@ def ensure_roi_img_stats(acq_image: AcqImage, *, _preflight: bool = True) -> boo
         was marked dirty.
         
     Note:
-        - Tries to load channel 1 first, then other available channels if needed
         - Logs warnings for ROIs that fail to calculate stats
         - Returns False if image has no ROIs (nothing to update)
     """
@@ -80,47 +79,8 @@ def ensure_roi_img_stats(acq_image: AcqImage, *, _preflight: bool = True) -> boo
     if not has_undefined:
         return False
 
-    channel_loaded = False
-    channels_to_try = [1]
-    try:
-        available_channels = acq_image.getChannelKeys()
-        if available_channels:
-            channels_to_try = [1] + [ch for ch in available_channels if ch != 1]
-    except Exception:
-        pass
-    
-    for channel in channels_to_try:
-        if acq_image.load_channel(channel):
-            channel_loaded = True
-            break
-    
-    if not channel_loaded:
-        logger.warning(
-            f"Could not load image data for {acq_image.path} - "
-            f"skipping ROI image stats calculation"
-        )
-        return False
-    
-    needs_saving = False
-    for roi_id in roi_ids:
-        roi = acq_image.rois.get(roi_id)
-        if roi is None:
-            continue
-        try:
-            roi.calculate_image_stats(acq_image)
-            needs_saving = True
-        except ValueError as e:
-            logger.warning(
-                f"Could not calculate image stats for ROI {roi_id} in {acq_image.path}: {e}"
-            )
-        except Exception as e:
-            logger.warning(
-                f"Unexpected error calculating image stats for ROI {roi_id} in {acq_image.path}: {e}"
-            )
-    
-    if needs_saving:
-        acq_image.mark_metadata_dirty()
-    return needs_saving
+    # Reads ROI pixels through a memory map; the image is not loaded.
+    return acq_image.rois.calculate_image_stats(only_missing=True) > 0
 
 
 def get_acq_images_needing_roi_stats_update(
@@ -213,21 +173,11 @@ def main() -> List[RadonReport]:
         logger.warning("  3. Files can be loaded as KymImage instances")
         return []
     
-    # Load image data and calculate ROI image statistics
-    # This ensures that img_min, img_max, img_mean, img_std are populated
-    logger.info("Loading image data and calculating ROI image statistics...")
-    images_processed = 0
-    
-    for image in kym_image_list:
-        # Only process images that have ROIs (typically KymImage instances)
-        try:
-            ensure_roi_img_stats(image, _preflight=False)
-            images_processed += 1
-        except Exception as e:
-            logger.warning(f"Error processing image {image.path}: {e}")
-            continue
-    
-    logger.info(f"Processed {images_processed} images")
+    # Calculate missing ROI image statistics (img_min, img_max, img_mean, img_std)
+    # for all images in parallel, without loading image data
+    logger.info("Calculating ROI image statistics...")
+    n_updated = kym_image_list.calculate_roi_image_stats(only_missing=True)
+    logger.info(f"Updated image stats of {n_updated} ROI(s)")
     
     # Generate report using KymImageList.get_radon_report()
     # This aggregates reports from all KymImage files in the list
@@ -1,7 +1,7 @@
 """Analysis algorithms and utilities for kymograph flow analysis."""
 
 from kymflow.core.analysis.kym_flow_radon import FlowCancelled, mp_analyze_flow
-from kymflow.core.analysis.stall_analysis import Stall, detect_stalls
+from kymflow.core.analysis.stall_analysis import Stall, detect_stalls, detect_stalls_batch
 from kymflow.core.analysis.utils import _medianFilter, _removeOutliers_sd, _removeOutliers_analyzeflow
 
 __all__ = [
@@ -12,5 +12,6 @@ __all__ = [
     "_removeOutliers_analyzeflow",
     "Stall",
     "detect_stalls",
+    "detect_stalls_batch",
 ]
 
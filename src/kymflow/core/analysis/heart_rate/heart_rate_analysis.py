@@ -580,6 +580,238 @@ def estimate_heart_rate_segments(
     return ests, dbg
 
 
+def _window_index_bounds(
+    t_sorted: np.ndarray,
+    *,
+    t_start: float,
+    t_end: float,
+    win: float,
+    step: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(lefts, starts, ends)`` for sliding windows ``[left, left + win)``.
+
+    ``t_sorted`` must be non-decreasing (NaN allowed only at the end). Index
+    bounds are half-open and equivalent to the mask ``(t >= left) & (t < right)``.
+    """
+    n_win = 0
+    if (t_start + win) <= (t_end + 1e-9):
+        n_win = int(np.floor((t_end + 1e-9 - win - t_start) / step)) + 1
+    lefts = t_start + step * np.arange(n_win, dtype=float)
+    starts = np.searchsorted(t_sorted, lefts, side="left")
+    ends = np.searchsorted(t_sorted, lefts + win, side="left")
+    return lefts, starts, ends
+
+
+def _window_sums(
+    values: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    *,
+    axis: int = 0,
+) -> np.ndarray:
+    """Sum ``values`` over half-open index windows ``[start, end)`` along ``axis``.
+
+    The window axis is returned first: shape ``(n_windows, *other_axes)``.
+
+    Samples are first reduced into the blocks delimited by all window edges
+    (``np.add.reduceat``), so overlapping windows cost one pass over the data
+    plus a prefix sum over blocks.
+    """
+    values = np.asarray(values)
+    starts = np.asarray(starts, dtype=np.intp)
+    ends = np.asarray(ends, dtype=np.intp)
+    n = int(values.shape[axis])
+    other = tuple(d for i, d in enumerate(values.shape) if i != axis % values.ndim)
+    dtype = np.result_type(values, float)
+    if starts.size == 0 or n == 0:
+        return np.zeros((starts.size,) + other, dtype=dtype)
+    bounds = np.unique(np.concatenate([starts, ends]))
+    bounds = bounds[bounds < n]
+    if bounds.size == 0:
+        return np.zeros((starts.size,) + other, dtype=dtype)
+    blocks = np.moveaxis(np.add.reduceat(values, bounds, axis=axis), axis, 0)
+    prefix = np.concatenate([np.zeros((1,) + other, dtype=blocks.dtype), np.cumsum(blocks, axis=0)])
+    return prefix[np.searchsorted(bounds, ends)] - prefix[np.searchsorted(bounds, starts)]
+
+
+def lombscargle_power_windows(
+    t: np.ndarray,
+    x: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    f_grid: np.ndarray,
+    *,
+    max_block_elems: int = 1 << 22,
+) -> np.ndarray:
+    """Normalized Lomb–Scargle power for many index windows on one frequency grid.
+
+    For each window ``[start, end)`` this matches
+    ``scipy.signal.lombscargle(tw, xw - xw.mean(), 2*pi*f_grid, normalize=True)``
+    on the finite samples ``tw, xw`` of that window. All windows are evaluated
+    from per-frequency prefix sums, so overlapping windows share the
+    trigonometric work instead of recomputing it.
+
+    Args:
+        t: Sample times in seconds.
+        x: Samples aligned to ``t`` (non-finite samples are ignored).
+        starts: Window start indices (inclusive).
+        ends: Window end indices (exclusive).
+        f_grid: Frequency grid in Hz.
+        max_block_elems: Upper bound on ``len(t) * n_freq_chunk`` temporaries.
+
+    Returns:
+        np.ndarray: Power with shape ``(n_windows, n_freq)``; rows for windows
+        without variance are NaN.
+    """
+    t = np.asarray(t, dtype=float)
+    x = np.asarray(x, dtype=float)
+    starts = np.asarray(starts, dtype=np.intp)
+    ends = np.asarray(ends, dtype=np.intp)
+    f_grid = np.asarray(f_grid, dtype=float)
+
+    ok = np.isfinite(t) & np.isfinite(x)
+    okf = ok.astype(float)
+    tz = np.where(ok, t, 0.0)
+    xz = np.where(ok, x, 0.0)
+
+    n = _window_sums(okf, starts, ends)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mu = _window_sums(xz, starts, ends) / n
+        yy = _window_sums(xz * xz, starts, ends) / n - mu * mu
+    bad = ~(np.isfinite(yy) & (yy > 0))
+
+    n_freq = int(f_grid.size)
+    out = np.full((starts.size, n_freq), np.nan, dtype=float)
+    if starts.size == 0 or n_freq == 0:
+        return out
+
+    epsneg = np.finfo(float).epsneg
+    chunk = int(max(1, min(n_freq, max_block_elems // max(1, t.size))))
+    n_col = n[:, None]
+    mu_col = mu[:, None]
+    yy_col = yy[:, None]
+    # On a uniform grid, exp(i w_k t) = exp(i w_0 t) * exp(i dw t)**k avoids N*F complex exps.
+    df = np.diff(f_grid)
+    step_e: np.ndarray | None = None
+    cur_e: np.ndarray | None = None
+    if n_freq > 1 and np.allclose(df, df[0], rtol=1e-9, atol=0.0):
+        step_e = np.exp(1j * (2.0 * np.pi * float(df[0])) * tz)
+        cur_e = np.exp(1j * (2.0 * np.pi * float(f_grid[0])) * tz)
+    for f0 in range(0, n_freq, chunk):
+        w = 2.0 * np.pi * f_grid[f0 : f0 + chunk]
+        # e = exp(i w t): real/imag parts are cos(wt)/sin(wt); e**2 gives the 2wt terms.
+        # Frequency-major (n_freq_chunk, n_samples) keeps every row contiguous.
+        if cur_e is not None and step_e is not None:
+            e = np.empty((w.size, tz.size), dtype=complex)
+            for k in range(w.size):
+                e[k] = cur_e
+                np.multiply(cur_e, step_e, out=cur_e)
+        else:
+            e = np.exp(1j * (w[:, None] * tz[None, :]))
+        e *= okf
+        with np.errstate(invalid="ignore", divide="ignore"):
+            m1 = _window_sums(e, starts, ends, axis=1) / n_col
+            m2 = _window_sums(e * e, starts, ends, axis=1) / n_col
+            # Mean-removed projections: mean((x - mu) * cos(wt)) + i * mean((x - mu) * sin(wt)).
+            e *= xz
+            p = _window_sums(e, starts, ends, axis=1) / n_col - mu_col * m1
+
+            tau = 0.5 * np.arctan2(m2.imag, m2.real)
+            rot = p * np.exp(-1j * tau)
+            yc = rot.real
+            ys = rot.imag
+            cc = 0.5 * (1.0 + (m2 * np.exp(-2j * tau)).real)
+            ss = 1.0 - cc
+            cc = np.maximum(cc, epsneg)
+            ss = np.maximum(ss, epsneg)
+            out[:, f0 : f0 + chunk] = (yc * yc / cc + ys * ys / ss) / yy_col
+    out[bad, :] = np.nan
+    return out
+
+
+def _peaks_in_band(
+    f_axis: np.ndarray,
+    power: np.ndarray,
+    *,
+    band_hz: tuple[float, float],
+    edge_margin_hz: Optional[float],
+    peak_half_width_hz: float,
+) -> dict[str, np.ndarray]:
+    """Row-wise peak/QC metrics for a 2D spectrum (rows share ``f_axis``).
+
+    Vectorized counterpart of picking the in-band ``argmax`` and calling
+    :func:`_compute_qc_metrics_from_spectrum` for every row.
+    """
+    n_rows = int(power.shape[0])
+    nan_rows = np.full(n_rows, np.nan, dtype=float)
+    lo, hi = band_hz
+    m = (f_axis >= lo) & (f_axis <= hi)
+    if n_rows == 0 or not np.any(m):
+        return {
+            "f_peak": nan_rows,
+            "snr": nan_rows.copy(),
+            "edge_flag": nan_rows.copy(),
+            "band_concentration": nan_rows.copy(),
+        }
+
+    f_band = f_axis[m]
+    p_band = power[:, m]
+    row_ok = np.all(np.isfinite(p_band), axis=1)
+    p_safe = np.where(row_ok[:, None], p_band, 0.0)
+
+    i_peak = np.argmax(p_safe, axis=1)
+    rows = np.arange(n_rows)
+    f_peak = f_band[i_peak]
+    p_peak = p_safe[rows, i_peak]
+    med = np.median(p_safe, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        snr = np.where(med > 0, p_peak / np.where(med > 0, med, 1.0), np.inf)
+
+    margin = _effective_edge_margin_hz(band_hz, edge_margin_hz)
+    edge_flag = ((f_peak <= (lo + margin)) | (f_peak >= (hi - margin))).astype(float)
+
+    total = np.sum(p_safe, axis=1)
+    half_width = float(max(0.0, peak_half_width_hz))
+    near = np.abs(f_band[None, :] - f_peak[:, None]) <= half_width
+    local = np.sum(np.where(near, p_safe, 0.0), axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        bc = np.where(np.isfinite(total) & (total > 0), local / total, np.nan)
+
+    f_peak = np.where(row_ok, f_peak, np.nan)
+    return {
+        "f_peak": f_peak,
+        "snr": np.where(row_ok, snr, np.nan),
+        "edge_flag": np.where(row_ok, edge_flag, np.nan),
+        "band_concentration": np.where(row_ok, bc, np.nan),
+    }
+
+
+def _welch_power_rows(
+    rows: np.ndarray,
+    fs: float,
+    *,
+    band_hz: tuple[float, float],
+    order: int,
+    nperseg: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Band-pass and Welch PSD for equal-length rows; returns ``(f, Pxx)`` with ``Pxx`` 2D."""
+    if signal is None:  # pragma: no cover
+        raise ImportError("scipy is required for _welch_power_rows")
+    lo, hi = band_hz
+    nyq = 0.5 * fs
+    b, a = signal.butter(order, [lo / nyq, hi / nyq], btype="bandpass")
+    xf = signal.filtfilt(b, a, rows, axis=-1)
+    f, pxx = signal.welch(
+        xf,
+        fs=fs,
+        nperseg=min(nperseg, rows.shape[-1]),
+        detrend=False,
+        scaling="density",
+        axis=-1,
+    )
+    return f, np.atleast_2d(pxx)
+
+
 def estimate_heart_rate_segment_series(
     time_s: Sequence[float],
     velocity: Sequence[float],
@@ -600,10 +832,18 @@ def estimate_heart_rate_segment_series(
 ) -> dict[str, np.ndarray]:
     """Estimate windowed HR time-series for QC and non-stationarity checks.
 
+    The trace is preprocessed once (abs, MAD winsorization, detrend, and for
+    Welch small-gap interpolation) and window bounds come from ``searchsorted``
+    on the time axis. Lomb-Scargle evaluates every window on a shared frequency
+    grid (:func:`lombscargle_power_windows`); Welch band-passes and computes the
+    PSD of all equal-length, gap-free windows as one 2D array. Windows that
+    still contain long gaps fall back to a per-window Welch on their finite
+    samples.
+
     Args:
         time_s: Time samples in seconds.
         velocity: Velocity samples aligned to ``time_s``.
-        method: Global estimator method for each window.
+        method: ``"lombscargle"`` or ``"welch"``.
         bpm_band: Analysis heart-rate bounds in bpm.
         use_abs: Whether to analyze absolute velocity.
         outlier_k_mad: MAD clip factor.
@@ -625,8 +865,8 @@ def estimate_heart_rate_segment_series(
     v = np.asarray(velocity, dtype=float)
     finite_all = np.isfinite(t) & np.isfinite(v)
 
+    empty = np.array([], dtype=float)
     if t.size == 0 or not np.any(finite_all):
-        empty = np.array([], dtype=float)
         return {
             "t_center": empty,
             "bpm": empty,
@@ -636,6 +876,10 @@ def estimate_heart_rate_segment_series(
             "band_concentration": empty,
         }
 
+    method_l = method.lower()
+    if method_l not in ("lombscargle", "welch"):
+        raise ValueError(f"Unknown method={method!r}")
+
     t_start = float(np.nanmin(t[finite_all]))
     t_end = float(np.nanmax(t[finite_all]))
     win = float(seg_win_sec)
@@ -644,70 +888,109 @@ def estimate_heart_rate_segment_series(
     if win <= 0 or step <= 0:
         raise ValueError("seg_win_sec and seg_step_sec must be > 0.")
 
-    centers: list[float] = []
-    bpm_list: list[float] = []
-    snr_list: list[float] = []
-    valid_frac_list: list[float] = []
-    edge_list: list[float] = []
-    bc_list: list[float] = []
-
-    left = t_start
-    while (left + win) <= (t_end + 1e-9):
-        right = left + win
-        m_win = (t >= left) & (t < right)
-        if not np.any(m_win):
-            left += step
-            continue
-        tv = t[m_win]
-        vv = v[m_win]
-        finite = np.isfinite(tv) & np.isfinite(vv)
-        frac = float(np.sum(finite) / tv.size) if tv.size else 0.0
-
-        center = float((left + right) * 0.5)
-        centers.append(center)
-        valid_frac_list.append(frac)
-
-        if frac < min_frac:
-            bpm_list.append(float("nan"))
-            snr_list.append(float("nan"))
-            edge_list.append(float("nan"))
-            bc_list.append(float("nan"))
-            left += step
-            continue
+    # searchsorted needs a non-decreasing time axis (NaN sorts to the end).
+    if not bool(np.all(t[1:] >= t[:-1])):
+        order = np.argsort(t, kind="stable")
+        t = t[order]
+        v = v[order]
+        finite_all = finite_all[order]
 
-        est, _dbg = estimate_heart_rate_global(
-            tv,
-            vv,
-            bpm_band=bpm_band,
-            use_abs=use_abs,
-            outlier_k_mad=outlier_k_mad,
-            method=method,
-            lomb_n_freq=lomb_n_freq,
-            interp_max_gap_sec=interp_max_gap_sec,
-            bandpass_order=bandpass_order,
-            nperseg_sec=nperseg_sec,
-            edge_margin_hz=edge_margin_hz,
-            peak_half_width_hz=peak_half_width_hz,
-        )
-        if est is None:
-            bpm_list.append(float("nan"))
-            snr_list.append(float("nan"))
-            edge_list.append(float("nan"))
-            bc_list.append(float("nan"))
-        else:
-            bpm_list.append(float(est.bpm))
-            snr_list.append(float(est.snr))
-            edge_list.append(1.0 if bool(est.edge_flag) else 0.0)
-            bc = est.band_concentration
-            bc_list.append(float("nan") if bc is None else float(bc))
+    lefts, starts, ends = _window_index_bounds(t, t_start=t_start, t_end=t_end, win=win, step=step)
+    counts = ends - starts
+    keep = counts > 0
+    lefts, starts, ends, counts = lefts[keep], starts[keep], ends[keep], counts[keep]
+
+    n_win = int(starts.size)
+    centers = lefts + 0.5 * win
+    valid_frac = _window_sums(finite_all.astype(float), starts, ends) / np.maximum(counts, 1)
+
+    bpm = np.full(n_win, np.nan, dtype=float)
+    snr = np.full(n_win, np.nan, dtype=float)
+    edge = np.full(n_win, np.nan, dtype=float)
+    bc = np.full(n_win, np.nan, dtype=float)
+
+    lo_bpm, hi_bpm = bpm_band
+    band_hz = (lo_bpm / 60.0, hi_bpm / 60.0)
+
+    x0 = np.abs(v) if use_abs else v
+    x0 = winsorize_mad(x0, k=outlier_k_mad)
+    x0 = detrend_finite(x0)
+
+    def _assign(idx: np.ndarray, peaks: dict[str, np.ndarray]) -> None:
+        bpm[idx] = 60.0 * peaks["f_peak"]
+        ok = np.isfinite(peaks["f_peak"])
+        snr[idx] = np.where(ok, peaks["snr"], np.nan)
+        edge[idx] = np.where(ok, peaks["edge_flag"], np.nan)
+        bc[idx] = np.where(ok, peaks["band_concentration"], np.nan)
+
+    active = valid_frac >= min_frac
+
+    if method_l == "lombscargle":
+        ok_lomb = (np.isfinite(t) & np.isfinite(x0)).astype(float)
+        n_valid = _window_sums(ok_lomb, starts, ends)
+        idx = np.flatnonzero(active & (n_valid >= 256))
+        if idx.size:
+            lo, hi = band_hz
+            if lo <= 0 or hi <= lo:
+                raise ValueError(f"Invalid band_hz={band_hz}")
+            f_grid = np.linspace(lo, hi, int(lomb_n_freq), dtype=float)
+            power = lombscargle_power_windows(t, x0, starts[idx], ends[idx], f_grid)
+            _assign(
+                idx,
+                _peaks_in_band(
+                    f_grid,
+                    power,
+                    band_hz=band_hz,
+                    edge_margin_hz=edge_margin_hz,
+                    peak_half_width_hz=peak_half_width_hz,
+                ),
+            )
+    else:
+        x_interp = interpolate_small_gaps(t, x0, max_gap_sec=interp_max_gap_sec)
+        ok_welch = np.isfinite(t) & np.isfinite(x_interp)
+        n_valid = _window_sums(ok_welch.astype(float), starts, ends)
+        candidates = active & (n_valid >= 256)
+        try:
+            fs = estimate_fs(t[ok_welch])
+        except ValueError:
+            candidates[:] = False
+            fs = float("nan")
+        nperseg = int(np.clip(round(fs * nperseg_sec), 128, 8192)) if np.isfinite(fs) else 0
+
+        def _run_rows(idx: np.ndarray, rows: np.ndarray) -> None:
+            try:
+                f, pxx = _welch_power_rows(
+                    rows, fs, band_hz=band_hz, order=bandpass_order, nperseg=nperseg
+                )
+            except Exception:
+                return
+            _assign(
+                idx,
+                _peaks_in_band(
+                    f,
+                    pxx,
+                    band_hz=band_hz,
+                    edge_margin_hz=edge_margin_hz,
+                    peak_half_width_hz=peak_half_width_hz,
+                ),
+            )
 
-        left += step
+        # Gap-free windows are batched by length; others drop their NaNs individually.
+        full = candidates & (n_valid == counts)
+        for length in np.unique(counts[full]):
+            idx = np.flatnonzero(full & (counts == length))
+            rows = x_interp[starts[idx, None] + np.arange(int(length))[None, :]]
+            _run_rows(idx, rows)
+        for i in np.flatnonzero(candidates & ~full):
+            seg = x_interp[starts[i] : ends[i]]
+            seg = seg[ok_welch[starts[i] : ends[i]]]
+            _run_rows(np.array([i]), seg[None, :])
 
     return {
         "t_center": np.asarray(centers, dtype=float),
-        "bpm": np.asarray(bpm_list, dtype=float),
-        "snr": np.asarray(snr_list, dtype=float),
-        "valid_frac": np.asarray(valid_frac_list, dtype=float),
-        "edge_flag": np.asarray(edge_list, dtype=float),
-        "band_concentration": np.asarray(bc_list, dtype=float),
+        "bpm": bpm,
+        "snr": snr,
+        "valid_frac": np.asarray(valid_frac, dtype=float),
+        "edge_flag": edge,
+        "band_concentration": bc,
     }
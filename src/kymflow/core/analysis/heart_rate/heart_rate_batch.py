@@ -3,9 +3,12 @@ from __future__ import annotations
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Literal, Optional, Sequence
+import sys
+from typing import Literal, Mapping, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from .heart_rate_pipeline import (
@@ -20,17 +23,21 @@ logger = logging.getLogger(__name__)
 
 @dataclass(frozen=True)
 class HRBatchTask:
-    """One batch-analysis task over either a CSV path or a dataframe.
+    """One batch-analysis task over a CSV path, a dataframe, or per-ROI arrays.
 
     Args:
         csv_path: CSV input path for this task.
         df: In-memory dataframe input for this task.
+        roi_arrays: In-memory mapping ``roi_id -> (time_s, velocity)`` (e.g. from
+            ``RadonAnalysis``). Supported by both backends; the process backend
+            hands the arrays to workers through shared memory.
         source_id: Optional source identifier used in outputs.
         roi_ids: Optional ROI ids to analyze; defaults to all ROI ids in input.
         cfg: Optional task-specific analysis config.
 
     Raises:
-        ValueError: If both or neither of ``csv_path`` and ``df`` are provided.
+        ValueError: If not exactly one of ``csv_path``, ``df`` and ``roi_arrays``
+            is provided.
     """
 
     csv_path: Optional[Path] = None
@@ -38,16 +45,20 @@ class HRBatchTask:
     source_id: Optional[str] = None
     roi_ids: Optional[Sequence[int]] = None
     cfg: Optional[HRAnalysisConfig] = None
+    roi_arrays: Optional[Mapping[int, tuple[np.ndarray, np.ndarray]]] = None
 
     def __post_init__(self) -> None:
         has_csv = self.csv_path is not None
         has_df = self.df is not None
-        if has_csv == has_df:
-            raise ValueError("Exactly one of csv_path or df must be provided.")
+        has_arrays = self.roi_arrays is not None
+        if int(has_csv) + int(has_df) + int(has_arrays) != 1:
+            raise ValueError("Exactly one of csv_path, df or roi_arrays must be provided.")
         if has_csv and not isinstance(self.csv_path, Path):
             object.__setattr__(self, "csv_path", Path(self.csv_path))
         if self.df is not None and self.source_id is None:
             object.__setattr__(self, "source_id", "<df>")
+        if self.roi_arrays is not None and self.source_id is None:
+            object.__setattr__(self, "source_id", "<arrays>")
         if self.csv_path is not None and self.source_id is None:
             object.__setattr__(self, "source_id", str(self.csv_path))
 
@@ -108,6 +119,32 @@ def compute_hr_for_df(
     return HeartRateFileResult(source_id=source_id, per_roi=dict(analysis.results_by_roi))
 
 
+def compute_hr_for_arrays(
+    roi_arrays: Mapping[int, tuple[np.ndarray, np.ndarray]],
+    *,
+    roi_ids: Optional[Sequence[int]],
+    cfg: HRAnalysisConfig,
+    source_id: str,
+) -> HeartRateFileResult:
+    """Run HR analysis for one source given as per-ROI arrays.
+
+    Args:
+        roi_arrays: Mapping ``roi_id -> (time_s, velocity)``.
+        roi_ids: Optional ROI ids to analyze; defaults to all.
+        cfg: Analysis config for this task.
+        source_id: Source identifier for this output record.
+
+    Returns:
+        HeartRateFileResult: Structured file-level result.
+    """
+    analysis = HeartRateAnalysis.from_roi_arrays(roi_arrays, source=source_id)
+    selected = analysis.roi_ids if roi_ids is None else [int(x) for x in roi_ids]
+    cfg_obj = HRAnalysisConfig.from_any(cfg)
+    for rid in selected:
+        analysis.run_roi(rid, cfg=cfg_obj)
+    return HeartRateFileResult(source_id=source_id, per_roi=dict(analysis.results_by_roi))
+
+
 def compute_hr_for_csv(
     csv_path: Path,
     *,
@@ -136,10 +173,88 @@ def _process_csv_task(payload: tuple[str, Optional[list[int]], dict]) -> HeartRa
     return compute_hr_for_csv(Path(csv_path_str), roi_ids=roi_ids, cfg=cfg)
 
 
+# (roi_id, t_offset, v_offset, n_samples) into a float64 shared-memory block.
+_SharedRoiLayout = tuple[int, int, int, int]
+
+
+def _pack_roi_arrays_shared(
+    tasks: Sequence[HRBatchTask],
+) -> tuple[Optional[SharedMemory], dict[int, list[_SharedRoiLayout]]]:
+    """Copy all array-task time/velocity blocks into one shared-memory segment.
+
+    Returns:
+        ``(shm, layouts)`` where ``layouts[task_index]`` lists per-ROI element
+        offsets into ``shm``. ``shm`` is ``None`` when no task carries arrays.
+    """
+    layouts: dict[int, list[_SharedRoiLayout]] = {}
+    total = 0
+    for i, task in enumerate(tasks):
+        if task.roi_arrays is None:
+            continue
+        entries: list[_SharedRoiLayout] = []
+        for rid, (t, v) in task.roi_arrays.items():
+            n = int(np.asarray(t).size)
+            if int(np.asarray(v).size) != n:
+                raise ValueError(f"{task.source_id} roi_id={rid}: time/velocity lengths differ.")
+            entries.append((int(rid), total, total + n, n))
+            total += 2 * n
+        layouts[i] = entries
+    if not layouts:
+        return None, layouts
+
+    shm = SharedMemory(create=True, size=max(1, total) * np.dtype(np.float64).itemsize)
+    buf = np.ndarray((total,), dtype=np.float64, buffer=shm.buf)
+    for i, entries in layouts.items():
+        roi_arrays = tasks[i].roi_arrays
+        assert roi_arrays is not None
+        for (rid, t_off, v_off, n), (t, v) in zip(entries, roi_arrays.values()):
+            buf[t_off : t_off + n] = np.asarray(t, dtype=np.float64).ravel()
+            buf[v_off : v_off + n] = np.asarray(v, dtype=np.float64).ravel()
+    del buf
+    return shm, layouts
+
+
+def _attach_shared(name: str) -> SharedMemory:
+    """Attach to a parent-owned segment; the parent closes and unlinks it.
+
+    Workers share the parent's resource tracker, so attaching must not
+    unregister the segment (that would race the parent's ``unlink``).
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+def _process_shared_array_task(
+    payload: tuple[str, str, list[_SharedRoiLayout], Optional[list[int]], dict],
+) -> HeartRateFileResult:
+    """Top-level process worker for array tasks: views into shared memory, no DataFrame pickling."""
+    shm_name, source_id, layout, roi_ids, cfg_payload = payload
+    cfg = HRAnalysisConfig.from_dict(cfg_payload)
+    shm = _attach_shared(shm_name)
+    try:
+        buf = np.ndarray((shm.size // np.dtype(np.float64).itemsize,), dtype=np.float64, buffer=shm.buf)
+        roi_arrays = {
+            rid: (buf[t_off : t_off + n], buf[v_off : v_off + n]) for rid, t_off, v_off, n in layout
+        }
+        result = compute_hr_for_arrays(roi_arrays, roi_ids=roi_ids, cfg=cfg, source_id=source_id)
+        # Drop every view into the segment before closing it.
+        del roi_arrays, buf
+        return result
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            logger.warning("HR batch worker could not release shared memory view for %s", source_id)
+
+
 def _thread_task(task: HRBatchTask, cfg_obj: HRAnalysisConfig) -> HeartRateFileResult:
     """Run one task on thread backend."""
     if task.csv_path is not None:
         return compute_hr_for_csv(task.csv_path, roi_ids=task.roi_ids, cfg=cfg_obj)
+    if task.roi_arrays is not None:
+        source_id = task.source_id or "<arrays>"
+        return compute_hr_for_arrays(task.roi_arrays, roi_ids=task.roi_ids, cfg=cfg_obj, source_id=source_id)
     if task.df is None:
         raise ValueError("Invalid task: neither csv_path nor df provided.")
     source_id = task.source_id or "<df>"
@@ -164,6 +279,10 @@ def run_hr_batch(
     Returns:
         list[HeartRateFileResult]: One result per task, preserving task order.
 
+    The process backend accepts ``csv_path`` tasks (each worker reads its CSV)
+    and ``roi_arrays`` tasks (time/velocity blocks are copied once into a shared
+    memory segment and workers analyze views into it).
+
     Raises:
         ValueError: If backend is invalid or process backend receives dataframe tasks.
     """
@@ -176,15 +295,34 @@ def run_hr_batch(
 
     if backend == "process":
         for task in tasks:
-            if task.df is not None or task.csv_path is None:
-                raise ValueError("backend='process' requires tasks with csv_path only (df tasks are not allowed).")
-        payloads: list[tuple[str, Optional[list[int]], dict]] = []
-        for task in tasks:
-            cfg_obj = HRAnalysisConfig.from_any(task.cfg if task.cfg is not None else cfg_default)
-            rid_list = None if task.roi_ids is None else [int(x) for x in task.roi_ids]
-            payloads.append((str(task.csv_path), rid_list, cfg_obj.to_dict()))
-        with ProcessPoolExecutor(max_workers=max_workers) as pool:
-            return list(pool.map(_process_csv_task, payloads))
+            if task.df is not None:
+                raise ValueError(
+                    "backend='process' requires tasks with csv_path only or roi_arrays (df tasks are not allowed)."
+                )
+        shm, layouts = _pack_roi_arrays_shared(tasks)
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = []
+                for i, task in enumerate(tasks):
+                    cfg_obj = HRAnalysisConfig.from_any(task.cfg if task.cfg is not None else cfg_default)
+                    rid_list = None if task.roi_ids is None else [int(x) for x in task.roi_ids]
+                    if task.csv_path is not None:
+                        futures.append(
+                            pool.submit(_process_csv_task, (str(task.csv_path), rid_list, cfg_obj.to_dict()))
+                        )
+                    else:
+                        assert shm is not None
+                        futures.append(
+                            pool.submit(
+                                _process_shared_array_task,
+                                (shm.name, task.source_id or "<arrays>", layouts[i], rid_list, cfg_obj.to_dict()),
+                            )
+                        )
+                return [f.result() for f in futures]
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
 
     cfgs = [HRAnalysisConfig.from_any(t.cfg if t.cfg is not None else cfg_default) for t in tasks]
     with ThreadPoolExecutor(max_workers=max_workers) as pool:
@@ -257,14 +395,20 @@ def _run_and_save_one_csv(
     roi_ids: Optional[Sequence[int]],
     cfg: Optional[HRAnalysisConfig],
     overwrite: bool,
+    use_cache: bool = True,
 ) -> HRBatchSaveResult:
     """Run analysis and persist one CSV file to ``*_heart_rate.json``.
 
+    With ``use_cache`` the existing JSON (if readable) seeds the per-ROI
+    results, so ROIs whose input hash is unchanged are not recomputed and the
+    JSON is not rewritten when nothing changed.
+
     Args:
         csv_path: Source CSV path.
         roi_ids: Optional ROI ids to analyze; defaults to all in the file.
         cfg: Optional shared config. Defaults to ``HRAnalysisConfig()``.
         overwrite: Whether to recompute/overwrite existing JSON output.
+        use_cache: Reuse saved per-ROI results whose input hash matches.
 
     Returns:
         HRBatchSaveResult: Success/failure record for this CSV.
@@ -290,9 +434,24 @@ def _run_and_save_one_csv(
                     error=f"Requested roi_ids not found in file: {missing}; available={analysis.roi_ids}",
                 )
 
+        if use_cache and out_path.exists():
+            try:
+                analysis.load_results_json(out_path)
+            except Exception as e:
+                logger.debug("HR batch ignoring unreadable results cache %s: %s", out_path, e)
+                analysis.results_by_roi = {}
+        previous = dict(analysis.results_by_roi)
+
         cfg_obj = HRAnalysisConfig() if cfg is None else HRAnalysisConfig.from_any(cfg)
         for rid in selected_roi_ids:
-            analysis.run_roi(rid, cfg=cfg_obj)
+            analysis.run_roi(rid, cfg=cfg_obj, use_cache=use_cache)
+        analysis.results_by_roi = {rid: analysis.results_by_roi[rid] for rid in selected_roi_ids}
+
+        unchanged = analysis.results_by_roi.keys() == previous.keys() and all(
+            analysis.results_by_roi[rid] is previous[rid] for rid in selected_roi_ids
+        )
+        if unchanged:
+            return HRBatchSaveResult(csv_path=csv_path, ok=True, saved_json_path=out_path, error="")
         saved = analysis.save_results_json(out_path)
         return HRBatchSaveResult(csv_path=csv_path, ok=True, saved_json_path=saved, error="")
     except Exception as e:
@@ -300,11 +459,15 @@ def _run_and_save_one_csv(
         return HRBatchSaveResult(csv_path=csv_path, ok=False, saved_json_path=None, error=str(e))
 
 
-def _run_and_save_worker(payload: tuple[str, Optional[list[int]], Optional[dict], bool]) -> HRBatchSaveResult:
+def _run_and_save_worker(
+    payload: tuple[str, Optional[list[int]], Optional[dict], bool, bool],
+) -> HRBatchSaveResult:
     """Top-level process worker for ``batch_run_and_save``."""
-    csv_path_str, roi_ids, cfg_payload, overwrite = payload
+    csv_path_str, roi_ids, cfg_payload, overwrite, use_cache = payload
     cfg = None if cfg_payload is None else HRAnalysisConfig.from_dict(cfg_payload)
-    return _run_and_save_one_csv(Path(csv_path_str), roi_ids=roi_ids, cfg=cfg, overwrite=overwrite)
+    return _run_and_save_one_csv(
+        Path(csv_path_str), roi_ids=roi_ids, cfg=cfg, overwrite=overwrite, use_cache=use_cache
+    )
 
 
 def batch_run_and_save(
@@ -315,6 +478,7 @@ def batch_run_and_save(
     overwrite: bool = True,
     backend: Literal["process", "thread", "serial"] = "process",
     n_workers: int = 0,
+    use_cache: bool = True,
 ) -> list[HRBatchSaveResult]:
     """Run HR analysis for each CSV and save JSON next to each source file.
 
@@ -327,6 +491,9 @@ def batch_run_and_save(
         backend: ``"serial"``, ``"thread"``, or ``"process"``.
         n_workers: Worker count for thread/process backends. Non-positive values
             use executor defaults.
+        use_cache: When True, ROIs whose time/velocity data and config match
+            the hash saved in the existing JSON are reused instead of
+            recomputed (see ``compute_hr_input_hash``).
 
     Returns:
         list[HRBatchSaveResult]: Per-input CSV save result in input order.
@@ -346,19 +513,26 @@ def batch_run_and_save(
 
     if backend == "serial":
         return [
-            _run_and_save_one_csv(path, roi_ids=rid_list, cfg=cfg_obj, overwrite=overwrite)
+            _run_and_save_one_csv(path, roi_ids=rid_list, cfg=cfg_obj, overwrite=overwrite, use_cache=use_cache)
             for path in csv_list
         ]
 
     if backend == "thread":
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
             futures = [
-                pool.submit(_run_and_save_one_csv, path, roi_ids=rid_list, cfg=cfg_obj, overwrite=overwrite)
+                pool.submit(
+                    _run_and_save_one_csv,
+                    path,
+                    roi_ids=rid_list,
+                    cfg=cfg_obj,
+                    overwrite=overwrite,
+                    use_cache=use_cache,
+                )
                 for path in csv_list
             ]
             return [f.result() for f in futures]
 
     cfg_payload = None if cfg_obj is None else cfg_obj.to_dict()
-    payloads = [(str(path), rid_list, cfg_payload, bool(overwrite)) for path in csv_list]
+    payloads = [(str(path), rid_list, cfg_payload, bool(overwrite), bool(use_cache)) for path in csv_list]
     with ProcessPoolExecutor(max_workers=max_workers) as pool:
         return list(pool.map(_run_and_save_worker, payloads))
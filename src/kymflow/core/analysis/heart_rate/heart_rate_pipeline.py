@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import MISSING, dataclass, field, fields, is_dataclass, replace
 from datetime import datetime, timezone
 from enum import Enum
+import hashlib
 import json
 from pathlib import Path
 from types import UnionType
@@ -21,6 +22,7 @@ from .heart_rate_analysis import (
 AGREE_TOL_BPM_DEFAULT = 30.0
 RESULTS_JSON_SCHEMA_VERSION = 1
 T = TypeVar("T")
+HR_METHODS: tuple[str, ...] = ("lombscargle", "welch")
 
 
 def dataclass_to_jsonable(obj: Any) -> Any:
@@ -264,6 +266,37 @@ class HRAnalysisConfig:
         return dataclass_from_dict(cls, payload)
 
 
+def compute_hr_input_hash(
+    time_s: np.ndarray,
+    velocity: np.ndarray,
+    cfg: HRAnalysisConfig,
+    methods: Sequence[str] = HR_METHODS,
+) -> str:
+    """Return a content hash identifying one ROI analysis request.
+
+    The hash covers the exact float64 time/velocity samples, the full
+    ``cfg.to_dict()`` payload and the requested methods, so equal hashes mean
+    a previous result can be reused verbatim.
+
+    Args:
+        time_s: ROI time samples (sorted, as passed to the estimators).
+        velocity: ROI velocity samples.
+        cfg: Analysis config for the run.
+        methods: Methods requested for the run.
+
+    Returns:
+        str: Hex digest.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for arr in (time_s, velocity):
+        a = np.ascontiguousarray(arr, dtype=np.float64)
+        h.update(str(a.size).encode("ascii"))
+        h.update(a.tobytes())
+    h.update(json.dumps(cfg.to_dict(), sort_keys=True).encode("utf-8"))
+    h.update(",".join(sorted(m.lower() for m in methods)).encode("utf-8"))
+    return h.hexdigest()
+
+
 @dataclass(frozen=True)
 class HeartRateResults:
     """Result payload for one method on one ROI.
@@ -397,6 +430,8 @@ class HeartRatePerRoiResults:
         time_range: Optional `(t_min, t_max)` for this ROI.
         analysis_cfg: Exact analysis config used for this ROI run.
         segments: Optional windowed segment HR QC payload.
+        input_hash: ``compute_hr_input_hash`` of the inputs that produced this
+            result; ``run_roi`` reuses the result when it matches.
     """
 
     roi_id: int
@@ -409,6 +444,7 @@ class HeartRatePerRoiResults:
     time_range: Optional[tuple[float, float]]
     analysis_cfg: HRAnalysisConfig
     segments: Optional[dict[str, list[float]]] = None
+    input_hash: Optional[str] = None
 
     def to_dict(self, *, compact: bool = False) -> dict[str, Any]:
         """Return JSON-serializable per-ROI summary.
@@ -430,6 +466,7 @@ class HeartRatePerRoiResults:
             "valid_fraction": float(self.valid_fraction),
             "time_range": None,
             "analysis_cfg": self.analysis_cfg.to_dict(),
+            "input_hash": self.input_hash,
         }
         if self.time_range is not None:
             out["time_range"] = [float(self.time_range[0]), float(self.time_range[1])]
@@ -472,6 +509,9 @@ class HeartRateAnalysis:
     (`run_roi`) or iterates ROI-by-ROI (`run_all_rois`). Analysis is never run
     across mixed `roi_id` values.
 
+    Objects built with `from_roi_arrays` keep per-ROI time/velocity arrays as-is
+    (no dataframe copy or per-ROI filtering); `df` is then assembled on first access.
+
     Attributes:
         df: Full dataframe including all ROI rows.
         roi_ids: Sorted integer ROI ids found in the dataframe.
@@ -511,10 +551,17 @@ class HeartRateAnalysis:
         local_df = df.copy()
         local_df[roi_col] = _coerce_roi_to_int(local_df[roi_col], roi_col=roi_col)
 
-        self.df = local_df
+        self._df: Optional[pd.DataFrame] = local_df
+        self._roi_arrays: Optional[dict[int, tuple[np.ndarray, np.ndarray]]] = None
         self.time_col = time_col
         self.vel_col = vel_col
         self.roi_col = roi_col
+        self._set_source(source_path=source_path, source=source)
+        self.roi_ids: list[int] = sorted(int(x) for x in np.unique(local_df[roi_col].to_numpy(dtype=int)))
+        self.results_by_roi: dict[int, HeartRatePerRoiResults] = {}
+
+    def _set_source(self, *, source_path: Optional[Path], source: Optional[str]) -> None:
+        """Set ``source_path``/``source`` with ``source_path`` taking precedence."""
         if source_path is not None:
             self.source_path: Optional[Path] = Path(source_path)
             self.source = str(self.source_path)
@@ -524,8 +571,89 @@ class HeartRateAnalysis:
         else:
             self.source_path = None
             self.source = None
-        self.roi_ids: list[int] = sorted(int(x) for x in np.unique(local_df[roi_col].to_numpy(dtype=int)))
-        self.results_by_roi: dict[int, HeartRatePerRoiResults] = {}
+
+    @classmethod
+    def from_roi_arrays(
+        cls,
+        arrays_by_roi: Mapping[int, tuple[Any, Any]],
+        *,
+        time_col: str = "time",
+        vel_col: str = "velocity",
+        roi_col: str = "roi_id",
+        source_path: Optional[Path] = None,
+        source: Optional[str] = None,
+    ) -> "HeartRateAnalysis":
+        """Create analysis object from per-ROI ``(time_s, velocity)`` arrays.
+
+        Arrays are used without copying when they are already float64 and
+        sorted by time (e.g. ``RadonAnalysis`` outputs or shared-memory views);
+        otherwise they are converted/sorted once per ROI.
+
+        Args:
+            arrays_by_roi: Mapping ``roi_id -> (time_s, velocity)``.
+            time_col: Time column name used if ``df`` is materialized.
+            vel_col: Velocity column name used if ``df`` is materialized.
+            roi_col: ROI column name used if ``df`` is materialized.
+            source_path: Optional CSV source path used for persistence naming.
+            source: Optional source identifier.
+
+        Returns:
+            HeartRateAnalysis: Initialized pipeline over the given ROI arrays.
+
+        Raises:
+            ValueError: If no ROI is given or time/velocity shapes differ.
+        """
+        if not arrays_by_roi:
+            raise ValueError("arrays_by_roi must contain at least one ROI.")
+        roi_arrays: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        for rid, (time_s, velocity) in arrays_by_roi.items():
+            t = np.asarray(time_s, dtype=float)
+            v = np.asarray(velocity, dtype=float)
+            if t.ndim != 1 or t.shape != v.shape:
+                raise ValueError(f"roi_id={rid}: time_s and velocity must be 1-D with matching shapes.")
+            if t.size > 1 and not bool(np.all(t[1:] >= t[:-1])):
+                order = np.argsort(t, kind="mergesort")
+                t = t[order]
+                v = v[order]
+            roi_arrays[int(rid)] = (t, v)
+
+        obj = cls.__new__(cls)
+        obj._df = None
+        obj._roi_arrays = roi_arrays
+        obj.time_col = time_col
+        obj.vel_col = vel_col
+        obj.roi_col = roi_col
+        obj._set_source(source_path=source_path, source=source)
+        obj.roi_ids = sorted(roi_arrays)
+        obj.results_by_roi = {}
+        return obj
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Full dataframe including all ROI rows (built on demand for array-backed objects)."""
+        if self._df is None:
+            assert self._roi_arrays is not None
+            self._df = pd.concat(
+                [self._roi_frame(rid) for rid in self.roi_ids],
+                ignore_index=True,
+            )
+        return self._df
+
+    @df.setter
+    def df(self, value: pd.DataFrame) -> None:
+        self._df = value
+
+    def _roi_frame(self, roi_id: int) -> pd.DataFrame:
+        """Build a dataframe for one array-backed ROI."""
+        assert self._roi_arrays is not None
+        t, v = self._roi_arrays[roi_id]
+        return pd.DataFrame(
+            {
+                self.time_col: t,
+                self.vel_col: v,
+                self.roi_col: np.full(t.shape, int(roi_id), dtype=int),
+            }
+        )
 
     @classmethod
     def from_csv(
@@ -650,14 +778,21 @@ class HeartRateAnalysis:
         *,
         cfg: Any = None,
         methods: Optional[Sequence[str]] = None,
+        use_cache: bool = True,
     ) -> HeartRatePerRoiResults:
         """Run global HR analysis for exactly one ROI and cache results.
 
+        When ``use_cache`` is True and the existing result for this ROI (from a
+        previous run or ``load_results_json``) has the same
+        ``compute_hr_input_hash`` as the current arrays/config/methods, that
+        result is returned without recomputation.
+
         Args:
             roi_id: ROI id to analyze. Must exist in `self.roi_ids`.
             cfg: Config for this ROI (`HRAnalysisConfig`, dict, or config-like object).
             methods: Optional iterable of methods to run. If omitted, both
                 `"lombscargle"` and `"welch"` are executed.
+            use_cache: Reuse a matching cached result instead of recomputing.
 
         Returns:
             HeartRatePerRoiResults: Latest per-ROI result payload.
@@ -670,11 +805,21 @@ class HeartRateAnalysis:
             raise ValueError(f"roi_id={roi_id} not found. Available roi_ids={self.roi_ids}")
 
         cfg_obj = HRAnalysisConfig.from_any(cfg)
+        method_list = HR_METHODS if methods is None else tuple(methods)
+        method_set = {m.lower() for m in method_list}
+        for m in method_set:
+            if m not in set(HR_METHODS):
+                raise ValueError(f"Unsupported method={m!r}")
+
         t, v = self.get_time_velocity(roi_id)
-        df_roi = self.get_roi_df(roi_id)
+        input_hash = compute_hr_input_hash(t, v, cfg_obj, sorted(method_set))
+        cached = self.results_by_roi.get(roi_id)
+        if use_cache and cached is not None and cached.input_hash == input_hash:
+            return cached
+
         finite = np.isfinite(t) & np.isfinite(v)
 
-        n_total = int(len(df_roi))
+        n_total = int(t.size)
         n_valid = int(np.sum(finite))
         valid_fraction = float(n_valid / n_total) if n_total else 0.0
 
@@ -682,12 +827,6 @@ class HeartRateAnalysis:
         if n_valid > 0:
             time_range = (float(np.nanmin(t[finite])), float(np.nanmax(t[finite])))
 
-        method_list = ("lombscargle", "welch") if methods is None else tuple(methods)
-        method_set = {m.lower() for m in method_list}
-        for m in method_set:
-            if m not in {"lombscargle", "welch"}:
-                raise ValueError(f"Unsupported method={m!r}")
-
         lomb: Optional[HeartRateResults] = None
         welch: Optional[HeartRateResults] = None
 
@@ -770,6 +909,7 @@ class HeartRateAnalysis:
             time_range=time_range,
             analysis_cfg=cfg_obj,
             segments=segments_payload,
+            input_hash=input_hash,
         )
         self.results_by_roi[roi_id] = per_roi
         return per_roi
@@ -790,7 +930,10 @@ class HeartRateAnalysis:
         rid = int(roi_id)
         if rid not in self.roi_ids:
             raise KeyError(f"roi_id={rid} not found. Available roi_ids={self.roi_ids}")
-        out = self.df[self.df[self.roi_col] == rid]
+        if self._roi_arrays is not None and self._df is None:
+            out = self._roi_frame(rid)
+        else:
+            out = self.df[self.df[self.roi_col] == rid]
         if out.empty:
             raise ValueError(f"No rows found for roi_id={rid}.")
         return out
@@ -808,6 +951,14 @@ class HeartRateAnalysis:
             KeyError: If ``roi_id`` is not available.
             ValueError: If filtered ROI contains no rows.
         """
+        if self._roi_arrays is not None:
+            rid = int(roi_id)
+            if rid not in self._roi_arrays:
+                raise KeyError(f"roi_id={rid} not found. Available roi_ids={self.roi_ids}")
+            t, v = self._roi_arrays[rid]
+            if t.size == 0:
+                raise ValueError(f"No samples for roi_id={roi_id}.")
+            return t, v
         df_roi = self.get_roi_df(roi_id)
         df_sorted = df_roi.sort_values(by=self.time_col, kind="mergesort")
         t = df_sorted[self.time_col].to_numpy(dtype=float)
@@ -869,7 +1020,8 @@ class HeartRateAnalysis:
         *,
         cfg_by_roi: Optional[dict[int, Any]] = None,
         cfg: Any = None,
-        methods: Sequence[str] = ("lombscargle", "welch"),
+        methods: Sequence[str] = HR_METHODS,
+        use_cache: bool = True,
     ) -> dict[int, HeartRatePerRoiResults]:
         """Run analysis ROI-by-ROI across all available ROI ids.
 
@@ -882,6 +1034,7 @@ class HeartRateAnalysis:
             cfg_by_roi: Optional per-ROI config mapping.
             cfg: Optional fallback config for all ROIs.
             methods: Methods to pass through to `run_roi`.
+            use_cache: Passed through to `run_roi`; unchanged ROIs are not recomputed.
 
         Returns:
             dict[int, HeartRatePerRoiResults]: Mapping of roi_id to latest results.
@@ -890,7 +1043,7 @@ class HeartRateAnalysis:
         out: dict[int, HeartRatePerRoiResults] = {}
         for roi_id in self.roi_ids:
             selected_cfg = local_cfg_by_roi.get(roi_id, cfg)
-            out[roi_id] = self.run_roi(roi_id, cfg=selected_cfg, methods=methods)
+            out[roi_id] = self.run_roi(roi_id, cfg=selected_cfg, methods=methods, use_cache=use_cache)
         return out
 
     def getSummaryDict(self, *, compact: bool = True) -> dict[str, Any]:
@@ -993,15 +1146,8 @@ def run_hr_analysis(
         if t.shape != v.shape:
             raise ValueError("time_s and velocity must have matching shapes.")
 
-        df = pd.DataFrame(
-            {
-                time_col: t,
-                vel_col: v,
-                roi_col: np.full(t.shape, int(roi_id), dtype=int),
-            }
-        )
-        analysis = HeartRateAnalysis(
-            df,
+        analysis = HeartRateAnalysis.from_roi_arrays(
+            {int(roi_id): (t, v)},
             time_col=time_col,
             vel_col=vel_col,
             roi_col=roi_col,
@@ -9,53 +9,18 @@ search to efficiently determine flow angles.
 from __future__ import annotations
 
 import math
-import multiprocessing as mp
 import os
-import sys
 import time
 import queue
 from typing import Callable, Optional, Tuple
 
 import numpy as np
 from multiprocessing import Pool
-from skimage.transform import radon
 
 from kymflow.core.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Temporary diagnostics to trace GUI imports during spawn
-def _check_gui_imports(context: str) -> None:
-    """Check if GUI modules are imported at this point.
-    
-    This is temporary diagnostic logging to identify import chains that pull
-    in GUI code during multiprocessing worker spawn.
-    
-    Args:
-        context: Description of where this check is happening (e.g., "module import").
-    """
-    process_name = mp.current_process().name
-    pid = os.getpid()
-    module_name = __name__
-    
-    has_gui_v2 = 'kymflow.gui_v2' in sys.modules
-    has_nicegui = 'nicegui' in sys.modules
-    gui_modules = [m for m in sys.modules.keys() if 'gui' in m.lower() or 'nicegui' in m.lower()]
-    
-    if has_gui_v2 or has_nicegui or gui_modules:
-        logger.warning(
-            f"GUI MODULES DETECTED [{context}]: "
-            f"pid={pid}, process={process_name}, module={module_name}, "
-            f"gui_v2={has_gui_v2}, nicegui={has_nicegui}, modules={gui_modules}"
-        )
-    else:
-        logger.debug(
-            f"No GUI modules detected [{context}]: "
-            f"pid={pid}, process={process_name}, module={module_name}"
-        )
-
-# Check on module import
-# _check_gui_imports("kym_flow_radon module import")
 
 class FlowCancelled(Exception):
     """Exception raised when flow analysis is cancelled.
@@ -91,6 +56,10 @@ def radon_worker(
             - Best angle in degrees (float) for this window.
             - 1D array of variance values for each fine angle.
     """
+    # Imported here so importing this module (and spawning workers) does not
+    # pull in scikit-image until a window is analyzed.
+    from skimage.transform import radon
+
     # Ensure float for radon + mean subtraction
     data_window = data_window.astype(np.float32, copy=False)
 
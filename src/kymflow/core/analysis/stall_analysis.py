@@ -16,9 +16,10 @@ results.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 
 import numpy as np
 
@@ -83,6 +84,128 @@ class Stall:  # pragma: no cover
         return cls(bin_start=bin_start, bin_stop=bin_stop)
 
 
+def _validate_stall_params(
+    refactory_bins: int,
+    min_stall_duration: int,
+    end_stall_non_nan_bins: int,
+) -> None:
+    """Raise ``ValueError`` for invalid :func:`detect_stalls` parameters."""
+    if refactory_bins < 0:
+        raise ValueError(f"refactory_bins must be >= 0, got {refactory_bins}")
+    if min_stall_duration < 1:
+        raise ValueError(f"min_stall_duration must be >= 1, got {min_stall_duration}")
+    if end_stall_non_nan_bins < 1:
+        raise ValueError(
+            f"end_stall_non_nan_bins must be >= 1, got {end_stall_non_nan_bins}"
+        )
+
+
+def _detect_stall_spans(
+    isnan: np.ndarray,
+    trace_starts: np.ndarray,
+    refactory_bins: int,
+    min_stall_duration: int,
+    end_stall_non_nan_bins: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Run-length stall detection over one or more concatenated traces.
+
+    A non-NaN run of at least ``end_stall_non_nan_bins`` bins that follows a NaN
+    terminates a stall. The NaNs between two such terminators (or between a
+    terminator and the end of the trace) form a *block*; every stall spans from
+    a NaN in a block to the block end, so each block yields at most one stall.
+    The block end is the bin before the next terminator, or the last bin of the
+    trace when no terminator follows (trailing short non-NaN runs are bridged).
+
+    Args:
+        isnan: Concatenated NaN mask of all traces.
+        trace_starts: Sorted start index of each trace in ``isnan`` (first is 0).
+        refactory_bins: See :func:`detect_stalls`.
+        min_stall_duration: See :func:`detect_stalls`.
+        end_stall_non_nan_bins: See :func:`detect_stalls`.
+
+    Returns:
+        ``(trace_index, start_idx, stop_idx)`` of accepted stalls, with indices
+        in concatenated-array space, ordered by position.
+    """
+    empty = np.zeros(0, dtype=np.intp)
+    n = int(isnan.size)
+    nan_idx = np.flatnonzero(isnan)
+    if nan_idx.size == 0:
+        return empty, empty, empty
+
+    trace_ends = np.append(trace_starts[1:], n)  # exclusive
+    first_bin = np.zeros(n, dtype=bool)
+    first_bin[trace_starts[trace_starts < n]] = True
+
+    # Maximal non-NaN runs that start right after a NaN (same trace).
+    valid = ~isnan
+    run_start_mask = valid.copy()
+    run_start_mask[1:] &= isnan[:-1]
+    run_start_mask &= ~first_bin
+    run_starts = np.flatnonzero(run_start_mask)
+    run_stop_mask = valid.copy()
+    run_stop_mask[:-1] &= isnan[1:] | first_bin[1:]
+    run_stops = np.flatnonzero(run_stop_mask)  # inclusive, may include runs at trace starts
+    if run_starts.size:
+        run_lengths = run_stops[np.searchsorted(run_stops, run_starts)] - run_starts + 1
+        term_starts = run_starts[run_lengths >= end_stall_non_nan_bins]
+    else:
+        term_starts = empty
+
+    # Group NaNs into blocks: a new block begins after a terminator or at a new trace.
+    nan_trace = np.searchsorted(trace_starts, nan_idx, side="right") - 1
+    n_term_before = np.searchsorted(term_starts, nan_idx)
+    new_block = np.ones(nan_idx.size, dtype=bool)
+    new_block[1:] = (n_term_before[1:] != n_term_before[:-1]) | (nan_trace[1:] != nan_trace[:-1])
+    first_in_block = np.flatnonzero(new_block)
+    block_first = nan_idx[first_in_block]
+    block_trace = nan_trace[first_in_block]
+    next_term = n_term_before[first_in_block]
+
+    trace_last = trace_ends[block_trace] - 1
+    term_at = np.append(term_starts, n)[next_term]  # sentinel n: no terminator follows
+    block_stop = np.where(term_at <= trace_last, term_at - 1, trace_last)
+
+    block_start = block_first
+    accepted = (block_stop - block_start + 1) >= min_stall_duration
+
+    # Refractory: a block whose first NaN is within refactory_bins of the previous
+    # block's stop may start later (or not at all) depending on earlier acceptances.
+    if refactory_bins > 0 and block_first.size > 1:
+        same_trace = block_trace[1:] == block_trace[:-1]
+        close = same_trace & ((block_first[1:] - block_stop[:-1]) <= refactory_bins)
+        if np.any(close):
+            # Only blocks close to their predecessor depend on history. Any other
+            # block starts at its first NaN, and no stall before it can reach
+            # past it, so the sequential pass visits close blocks only.
+            close_list = close.tolist()
+            first_list = block_first.tolist()
+            stop_list = block_stop.tolist()
+            start_list = list(first_list)
+            accepted_list = accepted.tolist()
+            nan_list = nan_idx.tolist()
+            last_stop = -refactory_bins - 1
+            for k in (np.flatnonzero(close) + 1).tolist():
+                if accepted_list[k - 1]:
+                    last_stop = stop_list[k - 1]
+                elif k == 1 or not close_list[k - 2]:
+                    last_stop = -refactory_bins - 1
+                accepted_list[k] = False
+                start = first_list[k]
+                threshold = last_stop + refactory_bins + 1
+                if start < threshold:
+                    j = bisect_left(nan_list, threshold)
+                    if j >= len(nan_list) or nan_list[j] > stop_list[k]:
+                        continue
+                    start = nan_list[j]
+                start_list[k] = start
+                accepted_list[k] = stop_list[k] - start + 1 >= min_stall_duration
+            block_start = np.asarray(start_list, dtype=np.intp)
+            accepted = np.asarray(accepted_list, dtype=bool)
+
+    return block_trace[accepted], block_start[accepted], block_stop[accepted]
+
+
 def detect_stalls(
     velocity: np.ndarray,
     refactory_bins: int,
@@ -99,6 +222,9 @@ def detect_stalls(
     The refractory period prevents a new stall from starting until
     *refactory_bins* bins have elapsed after the previous accepted stall.
 
+    Detection works on NaN/non-NaN runs with array operations; see
+    :func:`detect_stalls_batch` to analyze many traces in one call.
+
     Note:
         ``min_stall_duration`` applies to the **total stall span length** in bins
         (NaN + any bridged non-NaN).
@@ -124,86 +250,82 @@ def detect_stalls(
     """
     if velocity.ndim != 1:
         raise ValueError(f"velocity must be 1D array, got shape {velocity.shape}")
-    if refactory_bins < 0:
-        raise ValueError(f"refactory_bins must be >= 0, got {refactory_bins}")
-    if min_stall_duration < 1:
-        raise ValueError(f"min_stall_duration must be >= 1, got {min_stall_duration}")
-    if end_stall_non_nan_bins < 1:
-        raise ValueError(
-            f"end_stall_non_nan_bins must be >= 1, got {end_stall_non_nan_bins}"
-        )
-    if start_bin is not None and int(start_bin) < 0:
-        raise ValueError(f"start_bin must be >= 0, got {start_bin}")
-
-    stalls: List[Stall] = []
-    n = int(len(velocity))
-    i = 0
-
-    # Track the last accepted stall stop in *array index space*.
-    last_stall_stop_idx = -refactory_bins - 1
-
-    # Normalize offset for translating indices to bins.
-    offset = int(start_bin) if start_bin is not None else 0
-
-    while i < n:
-        # Skip non-NaN values quickly.
-        if not np.isnan(velocity[i]):
-            i += 1
-            continue
-
-        # Enforce refractory period relative to the last *accepted* stall.
-        if (i - last_stall_stop_idx) <= refactory_bins:
-            i += 1
-            continue
-
-        # Found a candidate stall start at index i.
-        stall_start_idx = i
-
-        non_nan_run = 0  # consecutive non-NaN count since last NaN within current stall
-        i += 1
-
-        # Expand stall until termination criterion is met or we hit end of array.
-        while i < n:
-            if np.isnan(velocity[i]):
-                # Reset termination counter on NaN.
-                non_nan_run = 0
-            else:
-                non_nan_run += 1
-                # Once we see enough consecutive non-NaNs, terminate stall.
-                if non_nan_run >= end_stall_non_nan_bins:
-                    break
-            i += 1
-
-        if i >= n:
-            # Stall extends to end; include all remaining bins.
-            stall_stop_idx = n - 1
-        else:
-            # i currently points to the last non-NaN in the terminating run (or later),
-            # so exclude that terminating non-NaN run from the stall span.
-            stall_stop_idx = i - non_nan_run
-
-        stall_bins = stall_stop_idx - stall_start_idx + 1
-
-        # Accept only if long enough (duration counts NaN + bridged non-NaN).
-        if stall_bins >= min_stall_duration:
-            bin_start_actual = offset + stall_start_idx
-            bin_stop_actual = offset + stall_stop_idx
-            stalls.append(
-                Stall(
-                    bin_start=bin_start_actual,
-                    bin_stop=bin_stop_actual,
-                )
-            )
-            last_stall_stop_idx = stall_stop_idx
+    return detect_stalls_batch(
+        [velocity],
+        refactory_bins=refactory_bins,
+        min_stall_duration=min_stall_duration,
+        end_stall_non_nan_bins=end_stall_non_nan_bins,
+        start_bins=[start_bin],
+    )[0]
 
-        # Continue scanning from the end of the terminating non-NaN run (if any),
-        # otherwise one bin past the stall stop.
-        if i < n:
-            i = stall_stop_idx + non_nan_run
-        else:
-            i = n
 
-    return stalls
+def detect_stalls_batch(
+    velocities: Sequence[np.ndarray],
+    refactory_bins: int,
+    min_stall_duration: int = 1,
+    end_stall_non_nan_bins: int = 1,
+    start_bins: Sequence[int | None] | None = None,
+) -> List[List[Stall]]:
+    """Detect stalls in many 1D traces (ragged lengths) in one pass.
+
+    Traces are concatenated and analyzed together; stalls never cross trace
+    boundaries and each trace gets its own refractory state, so the result for
+    each trace equals :func:`detect_stalls` on that trace alone.
+
+    Args:
+        velocities: 1D signal arrays (e.g. one per ROI). NaNs mark missing.
+        refactory_bins: See :func:`detect_stalls`.
+        min_stall_duration: See :func:`detect_stalls`.
+        end_stall_non_nan_bins: See :func:`detect_stalls`.
+        start_bins: Optional per-trace bin offsets (same length as
+            ``velocities``); ``None`` entries mean offset 0.
+
+    Returns:
+        One list of :class:`Stall` per input trace, in input order.
+
+    Raises:
+        ValueError: If parameters are invalid, a trace is not 1D, or
+            ``start_bins`` has the wrong length.
+    """
+    _validate_stall_params(refactory_bins, min_stall_duration, end_stall_non_nan_bins)
+    arrays = [np.asarray(v) for v in velocities]
+    for v in arrays:
+        if v.ndim != 1:
+            raise ValueError(f"velocity must be 1D array, got shape {v.shape}")
+    if start_bins is None:
+        offsets = [0] * len(arrays)
+    else:
+        if len(start_bins) != len(arrays):
+            raise ValueError(
+                f"start_bins must have one entry per trace ({len(arrays)}), got {len(start_bins)}"
+            )
+        offsets = []
+        for sb in start_bins:
+            if sb is not None and int(sb) < 0:
+                raise ValueError(f"start_bin must be >= 0, got {sb}")
+            offsets.append(int(sb) if sb is not None else 0)
+    if not arrays:
+        return []
+
+    lengths = np.array([v.size for v in arrays], dtype=np.intp)
+    trace_starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.intp)
+    isnan = np.isnan(np.concatenate([v.astype(float, copy=False) for v in arrays]))
+
+    trace_idx, start_idx, stop_idx = _detect_stall_spans(
+        isnan,
+        trace_starts,
+        int(refactory_bins),
+        int(min_stall_duration),
+        int(end_stall_non_nan_bins),
+    )
+
+    out: List[List[Stall]] = [[] for _ in arrays]
+    shift = np.asarray(offsets, dtype=np.intp) - trace_starts
+    bin_start = start_idx + shift[trace_idx]
+    bin_stop = stop_idx + shift[trace_idx]
+    for t, b0, b1 in zip(trace_idx.tolist(), bin_start.tolist(), bin_stop.tolist()):
+        out[t].append(Stall(bin_start=b0, bin_stop=b1))
+    return out
 
 
 @dataclass(frozen=True)
@@ -289,6 +411,37 @@ class StallAnalysis:  # pragma: no cover
         analyzed_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
         return cls(params=params, stalls=stalls, analyzed_at=analyzed_at)
 
+    @classmethod
+    def run_batch(
+        cls,
+        velocities: Sequence[np.ndarray],
+        params: StallAnalysisParams,
+        *,
+        start_bins: Sequence[int | None] | None = None,
+    ) -> List["StallAnalysis"]:
+        """Run stall detection on many signal arrays with shared parameters.
+
+        Args:
+            velocities: 1D arrays to analyze (e.g. one per ROI); lengths may differ.
+            params: Stall analysis parameters shared by all traces.
+            start_bins: Optional per-trace offsets to translate indices to global bins.
+
+        Returns:
+            One :class:`StallAnalysis` per input trace, in input order.
+        """
+        stalls_per_trace = detect_stalls_batch(
+            velocities,
+            refactory_bins=params.refactory_bins,
+            min_stall_duration=params.min_stall_duration,
+            end_stall_non_nan_bins=params.end_stall_non_nan_bins,
+            start_bins=start_bins,
+        )
+        analyzed_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        return [
+            cls(params=params, stalls=stalls, analyzed_at=analyzed_at)
+            for stalls in stalls_per_trace
+        ]
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize results to a JSON-friendly dictionary."""
         return {
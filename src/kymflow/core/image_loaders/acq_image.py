@@ -85,6 +85,8 @@ class AcqImage:
         # Image data dictionary
         self._imgData: dict[int, np.ndarray] = {}
         # dictionary of color channel like {int: np.ndarray}
+        # Serializes load_channel/unload_channel (GUI thread vs. background prefetch)
+        self._load_lock = threading.RLock()
         
         # Experimental metadata
         self._experiment_metadata = ExperimentMetadata()
@@ -293,30 +295,49 @@ class AcqImage:
             True if the channel data is available after this call (either because
             it was already loaded or loading succeeded), False otherwise.
         """
-        # Idempotent check: if channel data already exists, return True
-        if self.getChannelData(channel) is not None:
-            # logger.info(f'Idempotent channel:{channel}: channel data already exists')
-            return True
-        
-        # Get channel path
-        path = self.getChannelPath(channel)
-        if path is None:
-            logger.error(f"load_channel({channel}): No file path available for channel {channel}")
-            return False
-        
-        # Load via addColorChannel which calls _load_channel_from_path()
-        try:
-            self.addColorChannel(channel, None, path=path, load_image=True)
-            # Verify it was loaded
+        with self._load_lock:
+            # Idempotent check: if channel data already exists, return True
             if self.getChannelData(channel) is not None:
+                # logger.info(f'Idempotent channel:{channel}: channel data already exists')
                 return True
-            else:
-                logger.error(f"load_channel({channel}): Failed to load image data from {path}")
+        
+            # Get channel path
+            path = self.getChannelPath(channel)
+            if path is None:
+                logger.error(f"load_channel({channel}): No file path available for channel {channel}")
                 return False
-        except Exception as e:
-            logger.error(f"load_channel({channel}): Exception while loading from {path}: {e}")
-            return False
-    
+        
+            # Load via addColorChannel which calls _load_channel_from_path()
+            try:
+                self.addColorChannel(channel, None, path=path, load_image=True)
+                # Verify it was loaded
+                if self.getChannelData(channel) is not None:
+                    return True
+                else:
+                    logger.error(f"load_channel({channel}): Failed to load image data from {path}")
+                    return False
+            except Exception as e:
+                logger.error(f"load_channel({channel}): Exception while loading from {path}: {e}")
+                return False
+
+    def unload_channel(self, channel: int) -> bool:
+        """Drop the loaded image data of a path-backed channel.
+
+        The channel stays available and is read again from its file by the next
+        :meth:`load_channel`. Channels without a file path (data passed in
+        memory) are never dropped.
+
+        Args:
+            channel: 1-based channel index.
+
+        Returns:
+            True if loaded data was dropped.
+        """
+        with self._load_lock:
+            if self.getChannelPath(channel) is None:
+                return False
+            return self._imgData.pop(channel, None) is not None
+
     def _load_channel_from_path(self, channel: int, path: Path) -> bool:
         """Load image data from path for a specific channel.
         
@@ -433,6 +454,21 @@ class AcqImage:
         """
         return self._imgData.get(channel)
     
+    def get_channel_view(self, channel: int = 1) -> np.ndarray | None:
+        """Get channel data for reading without loading it into this image.
+
+        The base implementation returns the loaded data (see getChannelData()).
+        Subclasses backed by files may return a read-only view of the file, e.g.
+        a memory map, when the channel is not loaded.
+
+        Args:
+            channel: Channel number (1-based integer key).
+
+        Returns:
+            Channel array, or None if the data is not available.
+        """
+        return self.getChannelData(channel)
+
     def num_channels(self):
         """Return the number of channels."""
         return len(self.getChannelKeys())
@@ -758,7 +794,7 @@ class AcqImage:
             logger.error(f"Failed to save metadata to {metadata_path}: {e}")
             return False
     
-    def load_metadata(self, path: Path | None = None) -> bool:
+    def load_metadata(self, path: Path | None = None, *, metadata: dict | None = None) -> bool:
         """Load combined metadata from JSON file.
         
         Loads header, experiment_metadata, and ROIs from a JSON file. After
@@ -767,23 +803,31 @@ class AcqImage:
         
         Args:
             path: Optional path override. If None, uses same name as image file.
+            metadata: Already parsed contents of the metadata file (e.g. from a
+                FolderCatalog). If given, no file is read.
             
         Returns:
             True if loaded successfully, False if file doesn't exist.
         """
         metadata_path = path if path is not None else self._get_metadata_path()
-        if metadata_path is None:
-            logger.warning("No path available for loading metadata")
-            return False
-        
-        if not metadata_path.exists():
-            # logger.info(f"Metadata file does not exist: {metadata_path}")
-            return False
-                
+        if metadata is None:
+            if metadata_path is None:
+                logger.warning("No path available for loading metadata")
+                return False
+
+            if not metadata_path.exists():
+                # logger.info(f"Metadata file does not exist: {metadata_path}")
+                return False
+
+            try:
+                with open(metadata_path, 'r') as f:
+                    loaded: dict = json.load(f)
+                metadata = loaded
+            except Exception as e:
+                logger.error(f"Failed to load metadata from {metadata_path}: {e}")
+                return False
+
         try:
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
-            
             # Load header fields
             if "header" in metadata:
                 self._header = AcqImgHeader.from_dict(metadata["header"])
@@ -851,6 +895,7 @@ class AcqImage:
                         logger.warning(f"Could not validate ROI {roi.id} on load: {e}")
                 
                 if clamped_count > 0:
+                    self._roi_set.refresh_bounds()
                     logger.info(f"Clamped {clamped_count} ROI(s) to current image bounds during load")
             
             # logger.info(f"Loaded metadata from {metadata_path}")
@@ -21,6 +21,7 @@ from __future__ import annotations
 import os
 import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Generic, Iterator, List, Optional, Type, TypeVar
@@ -28,13 +29,21 @@ from typing import Any, Dict, Generic, Iterator, List, Optional, Type, TypeVar
 import pandas as pd
 
 from kymflow.core.image_loaders.acq_image import AcqImage
+from kymflow.core.image_loaders.folder_catalog import FolderCatalog
 from kymflow.core.image_loaders.olympus_header.read_olympus_header import _readOlympusHeader
+from kymflow.core.utils.file_walk import iter_files
 from kymflow.core.utils.logging import get_logger
 from kymflow.core.utils.progress import CancelledError, ProgressCallback, ProgressMessage
 
 
 logger = get_logger(__name__)
 
+# Files found between streamed "scan" progress messages.
+_SCAN_PROGRESS_EVERY = 250
+
+# Images whose ROI stats are computed concurrently by calculate_roi_image_stats().
+DEFAULT_ROI_STATS_WORKERS = 4
+
 
 def dedupe_olympus_multichannel_scan_paths(paths: List[Path]) -> List[Path]:
     """Drop extra Olympus sibling TIF paths so each acquisition appears once in a scan list.
@@ -186,6 +195,7 @@ class AcqImageList(Generic[T]):
         cancel_event: threading.Event | None = None,
         progress_cb: ProgressCallback | None = None,
         dedupe_olympus_multichannel: bool = False,
+        folder_catalog: bool = False,
     ):
         """Initialize AcqImageList and automatically load files.
 
@@ -220,6 +230,10 @@ class AcqImageList(Generic[T]):
                 path = lowest channel present on disk and in the scan set). Subclasses such
                 as :class:`~kymflow.core.image_loaders.kym_image_list.KymImageList` enable this;
                 generic lists default to False.
+            folder_catalog: If True, folder scans cache parsed sidecar files in a
+                :class:`~kymflow.core.image_loaders.folder_catalog.FolderCatalog`
+                under the folder's ``.kymflow_hidden`` directory and pass it to
+                ``image_cls``, which must accept a ``catalog`` argument.
         """
         # Validate mutual exclusivity
         if path is not None and file_path_list is not None:
@@ -231,6 +245,8 @@ class AcqImageList(Generic[T]):
         self.image_cls = image_cls
         self.images: List[T] = []
         self._dedupe_olympus_multichannel = dedupe_olympus_multichannel
+        self._use_folder_catalog = folder_catalog
+        self._catalog: Optional[FolderCatalog] = None
 
         # Internal mode: directory scan vs single-file vs file_list
         self._single_file: Optional[Path] = None
@@ -461,6 +477,8 @@ class AcqImageList(Generic[T]):
                 "load_image": False,
                 "_blind_index": blind_index,
             }
+            if self._catalog is not None:
+                kwargs_full["catalog"] = self._catalog
             try:
                 return self.image_cls(**kwargs_full)
             except TypeError:
@@ -554,14 +572,35 @@ class AcqImageList(Generic[T]):
         )
         if self._dedupe_olympus_multichannel:
             paths_to_wrap = dedupe_olympus_multichannel_scan_paths(paths_to_wrap)
-        images = self._wrap_paths(
-            paths_to_wrap,
-            cancel_event=cancel_event,
-            progress_cb=progress_cb,
-        )
+        if self._use_folder_catalog and self._catalog is None:
+            self._catalog = FolderCatalog.for_folder(self._folder)
+        hits_before = misses_before = 0
+        if self._catalog is not None:
+            hits_before, misses_before = self._catalog.hits, self._catalog.misses
+        try:
+            images = self._wrap_paths(
+                paths_to_wrap,
+                cancel_event=cancel_event,
+                progress_cb=progress_cb,
+            )
+        finally:
+            if self._catalog is not None:
+                self._catalog.commit()
+        if self._catalog is not None:
+            self._catalog.prune(paths_to_wrap)
+            self._catalog.commit()
+            logger.info(
+                f"Folder catalog: {self._catalog.hits - hits_before} cached, "
+                f"{self._catalog.misses - misses_before} parsed ({self._folder})"
+            )
         self.images = images
         return
 
+    @property
+    def catalog(self) -> Optional[FolderCatalog]:
+        """FolderCatalog of the scanned folder, or None (disabled or not a folder scan)."""
+        return self._catalog
+
     def load(
         self,
         follow_symlinks: bool = False,
@@ -814,51 +853,45 @@ class AcqImageList(Generic[T]):
         cancel_event: threading.Event | None = None,
         progress_cb: ProgressCallback | None = None,
     ) -> List[Path]:
-        """Collect matching file paths from a folder with depth filtering."""
+        """Collect matching file paths from a folder, pruning the walk at ``depth``.
+
+        GUI depth N lists the base folder (code depth 0) through code depth
+        N-1; deeper folders are never scanned. Scan progress is reported every
+        ``_SCAN_PROGRESS_EVERY`` files while walking.
+
+        Raises:
+            CancelledError: If ``cancel_event`` is set during the scan.
+        """
         if progress_cb is not None:
             progress_cb(ProgressMessage(phase="scan", done=0, total=None, path=folder))
 
-        # Build glob pattern from file extension
         ext = file_extension.strip()
         if ext and not ext.startswith("."):
             ext = f".{ext}"
-        glob_pattern = f"*{ext}" if ext else "*"
-
-        # Collect all matching files recursively
-        if follow_symlinks:
-            all_paths = list(folder.rglob(glob_pattern))
-        else:
-            all_paths = list(folder.glob(f"**/{glob_pattern}"))
-
-        if cancel_event is not None and cancel_event.is_set():
-            raise CancelledError("Cancelled during folder scan.")
-
-        # Filter by depth: calculate depth relative to base folder
-        # Code depth: base folder = 0, first subfolder = 1, second subfolder = 2, etc.
-        # GUI depth N maps to code depths 0 through (N-1)
-        filtered_paths: List[Path] = []
-        for p in all_paths:
-            if cancel_event is not None and cancel_event.is_set():
-                raise CancelledError("Cancelled during folder scan.")
-
-            if not p.is_file():
-                continue
-
-            if ext and p.suffix.lower() != ext.lower():
-                continue
 
+        found: List[Path] = []
+        for p in iter_files(
+            folder,
+            max_depth=depth - 1,
+            suffixes={ext} if ext else None,
+            follow_symlinks=follow_symlinks,
+            cancel_event=cancel_event,
+        ):
             if ignore_file_stub is not None and ignore_file_stub in p.name:
                 continue
+            found.append(p)
+            if progress_cb is not None and len(found) % _SCAN_PROGRESS_EVERY == 0:
+                progress_cb(
+                    ProgressMessage(
+                        phase="scan",
+                        done=len(found),
+                        total=None,
+                        detail=f"{len(found)} files",
+                        path=p.parent,
+                    )
+                )
 
-            try:
-                relative_path = p.relative_to(folder)
-                path_depth = len(relative_path.parts) - 1
-                if path_depth < depth:
-                    filtered_paths.append(p)
-            except ValueError:
-                continue
-
-        filtered_paths = sorted(filtered_paths)
+        filtered_paths = sorted(found)
 
         if progress_cb is not None:
             progress_cb(
@@ -960,6 +993,34 @@ class AcqImageList(Generic[T]):
                 values.add(s)
         return sorted(values)
     
+    def calculate_roi_image_stats(
+        self,
+        *,
+        only_missing: bool = True,
+        max_workers: int = DEFAULT_ROI_STATS_WORKERS,
+    ) -> int:
+        """Calculate ROI image stats (img_min, img_max, ...) for all images.
+
+        Images are processed in a thread pool. Pixels are read through
+        ``get_channel_view()`` (memory-mapped for KymImage), so images are not
+        loaded. Images whose stats change are marked dirty but not saved.
+
+        Args:
+            only_missing: If True, only ROIs with undefined stats are calculated.
+            max_workers: Number of images processed concurrently.
+
+        Returns:
+            Number of ROIs whose stats changed.
+        """
+        if not self.images:
+            return 0
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            counts = pool.map(
+                lambda image: image.rois.calculate_image_stats(only_missing=only_missing),
+                self.images,
+            )
+            return sum(counts)
+
     def find_by_path(self, path: str | Path) -> Optional[T]:
         """Find an image in the list by its path.
         
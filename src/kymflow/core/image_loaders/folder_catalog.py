@@ -0,0 +1,229 @@
+"""Persistent per-folder catalog of parsed sidecar files.
+
+Opening a folder creates one KymImage per TIFF, and each of them parses its
+Olympus ``.txt`` header and reads its metadata JSON. :class:`FolderCatalog`
+keeps those parsed results in an SQLite database in the folder's
+``.kymflow_hidden`` directory, keyed by image path.
+
+Each entry records the size and modification time of every file it was built
+from (a file that did not exist is recorded as missing). :meth:`FolderCatalog.lookup`
+only returns an entry while all of them are unchanged, so re-opening a folder
+costs one ``stat`` per dependency instead of parsing the sidecars. Changed or
+new files miss and are parsed and stored again.
+
+The catalog is a cache: if the database cannot be opened or written it is
+disabled with a warning and images are loaded from their files as before.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from kymflow.core.utils.hidden_cache_paths import (
+    ensure_hidden_cache_dir,
+    get_hidden_cache_path,
+)
+from kymflow.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Visible name of the catalog; the database lives in <folder>/.kymflow_hidden/.
+CATALOG_FILENAME = "kymflow_catalog.sqlite3"
+
+# Bump when the payload layout changes; older databases are emptied on open.
+CATALOG_SCHEMA_VERSION = 1
+
+
+def file_signature(path: str | Path) -> Optional[list[int]]:
+    """Return ``[size, mtime_ns]`` of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [int(st.st_size), int(st.st_mtime_ns)]
+
+
+class FolderCatalog:
+    """SQLite cache of per-image payloads validated by file signatures.
+
+    Safe to share between threads (one connection guarded by a lock). Writes
+    are batched; call :meth:`commit` (or :meth:`close`) after a load.
+
+    Args:
+        db_path: Path of the SQLite database file.
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        try:
+            self._conn = self._connect()
+        except sqlite3.DatabaseError:
+            # Not a database (or corrupt): it is only a cache, start over.
+            logger.warning(f"Recreating unreadable folder catalog: {self.db_path}")
+            try:
+                self.db_path.unlink(missing_ok=True)
+                self._conn = self._connect()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Folder catalog disabled, could not open {self.db_path}: {e}")
+        except OSError as e:
+            logger.warning(f"Folder catalog disabled, could not open {self.db_path}: {e}")
+
+    @classmethod
+    def for_folder(cls, folder: str | Path) -> "FolderCatalog":
+        """Open (or create) the catalog of ``folder``."""
+        visible_path = Path(folder) / CATALOG_FILENAME
+        try:
+            ensure_hidden_cache_dir(visible_path)
+        except OSError as e:
+            logger.warning(f"Could not create hidden cache directory for {visible_path}: {e}")
+        return cls(get_hidden_cache_path(visible_path))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != CATALOG_SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "path TEXT PRIMARY KEY, deps TEXT NOT NULL, payload TEXT NOT NULL)"
+            )
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    @property
+    def enabled(self) -> bool:
+        """False if the database could not be opened or a write failed."""
+        return self._conn is not None
+
+    def lookup(self, path: str | Path) -> Optional[dict[str, Any]]:
+        """Return the payload stored for ``path`` if none of its dependencies changed.
+
+        Args:
+            path: Image path (as passed to :meth:`store`).
+
+        Returns:
+            The stored payload, or None on a miss (no entry, changed file, or
+            catalog disabled).
+        """
+        if self._conn is None:
+            return None
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT deps, payload FROM files WHERE path = ?", (str(path),)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Folder catalog lookup failed for {path}: {e}")
+                row = None
+        if row is None:
+            self.misses += 1
+            return None
+        deps = json.loads(row[0])
+        for dep_path, signature in deps.items():
+            if file_signature(dep_path) != signature:
+                self.misses += 1
+                return None
+        self.hits += 1
+        return json.loads(row[1])
+
+    def store(self, path: str | Path, deps: Iterable[str | Path], payload: dict[str, Any]) -> None:
+        """Store ``payload`` for ``path``, valid while ``deps`` are unchanged.
+
+        Args:
+            path: Image path (the lookup key).
+            deps: Files the payload was built from, existing or not. ``path``
+                itself should be included.
+            payload: JSON-serializable data.
+        """
+        if self._conn is None:
+            return
+        signatures = {str(dep): file_signature(dep) for dep in deps}
+        try:
+            row = (str(path), json.dumps(signatures), json.dumps(payload, default=str))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Not cataloguing {path}: {e}")
+            return
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO files (path, deps, payload) VALUES (?, ?, ?)", row
+                )
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    def paths(self) -> list[Path]:
+        """Return all catalogued image paths."""
+        if self._conn is None:
+            return []
+        with self._lock:
+            try:
+                rows = self._conn.execute("SELECT path FROM files").fetchall()
+            except sqlite3.Error as e:
+                logger.warning(f"Folder catalog read failed on {self.db_path}: {e}")
+                return []
+        return [Path(row[0]) for row in rows]
+
+    def prune(self, present: Iterable[str | Path]) -> int:
+        """Remove entries of images that no longer exist.
+
+        Entries not in ``present`` are kept while their file exists (e.g. a
+        deeper folder level that this scan did not include).
+
+        Args:
+            present: Image paths found by the current scan.
+
+        Returns:
+            Number of removed entries.
+        """
+        keep = {str(p) for p in present}
+        gone = [(str(p),) for p in self.paths() if str(p) not in keep and not p.exists()]
+        if not gone or self._conn is None:
+            return 0
+        with self._lock:
+            try:
+                self._conn.executemany("DELETE FROM files WHERE path = ?", gone)
+            except sqlite3.Error as e:
+                self._disable(e)
+                return 0
+        return len(gone)
+
+    def commit(self) -> None:
+        """Write pending changes to disk."""
+        if self._conn is None:
+            return
+        with self._lock:
+            try:
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    def close(self) -> None:
+        """Commit and close the database."""
+        self.commit()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _disable(self, error: Exception) -> None:
+        """Stop using the catalog after a write error (caller holds the lock)."""
+        logger.warning(f"Folder catalog disabled after write error on {self.db_path}: {error}")
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+        self._conn = None
@@ -0,0 +1,293 @@
+"""Change notification for a loaded folder (incremental KymImageList refresh).
+
+:class:`FolderWatcher` compares successive snapshots of a folder-mode
+:class:`~kymflow.core.image_loaders.kym_image_list.KymImageList` and reports
+:class:`FolderChanges`, which ``KymImageList.apply_folder_changes`` applies
+without rebuilding the images that did not change:
+
+- added: image files that appeared in the scan,
+- removed: image files that disappeared,
+- modified: images whose TIFF, Olympus header, metadata JSON or analysis
+  files changed size or modification time (the signatures used by
+  :class:`~kymflow.core.image_loaders.folder_catalog.FolderCatalog`).
+
+Snapshots are taken in a daemon thread. When the optional ``watchdog`` package
+is installed, filesystem notifications (inotify, FSEvents, ...) trigger a
+snapshot shortly after a burst of changes; otherwise the folder is polled
+every ``interval_s`` seconds. The owner drains the result on its own thread
+with :meth:`FolderWatcher.pop_changes`.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from kymflow.core.image_loaders.acq_image_list import dedupe_olympus_multichannel_scan_paths
+from kymflow.core.image_loaders.folder_catalog import file_signature
+from kymflow.core.image_loaders.olympus_header.read_olympus_header import _olympus_txt_candidate
+from kymflow.core.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from kymflow.core.image_loaders.kym_image import KymImage
+    from kymflow.core.image_loaders.kym_image_list import KymImageList
+
+logger = get_logger(__name__)
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional dependency, fall back to polling
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+    Observer = None
+
+# Seconds between snapshots when polling.
+DEFAULT_POLL_INTERVAL_S = 3.0
+
+# Seconds to wait after a filesystem notification so a burst (e.g. a TIFF and
+# its header being written) results in one snapshot.
+DEFAULT_SETTLE_S = 0.5
+
+
+@dataclass
+class FolderChanges:
+    """Image paths added, removed and modified since the previous snapshot."""
+
+    added: list[Path] = field(default_factory=list)
+    removed: list[Path] = field(default_factory=list)
+    modified: list[Path] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    def merge(self, other: "FolderChanges") -> None:
+        """Fold ``other`` (newer) into these changes."""
+        for path in other.added:
+            if path in self.removed:
+                # Removed and re-created: reload it.
+                self.removed.remove(path)
+                self._add_unique(self.modified, path)
+            else:
+                self._add_unique(self.added, path)
+        for path in other.removed:
+            if path in self.added:
+                self.added.remove(path)
+            else:
+                self._add_unique(self.removed, path)
+            if path in self.modified:
+                self.modified.remove(path)
+        for path in other.modified:
+            if path not in self.added:
+                self._add_unique(self.modified, path)
+
+    @staticmethod
+    def _add_unique(paths: list[Path], path: Path) -> None:
+        if path not in paths:
+            paths.append(path)
+
+
+def image_dependencies(kym_image: "KymImage") -> list[Path]:
+    """Files whose changes require reloading ``kym_image``."""
+    path = kym_image.path
+    if path is None:
+        return []
+    deps: list[Path] = list(kym_image._file_path_dict.values())
+    deps.append(Path(_olympus_txt_candidate(path)))
+    metadata_path = kym_image._get_metadata_path()
+    if metadata_path is not None:
+        deps.append(metadata_path)
+    try:
+        ka = kym_image.get_kym_analysis()
+        radon_paths = ka.get_radon_save_paths()
+        if radon_paths is not None:
+            deps.extend(radon_paths)
+        deps.append(ka._get_events_json_path())
+    except ValueError:
+        pass
+    return deps
+
+
+class _NotifyHandler(FileSystemEventHandler):
+    """watchdog handler that wakes the watcher thread."""
+
+    def __init__(self, wake: threading.Event) -> None:
+        super().__init__()
+        self._wake = wake
+
+    def on_any_event(self, event) -> None:
+        # Our own caches and databases are written while the folder is open.
+        path = str(getattr(event, "src_path", ""))
+        if ".kymflow_hidden" in path or path.endswith("_db.csv"):
+            return
+        self._wake.set()
+
+
+class FolderWatcher:
+    """Report changes of a folder-mode KymImageList from a background thread.
+
+    Args:
+        image_list: Loaded list to watch (its folder, depth, extension and
+            ignore stub define the scan).
+        interval_s: Seconds between snapshots when polling. With native
+            notifications the folder is only re-scanned after a notification.
+        settle_s: Delay after a notification before taking a snapshot.
+        use_native: Use watchdog notifications when available.
+        follow_symlinks: Passed to the folder scan.
+    """
+
+    def __init__(
+        self,
+        image_list: "KymImageList",
+        *,
+        interval_s: float = DEFAULT_POLL_INTERVAL_S,
+        settle_s: float = DEFAULT_SETTLE_S,
+        use_native: bool = True,
+        follow_symlinks: bool = False,
+    ) -> None:
+        if image_list.folder is None or image_list._get_mode() != "folder":
+            raise ValueError("FolderWatcher requires a KymImageList loaded from a folder")
+        self._list = image_list
+        self.interval_s = float(interval_s)
+        self.settle_s = float(settle_s)
+        self.follow_symlinks = follow_symlinks
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._pending = FolderChanges()
+        self._scan: Optional[set[Path]] = None
+        self._signatures: dict[Path, tuple] = {}
+        # acknowledge() calls, so a snapshot taken before one does not undo it
+        self._ack_count = 0
+        self._acked: dict[Path, int] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._observer = None
+        self._use_native = use_native and Observer is not None
+
+    @property
+    def native(self) -> bool:
+        """True if filesystem notifications drive the snapshots."""
+        return self._observer is not None
+
+    def start(self) -> None:
+        """Take the baseline snapshot and start watching in a daemon thread."""
+        if self._thread is not None:
+            return
+        if self._use_native:
+            try:
+                observer = Observer()
+                observer.schedule(
+                    _NotifyHandler(self._wake),
+                    str(self._list.folder),
+                    recursive=self._list.depth > 1,
+                )
+                observer.daemon = True
+                observer.start()
+                self._observer = observer
+            except Exception as e:
+                logger.warning(f"Filesystem notifications unavailable, polling {self._list.folder}: {e}")
+                self._observer = None
+        self._thread = threading.Thread(target=self._run, name="kymflow-folder-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching (pending changes are kept)."""
+        self._stop.set()
+        self._wake.set()
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+            except Exception:
+                logger.exception("Failed to stop filesystem observer")
+            self._observer = None
+
+    def pop_changes(self) -> FolderChanges:
+        """Return and clear the changes collected so far."""
+        with self._lock:
+            changes, self._pending = self._pending, FolderChanges()
+        return changes
+
+    def poll(self) -> FolderChanges:
+        """Take a snapshot now and return the changes since the previous one.
+
+        The first call only records the baseline. The changes are also added
+        to those returned by :meth:`pop_changes`.
+        """
+        with self._lock:
+            ack_count = self._ack_count
+        scan, images = self._scan_folder()
+        signatures = {
+            Path(image.path): tuple(file_signature(dep) for dep in image_dependencies(image))
+            for image in images
+            if image.path is not None
+        }
+        changes = FolderChanges()
+        with self._lock:
+            for path in [p for p, n in self._acked.items() if n > ack_count]:
+                if path in self._signatures:
+                    signatures[path] = self._signatures[path]
+            self._acked = {p: n for p, n in self._acked.items() if n > ack_count}
+            if self._scan is not None:
+                changes.added = sorted(scan - self._scan)
+                changes.removed = sorted(self._scan - scan)
+                changes.modified = sorted(
+                    path
+                    for path, signature in signatures.items()
+                    if path in scan and path in self._signatures and self._signatures[path] != signature
+                )
+            self._scan = scan
+            self._signatures = signatures
+            self._pending.merge(changes)
+        return changes
+
+    def acknowledge(self, kym_image: "KymImage") -> None:
+        """Accept the current files of ``kym_image`` as unchanged (e.g. after saving it).
+
+        Changes this process wrote are not reported back as modifications.
+        """
+        if kym_image.path is None:
+            return
+        path = Path(kym_image.path)
+        signature = tuple(file_signature(dep) for dep in image_dependencies(kym_image))
+        with self._lock:
+            self._ack_count += 1
+            self._acked[path] = self._ack_count
+            if self._scan is not None:
+                self._signatures[path] = signature
+            if path in self._pending.modified:
+                self._pending.modified.remove(path)
+
+    def _scan_folder(self) -> tuple[set[Path], list["KymImage"]]:
+        image_list = self._list
+        images = list(image_list.images)
+        paths = image_list.collect_paths_from_folder(
+            image_list.folder,
+            depth=image_list.depth,
+            file_extension=image_list.file_extension,
+            ignore_file_stub=image_list.ignore_file_stub,
+            follow_symlinks=self.follow_symlinks,
+        )
+        if image_list._dedupe_olympus_multichannel:
+            paths = dedupe_olympus_multichannel_scan_paths(paths)
+        return set(paths), images
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                changes = self.poll()
+            except Exception:
+                logger.exception(f"Folder watch snapshot failed for {self._list.folder}")
+                changes = FolderChanges()
+            if changes:
+                logger.info(
+                    f"Folder changed: {len(changes.added)} added, {len(changes.removed)} removed, "
+                    f"{len(changes.modified)} modified ({self._list.folder})"
+                )
+            if self._observer is not None:
+                self._wake.wait()
+                if self._stop.wait(self.settle_s):
+                    return
+            else:
+                self._wake.wait(self.interval_s)
+            self._wake.clear()
@@ -16,7 +16,13 @@ from kymflow.core.image_loaders.image_loader_plugins.my_image_import import (
     ImageLoaderBase,
     preview_yx_shape_hint_from_catalog_record,
 )
-from kymflow.core.image_loaders.image_loader_plugins.my_image_list import MyImageList
+from kymflow.core.image_loaders.image_loader_plugins.my_image_list import (
+    HeaderReadJob,
+    MyImageList,
+)
+
+# Seconds between moving finished background header reads into the table.
+HEADER_UPDATE_INTERVAL_S = 0.5
 
 # (field, header label) — fields match :meth:`MyImageList.header_records`.
 _AGGRID_COLUMNS: list[tuple[str, str]] = [
@@ -130,6 +136,9 @@ class FolderCatalogPanel:
             "tif",
         ]
         self._catalog = MyImageList(folder, find_these_extensions=exts, max_depth=max_depth)
+        self._header_job: HeaderReadJob | None = None
+        self._header_timer: ui.timer | None = None
+        self._table: MyFileTable | None = None
         self._plot_dict: dict = image_plot_plotly(None).to_dict()
         self._plot: ui.plotly | None = None
         self._status: ui.label | None = None
@@ -166,7 +175,8 @@ class FolderCatalogPanel:
         """Build UI in the current NiceGUI container."""
         # ui.label("Folder catalog (MyImageList + 2D preview)").classes("text-h6 q-mb-sm")
 
-        records = self._catalog.header_records()
+        # List the folder now; headers are filled in as they are read.
+        records = self._catalog.header_records(load=False)
         grid_rows = _rows_for_aggrid(records)
 
         self._status = ui.label("Select a row to load pixels and show a 2D heatmap.").classes(
@@ -178,14 +188,42 @@ class FolderCatalogPanel:
         async def on_row_selected(row_id: str, _row: dict) -> None:
             await self._load_row_for_relative_path_async(row_id)
 
-        MyFileTable(
+        self._table = MyFileTable(
             grid_rows,
             columns=_AGGRID_COLUMNS,
             row_id_field="relative_path",
             on_selected=on_row_selected,
-        ).render().classes("mt-4")
+        )
+        self._table.render().classes("mt-4")
 
         ui.label(f"Root: {self._catalog.folder}").classes("text-caption text-grey-7 q-mb-sm")
+        self._header_timer = ui.timer(HEADER_UPDATE_INTERVAL_S, self._apply_header_records)
+        self._start_header_reads()
+
+    def _start_header_reads(self) -> None:
+        self._header_job = self._catalog.read_headers_in_background()
+        if self._header_job.total:
+            self._set_footer(f"Reading headers: 0/{self._header_job.total}")
+        if self._header_timer is not None:
+            self._header_timer.activate()
+
+    def _apply_header_records(self) -> None:
+        """Timer callback: move finished header reads into the table (UI thread)."""
+        job = self._header_job
+        if job is None:
+            return
+        done = job.done
+        records = job.pop_records()
+        if records and self._table is not None:
+            self._table.update_rows(_rows_for_aggrid(records))
+        if done:
+            if job.total:
+                self._set_footer(f"Read {job.total} headers.")
+            self._header_job = None
+            if self._header_timer is not None:
+                self._header_timer.deactivate()
+        elif records:
+            self._set_footer(f"Reading headers: {job.total - job.pending}/{job.total}")
 
     async def show_upload_preview_async(
         self,
@@ -224,7 +262,11 @@ class FolderCatalogPanel:
         assert self._plot is not None
         assert self._status is not None
         self._set_footer("Ready.")
-        policy = self._catalog.describe_pixel_load(relative_path)
+        # May read this row's header if the background reads did not reach it yet.
+        policy = await run.io_bound(self._catalog.describe_pixel_load, relative_path)
+        if policy is None:
+            # The app is shutting down
+            return
         if not policy.allowed:
             msg = policy.message or policy.code
             self._status.set_text(msg)
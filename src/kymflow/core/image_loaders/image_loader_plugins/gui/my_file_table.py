@@ -109,6 +109,26 @@ class MyFileTable:
                     await result
                 return
 
+    def update_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Update existing rows in place, matched by ``row_id_field``.
+
+        Uses an AG Grid transaction so only the changed rows are re-rendered and
+        the selection and scroll position are kept.
+        """
+        if not rows:
+            return
+        fid = self._row_id_field
+        index = {str(row.get(fid)): i for i, row in enumerate(self._rows)}
+        changed = []
+        for row in rows:
+            i = index.get(str(row.get(fid)))
+            if i is None:
+                continue
+            self._rows[i] = row
+            changed.append(row)
+        if self._grid is not None and changed:
+            self._grid.run_grid_method("applyTransaction", {"update": changed})
+
     def render(self) -> ui.aggrid:
         """Build the grid in the current NiceGUI container.
 
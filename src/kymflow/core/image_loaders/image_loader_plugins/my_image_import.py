@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import math
 import os
+import threading
+from collections import OrderedDict
 from collections.abc import Mapping
 from dataclasses import dataclass, fields
 from datetime import datetime
@@ -17,10 +19,14 @@ import tifffile
 from kymflow.core.image_loaders.image_loader_plugins.olympus_txt_kym import (
     read_olympus_txt_dict,
 )
+from kymflow.core.plotting.display_lut import intensity_range, stretch_to_indices
 from kymflow.core.utils.logging import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
+# Decoded planes/channels kept per loader while the full array is not loaded.
+PLANE_CACHE_SIZE = 8
+
 def _build_file_list(path: str | Path, file_types: list[str]) -> list[str]:
     """Build a list of files in the given path.
 
@@ -424,6 +430,9 @@ class ImageLoaderBase:
         self.path = path
         self._stream: BinaryIO | None = None
         self._img_data: Optional[np.ndarray] = None
+        self._planes: OrderedDict[tuple[int, ...], np.ndarray] = OrderedDict()
+        # Guards _planes: loaders are read from worker threads (prefetch, io_bound)
+        self._planes_lock = threading.Lock()
         if header is None:
             self._header = self.read_header()
         else:
@@ -520,6 +529,45 @@ class ImageLoaderBase:
             f"{type(self).__name__} must implement _load_full_image_array()"
         )
 
+    def _read_plane(self, selection: dict[str, int]) -> Optional[np.ndarray]:
+        """Subclass hook: read one ``(Y, X)`` plane without loading the full array.
+
+        Args:
+            selection: Index along each of the ``T``/``Z``/``C`` dims present in
+                the header (validated by the caller).
+
+        Returns:
+            The plane, or ``None`` if the format cannot read it on its own (the
+            full array is loaded instead).
+        """
+        return None
+
+    def _read_channel(self, channel: int) -> Optional[np.ndarray]:
+        """Subclass hook: read one channel (``C`` axis removed) without the others.
+
+        Returns:
+            The channel array, or ``None`` to load the full array instead.
+        """
+        return None
+
+    def _cached_read(self, key: tuple[int, ...], read: Any) -> Optional[np.ndarray]:
+        """Return ``read()`` through the per-loader LRU of decoded planes/channels."""
+        with self._planes_lock:
+            arr = self._planes.get(key)
+            if arr is not None:
+                self._planes.move_to_end(key)
+                return arr
+        # Decode outside the lock; concurrent reads of one key both store the same plane
+        arr = read()
+        if arr is None:
+            return None
+        arr.flags.writeable = False
+        with self._planes_lock:
+            self._planes[key] = arr
+            while len(self._planes) > PLANE_CACHE_SIZE:
+                self._planes.popitem(last=False)
+        return arr
+
     def load_image_data(self) -> np.ndarray:
         """Load and cache the full image array (lazy, idempotent).
 
@@ -528,41 +576,45 @@ class ImageLoaderBase:
         """
         if self._img_data is None:
             self._img_data = self._load_full_image_array()
+            # Slices are views of the full array from now on.
+            with self._planes_lock:
+                self._planes.clear()
         return self._img_data
 
     def unload_image_data(self) -> None:
         """Drop cached pixel data; header is unchanged."""
         self._img_data = None
+        with self._planes_lock:
+            self._planes.clear()
 
     @staticmethod
-    def array_for_plotly_display(image: np.ndarray) -> np.ndarray:
+    def array_for_plotly_display(
+        image: np.ndarray,
+        value_range: tuple[float, float] | None = None,
+    ) -> np.ndarray:
         """Return a ``uint8`` array for GUI heatmaps (e.g. NiceGUI Plotly); pixel caches unchanged.
 
         Use this only for display. Analysis should keep using :meth:`get_slice_data` /
         :meth:`load_image_data` at full :attr:`~ImageHeader.dtype`.
 
         - **uint8**: returned contiguous, no rescaling.
-        - **uint16**: linear min–max stretch to 0–255 (full dynamic range for display).
+        - **uint16**: linear min–max stretch to 0–255 through a cached 65536-entry
+          lookup table (one ``np.take``, no float copy).
         - **Other numeric dtypes**: same min–max stretch to ``uint8``.
 
         Constant arrays become all zeros.
+
+        Args:
+            image: Array to convert.
+            value_range: ``(min, max)`` to stretch; by default the image range,
+                cached for read-only arrays such as loader slices.
         """
         if image.dtype == np.uint8:
             return np.ascontiguousarray(image)
-        if image.dtype == np.uint16:
-            a = image.astype(np.float32, copy=False)
-            vmin = float(a.min())
-            vmax = float(a.max())
-            if vmax <= vmin:
-                return np.zeros(image.shape, dtype=np.uint8)
-            scale = 255.0 / (vmax - vmin)
-            return ((a - vmin) * scale).astype(np.uint8)
-        a = np.asarray(image, dtype=np.float64)
-        vmin = float(a.min())
-        vmax = float(a.max())
+        vmin, vmax = value_range if value_range is not None else intensity_range(image)
         if vmax <= vmin:
             return np.zeros(image.shape, dtype=np.uint8)
-        return ((a - vmin) / (vmax - vmin) * 255.0).astype(np.uint8)
+        return stretch_to_indices(image, vmin, vmax)
 
     @property
     def header(self) -> ImageHeader:
@@ -572,7 +624,10 @@ class ImageLoaderBase:
     def get_slice_data(self, channel: int, z: int = 0, t: int = 0) -> np.ndarray:
         """Return a single 2D ``(Y, X)`` slice after optional ``T``/``Z``/``C`` selection.
 
-        Loads pixel data on first use.
+        If the full array is loaded the slice is a read-only view of it.
+        Otherwise only the requested plane is read where the format allows
+        (see :meth:`_read_plane`) and kept in a small per-loader LRU; formats
+        without plane access load the full array on first use.
 
         Args:
             channel: Channel index along ``C`` (or ``0`` when there is no ``C`` axis).
@@ -580,19 +635,18 @@ class ImageLoaderBase:
             t: Index along ``T`` if present; ignored if ``T`` is absent.
 
         Returns:
-            Two-dimensional array with dimensions ``(Y, X)``.
+            Two-dimensional, read-only array with dimensions ``(Y, X)``.
 
         Raises:
             IndexError: If any index is out of range.
             ValueError: If dims cannot be reduced to ``(Y, X)``.
         """
-        self.load_image_data()
         if channel < 0 or channel >= self._header.num_channels:
             raise IndexError(
                 f"Channel index {channel} out of range for {self._header.num_channels} channels"
             )
 
-        dims = list(self._header.dims)
+        dims = self._header.dims
         if "Y" not in dims or "X" not in dims:
             raise ValueError(
                 f"Expected dims to include Y and X; got dims={self._header.dims}"
@@ -606,40 +660,42 @@ class ImageLoaderBase:
             if channel != 0:
                 raise IndexError(f"No C axis; only channel 0 is valid, got {channel}")
 
-        assert self._img_data is not None
-        arr = self._img_data
-
-        def _take_and_drop(dim_label: str, index: int) -> None:
-            nonlocal arr, dims
+        selection: dict[str, int] = {}
+        for dim_label, index in (("T", t), ("Z", z), ("C", channel)):
             if dim_label not in dims:
-                return
-            axis = dims.index(dim_label)
-            size = arr.shape[axis]
+                continue
+            size = self._header.shape[dims.index(dim_label)]
             if index < 0 or index >= size:
                 raise IndexError(
-                    f"{dim_label} index {index} out of range for size {size} (dims={tuple(dims)})"
+                    f"{dim_label} index {index} out of range for size {size} (dims={dims})"
                 )
-            arr = np.take(arr, indices=index, axis=axis)
-            dims.pop(axis)
-
-        _take_and_drop("T", t)
-        _take_and_drop("Z", z)
-        if "C" in dims:
-            _take_and_drop("C", channel)
+            selection[dim_label] = index
 
-        if tuple(dims) != ("Y", "X"):
+        remaining = tuple(d for d in dims if d not in selection)
+        if remaining != ("Y", "X"):
             raise ValueError(
-                f"After selecting T/Z/C, expected remaining dims (Y, X); got {tuple(dims)} "
-                f"with shape {arr.shape}"
+                f"After selecting T/Z/C, expected remaining dims (Y, X); got {remaining} "
+                f"with shape {self._header.shape}"
             )
 
+        if self._img_data is None:
+            plane = self._cached_read(
+                (t, z, channel), lambda: self._read_plane(selection)
+            )
+            if plane is not None:
+                return plane
+
+        arr = self.load_image_data()[tuple(selection.get(d, slice(None)) for d in dims)]
+        arr.flags.writeable = False
         return arr
 
     def get_channel_data(self, channel: int) -> np.ndarray:
         """Return the full array for one channel (``C`` axis removed).
 
-        Loads pixel data on first use. Remaining dimensions stay in file order
-        (e.g. ``T, Y, X`` or ``Z, Y, X``).
+        Remaining dimensions stay in file order (e.g. ``T, Y, X`` or ``Z, Y, X``).
+        With a ``C`` axis the result is a read-only view of the loaded array, or,
+        before the full array is loaded, the channel read on its own where the
+        format allows (see :meth:`_read_channel`).
 
         Args:
             channel: Index along the ``C`` dimension, or ``0`` when there is no ``C`` axis.
@@ -651,7 +707,6 @@ class ImageLoaderBase:
             IndexError: If ``channel`` is invalid.
             ValueError: If the header implies multiple channels but there is no ``C`` dim.
         """
-        self.load_image_data()
         if channel < 0 or channel >= self._header.num_channels:
             raise IndexError(
                 f"Channel index {channel} out of range for {self._header.num_channels} channels"
@@ -664,12 +719,18 @@ class ImageLoaderBase:
                 )
             if channel != 0:
                 raise IndexError(f"No C axis; only channel 0 is valid, got {channel}")
-            assert self._img_data is not None
-            return self._img_data
+            return self.load_image_data()
+
+        if self._img_data is None:
+            arr = self._cached_read((channel,), lambda: self._read_channel(channel))
+            if arr is not None:
+                return arr
 
-        assert self._img_data is not None
         c_axis = self._header.dims.index("C")
-        return np.take(self._img_data, indices=channel, axis=c_axis)
+        index = tuple(channel if i == c_axis else slice(None) for i in range(len(self._header.dims)))
+        arr = self.load_image_data()[index]
+        arr.flags.writeable = False
+        return arr
 
 
 def _init_loader_from_stream(
@@ -683,6 +744,8 @@ def _init_loader_from_stream(
     inst.path = filename
     inst._stream = stream
     inst._img_data = None
+    inst._planes = OrderedDict()
+    inst._planes_lock = threading.Lock()
     if hasattr(cls, "_squeeze"):
         inst._squeeze = getattr(cls, "_squeeze")
     if header is None:
@@ -860,6 +923,46 @@ class MyCziImage(ImageLoaderBase):
         with czifile.CziFile(self.path) as czi_file:
             return np.asarray(czi_file.scenes[0].asarray())
 
+    def _read_plane(self, selection: dict[str, int]) -> Optional[np.ndarray]:
+        return self._read_selection(selection)
+
+    def _read_channel(self, channel: int) -> Optional[np.ndarray]:
+        return self._read_selection({"C": channel})
+
+    def _read_selection(self, selection: dict[str, int]) -> Optional[np.ndarray]:
+        """Decode only the subblocks of scene ``0`` matching ``selection``.
+
+        Args:
+            selection: Zero-based index per dimension of :attr:`header` dims.
+
+        Returns:
+            Array with the selected dims removed, or ``None`` if the scene
+            layout differs from the header.
+        """
+        dims = self._header.dims
+        expected = tuple(n for d, n in zip(dims, self._header.shape) if d not in selection)
+
+        def _read(czi_file: Any) -> Optional[np.ndarray]:
+            scene = czi_file.scenes[0]
+            if tuple(scene.dims) != dims:
+                return None
+            # czifile selections use absolute (file-level) coordinates.
+            start = dict(zip(scene.dims, scene.start))
+            absolute = {d: int(start[d]) + index for d, index in selection.items()}
+            arr = np.asarray(scene(**absolute).asarray())
+            return arr if arr.shape == expected else None
+
+        try:
+            if self._stream is not None:
+                self._stream.seek(0)
+                with czifile.CziFile(self._stream) as czi_file:
+                    return _read(czi_file)
+            with czifile.CziFile(self.path) as czi_file:
+                return _read(czi_file)
+        except (TypeError, ValueError) as exc:
+            logger.debug("CZI selection %s not readable on its own: %s", selection, exc)
+            return None
+
 
 class MyTifImage(ImageLoaderBase):
     """TIFF reader using ``tifffile.imread``; header from pixels and/or Olympus sidecar ``.txt``.
@@ -904,6 +1007,8 @@ class MyTifImage(ImageLoaderBase):
         inst.path = filename
         inst._stream = stream
         inst._img_data = None
+        inst._planes = OrderedDict()
+        inst._planes_lock = threading.Lock()
         inst._load_olympus_header = load_olympus_header
         if header is None:
             inst._header = inst.read_header()
@@ -925,6 +1030,37 @@ class MyTifImage(ImageLoaderBase):
             "physical units are set in _read_tif_header via ImageHeader.default_physical_for_dims"
         )
 
+    def _read_plane(self, selection: dict[str, int]) -> Optional[np.ndarray]:
+        # One page per (C, Z) plane, in C-major order.
+        lead = [d for d in self._header.dims if d not in ("Y", "X")]
+        if not lead:
+            return None
+        sizes = [self._header.sizes[d] for d in lead]
+        page = int(np.ravel_multi_index([selection[d] for d in lead], sizes))
+        return self._read_tif_pages(page)
+
+    def _read_channel(self, channel: int) -> Optional[np.ndarray]:
+        if self._header.dims != ("C", "Z", "Y", "X"):
+            return None
+        n_z = self._header.sizes["Z"]
+        return self._read_tif_pages(range(channel * n_z, (channel + 1) * n_z))
+
+    def _read_tif_pages(self, key: int | range) -> Optional[np.ndarray]:
+        """Read pages of the first series if it is one page per plane, else ``None``."""
+        shape = tuple(int(x) for x in self._header.shape)
+        n_planes = int(np.prod(shape[:-2]))
+        source = self._stream if self._stream is not None else self.path
+        if self._stream is not None:
+            self._stream.seek(0)
+        with tifffile.TiffFile(source) as tif:
+            series = tif.series[0]
+            if tuple(series.shape) != shape or len(series.pages) != n_planes:
+                return None
+            arr = np.asarray(tif.asarray(key=key, series=0))
+        if isinstance(key, range):
+            arr = arr.reshape((len(key),) + shape[-2:])
+        return arr
+
     def _read_tif_array(self) -> np.ndarray:
         if self._stream is not None:
             self._stream.seek(0)
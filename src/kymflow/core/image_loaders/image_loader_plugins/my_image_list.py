@@ -10,11 +10,18 @@ OIR/CZI are deferred until :meth:`MyImageList.header_records` (or
 from an Olympus ``.txt`` sidecar without reading pixels; otherwise the header is
 filled when a :class:`~kymflow.core.image_loaders.image_loader_plugins.my_image_import.MyTifImage`
 is constructed.
+
+To show a folder before its headers are read, list it with
+``header_records(load=False)`` and start :meth:`MyImageList.read_headers_in_background`;
+the returned :class:`HeaderReadJob` reads the headers in a bounded thread pool
+and hands finished rows back to the caller's thread.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Iterator
 
@@ -30,11 +37,15 @@ from kymflow.core.image_loaders.image_loader_plugins.olympus_txt_kym import (
     read_olympus_txt_dict,
 )
 
+from kymflow.core.utils.file_walk import iter_files
 from kymflow.core.utils.logging import get_logger
 logger = get_logger(__name__)
 
 _OME_NOT_SUPPORTED_MSG = "OME-TIFF is not supported for this catalog."
 
+# Threads reading headers for MyImageList.read_headers_in_background.
+DEFAULT_HEADER_WORKERS = 4
+
 
 @dataclass(frozen=True)
 class PixelLoadPolicy:
@@ -84,35 +95,39 @@ def _suffix_set_from_find_these(find_these_extensions: list[str]) -> set[str]:
     return {f".{_normalize_extension_token(e)}" for e in find_these_extensions}
 
 
-def _bounded_file_paths(root: Path, max_depth: int) -> list[Path]:
+def _bounded_file_paths(
+    root: Path, max_depth: int, suffixes: set[str] | None = None
+) -> list[Path]:
     """List files under ``root`` whose parent directory depth is at most ``max_depth``.
 
     Depth of ``root`` is ``0``; each step into a child directory adds ``1``.
     Files directly in ``root`` are included when ``max_depth >= 0``. Subdirectories
-    at depth ``max_depth`` are listed for files but not descended further.
+    at depth ``max_depth`` are listed for files but not descended further
+    (see :func:`~kymflow.core.utils.file_walk.iter_files`). Symlinks are
+    followed and returned resolved.
 
     If ``root`` does not exist (e.g. fixtures not checked out), returns an empty list
     so callers like :class:`MyImageList` can still construct with an empty catalog.
+
+    Args:
+        root: Catalog folder.
+        max_depth: Deepest directory level listed.
+        suffixes: Keep only these lower-case suffixes (e.g. ``{".tif"}``); None keeps all.
     """
     root = root.resolve()
     if not root.exists():
         return []
     if not root.is_dir():
         raise ValueError(f"Expected a directory: {root}")
-    out: list[Path] = []
-    stack: list[tuple[Path, int]] = [(root, 0)]
-    while stack:
-        dirpath, depth = stack.pop()
-        try:
-            children = sorted(dirpath.iterdir(), key=lambda p: p.name.lower())
-        except OSError:
-            continue
-        for p in children:
-            if p.is_dir():
-                if depth < max_depth:
-                    stack.append((p, depth + 1))
-            elif p.is_file():
-                out.append(p.resolve())
+    out = list(
+        iter_files(
+            root,
+            max_depth=max_depth,
+            suffixes=suffixes,
+            follow_symlinks=True,
+            resolve_links=True,
+        )
+    )
     out.sort(key=lambda x: str(x).lower())
     return out
 
@@ -130,6 +145,15 @@ class _CatalogRow:
     _header_error: str | None = None
     _header_attempted: bool = False
     _tif_olympus_attempted: bool = False
+    # Background header reads and the GUI thread may ask for the same row.
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def metadata_attempted(self) -> bool:
+        """True once :meth:`ensure_metadata` has nothing left to read."""
+        if self.format in ("tif", "tiff"):
+            return self._tif_olympus_attempted
+        return self._header_attempted or self.format == "ome-tiff"
 
     def _ensure_header_read(self) -> None:
         if self._header_attempted:
@@ -171,10 +195,11 @@ class _CatalogRow:
 
     def ensure_metadata(self) -> None:
         """Load lazy header metadata appropriate for this row's format."""
-        if self.format in ("tif", "tiff"):
-            self._ensure_tif_olympus_header()
-        else:
-            self._ensure_header_read()
+        with self._lock:
+            if self.format in ("tif", "tiff"):
+                self._ensure_tif_olympus_header()
+            else:
+                self._ensure_header_read()
 
     def _ancestry_fields(self) -> dict[str, Any]:
         pdir = Path(self.parent_dir)
@@ -186,9 +211,38 @@ class _CatalogRow:
             "grandparent_name": gdir.name,
         }
 
-    def as_flat_record(self) -> dict[str, Any]:
-        """Flattened row for APIs / JSON-like consumers."""
-        self.ensure_metadata()
+    def _placeholder_record(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "relative_path": self.relative_path,
+            "file_name": Path(self.path).name,
+            **self._ancestry_fields(),
+            "format": self.format,
+            "header_loaded": False,
+            "error": None,
+            "dims_display": "",
+            "shape_display": "",
+            "shape": None,
+            "dims": None,
+            "sizes": None,
+            "dtype": None,
+            "num_channels": None,
+            "num_scenes": None,
+            "physical_units": None,
+            "physical_units_labels": None,
+        }
+
+    def as_flat_record(self, *, load: bool = True) -> dict[str, Any]:
+        """Flattened row for APIs / JSON-like consumers.
+
+        Args:
+            load: Read lazy metadata first. When false, a row whose header was
+                not read yet has ``header_loaded=False`` and no header fields.
+        """
+        if load:
+            self.ensure_metadata()
+        elif not self.metadata_attempted:
+            return self._placeholder_record()
         fp = Path(self.path)
         base: dict[str, Any] = {
             "path": self.path,
@@ -286,6 +340,82 @@ class _CatalogRow:
         return base
 
 
+class HeaderReadJob:
+    """Header reads for catalog rows in a bounded thread pool, one future per row.
+
+    Finished rows are collected as flat records (see :meth:`_CatalogRow.as_flat_record`)
+    until the owner drains them with :meth:`pop_records`, so UI updates stay on
+    the owner's thread. :meth:`cancel` drops the rows not read yet.
+
+    Args:
+        rows: Rows to read, in priority order.
+        max_workers: Maximum number of concurrent header reads.
+    """
+
+    def __init__(self, rows: list[_CatalogRow], *, max_workers: int = DEFAULT_HEADER_WORKERS) -> None:
+        self._lock = threading.Lock()
+        self._records: list[dict[str, Any]] = []
+        self._cancelled = threading.Event()
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, int(max_workers)),
+            thread_name_prefix="kymflow-header-read",
+        )
+        self.futures: dict[str, Future] = {
+            row.relative_path: executor.submit(self._read_row, row) for row in rows
+        }
+        # Worker threads exit once the queued rows are read or cancelled.
+        executor.shutdown(wait=False)
+
+    def _read_row(self, row: _CatalogRow) -> dict[str, Any] | None:
+        if self._cancelled.is_set():
+            return None
+        try:
+            row.ensure_metadata()
+            record = row.as_flat_record()
+        except Exception:
+            logger.exception("Header read failed for %s", row.path)
+            return None
+        if self._cancelled.is_set():
+            return None
+        with self._lock:
+            self._records.append(record)
+        return record
+
+    def pop_records(self) -> list[dict[str, Any]]:
+        """Return and clear the records of rows read since the last call."""
+        with self._lock:
+            records, self._records = self._records, []
+        return records
+
+    @property
+    def total(self) -> int:
+        """Number of rows submitted."""
+        return len(self.futures)
+
+    @property
+    def pending(self) -> int:
+        """Number of rows not read (or cancelled) yet."""
+        return sum(1 for f in self.futures.values() if not f.done())
+
+    @property
+    def done(self) -> bool:
+        """True when every row was read or cancelled."""
+        return all(f.done() for f in self.futures.values())
+
+    @property
+    def cancelled(self) -> bool:
+        """True after :meth:`cancel`."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Drop rows not started yet; rows being read finish but are not reported."""
+        self._cancelled.set()
+        for future in self.futures.values():
+            future.cancel()
+        with self._lock:
+            self._records = []
+
+
 class MyImageList:
     """Catalog image files under a folder with lazy headers and cached loaders.
 
@@ -316,7 +446,10 @@ class MyImageList:
     def _build_rows(self) -> None:
         want_czi = ".czi" in self._allowed_suffixes
         want_oir = ".oir" in self._allowed_suffixes
-        for fp in _bounded_file_paths(self.folder, self._max_depth):
+        suffixes = set(self._allowed_suffixes)
+        if self._wants_tif:
+            suffixes |= {".tif", ".tiff"}
+        for fp in _bounded_file_paths(self.folder, self._max_depth, suffixes):
             parent_dir, grandparent_dir = _folder_ancestry(fp)
             rel = _relative_path_str(self.folder, fp)
             name_lower = fp.name.lower()
@@ -379,9 +512,13 @@ class MyImageList:
     def __iter__(self) -> Iterator[dict[str, Any]]:
         yield from self.header_records()
 
-    def header_records(self) -> list[dict[str, Any]]:
+    def header_records(self, *, load: bool = True) -> list[dict[str, Any]]:
         """One flattened dict per catalog row (lazy OIR/CZI header read).
 
+        With ``load=False`` no header is read; rows not read yet are placeholders
+        (``header_loaded=False``), e.g. to list a folder before
+        :meth:`read_headers_in_background` fills it in.
+
         Each dict includes ``relative_path`` (POSIX path relative to :attr:`folder`),
         plus filesystem context: ``parent_dir``, ``grandparent_dir``,
         ``parent_name``, ``grandparent_name``, ``file_name``. When a header is
@@ -389,7 +526,21 @@ class MyImageList:
         display helpers: ``shape_display``, ``dims_display`` (``physical_units`` and
         ``physical_units_labels`` come from the header as separate fields).
         """
-        return [row.as_flat_record() for row in self._rows]
+        return [row.as_flat_record(load=load) for row in self._rows]
+
+    def read_headers_in_background(
+        self, *, max_workers: int = DEFAULT_HEADER_WORKERS
+    ) -> HeaderReadJob:
+        """Start reading the headers of all rows not read yet, in catalog order.
+
+        Args:
+            max_workers: Maximum number of concurrent header reads.
+
+        Returns:
+            The running job; cancel it when the catalog is replaced.
+        """
+        rows = [row for row in self._rows if not row.metadata_attempted]
+        return HeaderReadJob(rows, max_workers=max_workers)
 
     def get_loader_for_path(self, path: str | Path) -> ImageLoaderBase:
         """Return a cached :class:`ImageLoaderBase` for ``path`` (create on first use).
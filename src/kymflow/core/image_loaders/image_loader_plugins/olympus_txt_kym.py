@@ -1,7 +1,8 @@
-"""Olympus kymograph sidecar ``.txt`` parsing (vendored; no import from ``olympus_header``).
+"""Olympus kymograph sidecar ``.txt`` parsing for ``image_loader_plugins``.
 
-Copied from ``kymflow.core.image_loaders.olympus_header.read_olympus_header`` logic
-for use only under ``image_loader_plugins``.
+Mirrors ``kymflow.core.image_loaders.olympus_header.read_olympus_header``; the
+header fields come from the shared, cached
+:func:`~kymflow.core.image_loaders.olympus_header.olympus_txt_fields.read_olympus_txt_fields`.
 """
 
 from __future__ import annotations
@@ -10,6 +11,7 @@ import os
 from pathlib import Path
 from typing import Any
 
+from kymflow.core.image_loaders.olympus_header.olympus_txt_fields import read_olympus_txt_fields
 from kymflow.core.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -62,59 +64,10 @@ def read_olympus_txt_dict(tif_path: str | Path) -> dict[str, Any] | None:
         "olympusTxtPath": olympus_txt_path,
     }
 
-    pixels_per_line: int | None = None
-
-    with open(olympus_txt_path, encoding="utf-8", errors="replace") as f:
-        for line in f:
-            line = line.strip()
-
-            if line.startswith('"Channel Dimension"'):
-                one_line = line.replace('"', "")
-                parts = one_line.split()
-                if len(parts) >= 3:
-                    ret_dict["numChannels"] = int(parts[2])
-
-            if line.startswith('"X Dimension"'):
-                parts = line.split()
-                if len(parts) > 7:
-                    ret_dict["umPerPixel"] = float(parts[7])
-
-            if line.startswith('"T Dimension"'):
-                parts = line.split()
-                if len(parts) > 5:
-                    ret_dict["durImage_sec"] = float(parts[5])
-
-            if line.startswith('"Image Size"'):
-                if pixels_per_line is None:
-                    parts = line.split()
-                    if len(parts) > 4:
-                        pixels_per_line = int(parts[2].replace('"', ""))
-                        num_lines = int(parts[4].replace('"', ""))
-                        ret_dict["pixelsPerLine"] = pixels_per_line
-                        ret_dict["numLines"] = num_lines
-
-            if line.startswith('"Date"'):
-                # Prefer tab-separated quoted blob: "Date"\t"10/30/2025 02:54:36.454 PM"
-                if "\t" in line:
-                    after_tab = line.split("\t", 1)[1].strip()
-                    if after_tab.startswith('"') and after_tab.endswith('"'):
-                        combined = after_tab[1:-1]
-                        ret_dict["olympusDateTimeCombined"] = combined
-                parts = line.split()
-                if len(parts) > 2:
-                    date_str = parts[1].replace('"', "")
-                    time_str = parts[2]
-                    dot_index = time_str.find(".")
-                    if dot_index != -1:
-                        time_str = time_str[0:dot_index]
-                    ret_dict["dateStr"] = date_str
-                    ret_dict["timeStr"] = time_str
-
-            if line.startswith('"Bits/Pixel"'):
-                parts = line.split()
-                if len(parts) > 1:
-                    bits = parts[1].replace('"', "")
-                    ret_dict["bitsPerPixel"] = int(bits)
+    fields = read_olympus_txt_fields(olympus_txt_path)
+    if fields is None:
+        return None
+    ret_dict.update(fields)
 
     if ret_dict["durImage_sec"] is None:
         logger.error("Olympus txt: did not get durImage_sec from %s", olympus_txt_path)
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import io
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -23,6 +24,7 @@ from kymflow.core.image_loaders.image_loader_plugins.my_image_import import (
     MyCziImage,
     MyOirImage,
     MyTifImage,
+    PLANE_CACHE_SIZE,
     PlotlyHeatmapUniformAxes2D,
     image_header_from_olympus_dict,
     image_loader_from_upload,
@@ -365,6 +367,40 @@ def test_my_tif_3d_and_4d_dims(tmp_path: Path) -> None:
     assert h4.num_channels == 2
 
 
+def test_my_tif_reads_single_planes_before_full_load(tmp_path: Path) -> None:
+    arr = np.arange(2 * 5 * 3 * 4, dtype=np.uint16).reshape(2, 5, 3, 4)
+    p = tmp_path / "planes.tif"
+    tifffile.imwrite(p, arr, photometric=PHOTOMETRIC.MINISBLACK)
+    img = MyTifImage(str(p), header=MyTifImage(str(p)).header)
+
+    assert np.array_equal(img.get_slice_data(1, z=2), arr[1, 2])
+    assert np.array_equal(img.get_channel_data(1), arr[1])
+    assert img._img_data is None  # noqa: SLF001
+    assert img.get_slice_data(1, z=2) is img.get_slice_data(1, z=2)
+
+    full = img.load_image_data()
+    sl = img.get_slice_data(0, z=3)
+    assert np.shares_memory(sl, full) and not sl.flags.writeable
+    assert np.shares_memory(img.get_channel_data(0), full)
+    with pytest.raises(IndexError):
+        img.get_slice_data(0, z=5)
+
+
+def test_my_tif_plane_cache_is_thread_safe(tmp_path: Path) -> None:
+    arr = np.arange(3 * 10 * 3 * 4, dtype=np.uint16).reshape(3, 10, 3, 4)
+    p = tmp_path / "threads.tif"
+    tifffile.imwrite(p, arr, photometric=PHOTOMETRIC.MINISBLACK)
+    img = MyTifImage(str(p))
+
+    def read(i: int) -> bool:
+        c, z = i % 3, (i // 3) % 10
+        return bool(np.array_equal(img.get_slice_data(c, z=z), arr[c, z]))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(read, range(600)))
+    assert len(img._planes) <= PLANE_CACHE_SIZE  # noqa: SLF001
+
+
 def test_my_tif_stream_header_matches_disk(tmp_path: Path) -> None:
     arr = np.arange(6, dtype=np.uint16).reshape(2, 3)
     p = tmp_path / "stream.tif"
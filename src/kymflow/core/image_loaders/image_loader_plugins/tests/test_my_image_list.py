@@ -257,3 +257,56 @@ def test_missing_directory_yields_empty_catalog(tmp_path: Path) -> None:
     lst = MyImageList(missing, find_these_extensions=["tif"], max_depth=2)
     assert len(lst) == 0
     assert lst.header_records() == []
+
+
+def test_background_header_reads_fill_placeholder_records(tmp_path: Path) -> None:
+    for name in ("a.czi", "b.czi", "c.czi"):
+        (tmp_path / name).write_bytes(b"not a czi")
+    lst = MyImageList(tmp_path, find_these_extensions=["czi"], max_depth=0)
+    with patch.object(
+        MyCziImage,
+        "read_header_from_path",
+        wraps=MyCziImage.read_header_from_path,
+    ) as spy:
+        placeholders = lst.header_records(load=False)
+        assert spy.call_count == 0
+        assert [r["header_loaded"] for r in placeholders] == [False] * 3
+        assert all(r["error"] is None for r in placeholders)
+
+        job = lst.read_headers_in_background(max_workers=2)
+        assert job.total == 3
+        for future in job.futures.values():
+            future.result(timeout=10)
+        assert job.done and spy.call_count == 3
+
+    records = job.pop_records()
+    assert sorted(r["relative_path"] for r in records) == ["a.czi", "b.czi", "c.czi"]
+    assert all(r["error"] is not None for r in records)
+    assert job.pop_records() == []
+    assert lst.read_headers_in_background().total == 0
+
+
+def test_cancelled_header_job_skips_queued_rows(tmp_path: Path) -> None:
+    import threading
+
+    for name in ("a.czi", "b.czi", "c.czi"):
+        (tmp_path / name).write_bytes(b"not a czi")
+    lst = MyImageList(tmp_path, find_these_extensions=["czi"], max_depth=0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_read(_path: str) -> None:
+        started.set()
+        release.wait(10)
+        raise ValueError("not a czi")
+
+    with patch.object(MyCziImage, "read_header_from_path", side_effect=blocking_read) as spy:
+        job = lst.read_headers_in_background(max_workers=1)
+        assert started.wait(10)
+        job.cancel()
+        release.set()
+        job.futures["a.czi"].result(timeout=10)
+        assert job.done and job.cancelled
+        assert spy.call_count == 1
+    assert job.pop_records() == []
+    assert [r["header_loaded"] for r in lst.header_records(load=False)] == [False] * 3
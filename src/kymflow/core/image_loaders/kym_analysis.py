@@ -8,10 +8,7 @@ must be explicitly defined before analysis.
 from __future__ import annotations
 
 import json
-import multiprocessing as mp
-import os
 import queue
-import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -43,39 +40,6 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
-# Temporary diagnostics to trace GUI imports during spawn
-def _check_gui_imports(context: str) -> None:
-    """Check if GUI modules are imported at this point.
-    
-    This is temporary diagnostic logging to identify import chains that pull
-    in GUI code during multiprocessing worker spawn.
-    
-    Args:
-        context: Description of where this check is happening (e.g., "module import").
-    """
-    process_name = mp.current_process().name
-    pid = os.getpid()
-    module_name = __name__
-    
-    has_gui_v2 = 'kymflow.gui_v2' in sys.modules
-    has_nicegui = 'nicegui' in sys.modules
-    gui_modules = [m for m in sys.modules.keys() if 'gui' in m.lower() or 'nicegui' in m.lower()]
-    
-    if has_gui_v2 or has_nicegui or gui_modules:
-        logger.warning(
-            f"GUI MODULES DETECTED [{context}]: "
-            f"pid={pid}, process={process_name}, module={module_name}, "
-            f"gui_v2={has_gui_v2}, nicegui={has_nicegui}, modules={gui_modules}"
-        )
-    else:
-        logger.debug(
-            f"No GUI modules detected [{context}]: "
-            f"pid={pid}, process={process_name}, module={module_name}"
-        )
-
-# Check on module import
-# _check_gui_imports("kym_analysis module import")
-
 CancelCallback = Callable[[], bool]
 
 # Re-export for backward compatibility (RADON_JSON_VERSION used by tests)
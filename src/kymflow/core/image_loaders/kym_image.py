@@ -1,6 +1,7 @@
 """KymImage is a subclass of AcqImage that represents a kymograph image.
 """
 
+import json
 from pathlib import Path
 import threading
 from typing import TYPE_CHECKING
@@ -9,15 +10,51 @@ import tifffile
 
 from kymflow.core.image_loaders.acq_image import AcqImage
 from kymflow.core.image_loaders.metadata import AcqImgHeader
-from kymflow.core.image_loaders.olympus_header.read_olympus_header import _readOlympusHeader  # OlympusHeader
+from kymflow.core.image_loaders.olympus_header.read_olympus_header import (  # OlympusHeader
+    _olympus_channel_tif_candidates,
+    _olympus_txt_candidate,
+    _readOlympusHeader,
+)
 
 from kymflow.core.utils.logging import get_logger
 from kymflow.core.utils.progress import ProgressCallback
 logger = get_logger(__name__)
 
 if TYPE_CHECKING:
+    from kymflow.core.image_loaders.folder_catalog import FolderCatalog
     from kymflow.core.image_loaders.kym_analysis import KymAnalysis
 
+# getRowDict() fields that are computed from KymAnalysis (see KymImage.getAnalysisRowDict).
+ANALYSIS_ROW_FIELDS: tuple[str, ...] = (
+    "Analyzed",
+    "Saved",
+    "Total Num Velocity Events",
+    "User Event",
+    "accepted",
+)
+
+def _olympus_header_to_catalog(olympus_dict: dict | None) -> dict | None:
+    """Return a JSON-serializable copy of a _readOlympusHeader() result."""
+    if olympus_dict is None:
+        return None
+    result = dict(olympus_dict)
+    if "tifChannelPaths" in result:
+        result["tifChannelPaths"] = {
+            str(ch): (str(p) if p is not None else None) for ch, p in result["tifChannelPaths"].items()
+        }
+    return result
+
+
+def _olympus_header_from_catalog(data: dict | None) -> dict | None:
+    """Inverse of _olympus_header_to_catalog (channel keys back to int)."""
+    if data is None:
+        return None
+    result = dict(data)
+    if "tifChannelPaths" in result:
+        result["tifChannelPaths"] = {int(ch): p for ch, p in result["tifChannelPaths"].items()}
+    return result
+
+
 class KymImage(AcqImage):
     """KymImage is a subclass of AcqImage that represents a kymograph image.
 
@@ -53,6 +90,7 @@ class KymImage(AcqImage):
                  _blind_index: int | None = None,
                  cancel_event: threading.Event | None = None,
                  progress_cb: ProgressCallback | None = None,
+                 catalog: "FolderCatalog | None" = None,
                  ):
         
         # Call super().__init__ with load_image=False since KymImage handles its own loading
@@ -71,7 +109,12 @@ class KymImage(AcqImage):
         # This discovers additional channels and sets header metadata
         if path is not None:
             path_obj = Path(path)
-            _olympusDict = _readOlympusHeader(path_obj)
+            # A FolderCatalog entry replaces parsing the Olympus header and metadata JSON
+            _catalogEntry = catalog.lookup(path_obj) if catalog is not None else None
+            if _catalogEntry is not None:
+                _olympusDict = _olympus_header_from_catalog(_catalogEntry["olympus"])
+            else:
+                _olympusDict = _readOlympusHeader(path_obj)
             if _olympusDict is not None:
 
                 # logger.info('>>> _olympusDict:')
@@ -136,12 +179,93 @@ class KymImage(AcqImage):
 
             # Load metadata (ROIs) if it exists - must happen before analysis loading
             # since analysis reconciles to existing ROIs
-            self.load_metadata()
+            if catalog is None:
+                self.load_metadata()
+            else:
+                self._load_metadata_with_catalog(catalog, path_obj, _olympusDict, _catalogEntry)
         
         # Always create KymAnalysis (it handles path=None and missing files gracefully)
         from kymflow.core.image_loaders.kym_analysis import KymAnalysis
         self._kym_analysis: "KymAnalysis" = KymAnalysis(self)
 
+    def _load_metadata_with_catalog(
+        self,
+        catalog: "FolderCatalog",
+        path: Path,
+        olympus_dict: dict | None,
+        entry: dict | None,
+    ) -> None:
+        """Load metadata from a catalog entry, or read it and store a new entry.
+
+        Args:
+            catalog: Catalog of the folder being loaded.
+            path: Image path (catalog key).
+            olympus_dict: Parsed Olympus header, or None if there is none.
+            entry: Result of ``catalog.lookup(path)``.
+        """
+        if entry is not None:
+            if entry["metadata"] is not None:
+                self.load_metadata(metadata=entry["metadata"])
+            return
+
+        metadata_path = self._get_metadata_path()
+        metadata = None
+        if metadata_path is not None and metadata_path.exists():
+            try:
+                with open(metadata_path, 'r') as f:
+                    metadata = json.load(f)
+            except Exception:
+                # Let load_metadata() report it; a broken file is not catalogued
+                self.load_metadata()
+                return
+
+        deps = [path, Path(_olympus_txt_candidate(path)), metadata_path]
+        deps.extend(self._file_path_dict.values())
+        if olympus_dict is not None:
+            # Missing sibling channels too, so a channel TIFF added later is a miss
+            candidates = _olympus_channel_tif_candidates(path, olympus_dict.get("numChannels", 1))
+            deps.extend(Path(p) for p in candidates.values())
+        catalog.store(
+            path,
+            [dep for dep in deps if dep is not None],
+            {"olympus": _olympus_header_to_catalog(olympus_dict), "metadata": metadata},
+        )
+        if metadata is not None:
+            self.load_metadata(metadata=metadata)
+
+    def get_channel_view(self, channel: int = 1) -> np.ndarray | None:
+        """Get channel data for reading without loading it into this image.
+
+        Returns the loaded array if the channel is loaded. Otherwise the TIFF is
+        memory-mapped read-only, so only the pages that are accessed are read;
+        TIFFs that cannot be memory-mapped (e.g. compressed) are read once
+        without being kept.
+
+        Args:
+            channel: Channel number (1-based integer key).
+
+        Returns:
+            2D channel array, or None if the data is not available.
+        """
+        img_array = self.getChannelData(channel)
+        if img_array is not None:
+            return img_array
+        path = self.getChannelPath(channel)
+        if path is None:
+            return None
+        try:
+            img_array = tifffile.memmap(path, mode="r")
+        except Exception:
+            try:
+                img_array = tifffile.imread(path)
+            except Exception as e:
+                logger.warning(f"Failed to read TIFF from {path} for channel {channel}: {e}")
+                return None
+        if img_array.ndim != 2:
+            logger.error(f"KymImage expects 2D images, got {img_array.ndim}D from {path}")
+            return None
+        return img_array
+
     def _load_channel_from_path(self, channel: int, path: Path) -> bool:
         """Load image data from TIFF file path for a specific channel.
         
@@ -280,7 +404,32 @@ class KymImage(AcqImage):
             return None
         return self.pixels_per_line * self.um_per_pixel
     
-    def getRowDict(self, *, blinded: bool = False, file_index: int | None = None) -> dict:
+    def getAnalysisRowDict(self) -> dict:
+        """Get the analysis-derived fields of :meth:`getRowDict`.
+
+        These are the row fields that walk KymAnalysis (see ``ANALYSIS_ROW_FIELDS``);
+        the file table fills them after the cheap header fields.
+
+        Returns:
+            Dictionary with one entry per field in ``ANALYSIS_ROW_FIELDS``.
+        """
+        kym_analysis = self.get_kym_analysis()
+        radon = kym_analysis.get_analysis_object("RadonAnalysis")
+        return {
+            "Analyzed": "True" if radon and radon.has_analysis() else "False",
+            "Saved": "True" if not kym_analysis.is_dirty else "False",
+            "Total Num Velocity Events": kym_analysis.total_num_velocity_events(),
+            "User Event": kym_analysis.num_user_added_velocity_events(),
+            "accepted": kym_analysis.get_accepted(),
+        }
+
+    def getRowDict(
+        self,
+        *,
+        blinded: bool = False,
+        file_index: int | None = None,
+        include_analysis: bool = True,
+    ) -> dict:
         """Get dictionary with header, file, and analysis information for table/row display.
         
         Overrides base class method to add analysis-specific fields matching summary_row() keys.
@@ -290,6 +439,8 @@ class KymImage(AcqImage):
             blinded: If True, replace file names with "File {index+1}" and all parent folders with "Blinded".
             file_index: DEPRECATED: Zero-based index (used only if _blind_index is None).
                        Prefer using _blind_index set during AcqImageList instantiation.
+            include_analysis: If False, skip KymAnalysis and set the fields in
+                ``ANALYSIS_ROW_FIELDS`` to None (fill them later with getAnalysisRowDict()).
         
         Returns:
             Dictionary containing file info, header fields, and analysis status.
@@ -325,14 +476,15 @@ class KymImage(AcqImage):
             parent_folder = parent1  # Use parent1 (date folder like "20251014")
         
         # Map to summary_row() keys and add analysis fields
+        analysis = self.getAnalysisRowDict() if include_analysis else dict.fromkeys(ANALYSIS_ROW_FIELDS)
         result = {
             "File Name": file_name,
-            "Analyzed": "True" if (radon := self.get_kym_analysis().get_analysis_object("RadonAnalysis")) and radon.has_analysis() else "False",
-            "Saved": "True" if not self.get_kym_analysis().is_dirty else "False",
+            "Analyzed": analysis["Analyzed"],
+            "Saved": analysis["Saved"],
             "Num Channels": self.num_channels(),
             "Num ROIS": self.rois.numRois(),
-            "Total Num Velocity Events": self.get_kym_analysis().total_num_velocity_events(),
-            "User Event": self.get_kym_analysis().num_user_added_velocity_events(),
+            "Total Num Velocity Events": analysis["Total Num Velocity Events"],
+            "User Event": analysis["User Event"],
             "Parent Folder": parent_folder,  # Use blinded or unblinded parent1
             "Grandparent Folder": grandparent_folder,
             "pixels": self.pixels_per_line if self.pixels_per_line is not None else "-",
@@ -355,7 +507,7 @@ class KymImage(AcqImage):
             "date": 'blinded' if blinded else self.experiment_metadata.date or "-",
 
             "note": self.experiment_metadata.note or "-",
-            "accepted": self.get_kym_analysis().get_accepted(),
+            "accepted": analysis["accepted"],
             "path": str(representative_path) if representative_path is not None else None,  # special case, not in any schema
         }
         
@@ -34,6 +34,7 @@ from kymflow.core.utils.hidden_cache_paths import (
 )
 
 if TYPE_CHECKING:
+    from kymflow.core.image_loaders.folder_watch import FolderChanges
     from kymflow.core.analysis.velocity_events.velocity_events import (
         BaselineDropParams,
         NanGapParams,
@@ -107,6 +108,7 @@ class KymImageList(AcqImageList[KymImage]):
         cancel_event: threading.Event | None = None,
         progress_cb: ProgressCallback | None = None,
         dedupe_olympus_multichannel: bool = True,
+        folder_catalog: bool = True,
     ):
         """Initialize KymImageList and automatically load files.
 
@@ -134,6 +136,9 @@ class KymImageList(AcqImageList[KymImage]):
             progress_cb: Optional progress callback for reporting progress.
             dedupe_olympus_multichannel: If True (default), collapse Olympus multi-channel
                 TIF paths to one list entry per acquisition before loading.
+            folder_catalog: If True (default), folder scans hydrate unchanged files'
+                Olympus header and metadata JSON from the folder's catalog
+                (see :class:`~kymflow.core.image_loaders.folder_catalog.FolderCatalog`).
         """
         # Hardcode image_cls=KymImage - this is a list of KymImage instances only
         super().__init__(
@@ -150,6 +155,7 @@ class KymImageList(AcqImageList[KymImage]):
             cancel_event=cancel_event,
             progress_cb=progress_cb,
             dedupe_olympus_multichannel=dedupe_olympus_multichannel,
+            folder_catalog=folder_catalog,
         )
         self._radon_report_cache: Dict[str, List[RadonReport]] = {}
         self._load_radon_report_db(progress_cb=progress_cb, cancel_event=cancel_event)
@@ -337,6 +343,90 @@ class KymImageList(AcqImageList[KymImage]):
                     )
             self.update_velocity_event_cache_only(image)
 
+    def apply_folder_changes(self, changes: "FolderChanges") -> "FolderChanges":
+        """Apply filesystem changes without rebuilding unchanged images.
+
+        Removed images are dropped, modified ones are re-created from disk and
+        added files are inserted in path order. The radon report and velocity
+        event caches are updated in memory for those images only (not
+        persisted). Images with unsaved analysis or metadata are left alone.
+
+        Args:
+            changes: Changes reported by a
+                :class:`~kymflow.core.image_loaders.folder_watch.FolderWatcher`.
+
+        Returns:
+            The changes that were applied.
+        """
+        from kymflow.core.image_loaders.folder_watch import FolderChanges
+
+        applied = FolderChanges()
+        by_path = {Path(image.path): image for image in self.images if image.path is not None}
+
+        for path in changes.removed:
+            image = by_path.pop(Path(path), None)
+            if image is None:
+                continue
+            if self._has_unsaved_changes(image):
+                logger.warning(f"Keeping {path}: deleted on disk but has unsaved changes")
+                continue
+            self.images.remove(image)
+            self._radon_report_cache.pop(str(image.path), None)
+            self._velocity_event_db.remove_path(image.path)
+            applied.removed.append(Path(path))
+
+        for path in changes.modified:
+            image = by_path.get(Path(path))
+            if image is None:
+                continue
+            if self._has_unsaved_changes(image):
+                logger.warning(f"Not reloading {path}: changed on disk but has unsaved changes")
+                continue
+            new_image = self._instantiate_image(Path(path), blind_index=image._blind_index)
+            if new_image is None:
+                continue
+            self.images[self.images.index(image)] = new_image
+            by_path[Path(path)] = new_image
+            self._update_caches_for_image(new_image)
+            applied.modified.append(Path(path))
+
+        next_blind_index = max((image._blind_index or 0 for image in self.images), default=-1) + 1
+        for path in changes.added:
+            path = Path(path)
+            if path in by_path or self.find_by_path(path) is not None:
+                continue
+            if not path.is_file() or not self._file_matches_filters(path):
+                continue
+            new_image = self._instantiate_image(path, blind_index=next_blind_index)
+            if new_image is None:
+                continue
+            next_blind_index += 1
+            index = next(
+                (i for i, image in enumerate(self.images) if image.path is not None and Path(image.path) > path),
+                len(self.images),
+            )
+            self.images.insert(index, new_image)
+            by_path[path] = new_image
+            self._update_caches_for_image(new_image)
+            applied.added.append(path)
+
+        if self.catalog is not None:
+            self.catalog.commit()
+        return applied
+
+    @staticmethod
+    def _has_unsaved_changes(image: KymImage) -> bool:
+        try:
+            return image.get_kym_analysis().is_dirty
+        except Exception:
+            return image.is_metadata_dirty
+
+    def _update_caches_for_image(self, image: KymImage) -> None:
+        """Refresh the in-memory radon report and velocity event rows of one image."""
+        if self._get_radon_db_path() is not None:
+            self.update_radon_report_cache_only(image)
+        self.update_velocity_event_cache_only(image)
+
     def get_velocity_event_df(self) -> pd.DataFrame:
         """Get velocity event database as a pandas DataFrame.
         
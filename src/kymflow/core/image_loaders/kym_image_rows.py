@@ -0,0 +1,221 @@
+"""Versioned table rows for a list of KymImage files.
+
+:class:`KymImageRowModel` builds file table rows in two passes. Header columns
+(file name, folders, experiment metadata, physical size) are computed eagerly
+for every file with ``getRowDict(include_analysis=False)``. Analysis columns
+(:data:`~kymflow.core.image_loaders.kym_image.ANALYSIS_ROW_FIELDS`) walk each
+file's KymAnalysis and are filled later, a batch at a time, by
+:meth:`KymImageRowModel.fill_analysis`.
+
+Every file has a version that is bumped when it is invalidated (or replaced by a
+new KymImage object). Rows are only recomputed when their version moved on, and
+only rows whose values actually changed are reported by
+:meth:`KymImageRowModel.pop_changed_rows`, so the grid receives just those.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from kymflow.core.image_loaders.kym_image import ANALYSIS_ROW_FIELDS
+from kymflow.core.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from kymflow.core.image_loaders.kym_image import KymImage
+
+logger = get_logger(__name__)
+
+Row = dict[str, object]
+
+
+def row_key(kym_image: "KymImage") -> str:
+    """Return the key identifying a file's row (its path, or the object id)."""
+    path = getattr(kym_image, "path", None)
+    return str(path) if path is not None else f"<id {id(kym_image)}>"
+
+
+class KymImageRowModel:
+    """Table rows for KymImage files with lazily filled analysis columns.
+
+    Attributes:
+        blinded: Whether rows are built with blinded file/folder names.
+    """
+
+    def __init__(self) -> None:
+        self.blinded: bool = False
+        self._order: list[str] = []
+        self._files: dict[str, "KymImage"] = {}
+        self._rows: dict[str, Row] = {}
+        # Current version per file, and the versions the header / analysis
+        # columns of its row were computed from.
+        self._versions: dict[str, int] = {}
+        self._header_versions: dict[str, int] = {}
+        self._analysis_versions: dict[str, int] = {}
+        # Keys whose row values changed since the last pop_changed_rows()
+        # (dict used as an ordered set).
+        self._changed: dict[str, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def set_files(self, files: Iterable["KymImage"], *, blinded: bool = False) -> bool:
+        """Set the files shown in the table and rebuild their header columns.
+
+        Files that are the same objects as before keep their rows (and analysis
+        columns) unless they were invalidated. New or replaced files get fresh
+        header columns and empty analysis columns.
+
+        Args:
+            files: Files in display order.
+            blinded: Build rows with blinded names (a change invalidates all rows).
+
+        Returns:
+            True if the set or order of rows changed (the grid needs a full
+            reload), False if at most individual row values changed.
+        """
+        if blinded != self.blinded:
+            self.blinded = blinded
+            self.invalidate_all()
+
+        order: list[str] = []
+        files_by_key: dict[str, "KymImage"] = {}
+        for kym_image in files:
+            key = row_key(kym_image)
+            if key in files_by_key:
+                logger.warning("Duplicate file in table: %s", key)
+                continue
+            order.append(key)
+            files_by_key[key] = kym_image
+            if self._files.get(key) is not kym_image:
+                self._versions[key] = self._versions.get(key, 0) + 1
+                self._rows.pop(key, None)
+                self._analysis_versions.pop(key, None)
+
+        for key in set(self._files) - set(files_by_key):
+            self._forget(key)
+        self._files = files_by_key
+
+        structure_changed = order != self._order
+        self._order = order
+        self.refresh_headers()
+        return structure_changed
+
+    def _forget(self, key: str) -> None:
+        self._rows.pop(key, None)
+        self._versions.pop(key, None)
+        self._header_versions.pop(key, None)
+        self._analysis_versions.pop(key, None)
+        self._changed.pop(key, None)
+
+    def _store(self, key: str, row: Row) -> None:
+        if self._rows.get(key) != row:
+            self._rows[key] = row
+            self._changed[key] = None
+
+    def _build_header(self, key: str) -> None:
+        row = self._files[key].getRowDict(blinded=self.blinded, include_analysis=False)
+        previous = self._rows.get(key)
+        if previous is not None:
+            # Keep the last analysis values on screen until they are refreshed.
+            for field in ANALYSIS_ROW_FIELDS:
+                row[field] = previous.get(field)
+        self._header_versions[key] = self._versions[key]
+        self._store(key, row)
+
+    def rows(self) -> list[Row]:
+        """Return the current rows in display order (analysis columns may be None)."""
+        return [self._rows[key] for key in self._order]
+
+    def row(self, key: str) -> Optional[Row]:
+        """Return the current row for ``key``, or None."""
+        return self._rows.get(key)
+
+    def file(self, key: str) -> Optional["KymImage"]:
+        """Return the file for ``key``, or None."""
+        return self._files.get(key)
+
+    def version(self, key: str) -> int:
+        """Return the current version of a file's row (0 if unknown)."""
+        return self._versions.get(key, 0)
+
+    def invalidate(self, key: str, kym_image: Optional["KymImage"] = None) -> bool:
+        """Mark one file's row as dirty and rebuild its header columns now.
+
+        Args:
+            key: Row key (see :func:`row_key`).
+            kym_image: Replacement object for the file, if it changed.
+
+        Returns:
+            True if the file is in the table.
+        """
+        if key not in self._files:
+            return False
+        if kym_image is not None:
+            self._files[key] = kym_image
+        self._versions[key] += 1
+        self._build_header(key)
+        return True
+
+    def invalidate_all(self) -> None:
+        """Mark every row dirty (headers are rebuilt by the next set_files/refresh)."""
+        for key in self._versions:
+            self._versions[key] += 1
+
+    def refresh_headers(self) -> None:
+        """Rebuild header columns of all rows whose version moved on."""
+        for key in self._order:
+            if self._header_versions.get(key) != self._versions[key]:
+                self._build_header(key)
+
+    def set_row(self, key: str, row: Row) -> bool:
+        """Replace a row with values computed elsewhere (treated as up to date).
+
+        Returns:
+            True if the file is in the table.
+        """
+        if key not in self._files:
+            return False
+        self._header_versions[key] = self._versions[key]
+        self._analysis_versions[key] = self._versions[key]
+        self._store(key, dict(row))
+        return True
+
+    def pending_analysis(self) -> int:
+        """Number of rows whose analysis columns are missing or stale."""
+        return sum(
+            1 for key in self._order if self._analysis_versions.get(key) != self._versions[key]
+        )
+
+    def fill_analysis(self, max_rows: Optional[int] = None) -> int:
+        """Compute analysis columns for the next stale rows, in display order.
+
+        Args:
+            max_rows: Maximum number of rows to compute; None computes all.
+
+        Returns:
+            Number of rows computed.
+        """
+        done = 0
+        for key in self._order:
+            if max_rows is not None and done >= max_rows:
+                break
+            version = self._versions[key]
+            if self._analysis_versions.get(key) == version:
+                continue
+            try:
+                analysis = self._files[key].getAnalysisRowDict()
+            except Exception:
+                logger.exception("Failed to compute analysis columns for %s", key)
+                analysis = {}
+            row = dict(self._rows[key])
+            row.update(analysis)
+            self._analysis_versions[key] = version
+            self._store(key, row)
+            done += 1
+        return done
+
+    def pop_changed_rows(self) -> list[Row]:
+        """Return rows whose values changed since the last call, and reset."""
+        changed = [self._rows[key] for key in self._changed if key in self._rows]
+        self._changed.clear()
+        return changed
@@ -0,0 +1,138 @@
+"""Single-pass, memoized reader for the fields kymflow uses from Olympus .txt headers.
+
+Olympus exports one tab-separated ``.txt`` per acquisition, e.g.::
+
+    "X Dimension"	"38, 0.0 - 10.796 [um], 0.284 [um/pixel]"
+
+:func:`read_olympus_txt_fields` looks only at the keys in ``_FIELD_PATTERNS``,
+stops reading as soon as all of them were found, and keeps the result for the
+lifetime of the process keyed by path, size and modification time. It is shared
+by ``_readOlympusHeader``, ``read_olympus_header_2`` and the image loader
+plugins, so the channel TIFFs of one acquisition and repeated folder loads
+parse a header once.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from kymflow.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Maximum number of parsed headers kept in memory (least recently used are dropped).
+OLYMPUS_TXT_CACHE_SIZE = 4096
+
+_NUMBER = r"[-+]?\d+(?:\.\d+)?"
+
+# Header key -> pattern applied to its (unquoted) value.
+_FIELD_PATTERNS: dict[str, re.Pattern[str]] = {
+    # "1 [Ch]"
+    "Channel Dimension": re.compile(r"^\s*(\d+)"),
+    # "38, 0.0 - 10.796 [um], 0.284 [um/pixel]"
+    "X Dimension": re.compile(rf"({_NUMBER})\s*\[um/pixel\]"),
+    # "1, 0.000 - 35.099 [s], Interval FreeRun"
+    "T Dimension": re.compile(rf",\s*{_NUMBER}\s*-\s*({_NUMBER})"),
+    # "38 * 30000 [pixel]" (the first one; [Reference Image] repeats the key)
+    "Image Size": re.compile(r"^\s*(\d+)\s*\*\s*(\d+)"),
+    # "11/02/2022 12:54:17.359 PM"
+    "Date": re.compile(r"^\s*(\S+)\s+([^\s.]+)"),
+    # "12 [bits]"
+    "Bits/Pixel": re.compile(r"^\s*(\d+)"),
+}
+
+_cache: "OrderedDict[str, tuple[tuple[int, int], dict[str, Any]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _fields_from_match(key: str, match: re.Match[str], value: str) -> dict[str, Any]:
+    if key == "Channel Dimension":
+        return {"numChannels": int(match.group(1))}
+    if key == "X Dimension":
+        return {"umPerPixel": float(match.group(1))}
+    if key == "T Dimension":
+        return {"durImage_sec": float(match.group(1))}
+    if key == "Image Size":
+        return {"pixelsPerLine": int(match.group(1)), "numLines": int(match.group(2))}
+    if key == "Date":
+        return {
+            "dateStr": match.group(1),
+            "timeStr": match.group(2),
+            "olympusDateTimeCombined": value,
+        }
+    return {"bitsPerPixel": int(match.group(1))}
+
+
+def _parse_olympus_txt(txt_path: str) -> dict[str, Any]:
+    """Read the header fields of ``txt_path`` (no caching)."""
+    fields: dict[str, Any] = {}
+    remaining = set(_FIELD_PATTERNS)
+    with open(txt_path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            key, sep, value = line.partition("\t")
+            if not sep:
+                continue
+            key = key.strip().strip('"')
+            if key not in remaining:
+                continue
+            value = value.strip().strip('"')
+            match = _FIELD_PATTERNS[key].search(value)
+            if match is None:
+                logger.warning(f'Unexpected Olympus header value {key}="{value}" in {txt_path}')
+                continue
+            fields.update(_fields_from_match(key, match, value))
+            remaining.discard(key)
+            if not remaining:
+                break
+    return fields
+
+
+def read_olympus_txt_fields(txt_path: str | Path) -> Optional[dict[str, Any]]:
+    """Return the acquisition fields of an Olympus ``.txt`` header.
+
+    Args:
+        txt_path: Path to the header file.
+
+    Returns:
+        Dict with the keys that were found among ``numChannels``, ``umPerPixel``,
+        ``durImage_sec``, ``pixelsPerLine``, ``numLines``, ``dateStr``,
+        ``timeStr`` (without fractional seconds), ``olympusDateTimeCombined``
+        and ``bitsPerPixel``. None if the file does not exist. The dict is a
+        copy; callers may modify it.
+    """
+    key = os.path.abspath(txt_path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return None
+    signature = (int(st.st_size), int(st.st_mtime_ns))
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == signature:
+            _cache.move_to_end(key)
+            return dict(cached[1])
+
+    try:
+        fields = _parse_olympus_txt(key)
+    except OSError as e:
+        logger.error(f"Could not read Olympus header {key}: {e}")
+        return None
+
+    with _cache_lock:
+        _cache[key] = (signature, fields)
+        _cache.move_to_end(key)
+        while len(_cache) > OLYMPUS_TXT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return dict(fields)
+
+
+def clear_olympus_txt_cache() -> None:
+    """Forget all parsed headers."""
+    with _cache_lock:
+        _cache.clear()
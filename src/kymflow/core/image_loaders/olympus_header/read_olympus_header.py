@@ -14,6 +14,7 @@ from pathlib import Path
 from dataclasses import asdict, fields
 
 from kymflow.core.image_loaders.metadata import field_metadata
+from kymflow.core.image_loaders.olympus_header.olympus_txt_fields import read_olympus_txt_fields
 
 from kymflow.core.utils.logging import get_logger
 logger = get_logger(__name__)
@@ -260,6 +261,53 @@ def _get_channel_from_tif_filename(tifPath: str) -> int | None:
         return 3
     return None
 
+def _olympus_txt_candidate(tifPath: str | Path) -> str:
+    """Return the path the Olympus .txt file of a TIFF file would have.
+
+    The file may not exist (see _find_olympus_txt_file).
+    """
+    _tifFilename = os.path.basename(tifPath)
+    channel = _get_channel_from_tif_filename(tifPath)
+
+    if channel is None:
+        # single channel txt file matches tif file
+        return os.path.splitext(tifPath)[0] + ".txt"
+
+    chStub = f"_C{channel:03d}" # pad channel number with zeros to 3 digits
+
+    # replace everything in name after chStub
+    chStubIndex = _tifFilename.find(chStub)
+    olympusTxtFile = _tifFilename[0:chStubIndex] + ".txt"
+    return os.path.join(os.path.split(tifPath)[0], olympusTxtFile)
+
+def _olympus_channel_tif_candidates(tifPath: str | Path, numChannels: int) -> dict[int, str | Path]:
+    """Return the paths the channel TIFF files of a TIFF file would have.
+
+    Siblings differ only in the ``C00n`` channel stub. A file name without a
+    channel stub is a single channel. The files may not exist.
+
+    Args:
+        tifPath: Path of one channel TIFF.
+        numChannels: Number of channels from the Olympus header.
+
+    Returns:
+        Dict mapping 1-based channel number to path, including ``tifPath``.
+    """
+    _givenChannelNumber = _get_channel_from_tif_filename(tifPath)  # 1 based channel number
+    if _givenChannelNumber is None:
+        # no channel number in filename
+        return {1: tifPath}
+    _channelDict: dict[int, str | Path] = {_givenChannelNumber: tifPath}
+    _chStub = f"C{_givenChannelNumber:03d}" # pad channel number with zeros to 3 digits
+    tifFileName = os.path.basename(tifPath)
+    for channelIdx in range(numChannels):
+        channelNumber = channelIdx + 1
+        if channelNumber != _givenChannelNumber:
+            _channelDict[channelNumber] = os.path.join(
+                os.path.split(tifPath)[0], tifFileName.replace(_chStub, f"C{channelNumber:03d}")
+            )
+    return _channelDict
+
 def _find_olympus_txt_file(tifPath: str | Path) -> str | None:
     """Find the Olympus .txt file corresponding to the given TIFF file.
 
@@ -271,20 +319,8 @@ def _find_olympus_txt_file(tifPath: str | Path) -> str | None:
         Path to the Olympus .txt file.
         None if the .txt file is not found.
     """
-    _tifFilename = os.path.basename(tifPath)
-    channel = _get_channel_from_tif_filename(tifPath)
+    olympusTxtPath = _olympus_txt_candidate(tifPath)
 
-    if channel is None:
-        # single channel txt file matches tif file
-        olympusTxtPath = os.path.splitext(tifPath)[0] + ".txt"
-    else:
-        chStub = f"_C{channel:03d}" # pad channel number with zeros to 3 digits
-
-        # replace everything in name after chStub
-        chStubIndex = _tifFilename.find(chStub)
-        olympusTxtFile = _tifFilename[0:chStubIndex] + ".txt"
-        olympusTxtPath = os.path.join(os.path.split(tifPath)[0], olympusTxtFile)
-    
     if not os.path.isfile(olympusTxtPath):
         # logger.warning(f"did not find Olympus header: {olympusTxtPath}")
         return None
@@ -300,6 +336,9 @@ def _readOlympusHeader(tifPath: str | Path) -> dict | None:
     including spatial resolution (um/pixel), temporal resolution (seconds/line),
     image dimensions, and acquisition date/time.
 
+    The header fields come from :func:`read_olympus_txt_fields`, which caches
+    them per .txt file, so the channel TIFFs of one acquisition share one parse.
+
     The function looks for specific header lines:
     - "X Dimension": Contains spatial resolution (um/pixel)
     - "T Dimension": Contains total duration (seconds)
@@ -345,70 +384,16 @@ def _readOlympusHeader(tifPath: str | Path) -> dict | None:
         "olympusTxtPath": olympusTxtPath,
     }
 
-    pixelsPerLine = None
-
-    with open(olympusTxtPath) as f:
-        for line in f:
-            line = line.strip()
-
-            # abb 20251216
-            # "Channel Dimension"	"1 [Ch]"
-            if line.startswith('"Channel Dimension"'):
-                _oneLine = line.replace('"', '')
-                _oneLine = _oneLine.split()
-                # print('_oneLine:', _oneLine)
-                channel = _oneLine[2]
-                retDict["numChannels"] = int(channel)
-
-            # "X Dimension"	"38, 0.0 - 10.796 [um], 0.284 [um/pixel]"
-            if line.startswith('"X Dimension"'):
-                oneLine = line.split()
-                umPerPixel = oneLine[7]  # um/pixel
-                # print('umPerPixel:', umPerPixel)
-                retDict["umPerPixel"] = float(umPerPixel)
-
-            # "T Dimension"	"1, 0.000 - 35.099 [s], Interval FreeRun"
-            if line.startswith('"T Dimension"'):
-                oneLine = line.split()
-                durImage_sec = oneLine[5]  # imaging duration
-                # print('durImage_sec:', durImage_sec)
-                retDict["durImage_sec"] = float(durImage_sec)
-
-            # "Image Size"	"38 * 30000 [pixel]"
-            if line.startswith('"Image Size"'):
-                if pixelsPerLine is None:
-                    oneLine = line.split()
-                    pixelsPerLine = oneLine[2].replace('"', "")
-                    numLines = oneLine[4].replace('"', "")
-                    # print('pixelsPerLine:', pixelsPerLine)
-                    # print('numLines:', numLines)
-                    retDict["pixelsPerLine"] = int(pixelsPerLine)
-                    retDict["numLines"] = int(numLines)
-
-            # "Date"	"11/02/2022 12:54:17.359 PM"
-            if line.startswith('"Date"'):
-                oneLine = line.split()
-                dateStr = oneLine[1].replace('"', "")
-                timeStr = oneLine[2]
-                dotIndex = timeStr.find(".")
-                if dotIndex != -1:
-                    timeStr = timeStr[0:dotIndex]
-                # print('dateStr:', dateStr)
-                # print('timeStr:', timeStr)
-                retDict["dateStr"] = dateStr
-                retDict["timeStr"] = timeStr
-
-            # "Bits/Pixel"	"12 [bits]"
-            if line.startswith('"Bits/Pixel"'):
-                oneLine = line.split()
-                bitsPerPixel = oneLine[1].replace('"', "")
-                # print('bitsPerPixel:', bitsPerPixel)
-                retDict["bitsPerPixel"] = int(bitsPerPixel)
+    fields = read_olympus_txt_fields(olympusTxtPath)
+    if fields is None:
+        return None
+    fields.pop("olympusDateTimeCombined", None)
+    retDict.update(fields)
 
     # april 5, 2023
     if retDict["durImage_sec"] is None:
         logger.error("did not get durImage_sec")
-    else:
+    elif retDict["numLines"]:
         retDict["secondsPerLine"] = retDict["durImage_sec"] / retDict["numLines"]
 
     if retDict["umPerPixel"] is None:
@@ -416,26 +401,15 @@ def _readOlympusHeader(tifPath: str | Path) -> dict | None:
 
     # abb 20251216
     # now that we have numChannels, we can find the other channel tif files
-    _givenChannelNumber = _get_channel_from_tif_filename(tifPath)  # 1 based channel number
     _channelDict = {}
-    if _givenChannelNumber is None:
-        # no channel number in filename
-        _channelDict = {1: tifPath}
-    else:
-        _channelDict = {_givenChannelNumber: tifPath}
-        _chStub = f"C{_givenChannelNumber:03d}" # pad channel number with zeros to 3 digits
-        tifFileName = os.path.basename(tifPath)
-        for channelIdx in range(retDict["numChannels"]):
-            channelNumber = channelIdx + 1
-            if channelNumber == _givenChannelNumber:
-                continue
-            else:
-                otherChannelTifPath = os.path.join(os.path.split(tifPath)[0], tifFileName.replace(_chStub, f"C{channelNumber:03d}"))
-                if not os.path.isfile(otherChannelTifPath):
-                    logger.warning(f"did not find Olympus otherChannelTifPath: {otherChannelTifPath}")
-                    _channelDict[channelNumber] = None
-                else:
-                    _channelDict[channelNumber] = otherChannelTifPath
+    for channelNumber, channelTifPath in _olympus_channel_tif_candidates(
+        tifPath, retDict.get("numChannels", 1)
+    ).items():
+        if channelTifPath is tifPath or os.path.isfile(channelTifPath):
+            _channelDict[channelNumber] = channelTifPath
+        else:
+            logger.warning(f"did not find Olympus otherChannelTifPath: {channelTifPath}")
+            _channelDict[channelNumber] = None
 
     retDict['tifChannelPaths'] = _channelDict
 
@@ -9,6 +9,7 @@ import re
 from pathlib import Path
 from typing import Any, Iterable
 
+from kymflow.core.image_loaders.olympus_header.olympus_txt_fields import read_olympus_txt_fields
 from kymflow.core.utils.logging import get_logger
 logger = get_logger(__name__)
 
@@ -240,17 +241,13 @@ def pretty_print_all(parsed: ParsedHeader) -> None:
 
 
 def read_olympus_header_2(olympusTxtPath: str | Path) -> dict[str, Any]:
-    """Read and parse an olympus header txtx file.
+    """Read the acquisition fields of an olympus header txt file.
+
+    Uses the cached single-pass reader shared with ``_readOlympusHeader``; use
+    :func:`parse_olympus_header_file` for all sections.
     """
-    from .extractors import (
-        extract_int,
-        extract_image_size_pixels,
-        extract_um_per_pixel_from_x_dimension,
-        extract_duration_sec_from_t_dimension,
-    )
-
-    parsed = parse_olympus_header_file(olympusTxtPath)
-    if parsed is None:
+    fields = read_olympus_txt_fields(olympusTxtPath)
+    if fields is None:
         return None
 
     retDict = {
@@ -265,37 +262,8 @@ def read_olympus_header_2(olympusTxtPath: str | Path) -> dict[str, Any]:
         "numChannels": None,
         "olympusTxtPath": str(olympusTxtPath),
     }
-
-    # Channel Dimension: "2 [Ch]" or "1[Ch]"
-    retDict["numChannels"] = extract_int(parsed.dimensions.get("Channel Dimension"))
-
-    # X Dimension: "... 0.414 [um/pixel]"
-    retDict["umPerPixel"] = extract_um_per_pixel_from_x_dimension(parsed.dimensions.get("X Dimension"))
-
-    # T Dimension: "... 0.000 - 35.099 [s] ..."
-    retDict["durImage_sec"] = extract_duration_sec_from_t_dimension(parsed.dimensions.get("T Dimension"))
-
-    # Image Size: "38 * 30000 [pixel]"
-    img_size = extract_image_size_pixels(parsed.image.get("Image Size"))
-    if img_size is not None:
-        retDict["pixelsPerLine"], retDict["numLines"] = img_size
-
-    # Date: "09/08/2022 11:36:50.978 AM"
-    date_raw = parsed.general.get("Date")
-    if date_raw:
-        # keep it simple: split on space -> date + time + AM/PM (time may include .ms)
-        parts = date_raw.split()
-        if len(parts) >= 2:
-            retDict["dateStr"] = parts[0]
-            time_part = parts[1].split(".")[0]  # drop milliseconds if present
-            retDict["timeStr"] = time_part
-
-    # Bits/Pixel: "12 [bits]"
-    # (this works whether or not you used parse_units_for in a channel-summary call)
-    retDict["bitsPerPixel"] = extract_int(parsed.acquisition.get("Bits/Pixel")) or extract_int(
-        # some files may put Bits/Pixel in the channel section instead
-        (parsed.channels[0].get("Bits/Pixel") if parsed.channels else None)
-    )
+    fields.pop("olympusDateTimeCombined", None)
+    retDict.update(fields)
 
     # Derived:
     if retDict["durImage_sec"] is not None and retDict["numLines"]:
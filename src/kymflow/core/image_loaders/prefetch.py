@@ -0,0 +1,250 @@
+"""Background prefetch of the files next to the current selection.
+
+Next/previous navigation moves through a file list one file at a time, and
+every step used to pay for reading the channel image from disk on the GUI
+thread. :class:`NeighborPrefetcher` loads the displayed channel
+(:meth:`AcqImage.load_channel`) of the ``neighbors`` files before and after the
+current one in a single daemon thread, nearest first. Nothing else is built:
+the viewer draws straight from the channel data, and velocity analysis is
+loaded with each KymImage.
+
+Channel data the prefetcher loaded itself is dropped again
+(:meth:`AcqImage.unload_channel`) when its file leaves the window or would push
+prefetched data over ``max_bytes``. The display caches hold images weakly, so
+dropping the data frees it. A new :meth:`NeighborPrefetcher.schedule` call (the
+user jumped elsewhere) cancels the work in progress.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from kymflow.core.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from kymflow.core.image_loaders.acq_image import AcqImage
+
+logger = get_logger(__name__)
+
+# Files prefetched on each side of the current one.
+DEFAULT_PREFETCH_NEIGHBORS = 1
+
+# Budget for channel data held by the prefetcher (bytes).
+DEFAULT_PREFETCH_MAX_BYTES = 512 * 1024 * 1024
+
+
+def neighbor_order(n_files: int, index: int, neighbors: int) -> list[int]:
+    """Return indices around ``index``, nearest first, next before previous.
+
+    Args:
+        n_files: Length of the file list.
+        index: Index of the current file.
+        neighbors: Number of files on each side.
+
+    Returns:
+        Valid indices, e.g. ``[i+1, i-1, i+2, i-2]`` for ``neighbors=2``.
+    """
+    order: list[int] = []
+    for step in range(1, max(int(neighbors), 0) + 1):
+        for i in (index + step, index - step):
+            if 0 <= i < n_files:
+                order.append(i)
+    return order
+
+
+class NeighborPrefetcher:
+    """Prefetch the displayed channel of neighbouring files.
+
+    Args:
+        neighbors: Files prefetched on each side of the current one.
+        max_bytes: Maximum size of channel data loaded by the prefetcher.
+    """
+
+    def __init__(
+        self,
+        *,
+        neighbors: int = DEFAULT_PREFETCH_NEIGHBORS,
+        max_bytes: int = DEFAULT_PREFETCH_MAX_BYTES,
+    ) -> None:
+        self.neighbors = int(neighbors)
+        self.max_bytes = int(max_bytes)
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._targets: list["AcqImage"] = []
+        self._current: Optional["AcqImage"] = None
+        self._channel: Optional[int] = None
+        self._pending = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        # Channels whose data this prefetcher loaded, by file identity.
+        self._owned: dict[int, tuple["AcqImage", set[int]]] = {}
+        self._idle = threading.Event()
+        self._idle.set()
+
+    def schedule(
+        self,
+        files: Sequence["AcqImage"],
+        current: Optional["AcqImage"],
+        channel: Optional[int] = None,
+    ) -> None:
+        """Prefetch around ``current`` in ``files``, cancelling earlier work.
+
+        ``current`` is being displayed, so its data is no longer the
+        prefetcher's to drop. Prefetched data of files outside the new window
+        is released.
+
+        Args:
+            files: Files in navigation order.
+            current: Selected file (looked up by identity), or None to only cancel.
+            channel: Displayed channel. Neighbours without it (or all files when
+                None) are prefetched with their first available channel.
+        """
+        index = next((i for i, f in enumerate(files) if f is current), None) if current is not None else None
+        targets = (
+            [files[i] for i in neighbor_order(len(files), index, self.neighbors)]
+            if index is not None
+            else []
+        )
+        with self._cond:
+            self._generation += 1
+            self._targets = targets
+            self._current = current
+            self._channel = channel
+            self._pending = bool(targets)
+            if current is not None:
+                self._owned.pop(id(current), None)
+            keep = {id(f) for f in targets}
+            stale = [key for key in self._owned if key not in keep]
+            released = [self._owned.pop(key) for key in stale]
+            if targets:
+                self._idle.clear()
+                self._ensure_thread()
+            self._cond.notify()
+        for kf, channels in released:
+            self._release(kf, channels)
+
+    def cancel(self) -> None:
+        """Stop prefetching and release all prefetched channel data."""
+        with self._cond:
+            self._generation += 1
+            self._targets = []
+            self._current = None
+            self._pending = False
+            released = list(self._owned.values())
+            self._owned.clear()
+        for kf, channels in released:
+            self._release(kf, channels)
+
+    def close(self) -> None:
+        """Cancel and stop the worker thread."""
+        self.cancel()
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._idle.set()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until the scheduled window is done (for tests and batch use).
+
+        Returns:
+            True if idle, False on timeout.
+        """
+        return self._idle.wait(timeout)
+
+    def prefetched_bytes(self) -> int:
+        """Size of the channel data currently held by the prefetcher."""
+        with self._cond:
+            owned = list(self._owned.values())
+        return sum(_channel_bytes(kf, channels) for kf, channels in owned)
+
+    def is_prefetched(self, kf: "AcqImage") -> bool:
+        """True if some of ``kf``'s channel data was loaded by the prefetcher."""
+        with self._cond:
+            return id(kf) in self._owned
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="kymflow-prefetch", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._idle.set()
+                    self._cond.wait()
+                if self._closed:
+                    return
+                generation = self._generation
+                targets = list(self._targets)
+                channel = self._channel
+                self._pending = False
+            for kf in targets:
+                if not self._is_current(generation):
+                    break
+                try:
+                    if not self._prefetch_file(kf, channel, generation):
+                        break
+                except Exception:
+                    logger.exception("Prefetch failed for %s", getattr(kf, "path", kf))
+            with self._cond:
+                if not self._pending:
+                    self._idle.set()
+
+    def _is_current(self, generation: int) -> bool:
+        return generation == self._generation and not self._closed
+
+    def _prefetch_file(self, kf: "AcqImage", channel: Optional[int], generation: int) -> bool:
+        """Load one file's channel; False when the budget is used up or the window moved."""
+        available = kf.channels_available()
+        if not available:
+            return True
+        if channel not in available:
+            channel = available[0]
+        if kf.getChannelData(channel) is not None:
+            return True
+        if not kf.load_channel(channel):
+            return True
+        return self._adopt(kf, channel, generation)
+
+    def _adopt(self, kf: "AcqImage", channel: int, generation: int) -> bool:
+        """Record a channel loaded by the prefetcher, or drop it again."""
+        with self._cond:
+            if kf is self._current:
+                # Selected meanwhile: the data now belongs to the display.
+                return False
+            keep = self._is_current(generation) and any(f is kf for f in self._targets)
+            owned: list[tuple["AcqImage", set[int]]] = []
+            if keep:
+                _kf, channels = self._owned.setdefault(id(kf), (kf, set()))
+                channels.add(channel)
+                owned = list(self._owned.values())
+        if keep and sum(_channel_bytes(f, chs) for f, chs in owned) <= self.max_bytes:
+            return True
+        if keep:
+            logger.debug("Prefetch budget of %d bytes reached at %s", self.max_bytes, kf.path)
+            with self._cond:
+                entry = self._owned.get(id(kf))
+                if entry is not None:
+                    entry[1].discard(channel)
+                    if not entry[1]:
+                        self._owned.pop(id(kf))
+        self._release(kf, {channel})
+        return False
+
+    @staticmethod
+    def _release(kf: "AcqImage", channels: set[int]) -> None:
+        for channel in channels:
+            kf.unload_channel(channel)
+
+
+def _channel_bytes(kf: "AcqImage", channels: set[int]) -> int:
+    total = 0
+    for channel in channels:
+        data = kf.getChannelData(channel)
+        if data is not None:
+            total += int(data.nbytes)
+    return total
@@ -23,7 +23,7 @@ from kymflow.core.analysis.utils import _medianFilter, _removeOutliers_sd, _remo
 from kymflow.core.utils.logging import get_logger
 from kymflow.core.image_loaders.acq_analysis_base import AcqAnalysisBase
 from kymflow.core.image_loaders.radon_report import RadonReport
-from kymflow.core.image_loaders.roi import ROI
+from kymflow.core.image_loaders.roi import ROI, roi_image_stats
 
 if TYPE_CHECKING:
     from kymflow.core.image_loaders.acq_image import AcqImage
@@ -692,6 +692,12 @@ class RadonAnalysis(AcqAnalysisBase):
                 img_max = roi.img_max
                 img_mean = float(roi.img_mean) if roi.img_mean is not None else None
                 img_std = float(roi.img_std) if roi.img_std is not None else None
+                if None in (img_min, img_max, img_mean, img_std):
+                    # Memoized and read from a memory map; does not load the image.
+                    try:
+                        img_min, img_max, img_mean, img_std = roi_image_stats(self.acq_image, roi)
+                    except ValueError as e:
+                        logger.debug(f"No image stats for ROI {roi_id}: {e}")
 
             report.append(RadonReport(
                 roi_id=roi_id,
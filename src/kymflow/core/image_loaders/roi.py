@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import os
+import threading
+import weakref
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, ClassVar, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Union
 
 import numpy as np
 
@@ -11,6 +16,12 @@ from kymflow.core.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of memoized ROI image stats (least recently used are dropped).
+ROI_STATS_CACHE_SIZE = 4096
+
+# Pixels read per chunk when computing ROI stats (bounds memory for memmapped data).
+_STATS_CHUNK_PIXELS = 1 << 20
+
 if TYPE_CHECKING:
     # KymImage is used for type hints only - may not exist in all environments
     try:
@@ -190,53 +201,15 @@ class RectROI(BaseROI):
         
         Extracts the image region defined by this ROI's bounds, channel, and z,
         then calculates min, max, mean, and std. Updates the ROI's image stats
-        attributes in place.
+        attributes in place. Results are memoized, see roi_image_stats().
         
         Args:
             acq_image: AcqImage instance containing the image data.
             
         Raises:
-            ValueError: If channel doesn't exist or image data isn't loaded.
+            ValueError: If channel doesn't exist or image data isn't available.
         """
-        # Get 2D image slice for this ROI's channel and z.
-        # Prefer explicit get_img_slice; fall back to channel arrays.
-        if hasattr(acq_image, "get_img_slice"):
-            img_slice = acq_image.get_img_slice(slice_num=self.z, channel=self.channel)
-            if img_slice is None:
-                raise ValueError("Image data not available")
-        else:
-            arr: np.ndarray | None
-            if hasattr(acq_image, "get_channel"):
-                arr = acq_image.get_channel(self.channel)
-            elif hasattr(acq_image, "getChannelData"):
-                arr = acq_image.getChannelData(self.channel)
-            else:
-                raise ValueError("AcqImage does not provide a channel accessor")
-            if arr is None:
-                raise ValueError("Image data not available")
-            if arr.ndim == 2:
-                img_slice = arr
-            elif arr.ndim >= 3:
-                if self.z < 0 or self.z >= arr.shape[0]:
-                    raise ValueError(f"z index out of range: {self.z}")
-                img_slice = arr[self.z]
-            else:
-                raise ValueError(f"Unsupported image ndim for ROI stats: {arr.ndim}")
-        
-        # Extract ROI region from the image
-        # ROI bounds: dim0 = rows (height), dim1 = cols (width)
-        roi_region = img_slice[
-            self.bounds.dim0_start : self.bounds.dim0_stop,
-            self.bounds.dim1_start : self.bounds.dim1_stop
-        ]
-        
-        # Calculate statistics
-        # Note: We recalculate each time (no caching). Alternative: cache image slice
-        # if performance becomes an issue, but for now KISS.
-        self.img_min = int(np.min(roi_region))
-        self.img_max = int(np.max(roi_region))
-        self.img_mean = float(np.mean(roi_region))
-        self.img_std = float(np.std(roi_region))
+        self.img_min, self.img_max, self.img_mean, self.img_std = roi_image_stats(acq_image, self)
 
     def to_dict(self) -> dict[str, Any]:
         """Return a JSON-serializable envelope representation of this RectROI."""
@@ -398,6 +371,188 @@ def roi_from_dict(data: dict[str, Any]) -> BaseROI:
 ROI = RectROI
 
 
+# Pixels identity: (abspath, size, mtime_ns) of a file, or
+# (data pointer, shape, strides, dtype) of a read-only in-memory array.
+_PixelsIdentity = Union[tuple[str, int, int], tuple[int, tuple[int, ...], tuple[int, ...], str]]
+# (identity, channel, z, dim0_start, dim0_stop, dim1_start, dim1_stop)
+_StatsKey = tuple[_PixelsIdentity, int, int, int, int, int, int]
+
+# Entries of in-memory arrays hold a weak reference to the array owning the
+# memory; its finalizer queues the reference and the entry is evicted on the
+# next cache access.
+_stats_cache: "OrderedDict[_StatsKey, tuple[weakref.ref | None, tuple[int, int, float, float]]]" = OrderedDict()
+_stats_cache_lock = threading.Lock()
+_finalized_refs: "deque[weakref.ref]" = deque()
+
+
+def _purge_finalized() -> None:
+    """Evict entries whose array was garbage collected (call with the lock held)."""
+    if not _finalized_refs:
+        return
+    dead = set()
+    while _finalized_refs:
+        dead.add(id(_finalized_refs.popleft()))
+    for key in [k for k, (ref, _stats) in _stats_cache.items() if id(ref) in dead]:
+        del _stats_cache[key]
+
+
+def _owner_array(source: np.ndarray) -> np.ndarray:
+    """Return the outermost ndarray whose memory ``source`` views."""
+    while isinstance(source.base, np.ndarray):
+        source = source.base
+    return source
+
+
+def _channel_source(acq_image: "AcqImage", channel: int) -> np.ndarray | None:
+    """Return the channel array, preferring access that does not load the image."""
+    if hasattr(acq_image, "get_channel_view"):
+        return acq_image.get_channel_view(channel)
+    if hasattr(acq_image, "get_channel"):
+        return acq_image.get_channel(channel)
+    if hasattr(acq_image, "getChannelData"):
+        return acq_image.getChannelData(channel)
+    raise ValueError("AcqImage does not provide a channel accessor")
+
+
+def _file_identity(acq_image: "AcqImage", channel: int) -> tuple[str, int, int] | None:
+    """Identify the pixels of a path-backed channel by file path, size and mtime."""
+    get_path = getattr(acq_image, "getChannelPath", None)
+    path = get_path(channel) if callable(get_path) else None
+    if not isinstance(path, (str, Path)):
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), int(st.st_size), int(st.st_mtime_ns))
+
+
+def _image_plane(source: np.ndarray, z: int) -> np.ndarray:
+    if source.ndim == 2:
+        return source
+    if source.ndim == 3:
+        if z < 0 or z >= source.shape[0]:
+            raise ValueError(f"z index out of range: {z}")
+        return source[z]
+    raise ValueError(f"Unsupported image ndim for ROI stats: {source.ndim}")
+
+
+def _region_stats(region: np.ndarray) -> tuple[int, int, float, float]:
+    """Return (min, max, mean, std) of ``region`` reading each row block once.
+
+    Blocks of rows are reduced while in cache and merged with Chan's parallel
+    variance update, so memmapped data is streamed from disk a single time.
+    """
+    if region.size == 0:
+        raise ValueError("ROI region is empty")
+    rows_per_chunk = max(1, _STATS_CHUNK_PIXELS // max(1, region.shape[1]))
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    lows = []
+    highs = []
+    for start in range(0, region.shape[0], rows_per_chunk):
+        chunk = np.asarray(region[start : start + rows_per_chunk])
+        chunk_n = chunk.size
+        chunk_mean = float(chunk.mean(dtype=np.float64))
+        chunk_m2 = float(chunk.var(dtype=np.float64)) * chunk_n
+        lows.append(chunk.min())
+        highs.append(chunk.max())
+        total = n + chunk_n
+        delta = chunk_mean - mean
+        mean += delta * chunk_n / total
+        m2 += chunk_m2 + delta * delta * n * chunk_n / total
+        n = total
+    return int(min(lows)), int(max(highs)), float(mean), float(np.sqrt(m2 / n))
+
+
+def _roi_image_stats(
+    acq_image: "AcqImage",
+    roi: RectROI,
+    sources: dict[int, np.ndarray | None],
+) -> tuple[int, int, float, float]:
+    """roi_image_stats() reusing channel arrays opened earlier in ``sources``."""
+    channel = roi.channel
+    identity: _PixelsIdentity | None = _file_identity(acq_image, channel)
+    owner: np.ndarray | None = None
+    if identity is None:
+        if channel not in sources:
+            sources[channel] = _channel_source(acq_image, channel)
+        source = sources[channel]
+        # In-memory data is only memoized when it cannot change.
+        if source is not None and not source.flags.writeable:
+            identity = (
+                source.__array_interface__["data"][0],
+                source.shape,
+                source.strides,
+                source.dtype.str,
+            )
+            owner = _owner_array(source)
+    b = roi.bounds
+    key: _StatsKey | None = None
+    if identity is not None:
+        key = (identity, channel, roi.z, b.dim0_start, b.dim0_stop, b.dim1_start, b.dim1_stop)
+        with _stats_cache_lock:
+            _purge_finalized()
+            cached = _stats_cache.get(key)
+            if cached is not None:
+                if cached[0] is None or cached[0]() is owner:
+                    _stats_cache.move_to_end(key)
+                    return cached[1]
+                # The memory was freed and reused by another array.
+                del _stats_cache[key]
+
+    if channel not in sources:
+        sources[channel] = _channel_source(acq_image, channel)
+    source = sources[channel]
+    if source is None:
+        raise ValueError("Image data not available")
+    # ROI bounds: dim0 = rows (height), dim1 = cols (width)
+    plane = _image_plane(source, roi.z)
+    stats = _region_stats(plane[b.dim0_start : b.dim0_stop, b.dim1_start : b.dim1_stop])
+
+    if key is not None:
+        # Neither a memory map nor an in-memory array is kept alive by the cache.
+        ref = None if owner is None else weakref.ref(owner, _finalized_refs.append)
+        with _stats_cache_lock:
+            _purge_finalized()
+            _stats_cache[key] = (ref, stats)
+            while len(_stats_cache) > ROI_STATS_CACHE_SIZE:
+                _stats_cache.popitem(last=False)
+    return stats
+
+
+def roi_image_stats(acq_image: "AcqImage", roi: RectROI) -> tuple[int, int, float, float]:
+    """Return (min, max, mean, std) of the pixels inside ``roi``.
+
+    Pixels are read through ``acq_image.get_channel_view()`` when available, so
+    an unloaded image is read from a memory map instead of being loaded.
+    Results are memoized per image data, channel, z and bounds: path-backed
+    channels are identified by file path, size and mtime, in-memory channels
+    only when their array is read-only. Editing an ROI (which bumps
+    ``roi.revision``) changes its geometry and therefore its cache entry.
+
+    Args:
+        acq_image: Image the ROI belongs to.
+        roi: ROI to measure.
+
+    Returns:
+        Tuple (img_min, img_max, img_mean, img_std); std is the population std.
+
+    Raises:
+        ValueError: If image data isn't available, z is out of range or the
+            ROI region is empty.
+    """
+    return _roi_image_stats(acq_image, roi, {})
+
+
+def clear_roi_stats_cache() -> None:
+    """Forget all memoized ROI image stats."""
+    with _stats_cache_lock:
+        _stats_cache.clear()
+        _finalized_refs.clear()
+
+
 class RoiSet:
     """Container and manager for multiple ROI instances.
 
@@ -410,6 +565,13 @@ class RoiSet:
     - All kymflow APIs use int as the canonical ROI identifier.
     - For display in nicewidgets ImageRoiWidget, the adapter uses
       name=str(roi_id) (e.g. "1", "2") so selection can be mapped back to roi_id.
+
+    Alongside the ROI objects the set keeps their ids and bounds as NumPy
+    arrays (one row per ROI in creation order, bounds columns
+    ``dim0_start, dim0_stop, dim1_start, dim1_stop``) so hit-testing, clamping
+    and overlap queries run vectorized. The arrays are updated by
+    create_roi(), edit_roi(), delete() and clear(); code that assigns
+    ``roi.bounds`` directly must call refresh_bounds() afterwards.
     """
 
     def __init__(self, acq_image: "AcqImage") -> None:
@@ -421,6 +583,8 @@ class RoiSet:
         self.acq_image = acq_image
         self._rois: dict[int, ROI] = {}
         self._next_id: int = 1
+        self._ids: np.ndarray = np.empty(0, dtype=np.int64)
+        self._bounds: np.ndarray = np.empty((0, 4), dtype=np.int64)
     
     def _get_image_bounds(self) -> "ImageBounds":
         """Get image bounds from AcqImage.
@@ -463,6 +627,31 @@ class RoiSet:
         if callable(mark):
             mark()
 
+    def _row(self, roi_id: int) -> int:
+        """Return the row of ``roi_id`` in the id/bounds arrays."""
+        return int(np.flatnonzero(self._ids == roi_id)[0])
+
+    def refresh_bounds(self) -> None:
+        """Rebuild the id/bounds arrays from the ROI objects.
+
+        Call this after changing ``roi.bounds`` without going through edit_roi().
+        """
+        self._ids = np.fromiter(self._rois.keys(), dtype=np.int64, count=len(self._rois))
+        self._bounds = np.array(
+            [_bounds_to_row(roi.bounds) for roi in self._rois.values()], dtype=np.int64
+        ).reshape(-1, 4)
+
+    @property
+    def bounds_array(self) -> np.ndarray:
+        """Read-only (n, 4) array of ROI bounds in creation order.
+
+        Columns are ``dim0_start, dim0_stop, dim1_start, dim1_stop``; rows match
+        get_roi_ids().
+        """
+        view = self._bounds.view()
+        view.flags.writeable = False
+        return view
+
     def create_roi(
         self,
         bounds: RoiBounds | None = None,
@@ -529,6 +718,8 @@ class RoiSet:
             logger.warning(f"Could not calculate image stats for ROI {roi.id}: {e}")
         
         self._rois[roi.id] = roi
+        self._ids = np.append(self._ids, roi.id)
+        self._bounds = np.vstack([self._bounds, _bounds_to_row(roi.bounds)])
         self._next_id += 1
         self._mark_metadata_dirty()
         return roi
@@ -596,6 +787,7 @@ class RoiSet:
             clamped_bounds = clamp_coordinates_to_size(bounds, size)
             if roi.bounds != clamped_bounds:
                 roi.bounds = clamped_bounds
+                self._bounds[self._row(roi_id)] = _bounds_to_row(clamped_bounds)
                 changed = True
         
         # Update name and note if provided
@@ -630,6 +822,9 @@ class RoiSet:
         """
         removed = self._rois.pop(roi_id, None)
         if removed is not None:
+            keep = self._ids != roi_id
+            self._ids = self._ids[keep]
+            self._bounds = self._bounds[keep]
             self._mark_metadata_dirty()
 
     def clear(self) -> int:
@@ -640,6 +835,8 @@ class RoiSet:
         """
         n = len(self._rois)
         self._rois.clear()
+        self._ids = np.empty(0, dtype=np.int64)
+        self._bounds = np.empty((0, 4), dtype=np.int64)
         self._next_id = 1
         if n > 0:
             self._mark_metadata_dirty()
@@ -677,41 +874,120 @@ class RoiSet:
 
         This is an optional utility method. Bounds validation normally happens
         automatically in create_roi(), edit_roi(), and during load_metadata().
+        The current ``roi.bounds`` of every ROI are re-read first, so bounds
+        that were changed directly are validated too.
 
         Returns:
             Number of ROIs that were clamped (modified).
         """
-        clamped_count = 0
-        
+        self.refresh_bounds()
+        if not self._rois:
+            return 0
+        try:
+            image_bounds = self._get_image_bounds()
+        except ValueError as e:
+            logger.warning(f"Could not revalidate ROIs: {e}")
+            return 0
+
+        size = ImageSize(width=image_bounds.width, height=image_bounds.height)
+        clamped = clamp_bounds_array(self._bounds, size)
+        z = np.fromiter((roi.z for roi in self._rois.values()), dtype=np.int64, count=len(self._rois))
+        clamped_z = np.clip(z, 0, max(image_bounds.num_slices - 1, 0))
+
+        changed_rows = np.flatnonzero((clamped != self._bounds).any(axis=1) | (clamped_z != z))
+        rois = list(self._rois.values())
+        for row in changed_rows:
+            roi = rois[row]
+            roi.z = int(clamped_z[row])
+            roi.bounds = _row_to_bounds(clamped[row])
+        self._bounds = clamped
+        return int(changed_rows.size)
+
+    def calculate_image_stats(self, *, only_missing: bool = False) -> int:
+        """Calculate image stats of all ROIs, reading each channel once.
+
+        Args:
+            only_missing: If True, skip ROIs whose stats are all set.
+
+        Returns:
+            Number of ROIs whose stats changed. Metadata is marked dirty if any did.
+        """
+        sources: dict[int, np.ndarray | None] = {}
+        n_changed = 0
         for roi in self._rois.values():
+            old = (roi.img_min, roi.img_max, roi.img_mean, roi.img_std)
+            if only_missing and None not in old:
+                continue
             try:
-                image_bounds = self._get_image_bounds()
-                
-                # Validate and clamp z
-                original_z = roi.z
-                if roi.z < 0:
-                    roi.z = 0
-                    clamped_count += 1
-                elif roi.z >= image_bounds.num_slices:
-                    roi.z = image_bounds.num_slices - 1
-                    clamped_count += 1
-                
-                # Clamp coordinates
-                size = ImageSize(width=image_bounds.width, height=image_bounds.height)
-                clamped_bounds = clamp_coordinates_to_size(roi.bounds, size)
-                
-                if (roi.bounds.dim0_start != clamped_bounds.dim0_start or
-                    roi.bounds.dim0_stop != clamped_bounds.dim0_stop or
-                    roi.bounds.dim1_start != clamped_bounds.dim1_start or
-                    roi.bounds.dim1_stop != clamped_bounds.dim1_stop or
-                    roi.z != original_z):
-                    roi.bounds = clamped_bounds
-                    clamped_count += 1
-                    
+                new = _roi_image_stats(self.acq_image, roi, sources)
             except ValueError as e:
-                logger.warning(f"Could not revalidate ROI {roi.id}: {e}")
-        
-        return clamped_count
+                logger.warning(f"Could not calculate image stats for ROI {roi.id}: {e}")
+                continue
+            if new != old:
+                roi.img_min, roi.img_max, roi.img_mean, roi.img_std = new
+                n_changed += 1
+        if n_changed:
+            self._mark_metadata_dirty()
+        return n_changed
+
+    def hit_test(
+        self,
+        dim0_coord: int,
+        dim1_coord: int,
+        edge_tol: int = 5,
+    ) -> tuple[ROI | None, str | None]:
+        """Hit-test all ROIs at point (dim0_coord, dim1_coord).
+
+        See hit_test_rois() for the semantics of the returned mode.
+        """
+        if not self._ids.size:
+            return None, None
+        b = self._bounds
+        in_dim0 = (b[:, 0] <= dim0_coord) & (dim0_coord <= b[:, 1])
+        in_dim1 = (b[:, 2] <= dim1_coord) & (dim1_coord <= b[:, 3])
+        # Columns in priority order, matching _HIT_MODES.
+        hits = np.column_stack(
+            [
+                (np.abs(dim1_coord - b[:, 2]) <= edge_tol) & in_dim0,
+                (np.abs(dim1_coord - b[:, 3]) <= edge_tol) & in_dim0,
+                (np.abs(dim0_coord - b[:, 0]) <= edge_tol) & in_dim1,
+                (np.abs(dim0_coord - b[:, 1]) <= edge_tol) & in_dim1,
+                in_dim0 & in_dim1,
+            ]
+        )
+        hit_rows = np.flatnonzero(hits.any(axis=1))
+        if not hit_rows.size:
+            return None, None
+        # The most recently created ROI is "topmost".
+        row = int(hit_rows[-1])
+        mode = _HIT_MODES[int(np.argmax(hits[row]))]
+        return self._rois[int(self._ids[row])], mode
+
+    def find_overlapping(
+        self,
+        bounds: RoiBounds,
+        *,
+        exclude_id: int | None = None,
+    ) -> list[ROI]:
+        """Return ROIs whose rectangle overlaps ``bounds`` with a non-zero area.
+
+        Args:
+            bounds: Rectangle to test.
+            exclude_id: Optional ROI id to leave out (e.g. the ROI being edited).
+
+        Returns:
+            Overlapping ROIs in creation order.
+        """
+        b = self._bounds
+        overlaps = (
+            (b[:, 0] < bounds.dim0_stop)
+            & (bounds.dim0_start < b[:, 1])
+            & (b[:, 2] < bounds.dim1_stop)
+            & (bounds.dim1_start < b[:, 3])
+        )
+        if exclude_id is not None:
+            overlaps &= self._ids != exclude_id
+        return [self._rois[int(roi_id)] for roi_id in self._ids[overlaps]]
 
     def __iter__(self) -> Iterable[ROI]:
         """Iterate over ROIs in creation order."""
@@ -754,9 +1030,51 @@ class RoiSet:
             roi = roi_obj
             s._rois[roi.id] = roi
             s._next_id = max(s._next_id, roi.id + 1)
+        s.refresh_bounds()
         return s
 
 
+# hit_test() modes in the priority order of its columns.
+_HIT_MODES = (
+    "resizing_dim1_start",
+    "resizing_dim1_stop",
+    "resizing_dim0_start",
+    "resizing_dim0_stop",
+    "moving",
+)
+
+
+def _bounds_to_row(bounds: RoiBounds) -> tuple[int, int, int, int]:
+    return (bounds.dim0_start, bounds.dim0_stop, bounds.dim1_start, bounds.dim1_stop)
+
+
+def _row_to_bounds(row: np.ndarray) -> RoiBounds:
+    return RoiBounds(
+        dim0_start=int(row[0]),
+        dim0_stop=int(row[1]),
+        dim1_start=int(row[2]),
+        dim1_stop=int(row[3]),
+    )
+
+
+def clamp_bounds_array(bounds: np.ndarray, size: ImageSize) -> np.ndarray:
+    """Vectorized clamp_coordinates_to_size() over an (n, 4) bounds array.
+
+    Args:
+        bounds: Array with columns ``dim0_start, dim0_stop, dim1_start, dim1_stop``.
+        size: ImageSize with width and height dimensions.
+
+    Returns:
+        New array with coordinates clamped to the image and inverted edges swapped.
+    """
+    bounds = np.asarray(bounds, dtype=np.int64).reshape(-1, 4)
+    dim0 = np.clip(bounds[:, 0:2], 0, size.height)
+    dim1 = np.clip(bounds[:, 2:4], 0, size.width)
+    return np.column_stack(
+        [dim0.min(axis=1), dim0.max(axis=1), dim1.min(axis=1), dim1.max(axis=1)]
+    )
+
+
 def clamp_coordinates(
     bounds: RoiBounds,
     img: np.ndarray
@@ -882,8 +1200,8 @@ def hit_test_rois(
     """Hit-test a collection of ROIs at point (dim0_coord, dim1_coord) in full-image coordinates.
 
     This function checks the four edges of each ROI with a tolerance and then
-    the interior area. It iterates over ROIs in reverse creation order
-    so that "topmost" (most recently created) ROIs are hit first.
+    the interior area, vectorized over RoiSet.bounds_array. Among the ROIs
+    that are hit, the most recently created ("topmost") one wins.
 
     Args:
         rois: Collection of ROIs to test.
@@ -902,36 +1220,4 @@ def hit_test_rois(
                 'moving',
                 or None if no hit occurred.
     """
-    # Reverse the creation order to hit "topmost" ROIs first.
-    for roi in reversed(rois.as_list()):
-        bounds = roi.bounds
-
-        near_dim1_start = (
-            abs(dim1_coord - bounds.dim1_start) <= edge_tol
-            and bounds.dim0_start <= dim0_coord <= bounds.dim0_stop
-        )
-        near_dim1_stop = (
-            abs(dim1_coord - bounds.dim1_stop) <= edge_tol
-            and bounds.dim0_start <= dim0_coord <= bounds.dim0_stop
-        )
-        near_dim0_start = (
-            abs(dim0_coord - bounds.dim0_start) <= edge_tol
-            and bounds.dim1_start <= dim1_coord <= bounds.dim1_stop
-        )
-        near_dim0_stop = (
-            abs(dim0_coord - bounds.dim0_stop) <= edge_tol
-            and bounds.dim1_start <= dim1_coord <= bounds.dim1_stop
-        )
-
-        if near_dim1_start:
-            return roi, "resizing_dim1_start"
-        if near_dim1_stop:
-            return roi, "resizing_dim1_stop"
-        if near_dim0_start:
-            return roi, "resizing_dim0_start"
-        if near_dim0_stop:
-            return roi, "resizing_dim0_stop"
-        if point_in_roi(bounds, dim0_coord, dim1_coord):
-            return roi, "moving"
-
-    return None, None
+    return rois.hit_test(dim0_coord, dim1_coord, edge_tol)
@@ -372,6 +372,14 @@ class VelocityEventDb:
         except Exception as e:
             logger.error("Failed to update velocity event cache for %s: %s", path_str, e)
 
+    def remove_path(self, path: str | Path) -> None:
+        """Drop all cached entries of one image path (e.g. the file was deleted).
+
+        In-memory only. Does NOT persist.
+        """
+        path_str = str(path)
+        self._cache = [r for r in self._cache if r.get("path") != path_str]
+
     def update_from_image_and_persist(self, kym_image: "KymImage") -> None:
         """Update cache from image and persist to CSV."""
         self.update_from_image(kym_image)
@@ -2,6 +2,7 @@
 
 from kymflow.core.kym_analysis_batch.batch_preview import preview_batch_table_rows
 from kymflow.core.kym_analysis_batch.batch_result_table_row import batch_file_result_to_table_row
+from kymflow.core.kym_analysis_batch.diameter_batch_strategy import DiameterBatchStrategy
 from kymflow.core.kym_analysis_batch.kym_analysis_batch import BatchAnalysisStrategy, KymAnalysisBatch
 from kymflow.core.kym_analysis_batch.kym_event_batch import (
     has_radon_velocity_and_time,
@@ -20,6 +21,7 @@ __all__ = [
     "BatchAnalysisStrategy",
     "BatchFileOutcome",
     "BatchFileResult",
+    "DiameterBatchStrategy",
     "KymAnalysisBatch",
     "KymEventBatchStrategy",
     "RadonBatchStrategy",
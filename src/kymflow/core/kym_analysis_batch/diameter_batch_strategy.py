@@ -0,0 +1,278 @@
+"""Strategy for batch diameter analysis."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+
+from kymflow.core.analysis.diameter_analysis.diameter_analysis import (
+    DiameterAnalysisBundle,
+    DiameterAnalyzer,
+    DiameterDetectionParams,
+    Polarity,
+    PostFilterParams,
+    load_diameter_analysis,
+    save_diameter_analysis,
+)
+from kymflow.core.api.kym_external import get_kym_geometry, get_roi_pixel_bounds
+from kymflow.core.image_loaders.kym_image import KymImage
+from kymflow.core.kym_analysis_batch.roi_mode import resolve_effective_roi
+from kymflow.core.kym_analysis_batch.types import (
+    AnalysisBatchKind,
+    BatchFileOutcome,
+    BatchFileResult,
+)
+from kymflow.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class DiameterBatchStrategy:
+    """Run ``DiameterAnalyzer.analyze`` per file and persist with ``save_diameter_analysis``.
+
+    Each file is analyzed with the threaded diameter backend and written to its
+    ``<stem>.diameter.json`` / ``<stem>.diameter.csv`` sidecars. Runs for other
+    ROIs already present in the sidecars are preserved (the effective ROI's run
+    is replaced).
+
+    Attributes:
+        roi_mode: Use a shared ROI id or create a full-image ROI per file.
+        roi_id: ROI id when ``roi_mode == \"existing\"``.
+        channel: 1-based channel index.
+        detection_params: Diameter detection parameters (defaults when ``None``).
+        post_filter_params: Optional post-filter parameters.
+        backend: ``DiameterAnalyzer`` backend (``threads`` or ``serial``).
+        overwrite: When ``False``, skip files whose sidecar already holds the ROI.
+        out_dir: Optional sidecar directory (defaults to next to each file).
+    """
+
+    kind = AnalysisBatchKind.DIAMETER
+
+    def __init__(
+        self,
+        *,
+        roi_mode: Literal["existing", "new_full_image"],
+        roi_id: int | None,
+        channel: int,
+        detection_params: DiameterDetectionParams | None = None,
+        post_filter_params: PostFilterParams | None = None,
+        backend: Literal["threads", "serial"] = "threads",
+        overwrite: bool = False,
+        out_dir: Path | None = None,
+    ) -> None:
+        """Initialize the diameter batch strategy.
+
+        Args:
+            roi_mode: ``existing`` or ``new_full_image`` (``create_roi()`` with no args).
+            roi_id: ROI id when ``roi_mode == \"existing\"``.
+            channel: 1-based channel index.
+            detection_params: Detection parameters shared by all files.
+            post_filter_params: Optional post-filter parameters shared by all files.
+            backend: ``DiameterAnalyzer.analyze`` backend; ``threads`` is the fast path.
+            overwrite: Re-run and replace ROI results already saved in the sidecar.
+            out_dir: Optional sidecar directory passed to ``save_diameter_analysis``.
+        """
+        self._roi_mode: Literal["existing", "new_full_image"] = roi_mode
+        self._roi_id = roi_id
+        self._channel = channel
+        self._detection_params = detection_params or DiameterDetectionParams()
+        self._post_filter_params = post_filter_params
+        self._backend = backend
+        self._overwrite = bool(overwrite)
+        self._out_dir = out_dir
+
+    def prepare_file(self, kf: KymImage) -> None:
+        """Ensure the selected channel is loaded for image-backed operations.
+
+        Args:
+            kf: Kymograph file.
+        """
+        try:
+            kf.load_channel(self._channel)
+        except Exception:
+            logger.warning(
+                f"DiameterBatchStrategy.prepare_file: load_channel failed for {getattr(kf, 'path', None)} ch={self._channel}",
+                exc_info=True,
+            )
+
+    def _load_saved(
+        self, path: Path
+    ) -> tuple[
+        dict[tuple[int, int], list],
+        dict[tuple[int, int], DiameterDetectionParams],
+        dict[tuple[int, int], tuple[int, int, int, int]],
+    ]:
+        """Return previously saved runs for ``path`` (empty dicts when there is no sidecar).
+
+        Raises:
+            Exception: Any error reading an existing sidecar other than it being
+                missing. The caller must not save over a sidecar it could not read,
+                or the runs of every other ROI in it would be lost.
+        """
+        try:
+            bundle, params_by_run, bounds_by_run, _warnings = load_diameter_analysis(
+                path, in_dir=self._out_dir
+            )
+        except FileNotFoundError:
+            return {}, {}, {}
+        return dict(bundle.runs), dict(params_by_run), dict(bounds_by_run)
+
+    def process_file(
+        self,
+        kf: KymImage,
+        *,
+        cancel_event: threading.Event,
+    ) -> BatchFileResult:
+        """Run one-file diameter analysis and save sidecars; returns status.
+
+        Args:
+            kf: Kymograph file.
+            cancel_event: When set, returns ``CANCELLED`` without running/saving.
+
+        Returns:
+            :class:`BatchFileResult` describing outcome.
+        """
+        path = getattr(kf, "path", None)
+        file_label = path.name if path is not None else "unknown"
+
+        if cancel_event.is_set():
+            return BatchFileResult(
+                kym_image=kf,
+                kind=AnalysisBatchKind.DIAMETER,
+                outcome=BatchFileOutcome.CANCELLED,
+                message="cancelled",
+            )
+        if path is None:
+            return BatchFileResult(
+                kym_image=kf,
+                kind=AnalysisBatchKind.DIAMETER,
+                outcome=BatchFileOutcome.SKIPPED,
+                message="no file path for diameter sidecar",
+            )
+
+        self.prepare_file(kf)
+        if cancel_event.is_set():
+            return BatchFileResult(
+                kym_image=kf,
+                kind=AnalysisBatchKind.DIAMETER,
+                outcome=BatchFileOutcome.CANCELLED,
+                message="cancelled",
+            )
+
+        resolved = resolve_effective_roi(
+            kf,
+            roi_mode=self._roi_mode,
+            roi_id=self._roi_id,
+        )
+        if resolved.skip_message is not None:
+            return BatchFileResult(
+                kym_image=kf,
+                kind=AnalysisBatchKind.DIAMETER,
+                outcome=BatchFileOutcome.SKIPPED,
+                message=resolved.skip_message,
+            )
+        assert resolved.roi_id is not None
+        effective_roi_id = int(resolved.roi_id)
+
+        try:
+            runs, params_by_run, bounds_by_run = self._load_saved(path)
+        except Exception as exc:
+            logger.warning(
+                f"Diameter batch: unreadable diameter sidecar for {file_label}, not overwriting",
+                exc_info=True,
+            )
+            return BatchFileResult(
+                kym_image=kf,
+                kind=AnalysisBatchKind.DIAMETER,
+                outcome=BatchFileOutcome.FAILED,
+                message=f"unreadable diameter sidecar: {exc}",
+            )
+        saved_for_roi = [k for k in runs if k[0] == effective_roi_id]
+        if saved_for_roi and not self._overwrite:
+            return BatchFileResult(
+                kym_image=kf,
+                kind=AnalysisBatchKind.DIAMETER,
+                outcome=BatchFileOutcome.SKIPPED,
+                message=f"ROI {effective_roi_id} has saved diameter analysis",
+            )
+
+        try:
+            data = kf.getChannelData(self._channel)
+            if data is None:
+                return BatchFileResult(
+                    kym_image=kf,
+                    kind=AnalysisBatchKind.DIAMETER,
+                    outcome=BatchFileOutcome.SKIPPED,
+                    message=f"no image data for ch {self._channel}",
+                )
+            _shape, seconds_per_line, um_per_pixel = get_kym_geometry(kf)
+            b = get_roi_pixel_bounds(kf, effective_roi_id)
+            roi_bounds = (int(b.row_start), int(b.row_stop), int(b.col_start), int(b.col_stop))
+
+            analyzer = DiameterAnalyzer(
+                np.asarray(data),
+                seconds_per_line=seconds_per_line,
+                um_per_pixel=um_per_pixel,
+                polarity=Polarity(self._detection_params.polarity).value,
+            )
+            results = analyzer.analyze(
+                params=self._detection_params,
+                roi_id=effective_roi_id,
+                roi_bounds=roi_bounds,
+                channel_id=int(self._channel),
+                backend=self._backend,
+                post_filter_params=self._post_filter_params,
+            )
+            if cancel_event.is_set():
+                return BatchFileResult(
+                    kym_image=kf,
+                    kind=AnalysisBatchKind.DIAMETER,
+                    outcome=BatchFileOutcome.CANCELLED,
+                    message="cancelled",
+                )
+
+            # One channel per ROI in the sidecar: drop any prior run for this ROI.
+            for key in saved_for_roi:
+                runs.pop(key, None)
+                params_by_run.pop(key, None)
+                bounds_by_run.pop(key, None)
+            run_key = (effective_roi_id, int(self._channel))
+            runs[run_key] = results
+            params_by_run[run_key] = self._detection_params
+            bounds_by_run[run_key] = roi_bounds
+
+            save_diameter_analysis(
+                path,
+                DiameterAnalysisBundle(runs=runs),
+                roi_bounds_by_run=bounds_by_run,
+                detection_params_by_run=params_by_run,
+                out_dir=self._out_dir,
+            )
+        except ValueError as exc:
+            logger.warning(
+                f"Diameter batch failed (ValueError) for {file_label}: {exc}",
+            )
+            return BatchFileResult(
+                kym_image=kf,
+                kind=AnalysisBatchKind.DIAMETER,
+                outcome=BatchFileOutcome.FAILED,
+                message=str(exc),
+            )
+        except Exception as exc:
+            logger.exception(f"Diameter batch failed for {file_label}")
+            return BatchFileResult(
+                kym_image=kf,
+                kind=AnalysisBatchKind.DIAMETER,
+                outcome=BatchFileOutcome.FAILED,
+                message=repr(exc),
+            )
+
+        return BatchFileResult(
+            kym_image=kf,
+            kind=AnalysisBatchKind.DIAMETER,
+            outcome=BatchFileOutcome.OK,
+            message="ok",
+        )
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import dataclasses
 import threading
+import time
 from collections.abc import Callable, Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Protocol, runtime_checkable
@@ -39,7 +41,8 @@ class KymAnalysisBatch:
 
     Science outputs remain on each ``KymImage`` → ``KymAnalysis``; this class
     returns a lightweight :class:`~kymflow.core.kym_analysis_batch.types.BatchFileResult`
-    list for logging, tests, and GUI progress.
+    list for logging, tests, and GUI progress. Each result carries the per-file
+    wall time (``elapsed_s``) measured around ``process_file``.
 
     Attributes:
         _files: Files to process (order preserved in the returned list).
@@ -101,17 +104,18 @@ class KymAnalysisBatch:
                     outcome=BatchFileOutcome.CANCELLED,
                     message="cancelled",
                 )
+            t0 = time.perf_counter()
             try:
                 r = self._strategy.process_file(kf, cancel_event=cancel)
-                return i, r
             except Exception as exc:
                 logger.exception(f"Batch process_file raised for index {i}")
-                return i, BatchFileResult(
+                r = BatchFileResult(
                     kym_image=kf,
                     kind=self._strategy.kind,
                     outcome=BatchFileOutcome.FAILED,
                     message=repr(exc),
                 )
+            return i, dataclasses.replace(r, elapsed_s=time.perf_counter() - t0)
 
         if workers == 1:
             ordered: list[BatchFileResult] = []
@@ -27,9 +27,15 @@ class BatchFileOutcome(str, Enum):
 
 @dataclass(frozen=True, slots=True)
 class BatchFileResult:
-    """Lightweight per-file outcome (results remain on ``KymImage`` / ``KymAnalysis``)."""
+    """Lightweight per-file outcome (results remain on ``KymImage`` / ``KymAnalysis``).
+
+    ``elapsed_s`` is the wall time spent in the strategy for this file; it is
+    filled in by :class:`~kymflow.core.kym_analysis_batch.kym_analysis_batch.KymAnalysisBatch`
+    (``None`` when a strategy is called directly).
+    """
 
     kym_image: KymImage
     kind: AnalysisBatchKind
     outcome: BatchFileOutcome
     message: str
+    elapsed_s: float | None = None
@@ -1,24 +1,72 @@
+"""Plotting helpers (Plotly figures, image pyramids, histograms, decimation).
+
+Names are imported from their submodules on first access (module
+``__getattr__``), so importing a light submodule such as
+``kymflow.core.plotting.display_lut`` does not import Plotly.
+"""
+
 from __future__ import annotations
 
-from kymflow.core.plotting.image_plots import image_plot_plotly
-from kymflow.core.plotting.line_plots import (
-    line_plot_plotly,  # FLAGGED FOR REMOVAL: Check if used before removing
-    plot_image_line_plotly_v3,
-    # reset_image_zoom,  # DEPRECATED: Use dict-based updates (update_xaxis_range_v2, update_yaxis_range_v2) instead
-    update_colorscale,
-    update_contrast,
-    update_xaxis_range,
-    update_xaxis_range_v2,
-    update_yaxis_range_v2,
-    add_kym_event_rect,
-    delete_kym_event_rect,
-    move_kym_event_rect,
-    clear_kym_event_rects,
-    select_kym_event_rect,
-)
+import importlib
+from typing import Any
+
+# Public name -> submodule that defines it.
+_LAZY_ATTRS: dict[str, str] = {
+    "decimate_xy": "decimation",
+    "update_decimated_trace": "decimation",
+    "FigurePatch": "figure_patch",
+    "diff_figure": "figure_patch",
+    "snapshot_figure": "figure_patch",
+    "ImageHistogram": "image_histogram",
+    "get_image_histogram": "image_histogram",
+    "image_plot_plotly": "image_plots",
+    "ImagePyramid": "image_pyramid",
+    "get_image_pyramid": "image_pyramid",
+    "line_plot_plotly": "line_plots",  # FLAGGED FOR REMOVAL: Check if used before removing
+    "plot_image_line_plotly_v3": "line_plots",
+    # "reset_image_zoom",  # DEPRECATED: Use dict-based updates (update_xaxis_range_v2, update_yaxis_range_v2) instead
+    "update_colorscale": "line_plots",
+    "update_contrast": "line_plots",
+    "update_xaxis_range": "line_plots",
+    "update_xaxis_range_v2": "line_plots",
+    "update_yaxis_range_v2": "line_plots",
+    "add_kym_event_rect": "line_plots",
+    "delete_kym_event_rect": "line_plots",
+    "move_kym_event_rect": "line_plots",
+    "clear_kym_event_rects": "line_plots",
+    "select_kym_event_rect": "line_plots",
+    "update_heatmap_tile": "line_plots",
+    "update_line_decimation": "line_plots",
+    "update_heatmap_display_v2": "line_plots",
+    "update_image_tile": "line_plots",
+    "update_image_tile_display": "line_plots",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY_ATTRS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
+    "decimate_xy",
+    "update_decimated_trace",
+    "FigurePatch",
+    "diff_figure",
+    "snapshot_figure",
     "image_plot_plotly",
+    "ImageHistogram",
+    "get_image_histogram",
+    "ImagePyramid",
+    "get_image_pyramid",
     "line_plot_plotly",  # FLAGGED FOR REMOVAL: Check if used before removing
     "plot_image_line_plotly_v3",
     # "reset_image_zoom",  # DEPRECATED: Use dict-based updates (update_xaxis_range_v2, update_yaxis_range_v2) instead
@@ -32,4 +80,9 @@ __all__ = [
     "move_kym_event_rect",
     "clear_kym_event_rects",
     "select_kym_event_rect",
+    "update_heatmap_tile",
+    "update_line_decimation",
+    "update_heatmap_display_v2",
+    "update_image_tile",
+    "update_image_tile_display",
 ]
@@ -0,0 +1,241 @@
+"""Viewport-aware decimation of long line traces (min/max envelope and LTTB).
+
+A browser cannot draw more distinct points along the x-axis than there are
+screen pixels, so sending every radon window / diameter row / HR sample of a
+long recording only costs bandwidth and redraw time. The helpers here reduce a
+trace to about two points per on-screen pixel of the visible x-range while
+preserving its visual shape:
+
+* ``"minmax"`` (default): for each pixel bucket keep the minimum and maximum
+  sample (in time order), so spikes and dips survive. Fully vectorized.
+* ``"lttb"``: Largest-Triangle-Three-Buckets, which picks one visually
+  representative sample per bucket.
+
+NaN gaps are preserved: a bucket that contains NaN samples contributes one NaN
+point, so Plotly still breaks the line there.
+
+Decimated traces carry ``meta.kymflow_decimate`` so they can be re-decimated
+for a new x-range on relayout (see :func:`update_decimated_trace`).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal, Optional, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from kymflow.core.plotting.image_pyramid import DEFAULT_VIEWPORT_PX
+
+DecimationMethod = Literal["minmax", "lttb"]
+
+# Output points per on-screen pixel.
+POINTS_PER_PIXEL = 2
+
+
+def _bucket_edges(n: int, n_buckets: int) -> np.ndarray:
+    """Return ``n_buckets + 1`` index edges splitting ``range(n)`` evenly."""
+    return np.linspace(0, n, n_buckets + 1).astype(np.intp)
+
+
+def _nan_markers(isnan: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Return the first NaN index of every bucket that contains a NaN."""
+    if not isnan.any():
+        return np.empty(0, dtype=np.intp)
+    nan_idx = np.flatnonzero(isnan)
+    bucket = np.searchsorted(edges, nan_idx, side="right") - 1
+    first = np.ones(nan_idx.size, dtype=bool)
+    first[1:] = bucket[1:] != bucket[:-1]
+    return nan_idx[first]
+
+
+def minmax_indices(y: ArrayLike, n_buckets: int) -> np.ndarray:
+    """Return sorted sample indices of a min/max envelope of ``y``.
+
+    ``y`` is split into ``n_buckets`` equal-count buckets; each keeps the index
+    of its minimum and maximum finite sample plus, if it has any, its first
+    NaN sample. The first and last samples are always kept.
+
+    Args:
+        y: 1D sample values (may contain NaN).
+        n_buckets: Number of buckets (typically the viewport pixel width).
+
+    Returns:
+        Sorted unique indices into ``y`` (at most ``3 * n_buckets + 2``).
+    """
+    yy = np.asarray(y, dtype=float)
+    n = yy.size
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    n_buckets = max(int(n_buckets), 1)
+    if n <= 2 * n_buckets:
+        return np.arange(n, dtype=np.intp)
+
+    isnan = ~np.isfinite(yy)
+    edges = _bucket_edges(n, n_buckets)
+    starts = edges[:-1]
+    lo = np.where(isnan, np.inf, yy)
+    hi = np.where(isnan, -np.inf, yy)
+    min_val = np.minimum.reduceat(lo, starts)
+    max_val = np.maximum.reduceat(hi, starts)
+
+    # Position of each bucket's extreme: first index i in the bucket where
+    # value == bucket extreme (found with a running-index trick, no Python loop).
+    bucket_of = np.repeat(np.arange(n_buckets), np.diff(edges))
+    idx = np.arange(n)
+    big = np.intp(n)
+    min_pos = np.minimum.reduceat(np.where(lo == min_val[bucket_of], idx, big), starts)
+    max_pos = np.minimum.reduceat(np.where(hi == max_val[bucket_of], idx, big), starts)
+
+    finite_bucket = np.isfinite(min_val)
+    keep = [
+        min_pos[finite_bucket],
+        max_pos[finite_bucket],
+        _nan_markers(isnan, edges),
+        np.array([0, n - 1], dtype=np.intp),
+    ]
+    return np.unique(np.concatenate(keep).astype(np.intp))
+
+
+def lttb_indices(x: ArrayLike, y: ArrayLike, n_out: int) -> np.ndarray:
+    """Return sorted sample indices chosen by Largest-Triangle-Three-Buckets.
+
+    LTTB runs over the finite samples only; every bucket that contains NaN
+    samples additionally contributes its first NaN index so gaps survive.
+
+    Args:
+        x: 1D x values (monotonic).
+        y: 1D y values (may contain NaN).
+        n_out: Target number of finite points (>= 3).
+
+    Returns:
+        Sorted unique indices into ``x``/``y``.
+    """
+    xx = np.asarray(x, dtype=float)
+    yy = np.asarray(y, dtype=float)
+    n = yy.size
+    n_out = max(int(n_out), 3)
+    if n <= n_out:
+        return np.arange(n, dtype=np.intp)
+
+    isnan = ~(np.isfinite(xx) & np.isfinite(yy))
+    finite = np.flatnonzero(~isnan)
+    nan_keep = _nan_markers(isnan, _bucket_edges(n, n_out - 2))
+    if finite.size <= n_out:
+        return np.unique(np.concatenate([finite, nan_keep]).astype(np.intp))
+
+    fx = xx[finite]
+    fy = yy[finite]
+    m = finite.size
+    # Buckets over the inner points; first and last points are always kept.
+    edges = np.linspace(1, m - 1, n_out - 1).astype(np.intp)
+    # Mean of each bucket (used as the third triangle vertex of the previous bucket).
+    sum_x = np.add.reduceat(fx, edges[:-1])
+    sum_y = np.add.reduceat(fy, edges[:-1])
+    counts = np.diff(edges)
+    avg_x = np.append(sum_x / counts, fx[-1])
+    avg_y = np.append(sum_y / counts, fy[-1])
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0] = 0
+    a = 0
+    for b in range(n_out - 2):
+        s, e = edges[b], edges[b + 1]
+        ax, ay = fx[a], fy[a]
+        cx, cy = avg_x[b + 1], avg_y[b + 1]
+        area = np.abs((ax - cx) * (fy[s:e] - ay) - (ax - fx[s:e]) * (cy - ay))
+        a = s + int(np.argmax(area))
+        selected[b + 1] = a
+    selected[-1] = m - 1
+    return np.unique(np.concatenate([finite[selected], nan_keep]).astype(np.intp))
+
+
+def _visible_slice(x: np.ndarray, x_range: Optional[Sequence[float]]) -> slice:
+    """Return the index slice of ``x`` covering ``x_range`` plus one sample each side."""
+    if x_range is None or x.size < 2 or not (x[-1] >= x[0]):
+        return slice(0, x.size)
+    lo, hi = sorted((float(x_range[0]), float(x_range[1])))
+    i0 = max(int(np.searchsorted(x, lo, side="left")) - 1, 0)
+    i1 = min(int(np.searchsorted(x, hi, side="right")) + 1, x.size)
+    return slice(i0, i1)
+
+
+def decimate_xy(
+    x: ArrayLike,
+    y: ArrayLike,
+    *,
+    viewport_px: int = DEFAULT_VIEWPORT_PX,
+    x_range: Optional[Sequence[float]] = None,
+    method: DecimationMethod = "minmax",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce a line trace to about ``POINTS_PER_PIXEL * viewport_px`` points.
+
+    Args:
+        x: Monotonically increasing x values (e.g. time in seconds).
+        y: Sample values (may contain NaN).
+        viewport_px: On-screen width of the x-axis in pixels.
+        x_range: Visible ``[min, max]`` x-range; samples outside it (beyond one
+            sample of margin) are dropped before decimating. ``None`` keeps all.
+        method: ``"minmax"`` envelope or ``"lttb"``.
+
+    Returns:
+        Tuple ``(x_out, y_out)`` as float arrays. Traces that already fit are
+        returned unchanged (apart from the x-range crop).
+
+    Raises:
+        ValueError: If ``x`` and ``y`` differ in length or ``method`` is unknown.
+    """
+    xx = np.asarray(x, dtype=float)
+    yy = np.asarray(y, dtype=float)
+    if xx.shape != yy.shape:
+        raise ValueError(f"x and y must have the same shape, got {xx.shape} and {yy.shape}")
+    sl = _visible_slice(xx, x_range)
+    xx, yy = xx[sl], yy[sl]
+    n_buckets = max(int(viewport_px), 1)
+    if method == "minmax":
+        idx = minmax_indices(yy, n_buckets)
+    elif method == "lttb":
+        idx = lttb_indices(xx, yy, POINTS_PER_PIXEL * n_buckets)
+    else:
+        raise ValueError(f"Unknown decimation method: {method!r}")
+    if idx.size == xx.size:
+        return xx, yy
+    return xx[idx], yy[idx]
+
+
+def decimation_meta(viewport_px: int, method: DecimationMethod = "minmax") -> dict[str, Any]:
+    """Return the trace ``meta`` entry marking a trace as decimated."""
+    return {"kymflow_decimate": {"viewport_px": int(viewport_px), "method": method}}
+
+
+def update_decimated_trace(
+    trace: dict[str, Any],
+    x: ArrayLike,
+    y: ArrayLike,
+    x_range: Optional[Sequence[float]],
+) -> bool:
+    """Re-decimate a trace dict from its full-resolution data for ``x_range``.
+
+    Args:
+        trace: Plotly trace dict carrying ``meta.kymflow_decimate``.
+        x: Full-resolution x values of the trace.
+        y: Full-resolution y values of the trace.
+        x_range: New visible ``[min, max]`` x-range, or ``None`` for all data.
+
+    Returns:
+        True if the trace's ``x``/``y`` were replaced, False if it is not a
+        decimated trace.
+    """
+    meta = (trace.get("meta") or {}).get("kymflow_decimate")
+    if not meta:
+        return False
+    x_out, y_out = decimate_xy(
+        x,
+        y,
+        viewport_px=int(meta.get("viewport_px", DEFAULT_VIEWPORT_PX)),
+        x_range=x_range,
+        method=meta.get("method", "minmax"),
+    )
+    trace["x"] = x_out
+    trace["y"] = y_out
+    return True
@@ -0,0 +1,139 @@
+"""Lookup-table contrast stretching of integer images for display.
+
+Stretching an image to ``[zmin, zmax]`` with float arithmetic allocates a
+float32 copy of every pixel (4 bytes/pixel) plus the rounded index array.
+For ``uint8``/``uint16`` images :func:`stretch_lut` instead computes the
+result for every possible pixel value once per ``(dtype, zmin, zmax, n)`` (a
+65536-entry table for ``uint16``), and :func:`stretch_to_indices` maps the
+image with a single ``np.take`` straight to 1-byte indices.
+
+:func:`intensity_range` keeps the min/max of recently displayed read-only
+arrays, so converting the same image again does not rescan it. Entries hold only
+a weak reference to the array, so they never keep unloaded image data alive.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+# Integer dtypes converted through a lookup table (one entry per value).
+LUT_DTYPES = (np.dtype(np.uint8), np.dtype(np.uint16))
+
+_MAX_RANGE_CACHE = 32
+
+
+@lru_cache(maxsize=64)
+def _stretch_lut(dtype_str: str, zmin: float, zmax: float, n: int) -> np.ndarray:
+    dtype = np.dtype(dtype_str)
+    values = np.arange(int(np.iinfo(dtype).max) + 1, dtype=np.float32)
+    lut = _stretch_float(values, zmin, zmax, n)
+    lut.flags.writeable = False
+    return lut
+
+
+def _stretch_float(z: np.ndarray, zmin: float, zmax: float, n: int) -> np.ndarray:
+    z = np.asarray(z)
+    # float32 is enough for 8/16-bit data; wider ints and float64 keep float64 so
+    # large offsets (e.g. 1e8 + small signal) still resolve into distinct levels.
+    work = np.result_type(z.dtype, np.float32)
+    span = float(zmax) - float(zmin)
+    scale = (n - 1) / span if span > 0 else 0.0
+    idx = (z.astype(work, copy=False) - work.type(zmin)) * work.type(scale)
+    np.clip(idx, 0, n - 1, out=idx)
+    return np.rint(idx).astype(np.uint8 if n <= 256 else np.uint16)
+
+
+def stretch_lut(dtype: np.dtype, zmin: float, zmax: float, n: int = 256) -> Optional[np.ndarray]:
+    """Return the (cached, read-only) value -> index table for an integer dtype.
+
+    Args:
+        dtype: Image dtype.
+        zmin: Value mapped to index ``0`` (and below).
+        zmax: Value mapped to index ``n - 1`` (and above).
+        n: Number of output levels.
+
+    Returns:
+        Table indexed by pixel value, or ``None`` if ``dtype`` is not in
+        :data:`LUT_DTYPES`.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in LUT_DTYPES:
+        return None
+    return _stretch_lut(dtype.str, float(zmin), float(zmax), int(n))
+
+
+def stretch_to_indices(z: np.ndarray, zmin: float, zmax: float, n: int = 256) -> np.ndarray:
+    """Contrast-stretch ``z`` to ``[zmin, zmax]`` as indices ``0 .. n-1``.
+
+    Args:
+        z: Image values.
+        zmin: Value mapped to index ``0`` (and below).
+        zmax: Value mapped to index ``n - 1`` (and above).
+        n: Number of output levels.
+
+    Returns:
+        ``uint8`` indices (``uint16`` if ``n > 256``) with the shape of ``z``.
+    """
+    z = np.asarray(z)
+    lut = stretch_lut(z.dtype, zmin, zmax, n)
+    if lut is not None:
+        return np.take(lut, z)
+    return _stretch_float(z, zmin, zmax, n)
+
+
+_range_cache: "OrderedDict[tuple, tuple[weakref.ref, tuple[float, float]]]" = OrderedDict()
+_range_cache_lock = threading.Lock()
+
+
+def _owner_array(image: np.ndarray) -> np.ndarray:
+    """Return the outermost ndarray whose memory ``image`` views."""
+    while isinstance(image.base, np.ndarray):
+        image = image.base
+    return image
+
+
+def intensity_range(image: np.ndarray) -> tuple[float, float]:
+    """Return ``(min, max)`` of ``image``, cached per array.
+
+    Only read-only arrays (e.g. loader slices) are cached, keyed by their
+    memory, shape, strides and dtype. An entry is valid while the array owning
+    that memory is alive (tracked with a weak reference), so a new view of the
+    same data hits the cache, and an entry never pins the data in memory.
+
+    Raises:
+        ValueError: If ``image`` is empty.
+    """
+    image = np.asarray(image)
+    if image.size == 0:
+        raise ValueError("Cannot compute the intensity range of an empty image")
+    if image.flags.writeable:
+        return (float(image.min()), float(image.max()))
+    owner = _owner_array(image)
+    key = (
+        image.__array_interface__["data"][0],
+        image.shape,
+        image.strides,
+        image.dtype.str,
+    )
+    with _range_cache_lock:
+        cached = _range_cache.get(key)
+        if cached is not None:
+            if cached[0]() is owner:
+                _range_cache.move_to_end(key)
+                return cached[1]
+            # The memory was freed and reused by another array.
+            del _range_cache[key]
+    value_range = (float(image.min()), float(image.max()))
+    with _range_cache_lock:
+        for stale in [k for k, (ref, _r) in _range_cache.items() if ref() is None]:
+            del _range_cache[stale]
+        _range_cache[key] = (weakref.ref(owner), value_range)
+        while len(_range_cache) > _MAX_RANGE_CACHE:
+            _range_cache.popitem(last=False)
+    return value_range
@@ -0,0 +1,133 @@
+"""Minimal diffs between two Plotly figure dicts.
+
+Rebuilding a figure with :func:`~kymflow.core.plotting.line_plots.plot_image_line_plotly_v3`
+and sending it whole re-transmits the heatmap pixels even when only the line
+trace, a few shapes or layout keys changed (ROI switch, theme, event filter).
+:func:`diff_figure` compares the figure the client currently shows with the new
+one and returns a :class:`FigurePatch` holding only the changed trace
+attributes (for ``Plotly.restyle``) and layout keys (for ``Plotly.relayout``).
+
+Unchanged heatmap ``z`` therefore stays client-side. A structural change (trace
+count, order or type, or ``config``) requires a full update.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+# Layout keys always replaced whole rather than patched key by key.
+_WHOLE_LAYOUT_KEYS = frozenset({"template"})
+
+
+@dataclass
+class FigurePatch:
+    """Changes that turn one figure dict into another.
+
+    Attributes:
+        full: True if the figures differ structurally and the new figure must
+            be sent whole.
+        restyles: ``(trace_index, {attr: value})`` per changed trace. Removed
+            attributes map to ``None``.
+        relayout: Changed layout keys, dotted one level deep for nested objects
+            (e.g. ``"xaxis.range"``). Removed keys map to ``None``.
+    """
+
+    full: bool = False
+    restyles: list[tuple[int, dict[str, Any]]] = field(default_factory=list)
+    relayout: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing changed."""
+        return not self.full and not self.restyles and not self.relayout
+
+
+def _values_equal(a: Any, b: Any) -> bool:
+    """Return True if two figure-dict values are equal (NumPy-aware)."""
+    if a is b:
+        return True
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        a_arr = np.asarray(a)
+        b_arr = np.asarray(b)
+        if a_arr.shape != b_arr.shape:
+            return False
+        try:
+            return bool(np.array_equal(a_arr, b_arr, equal_nan=a_arr.dtype.kind == "f"))
+        except TypeError:
+            return bool(np.array_equal(a_arr, b_arr))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_values_equal(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_values_equal(x, y) for x, y in zip(a, b))
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+def _dict_changes(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Return top-level keys of ``new`` that differ from ``old`` (removed -> None)."""
+    changes = {k: v for k, v in new.items() if k not in old or not _values_equal(old[k], v)}
+    changes.update({k: None for k in old if k not in new})
+    return changes
+
+
+def snapshot_figure(fig_dict: dict[str, Any]) -> dict[str, Any]:
+    """Return a structural copy of a figure dict for later diffing.
+
+    Dicts and lists are copied so in-place edits of ``fig_dict`` (as done by the
+    ``*_v2`` dict helpers) show up in :func:`diff_figure`; leaf values such as
+    arrays and strings are shared, so snapshotting does not copy image pixels.
+
+    Args:
+        fig_dict: Plotly figure dict.
+
+    Returns:
+        Copy of ``fig_dict`` sharing leaf values.
+    """
+    if isinstance(fig_dict, dict):
+        return {k: snapshot_figure(v) for k, v in fig_dict.items()}
+    if isinstance(fig_dict, list):
+        return [snapshot_figure(v) for v in fig_dict]
+    return fig_dict
+
+
+def diff_figure(old: dict[str, Any], new: dict[str, Any]) -> FigurePatch:
+    """Compute the minimal patch turning figure dict ``old`` into ``new``.
+
+    Args:
+        old: Figure the client currently shows (see :func:`snapshot_figure`).
+        new: Figure to show.
+
+    Returns:
+        FigurePatch with ``full=True`` when traces were added, removed or
+        changed type, or the ``config`` changed.
+    """
+    old_data = old.get("data") or []
+    new_data = new.get("data") or []
+    if len(old_data) != len(new_data):
+        return FigurePatch(full=True)
+    if any(o.get("type") != n.get("type") for o, n in zip(old_data, new_data)):
+        return FigurePatch(full=True)
+    if not _values_equal(old.get("config"), new.get("config")):
+        return FigurePatch(full=True)
+
+    patch = FigurePatch()
+    for i, (o, n) in enumerate(zip(old_data, new_data)):
+        changes = _dict_changes(o, n)
+        if changes:
+            patch.restyles.append((i, changes))
+
+    old_layout = old.get("layout") or {}
+    new_layout = new.get("layout") or {}
+    for key, value in _dict_changes(old_layout, new_layout).items():
+        prev = old_layout.get(key)
+        if isinstance(prev, dict) and isinstance(value, dict) and key not in _WHOLE_LAYOUT_KEYS:
+            for sub, sub_value in _dict_changes(prev, value).items():
+                patch.relayout[f"{key}.{sub}"] = sub_value
+        else:
+            patch.relayout[key] = value
+    return patch
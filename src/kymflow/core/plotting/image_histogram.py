@@ -0,0 +1,176 @@
+"""Cached intensity histograms for the contrast view.
+
+:func:`compute_image_histogram` bins an image once; for integer images it uses
+a single ``np.bincount`` pass over the raw pixels (no flattened copy) and then
+folds the per-value counts into equal-width bins, giving the same result as
+``np.histogram(image, bins)``. :func:`get_image_histogram` caches the result per
+(file, channel) next to the image pyramids, so contrast slider and log-scale
+changes never touch pixel data.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from kymflow.core.plotting.image_pyramid import _source_cache_key
+
+if TYPE_CHECKING:
+    from kymflow.core.image_loaders.acq_image import AcqImage
+
+# Integer value spans wider than this fall back to np.histogram (bincount
+# would allocate one counter per possible value).
+_MAX_BINCOUNT_SPAN = 1 << 24
+_MAX_MEMORY_CACHE = 32
+
+
+@dataclass(frozen=True)
+class ImageHistogram:
+    """Intensity histogram of one image.
+
+    Attributes:
+        counts: Pixel count per bin (``int64``, length ``bins``).
+        bin_edges: Bin edges (length ``bins + 1``), as returned by ``np.histogram``.
+        image_min: Minimum pixel value.
+        image_max: Maximum pixel value.
+    """
+
+    counts: np.ndarray
+    bin_edges: np.ndarray
+    image_min: float
+    image_max: float
+
+    @property
+    def bin_centers(self) -> np.ndarray:
+        """Center of each bin."""
+        return (self.bin_edges[:-1] + self.bin_edges[1:]) / 2
+
+
+def _fold_counts(
+    value_counts: np.ndarray, first: int, bin_edges: np.ndarray
+) -> np.ndarray:
+    """Fold per-value counts (values ``first, first+1, ...``) into ``bin_edges`` bins.
+
+    Uses the same index computation as ``np.histogram`` for uniform bins.
+    """
+    bins = bin_edges.size - 1
+    values = np.arange(first, first + value_counts.size, dtype=np.float64)
+    lo, hi = float(bin_edges[0]), float(bin_edges[-1])
+    idx = ((values - lo) * (bins / (hi - lo))).astype(np.intp)
+    idx[idx == bins] -= 1
+    idx[values < bin_edges[idx]] -= 1
+    inc = (values >= bin_edges[idx + 1]) & (idx != bins - 1)
+    idx[inc] += 1
+    return np.bincount(idx, weights=value_counts, minlength=bins).astype(np.int64)
+
+
+def compute_image_histogram(image: np.ndarray, bins: int = 256) -> ImageHistogram:
+    """Compute the intensity histogram of ``image`` over its full value range.
+
+    Args:
+        image: Image array (any shape).
+        bins: Number of equal-width bins between the image min and max.
+
+    Returns:
+        ImageHistogram equal to ``np.histogram(image, bins=bins)``.
+
+    Raises:
+        ValueError: If ``image`` is empty.
+    """
+    if image.size == 0:
+        raise ValueError("Cannot compute a histogram of an empty image")
+    image_min = image.min()
+    image_max = image.max()
+    if image_min == image_max:
+        counts, bin_edges = np.histogram(np.asarray([image_min]), bins=bins)
+        counts = counts.astype(np.int64) * image.size
+    elif (
+        np.issubdtype(image.dtype, np.integer)
+        and int(image_max) - int(image_min) < _MAX_BINCOUNT_SPAN
+    ):
+        flat = image.ravel()  # view for contiguous images
+        first = int(image_min)
+        if first >= 0 and int(image_max) < _MAX_BINCOUNT_SPAN and image.dtype != np.uint64:
+            # Small non-negative values: count directly, no shifted copy.
+            value_counts = np.bincount(flat)[first:]
+        elif np.issubdtype(image.dtype, np.unsignedinteger):
+            # Shift in the source dtype (cannot go negative) so uint64 fits intp.
+            value_counts = np.bincount((flat - image_min).astype(np.intp))
+        else:
+            value_counts = np.bincount(flat.astype(np.intp) - first)
+        bin_edges = np.linspace(float(image_min), float(image_max), bins + 1)
+        counts = _fold_counts(value_counts, first, bin_edges)
+    else:
+        counts, bin_edges = np.histogram(image, bins=bins)
+        counts = counts.astype(np.int64)
+    return ImageHistogram(
+        counts=counts,
+        bin_edges=bin_edges,
+        image_min=float(image_min),
+        image_max=float(image_max),
+    )
+
+
+# Entries hold the source image weakly; entries of freed images are pruned on insert.
+_memory_cache: "OrderedDict[tuple, tuple[weakref.ref, ImageHistogram]]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+
+def _owner_array(image: np.ndarray) -> np.ndarray:
+    """Return the outermost ndarray whose memory ``image`` views."""
+    while isinstance(image.base, np.ndarray):
+        image = image.base
+    return image
+
+
+def get_image_histogram(
+    kf: "AcqImage", channel: int = 1, *, bins: int = 256
+) -> Optional[ImageHistogram]:
+    """Return the (cached) histogram of one image channel.
+
+    Histograms are kept in a small in-memory LRU keyed like the image pyramids
+    (source path, channel, shape/dtype, file size and mtime). An entry is only
+    reused while the array it was computed from is alive; the cache does not
+    keep that array alive.
+
+    Args:
+        kf: Image object providing ``get_img_slice`` and ``path``.
+        channel: 1-based channel index.
+        bins: Number of bins.
+
+    Returns:
+        ImageHistogram, or ``None`` if the channel has no image data.
+    """
+    image = kf.get_img_slice(channel=channel)
+    if image is None or getattr(image, "size", 0) == 0:
+        return None
+    path = getattr(kf, "path", None)
+    path = Path(path) if path is not None else None
+    key = (
+        str(path) if path is not None else id(kf),
+        int(channel),
+        int(bins),
+        _source_cache_key(path, channel, image),
+    )
+    owner = _owner_array(image)
+    with _memory_cache_lock:
+        cached = _memory_cache.get(key)
+        if cached is not None:
+            if cached[0]() is owner:
+                _memory_cache.move_to_end(key)
+                return cached[1]
+            del _memory_cache[key]
+    hist = compute_image_histogram(image, bins=bins)
+    with _memory_cache_lock:
+        for stale in [k for k, (ref, _h) in _memory_cache.items() if ref() is None]:
+            del _memory_cache[stale]
+        _memory_cache[key] = (weakref.ref(owner), hist)
+        while len(_memory_cache) > _MAX_MEMORY_CACHE:
+            _memory_cache.popitem(last=False)
+    return hist
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional
 
 import numpy as np
 import plotly.graph_objects as go
 
+from kymflow.core.plotting.image_histogram import ImageHistogram, compute_image_histogram
+from kymflow.core.plotting.image_pyramid import DEFAULT_VIEWPORT_PX, ImagePyramid
 from kymflow.core.plotting.theme import ThemeMode
 
 from kymflow.core.plotting.theme import get_theme_colors, get_theme_template
@@ -13,12 +15,16 @@ from kymflow.core.plotting.theme import get_theme_colors, get_theme_template
 def image_plot_plotly(  # pragma: no cover
     image: Optional[np.ndarray],
     theme: Optional[ThemeMode] = None,
+    viewport_px: Optional[int] = DEFAULT_VIEWPORT_PX,
 ) -> go.Figure:
     """Create a heatmap plot from a 2D numpy array (kymograph image).
 
     Args:
         image: 2D numpy array (kymograph image), or None for empty plot
         theme: Theme mode (DARK or LIGHT). Defaults to LIGHT if None.
+        viewport_px: Maximum number of image rows (lines) to send; longer images
+            are min/max decimated with :class:`ImagePyramid`. ``None`` sends
+            the full-resolution image.
 
     Returns:
         Plotly Figure ready for display
@@ -40,11 +46,16 @@ def image_plot_plotly(  # pragma: no cover
         )
         return fig
 
-    # Create heatmap with transposed image
+    # Create heatmap with transposed image (x = source row index)
+    x_rows = None
+    if viewport_px is not None and image.ndim == 2 and image.shape[0] > viewport_px:
+        view = ImagePyramid(image).view(max_rows=int(viewport_px))
+        image, x_rows = view.z, view.rows
     fig = go.Figure()
     fig.add_trace(
         go.Heatmap(
             z=image.T,
+            **({"x": x_rows} if x_rows is not None else {}),
             colorscale="Gray",
             showscale=False,
         )
@@ -60,6 +71,42 @@ def image_plot_plotly(  # pragma: no cover
     return fig
 
 
+def _contrast_markers(
+    zmin: Optional[int], zmax: Optional[int]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Return (shapes, annotations) for the dashed zmin/zmax lines of the histogram."""
+    shapes: list[dict[str, Any]] = []
+    annotations: list[dict[str, Any]] = []
+    for value, color, text in ((zmin, "blue", "Min"), (zmax, "red", "Max")):
+        if value is None:
+            continue
+        shapes.append(
+            {
+                "type": "line",
+                "xref": "x",
+                "yref": "y domain",
+                "x0": value,
+                "x1": value,
+                "y0": 0,
+                "y1": 1,
+                "line": {"color": color, "dash": "dash", "width": 2},
+            }
+        )
+        annotations.append(
+            {
+                "text": text,
+                "showarrow": False,
+                "xref": "x",
+                "yref": "y domain",
+                "x": value,
+                "y": 1,
+                "xanchor": "center",
+                "yanchor": "bottom",
+            }
+        )
+    return shapes, annotations
+
+
 # used in histogram view
 def histogram_plot_plotly(
     image: Optional[np.ndarray],
@@ -68,6 +115,7 @@ def histogram_plot_plotly(
     log_scale: bool = True,
     theme: Optional[ThemeMode] = None,
     bins: int = 256,
+    histogram: Optional[ImageHistogram] = None,
 ) -> dict:
     """Create a histogram plot of image pixel intensities.
 
@@ -78,9 +126,13 @@ def histogram_plot_plotly(
         log_scale: If True, use log scale for y-axis (default: True)
         theme: Theme mode (DARK or LIGHT). Defaults to LIGHT if None.
         bins: Number of bins for histogram (default: 256)
+        histogram: Precomputed histogram (e.g. from ``get_image_histogram``).
+            When given, ``image`` pixels are not read.
 
     Returns:
-        Plotly figure dict ready for ui.plotly / update_figure
+        Plotly figure dict ready for ui.plotly / update_figure. Move the
+        zmin/zmax lines or toggle the log scale with
+        :func:`update_histogram_markers` instead of rebuilding it.
     """
     # Default to LIGHT theme
     if theme is None:
@@ -91,7 +143,7 @@ def histogram_plot_plotly(
     grid_color = "rgba(255,255,255,0.2)" if theme is ThemeMode.DARK else "#cccccc"
 
     # Handle None image
-    if image is None:
+    if image is None and histogram is None:
         fig = go.Figure()
         fig.update_layout(
             template=template,
@@ -101,45 +153,23 @@ def histogram_plot_plotly(
         )
         return fig.to_dict()
 
-    # Compute histogram of entire image (always full range)
-    flat_image = image.flatten()
-    hist, bin_edges = np.histogram(flat_image, bins=bins)
-    bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-
-    # Get image intensity range for fixed x-axis (always start at 0)
-    image_max = float(np.max(flat_image))
+    # Histogram of entire image (always full range)
+    if histogram is None:
+        histogram = compute_image_histogram(image, bins=bins)
 
     # Create bar chart
     fig = go.Figure()
     fig.add_trace(
         go.Bar(
-            x=bin_centers,
-            y=hist,
+            x=histogram.bin_centers,
+            y=histogram.counts,
             marker_color=fg_color,
             opacity=0.7,
         )
     )
 
-    # Add vertical lines for zmin and zmax
-    if zmin is not None:
-        fig.add_vline(
-            x=zmin,
-            line_dash="dash",
-            line_color="blue",
-            line_width=2,
-            annotation_text="Min",
-            annotation_position="top",
-        )
-
-    if zmax is not None:
-        fig.add_vline(
-            x=zmax,
-            line_dash="dash",
-            line_color="red",
-            line_width=2,
-            annotation_text="Max",
-            annotation_position="top",
-        )
+    # Vertical lines for zmin and zmax
+    shapes, annotations = _contrast_markers(zmin, zmax)
 
     # Configure layout with fixed x-axis range
     fig.update_layout(
@@ -147,11 +177,13 @@ def histogram_plot_plotly(
         paper_bgcolor=bg_color,
         plot_bgcolor=bg_color,
         font=dict(color=fg_color),
+        shapes=shapes,
+        annotations=annotations,
         xaxis=dict(
             title="Pixel Intensity",
             color=fg_color,
             gridcolor=grid_color,
-            range=[0.0, image_max],  # Fix x-axis range: always start at 0, end at max
+            range=[0.0, histogram.image_max],  # Fix x-axis range: always start at 0, end at max
         ),
         yaxis=dict(
             title="Count",
@@ -165,3 +197,34 @@ def histogram_plot_plotly(
     )
 
     return fig.to_dict()
+
+
+def update_histogram_markers(
+    fig_dict: dict,
+    zmin: Optional[int] = None,
+    zmax: Optional[int] = None,
+    log_scale: bool = True,
+) -> dict[str, Any]:
+    """Move the zmin/zmax lines and set the y-axis scale of a histogram dict in place.
+
+    Args:
+        fig_dict: Figure dict from :func:`histogram_plot_plotly`.
+        zmin: Minimum intensity line position (None hides it).
+        zmax: Maximum intensity line position (None hides it).
+        log_scale: If True, use log scale for y-axis.
+
+    Returns:
+        The changed layout keys, suitable for ``Plotly.relayout`` so the client
+        can be updated without re-sending the bars.
+    """
+    shapes, annotations = _contrast_markers(zmin, zmax)
+    relayout = {
+        "shapes": shapes,
+        "annotations": annotations,
+        "yaxis.type": "log" if log_scale else "linear",
+    }
+    layout = fig_dict.setdefault("layout", {})
+    layout["shapes"] = shapes
+    layout["annotations"] = annotations
+    layout.setdefault("yaxis", {})["type"] = relayout["yaxis.type"]
+    return relayout
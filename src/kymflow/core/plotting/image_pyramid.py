@@ -0,0 +1,364 @@
+"""Min/max-preserving multi-resolution pyramid for kymograph heatmaps.
+
+Long kymographs (tens of thousands of lines) are far taller than the number of
+screen pixels available to draw them, so sending the full-resolution array to
+the browser wastes bandwidth. :class:`ImagePyramid` keeps decimated copies of a
+2D image along dim0 (time/lines). Each coarser level stores, for every block
+of source lines, the per-pixel minimum followed by the per-pixel maximum, so
+brief bright or dark features survive decimation.
+
+Levels are built lazily on first use and can be persisted next to the source
+file under ``.kymflow_hidden`` (see :func:`get_image_pyramid`).
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+from kymflow.core.utils.hidden_cache_paths import get_hidden_cache_dir
+from kymflow.core.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from kymflow.core.image_loaders.acq_image import AcqImage
+
+logger = get_logger(__name__)
+
+# Default on-screen width (in pixels) a heatmap is decimated for when the
+# caller does not know the real viewport width.
+DEFAULT_VIEWPORT_PX = 1024
+
+# Coarsest level stops once it has at most this many rows.
+PYRAMID_MIN_ROWS = 256
+
+_PYRAMID_CACHE_VERSION = 1
+_MAX_MEMORY_CACHE = 8
+
+
+@dataclass(frozen=True)
+class PyramidView:
+    """One decimated window of an :class:`ImagePyramid`.
+
+    Attributes:
+        z: Image rows for the window (shape ``(n_rows, n_cols)``).
+        rows: Fractional source-row coordinate of each row in ``z`` (row center).
+        factor: Decimation factor of the level used (1 = full resolution).
+    """
+
+    z: np.ndarray
+    rows: np.ndarray
+    factor: int
+
+
+class _PyramidLevels:
+    """Decimated levels of one source image, shared by the pyramids over it."""
+
+    def __init__(self) -> None:
+        self.levels: Optional[dict[int, np.ndarray]] = None
+        self.lock = threading.Lock()
+
+    def release(self, _ref: object = None) -> None:
+        """Drop the levels (weakref callback once the source image is freed)."""
+        self.levels = None
+
+
+def _minmax_halve(level: np.ndarray, *, from_source: bool) -> np.ndarray:
+    """Return the next coarser (min, max) level from ``level``.
+
+    Args:
+        level: Source image (``from_source=True``) or an existing min/max level
+            whose rows alternate ``min, max``.
+        from_source: Whether ``level`` is the full-resolution image.
+
+    Returns:
+        Level with half as many rows (rounded up to an even count).
+    """
+    # Groups of 4 rows: 4 source rows, or two (min, max) pairs.
+    pad = (-level.shape[0]) % 4
+    if pad:
+        tail = level[-1:] if from_source else level[-2:]
+        reps = -(-pad // tail.shape[0])
+        level = np.concatenate([level, np.tile(tail, (reps, 1))[:pad]], axis=0)
+    groups = level.reshape(-1, 4, level.shape[1])
+    if from_source:
+        lo = groups.min(axis=1)
+        hi = groups.max(axis=1)
+    else:
+        lo = groups[:, 0::2].min(axis=1)
+        hi = groups[:, 1::2].max(axis=1)
+    out = np.empty((lo.shape[0] * 2, level.shape[1]), dtype=level.dtype)
+    out[0::2] = lo
+    out[1::2] = hi
+    return out
+
+
+class ImagePyramid:
+    """Lazily built min/max pyramid of a 2D image along dim0.
+
+    Level ``factor=1`` is the source image. Level ``factor=f`` (``f = 2, 4, ...``)
+    has ``ceil(n_rows / f)`` rows (rounded up to even): every block of ``2 * f``
+    source rows becomes a ``(min, max)`` row pair.
+
+    Attributes:
+        image: Full-resolution 2D source image.
+    """
+
+    def __init__(self, image: np.ndarray, *, cache_path: Optional[Path] = None, cache_key: str = "") -> None:
+        """Create a pyramid over ``image``.
+
+        Args:
+            image: 2D array ``(n_rows, n_cols)``; rows are decimated.
+            cache_path: Optional ``.npz`` path to load/store the levels.
+            cache_key: Identity of the source data; a cached file with a
+                different key is ignored and rebuilt.
+
+        Raises:
+            ValueError: If ``image`` is not 2D.
+        """
+        if image.ndim != 2:
+            raise ValueError(f"ImagePyramid requires a 2D image, got shape {image.shape}")
+        self.image = image
+        self._cache_path = cache_path
+        self._cache_key = cache_key
+        self._store = _PyramidLevels()
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Shape of the full-resolution image."""
+        return (int(self.image.shape[0]), int(self.image.shape[1]))
+
+    def _ensure_levels(self) -> dict[int, np.ndarray]:
+        """Load levels from the disk cache or build them (once, thread-safe)."""
+        store = self._store
+        levels = store.levels
+        if levels is not None:
+            return levels
+        with store.lock:
+            if store.levels is None:
+                store.levels = self._build_levels()
+            return store.levels
+
+    def _build_levels(self) -> dict[int, np.ndarray]:
+        levels = self._load_cached()
+        if levels is None:
+            levels = {}
+            current = self.image
+            factor = 1
+            while current.shape[0] > PYRAMID_MIN_ROWS:
+                current = _minmax_halve(current, from_source=(factor == 1))
+                factor *= 2
+                levels[factor] = current
+            self._save_cached(levels)
+        return levels
+
+    def _load_cached(self) -> Optional[dict[int, np.ndarray]]:
+        path = self._cache_path
+        if path is None or not path.is_file():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as npz:
+                if str(npz["cache_key"]) != self._cache_key:
+                    return None
+                if int(npz["version"]) != _PYRAMID_CACHE_VERSION:
+                    return None
+                return {
+                    int(name.split("_", 1)[1]): npz[name]
+                    for name in npz.files
+                    if name.startswith("level_")
+                }
+        except Exception as e:
+            logger.warning("Ignoring unreadable image pyramid cache %s: %s", path, e)
+            return None
+
+    def _save_cached(self, levels: dict[int, np.ndarray]) -> None:
+        path = self._cache_path
+        if path is None or not levels:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp.npz")
+            arrays: dict[str, Any] = {f"level_{f}": arr for f, arr in levels.items()}
+            np.savez(
+                tmp,
+                cache_key=np.array(self._cache_key),
+                version=np.array(_PYRAMID_CACHE_VERSION),
+                **arrays,
+            )
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning("Could not write image pyramid cache %s: %s", path, e)
+
+    def factors(self) -> list[int]:
+        """Return available decimation factors, finest first (always starts with 1)."""
+        return [1, *sorted(self._ensure_levels())]
+
+    def level(self, factor: int) -> np.ndarray:
+        """Return the level array for ``factor`` (``1`` is the source image).
+
+        Raises:
+            KeyError: If ``factor`` is not a level of this pyramid.
+        """
+        if int(factor) == 1:
+            return self.image
+        return self._ensure_levels()[int(factor)]
+
+    def select_factor(self, n_visible_rows: float, max_rows: int) -> int:
+        """Return the finest factor whose level fits ``n_visible_rows`` in ``max_rows``.
+
+        Args:
+            n_visible_rows: Number of source rows in the visible range.
+            max_rows: Maximum number of rows to send (e.g. viewport pixel width).
+
+        Returns:
+            Decimation factor; the coarsest level when none fits.
+        """
+        if n_visible_rows <= max_rows:
+            return 1
+        factors = self.factors()
+        for f in factors:
+            if n_visible_rows / f <= max_rows:
+                return f
+        return factors[-1]
+
+    def view(
+        self,
+        row_range: Optional[tuple[float, float]] = None,
+        *,
+        max_rows: int = DEFAULT_VIEWPORT_PX,
+    ) -> PyramidView:
+        """Return the rows covering ``row_range`` at the matching resolution.
+
+        Args:
+            row_range: Visible ``(row_start, row_stop)`` in source-row units, or
+                ``None`` for the whole image.
+            max_rows: Target row count (typically the viewport pixel width).
+
+        Returns:
+            PyramidView: Decimated rows and their source-row coordinates.
+        """
+        n = self.shape[0]
+        if row_range is None:
+            r0, r1 = 0.0, float(n)
+        else:
+            r0, r1 = sorted((float(row_range[0]), float(row_range[1])))
+            r0 = min(max(r0, 0.0), float(n))
+            r1 = min(max(r1, 0.0), float(n))
+        factor = self.select_factor(max(r1 - r0, 1.0), max(int(max_rows), 1))
+        arr = self.level(factor)
+        # Level row i nominally stands for source rows [i*f, (i+1)*f).
+        i0 = int(np.floor(r0 / factor))
+        i1 = int(np.ceil(r1 / factor))
+        if factor > 1:
+            i0 -= i0 % 2  # keep (min, max) pairs together
+            i1 += i1 % 2
+        # One row of margin on each side so the heatmap reaches the axis edges.
+        i0 = max(i0 - (2 if factor > 1 else 1), 0)
+        i1 = min(i1 + (2 if factor > 1 else 1), arr.shape[0])
+        rows = (np.arange(i0, i1, dtype=float) + 0.5) * factor - 0.5
+        rows = np.minimum(rows, float(n - 1))
+        return PyramidView(z=arr[i0:i1], rows=rows, factor=factor)
+
+
+# Levels of recently used images. Entries hold the source image weakly: once
+# it is freed, its levels are released at once and the entry is evicted on the
+# next cache access.
+_memory_cache: "OrderedDict[tuple, tuple[weakref.ref, _PyramidLevels]]" = OrderedDict()
+# Guards _memory_cache; pyramids are also requested from worker threads.
+_memory_cache_lock = threading.Lock()
+_finalized_refs: "deque[weakref.ref]" = deque()
+
+
+def _purge_finalized() -> None:
+    """Evict entries whose source image was garbage collected (call with the lock held)."""
+    if not _finalized_refs:
+        return
+    dead = set()
+    while _finalized_refs:
+        dead.add(id(_finalized_refs.popleft()))
+    for key in [k for k, (ref, _store) in _memory_cache.items() if id(ref) in dead]:
+        del _memory_cache[key]
+
+
+def _owner_array(image: np.ndarray) -> np.ndarray:
+    """Return the outermost ndarray whose memory ``image`` views."""
+    while isinstance(image.base, np.ndarray):
+        image = image.base
+    return image
+
+
+def _on_source_finalized(store: _PyramidLevels, ref: weakref.ref) -> None:
+    store.release()
+    _finalized_refs.append(ref)
+
+
+def _source_cache_key(path: Optional[Path], channel: int, image: np.ndarray) -> str:
+    """Identity of a channel image: shape/dtype plus source file size and mtime."""
+    parts = [f"ch{int(channel)}", "x".join(str(s) for s in image.shape), str(image.dtype)]
+    if path is not None:
+        try:
+            st = Path(path).stat()
+            parts += [str(st.st_size), str(st.st_mtime_ns)]
+        except OSError:
+            pass
+    return "|".join(parts)
+
+
+def pyramid_cache_path(path: Path, channel: int) -> Path:
+    """Return the on-disk pyramid cache path for ``path``/``channel`` under ``.kymflow_hidden``."""
+    path = Path(path)
+    return get_hidden_cache_dir(path) / f"{path.name}.ch{int(channel)}.pyramid.npz"
+
+
+def get_image_pyramid(
+    kf: "AcqImage",
+    channel: int = 1,
+    *,
+    use_disk_cache: bool = True,
+) -> Optional[ImagePyramid]:
+    """Return the (cached) pyramid for one image channel.
+
+    Levels are kept in a small in-memory LRU keyed by source identity for as
+    long as the source image is alive, and are persisted under
+    ``.kymflow_hidden`` next to the source file when ``use_disk_cache`` is True
+    and the image has a path.
+
+    Args:
+        kf: Image object providing ``get_img_slice`` and ``path``.
+        channel: 1-based channel index.
+        use_disk_cache: Load/store levels on disk.
+
+    Returns:
+        ImagePyramid, or ``None`` if the channel has no 2D image data.
+    """
+    image = kf.get_img_slice(channel=channel)
+    if image is None or getattr(image, "ndim", 0) != 2:
+        return None
+    path = getattr(kf, "path", None)
+    path = Path(path) if path is not None else None
+    key = _source_cache_key(path, channel, image)
+    mem_key = (str(path) if path is not None else id(kf), int(channel), key)
+
+    owner = _owner_array(image)
+    cache_path = pyramid_cache_path(path, channel) if (use_disk_cache and path is not None) else None
+    pyramid = ImagePyramid(image, cache_path=cache_path, cache_key=key)
+
+    with _memory_cache_lock:
+        _purge_finalized()
+        cached = _memory_cache.get(mem_key)
+        if cached is not None and cached[0]() is owner:
+            _memory_cache.move_to_end(mem_key)
+            pyramid._store = cached[1]
+            return pyramid
+
+        store = pyramid._store
+        ref = weakref.ref(owner, lambda r, store=store: _on_source_finalized(store, r))
+        _memory_cache[mem_key] = (ref, store)
+        while len(_memory_cache) > _MAX_MEMORY_CACHE:
+            _memory_cache.popitem(last=False)
+        return pyramid
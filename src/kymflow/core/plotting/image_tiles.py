@@ -0,0 +1,182 @@
+"""Server-side colormapped image tiles for kymograph display.
+
+Instead of sending heatmap values that Plotly colormaps in the browser, the
+visible window of the image (taken from the :class:`ImagePyramid`) is
+contrast-stretched with ``zmin``/``zmax``, mapped through a NumPy lookup table
+built from the same colorscale as the heatmap (:mod:`kymflow.core.plotting.colorscales`),
+encoded as PNG/WebP and shown as a Plotly layout image stretched over the
+physical axis extent. The browser then only holds one small compressed image,
+whatever the length of the kymograph.
+
+Tiles are wired into the v1 :class:`ImageLineViewerView` only; the app's
+``ImageLineViewerV2View`` renders through the nicewidgets combined widget,
+which builds its own heatmap and does not use these helpers.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+from typing import Any, Literal, Optional, Sequence
+
+import numpy as np
+import plotly.colors
+
+from kymflow.core.plotting.colorscales import get_colorscale
+from kymflow.core.plotting.display_lut import stretch_to_indices
+from kymflow.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+TileFormat = Literal["png", "webp"]
+
+# Name of the layout image holding the tile (``layout.images[*].name``).
+TILE_IMAGE_NAME = "kymflow_tile"
+
+LUT_SIZE = 256
+
+
+def _parse_color(color: str) -> tuple[float, float, float]:
+    """Return an ``(r, g, b)`` tuple (0-255) for a Plotly color string."""
+    color = color.strip()
+    if color.startswith("#"):
+        return tuple(float(c) for c in plotly.colors.hex_to_rgb(color))  # type: ignore[return-value]
+    if color.startswith("rgb"):
+        r, g, b = plotly.colors.unlabel_rgb(color)[:3]
+        return (float(r), float(g), float(b))
+    raise ValueError(f"Unsupported color {color!r}")
+
+
+def colorscale_lut(colorscale: str | Sequence, n: int = LUT_SIZE) -> np.ndarray:
+    """Return an ``(n, 3)`` ``uint8`` lookup table for a colorscale.
+
+    Args:
+        colorscale: Name from :data:`~kymflow.core.plotting.colorscales.COLORSCALE_OPTIONS`
+            (resolved with :func:`get_colorscale`), a Plotly named colorscale,
+            or a Plotly colorscale list ``[[pos, color], ...]``.
+        n: Number of LUT entries.
+
+    Returns:
+        Lookup table matching how Plotly interpolates the colorscale.
+    """
+    scale = get_colorscale(colorscale) if isinstance(colorscale, str) else colorscale
+    if isinstance(scale, str):
+        try:
+            scale = plotly.colors.get_colorscale(scale)
+        except Exception:
+            logger.warning("Unknown colorscale %r, using gray", colorscale)
+            scale = [[0.0, "rgb(0,0,0)"], [1.0, "rgb(255,255,255)"]]
+    positions = np.asarray([float(p) for p, _c in scale])
+    colors = np.asarray([_parse_color(str(c)) for _p, c in scale])
+    t = np.linspace(0.0, 1.0, n)
+    lut = np.stack([np.interp(t, positions, colors[:, i]) for i in range(3)], axis=1)
+    return np.clip(np.rint(lut), 0, 255).astype(np.uint8)
+
+
+def apply_lut(z: np.ndarray, zmin: float, zmax: float, lut: np.ndarray) -> np.ndarray:
+    """Contrast-stretch ``z`` to ``[zmin, zmax]`` and map it through ``lut``.
+
+    ``uint8``/``uint16`` images go through a cached per-value index table
+    (:func:`~kymflow.core.plotting.display_lut.stretch_to_indices`) instead of
+    a float32 copy.
+
+    Args:
+        z: 2D image values.
+        zmin: Value mapped to the first LUT entry (and below).
+        zmax: Value mapped to the last LUT entry (and above).
+        lut: ``(n, 3)`` lookup table from :func:`colorscale_lut`.
+
+    Returns:
+        ``(rows, cols, 3)`` ``uint8`` RGB image.
+    """
+    return lut[stretch_to_indices(z, zmin, zmax, lut.shape[0])]
+
+
+def encode_tile(rgb: np.ndarray, fmt: TileFormat = "png") -> str:
+    """Encode an RGB array as a ``data:`` URI for a Plotly layout image.
+
+    Args:
+        rgb: ``(rows, cols, 3)`` ``uint8`` image; row 0 is the top.
+        fmt: ``"png"`` (lossless) or ``"webp"`` (lossless WebP, smaller).
+
+    Returns:
+        Base64 data URI.
+    """
+    from PIL import Image  # Pillow is installed with scikit-image
+
+    buf = io.BytesIO()
+    img = Image.fromarray(np.ascontiguousarray(rgb), mode="RGB")
+    if fmt == "webp":
+        img.save(buf, format="WEBP", lossless=True)
+    else:
+        img.save(buf, format="PNG", compress_level=1)
+    return f"data:image/{fmt};base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def _axis_extent(coords: np.ndarray) -> tuple[float, float]:
+    """Return ``(start_edge, size)`` of pixels centered on ``coords``."""
+    coords = np.asarray(coords, dtype=float)
+    if coords.size < 2:
+        c = float(coords[0]) if coords.size else 0.0
+        return c - 0.5, 1.0
+    step = (coords[-1] - coords[0]) / (coords.size - 1)
+    return float(coords[0] - step / 2), float(coords[-1] - coords[0] + step)
+
+
+def tile_layout_image(
+    z: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    *,
+    colorscale: str | Sequence,
+    zmin: float,
+    zmax: float,
+    fmt: TileFormat = "png",
+    xref: str = "x",
+    yref: str = "y",
+) -> dict[str, Any]:
+    """Return a Plotly layout image showing ``z`` like a heatmap would.
+
+    ``z``, ``x`` and ``y`` follow heatmap conventions: ``z[i, j]`` is drawn at
+    ``(x[j], y[i])`` and ``y`` increases upwards.
+
+    Args:
+        z: 2D values (rows along ``y``).
+        x: Cell-center coordinates of the columns (uniformly spaced).
+        y: Cell-center coordinates of the rows (uniformly spaced).
+        colorscale: Colorscale name or list (see :func:`colorscale_lut`).
+        zmin: Lower contrast limit.
+        zmax: Upper contrast limit.
+        fmt: Tile encoding.
+        xref: Plotly x-axis reference.
+        yref: Plotly y-axis reference.
+
+    Returns:
+        Layout image dict (``layout.images`` entry).
+    """
+    rgb = apply_lut(z, zmin, zmax, colorscale_lut(colorscale))
+    x0, sizex = _axis_extent(x)
+    y0, sizey = _axis_extent(y)
+    return {
+        "name": TILE_IMAGE_NAME,
+        # Flip: image row 0 is the top, heatmap row 0 is the bottom.
+        "source": encode_tile(rgb[::-1], fmt),
+        "xref": xref,
+        "yref": yref,
+        "x": x0,
+        "y": y0 + sizey,
+        "sizex": sizex,
+        "sizey": sizey,
+        "xanchor": "left",
+        "yanchor": "top",
+        "sizing": "stretch",
+        "layer": "below",
+    }
+
+
+def find_tile_image(plotly_dict: dict) -> Optional[dict[str, Any]]:
+    """Return the tile layout image of a figure dict, or ``None``."""
+    for image in (plotly_dict.get("layout") or {}).get("images") or []:
+        if image.get("name") == TILE_IMAGE_NAME:
+            return image
+    return None
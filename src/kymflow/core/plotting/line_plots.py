@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Literal, Optional, Union
 
 import numpy as np
 import plotly.graph_objects as go
@@ -10,6 +10,22 @@ from kymflow.core.plotting.theme import ThemeMode
 from kymflow.core.image_loaders.kym_image import KymImage
 
 from kymflow.core.plotting.colorscales import get_colorscale
+from kymflow.core.plotting.decimation import (
+    decimate_xy,
+    decimation_meta,
+    update_decimated_trace,
+)
+from kymflow.core.plotting.image_histogram import get_image_histogram
+from kymflow.core.plotting.image_pyramid import (
+    DEFAULT_VIEWPORT_PX,
+    ImagePyramid,
+    get_image_pyramid,
+)
+from kymflow.core.plotting.image_tiles import (
+    TileFormat,
+    find_tile_image,
+    tile_layout_image,
+)
 from kymflow.core.plotting.theme import get_theme_colors, get_theme_template
 from kymflow.core.plotting.roi_config import (
     ROI_COLOR_DEFAULT,
@@ -164,6 +180,37 @@ def line_plot_plotly(  # pragma: no cover
     return fig
 
 
+def get_roi_line_values(
+    kym_analysis,
+    roi_id: int,
+    yStat: str,
+    remove_outliers: bool = False,
+    median_filter: int = 0,
+) -> tuple[np.ndarray | None, np.ndarray | None]:
+    """Return the full-resolution (time, yStat) radon arrays plotted for an ROI.
+
+    Args:
+        kym_analysis: KymAnalysis instance to get data from.
+        roi_id: ROI identifier.
+        yStat: Column name for y-axis data (e.g., "velocity").
+        remove_outliers: If True, remove outliers using 2*std threshold.
+        median_filter: Median filter window size.
+
+    Returns:
+        Tuple of (time_values, y_values), or (None, None) if the ROI has no
+        radon analysis.
+    """
+    radon = kym_analysis.get_analysis_object("RadonAnalysis")
+    channel = radon.get_channel_for_roi(roi_id) if radon else None
+    if radon is None or channel is None or not radon.has_analysis(roi_id, channel):
+        return (None, None)
+    time_values = radon.get_analysis_value(roi_id, channel, "time")
+    y_values = radon.get_analysis_value(roi_id, channel, yStat, remove_outliers, median_filter)
+    if time_values is None or y_values is None:
+        return (None, None)
+    return (time_values, y_values)
+
+
 def _add_single_roi_line_plot(  # pragma: no cover
     fig: go.Figure,
     kym_analysis,
@@ -176,6 +223,7 @@ def _add_single_roi_line_plot(  # pragma: no cover
     fg_color: str,
     bg_color: str,
     font_dict: dict,
+    viewport_px: Optional[int] = None,
 ) -> tuple[np.ndarray | None, np.ndarray | None]:
     """Add a line plot with stall overlays for a single ROI to a specific subplot row.
     
@@ -191,13 +239,19 @@ def _add_single_roi_line_plot(  # pragma: no cover
         fg_color: Color for foreground text.
         bg_color: Background color for legend box.
         font_dict: Font dictionary for annotations.
+        viewport_px: On-screen width of the time axis in pixels. When given, the
+            trace is min/max decimated to about two points per pixel (see
+            :func:`~kymflow.core.plotting.decimation.decimate_xy`); ``None``
+            plots every point.
     
     Returns:
-        Tuple of (time_values, y_values) arrays, or (None, None) if no analysis data.
+        Tuple of full-resolution (time_values, y_values) arrays, or (None, None)
+        if no analysis data.
     """
-    radon = kym_analysis.get_analysis_object("RadonAnalysis")
-    channel = radon.get_channel_for_roi(roi_id) if radon else None
-    if radon is None or channel is None or not radon.has_analysis(roi_id, channel):
+    analysis_time_values, y_values = get_roi_line_values(
+        kym_analysis, roi_id, yStat, remove_outliers, median_filter
+    )
+    if analysis_time_values is None:
         # No analysis data - show message
         fig.add_annotation(
             text="Analyze flow to see velocity trace",
@@ -212,22 +266,25 @@ def _add_single_roi_line_plot(  # pragma: no cover
         )
         return (None, None)
     
-    analysis_time_values = radon.get_analysis_value(roi_id, channel, "time")
-    y_values = radon.get_analysis_value(roi_id, channel, yStat, remove_outliers, median_filter)
-    
     if (
         analysis_time_values is not None
         and y_values is not None
         and len(analysis_time_values) > 0
     ):
         # Add line plot trace with legend label
+        plot_x, plot_y = analysis_time_values, y_values
+        decimate_kwargs: dict = {}
+        if viewport_px is not None:
+            plot_x, plot_y = decimate_xy(plot_x, plot_y, viewport_px=int(viewport_px))
+            decimate_kwargs = {"meta": decimation_meta(int(viewport_px))}
         fig.add_trace(
             # go.Scatter(
             go.Scattergl(
-                x=analysis_time_values,
-                y=y_values,
+                x=plot_x,
+                y=plot_y,
                 mode="lines",
                 name=f"ROI {roi_id}",
+                **decimate_kwargs,
             ),
             row=row,
             col=1,
@@ -490,6 +547,9 @@ def plot_image_line_plotly_v3(
     selected_event_id: Optional[str] = None,
     event_filter: Optional[dict[str, bool]] = None,
     # x_axis_callback: Optional[Callable[[XAxisCallback], None]] = None,
+    viewport_px: Optional[int] = DEFAULT_VIEWPORT_PX,
+    image_render: Literal["heatmap", "tile"] = "heatmap",
+    tile_format: TileFormat = "png",
 ) -> go.Figure:
     """Create a figure with kymograph image and one or more line plots for multiple ROIs.
     
@@ -514,6 +574,17 @@ def plot_image_line_plotly_v3(
         span_sec_if_no_end: Fixed width in seconds for velocity events when t_end is None
                            (default: 0.20)
         event_filter: Optional dict mapping event_type (str) to bool (True = include, False = exclude).
+        viewport_px: Approximate on-screen width of the time axis in pixels. The
+            heatmap is taken from the channel's :class:`ImagePyramid` level with
+            at most this many lines (min/max preserving). ``None`` sends the
+            full-resolution image. Velocity traces are min/max decimated to
+            about two points per pixel; ``None`` plots every point.
+        image_render: ``"heatmap"`` sends image values for Plotly to colormap
+            in the browser. ``"tile"`` colormaps the visible pyramid window on
+            the server and shows it as a compressed layout image (see
+            :mod:`kymflow.core.plotting.image_tiles`); row 1 then holds an
+            invisible placeholder trace that spans the image extent.
+        tile_format: Encoding of the ``"tile"`` image (``"png"`` or ``"webp"``).
 
     Returns:
         Plotly Figure with image subplot and one or more line plot subplots with
@@ -592,10 +663,30 @@ def plot_image_line_plotly_v3(
     # Plot image in top subplot (row=1)
     colorscale_value = get_colorscale(colorscale)
 
+    z_image = image
+    pyramid_meta: dict = {}
+    if viewport_px is not None:
+        pyramid = get_image_pyramid(kf, channel)
+        if pyramid is not None:
+            view = pyramid.view(max_rows=int(viewport_px))
+            z_image = view.z
+            dim0_arange = _rows_to_dim0(view.rows, dim0_arange)
+            pyramid_meta = {
+                "meta": {
+                    "kymflow_pyramid": {
+                        "channel": int(channel),
+                        "viewport_px": int(viewport_px),
+                        "transpose": bool(transpose),
+                        "factor": int(view.factor),
+                    }
+                }
+            }
+
     heatmap_kwargs = {
-        "z": image.transpose() if transpose else image,
+        "z": z_image.transpose() if transpose else z_image,
         "x": dim0_arange if transpose else dim1_arange,
         "y": dim1_arange if transpose else dim0_arange,
+        **pyramid_meta,
         "colorscale": colorscale_value,
         "showscale": False,
         "hoverinfo": "skip",
@@ -603,12 +694,15 @@ def plot_image_line_plotly_v3(
         **({"zmax": zmax} if zmax is not None else {}),
     }
 
-    fig.add_trace(
-        # go.Heatmapgl(**heatmap_kwargs),
-        go.Heatmap(**heatmap_kwargs),
-        row=1,
-        col=1,
-    )
+    if image_render == "tile":
+        _add_image_tile(fig, kf, channel, heatmap_kwargs, colorscale, pyramid_meta, tile_format)
+    else:
+        fig.add_trace(
+            # go.Heatmapgl(**heatmap_kwargs),
+            go.Heatmap(**heatmap_kwargs),
+            row=1,
+            col=1,
+        )
 
     # Configure top subplot axes using header labels
     y_label = kf.header.labels[1] if transpose else kf.header.labels[0]  # Space dimension
@@ -665,6 +759,7 @@ def plot_image_line_plotly_v3(
                 fg_color,
                 bg_color,
                 font_dict,
+                viewport_px=viewport_px,
             )
             
             # Add velocity event overlays after stall overlays (so they render on top)
@@ -827,15 +922,285 @@ def _add_roi_overlay(  # pragma: no cover
         fig.update_layout(annotations=existing_annotations)
 
 
-def update_xaxis_range_v2(plotly_dict: dict, x_range: list[float]) -> None:  # pragma: no cover
+def _add_image_tile(
+    fig: go.Figure,
+    kf: KymImage,
+    channel: int,
+    heatmap_kwargs: dict,
+    colorscale: str,
+    pyramid_meta: dict,
+    tile_format: TileFormat,
+) -> None:
+    """Show the image row as a server-colormapped layout image (``image_render="tile"``).
+
+    Adds an invisible placeholder trace spanning the image extent (so axis
+    autorange and trace indices match the heatmap mode) carrying the tile
+    settings in ``meta.kymflow_tile``.
+    """
+    zmin = heatmap_kwargs.get("zmin")
+    zmax = heatmap_kwargs.get("zmax")
+    if zmin is None or zmax is None:
+        hist = get_image_histogram(kf, channel)
+        if hist is not None:
+            zmin = hist.image_min if zmin is None else zmin
+            zmax = hist.image_max if zmax is None else zmax
+    if zmin is None or zmax is None:
+        z = np.asarray(heatmap_kwargs["z"])
+        zmin = float(np.nanmin(z)) if zmin is None else zmin
+        zmax = float(np.nanmax(z)) if zmax is None else zmax
+    x = np.asarray(heatmap_kwargs["x"], dtype=float)
+    y = np.asarray(heatmap_kwargs["y"], dtype=float)
+    image = tile_layout_image(
+        heatmap_kwargs["z"],
+        x,
+        y,
+        colorscale=colorscale,
+        zmin=float(zmin),
+        zmax=float(zmax),
+        fmt=tile_format,
+    )
+    tile_meta = {
+        **(pyramid_meta.get("meta", {}).get("kymflow_pyramid") or {"channel": int(channel)}),
+        "colorscale": colorscale,
+        "zmin": zmin,
+        "zmax": zmax,
+        "format": tile_format,
+        "x_range": None,
+    }
+    fig.add_trace(
+        go.Scatter(
+            x=[image["x"], image["x"] + image["sizex"]],
+            y=[image["y"] - image["sizey"], image["y"]],
+            mode="markers",
+            marker={"opacity": 0},
+            hoverinfo="skip",
+            showlegend=False,
+            meta={"kymflow_tile": tile_meta},
+        ),
+        row=1,
+        col=1,
+    )
+    fig.add_layout_image(image)
+
+
+def _extent_coords(start: float, size: float, n: int) -> np.ndarray:
+    """Return ``n`` pixel-center coordinates covering ``[start, start + size]``."""
+    return start + (np.arange(n, dtype=float) + 0.5) * (size / max(n, 1))
+
+
+def update_image_tile(
+    plotly_dict: dict,
+    pyramid: ImagePyramid,
+    dim0_arange: np.ndarray,
+    x_range: Optional[list[float]],
+) -> bool:
+    """Re-encode the server-rendered tile for the pyramid window matching ``x_range``.
+
+    Tile counterpart of :func:`update_heatmap_tile` for figures built with
+    ``image_render="tile"``. Only the visible window is colormapped/encoded.
+
+    Args:
+        plotly_dict: Plotly figure dictionary (from fig.to_dict()).
+        pyramid: Pyramid of the displayed channel (see ``get_image_pyramid``).
+        dim0_arange: Physical dim0 coordinates of the full-resolution rows.
+        x_range: Visible ``[min, max]`` in dim0 units, or ``None`` for all rows.
+
+    Returns:
+        True if the tile image was replaced.
+    """
+    image = find_tile_image(plotly_dict)
+    meta = None
+    for trace in plotly_dict.get("data", []):
+        meta = (trace.get("meta") or {}).get("kymflow_tile")
+        if meta:
+            break
+    if image is None or not meta:
+        return False
+    transpose = bool(meta.get("transpose", True))
+    if not transpose and x_range is not None:
+        # x is space when not transposed; dim0 windows only apply to time on x.
+        x_range = None
+
+    row_range = None
+    if x_range is not None and dim0_arange.size > 1:
+        rows = np.arange(dim0_arange.size)
+        row_range = (
+            float(np.interp(min(x_range), dim0_arange, rows)),
+            float(np.interp(max(x_range), dim0_arange, rows)) + 1.0,
+        )
+    view = pyramid.view(row_range, max_rows=int(meta.get("viewport_px", DEFAULT_VIEWPORT_PX)))
+    dim0 = _rows_to_dim0(view.rows, dim0_arange)
+    n_cols = view.z.shape[1]
+    if transpose:
+        z = view.z.transpose()
+        x = dim0
+        y = _extent_coords(image["y"] - image["sizey"], image["sizey"], n_cols)
+    else:
+        z = view.z
+        x = _extent_coords(image["x"], image["sizex"], n_cols)
+        y = dim0
+    new_image = tile_layout_image(
+        z,
+        x,
+        y,
+        colorscale=meta.get("colorscale", "Gray"),
+        zmin=float(meta["zmin"]),
+        zmax=float(meta["zmax"]),
+        fmt=meta.get("format", "png"),
+    )
+    image.clear()
+    image.update(new_image)
+    meta["factor"] = int(view.factor)
+    meta["x_range"] = list(x_range) if x_range is not None else None
+    return True
+
+
+def update_image_tile_display(
+    plotly_dict: dict,
+    pyramid: ImagePyramid,
+    dim0_arange: np.ndarray,
+    colorscale: Optional[str] = None,
+    zmin: Optional[float] = None,
+    zmax: Optional[float] = None,
+) -> bool:
+    """Re-encode only the visible tile with a new colorscale and/or contrast.
+
+    Args:
+        plotly_dict: Plotly figure dictionary (from fig.to_dict()).
+        pyramid: Pyramid of the displayed channel.
+        dim0_arange: Physical dim0 coordinates of the full-resolution rows.
+        colorscale: Colorscale name, or None to keep the current one.
+        zmin: Lower contrast limit, or None to keep the current value.
+        zmax: Upper contrast limit, or None to keep the current value.
+
+    Returns:
+        True if the figure has a tile and it was re-encoded.
+    """
+    for trace in plotly_dict.get("data", []):
+        meta = (trace.get("meta") or {}).get("kymflow_tile")
+        if not meta:
+            continue
+        if colorscale is not None:
+            meta["colorscale"] = colorscale
+        if zmin is not None:
+            meta["zmin"] = zmin
+        if zmax is not None:
+            meta["zmax"] = zmax
+        return update_image_tile(plotly_dict, pyramid, dim0_arange, meta.get("x_range"))
+    return False
+
+
+def _rows_to_dim0(rows: np.ndarray, dim0_arange: np.ndarray) -> np.ndarray:
+    """Map (fractional) source-row coordinates to dim0 physical units."""
+    if dim0_arange.size < 2:
+        return np.asarray(rows, dtype=float)
+    return np.interp(rows, np.arange(dim0_arange.size), dim0_arange)
+
+
+def update_heatmap_tile(
+    plotly_dict: dict,
+    pyramid: ImagePyramid,
+    dim0_arange: np.ndarray,
+    x_range: Optional[list[float]],
+) -> bool:
+    """Swap the heatmap pixels for the pyramid level/window matching ``x_range``.
+
+    Only applies to heatmaps built by :func:`plot_image_line_plotly_v3` with a
+    pyramid and ``transpose=True`` (time on the x-axis).
+
+    Args:
+        plotly_dict: Plotly figure dictionary (from fig.to_dict()).
+        pyramid: Pyramid of the displayed channel (see ``get_image_pyramid``).
+        dim0_arange: Physical dim0 coordinates of the full-resolution rows.
+        x_range: Visible ``[min, max]`` in dim0 units, or ``None`` for all rows.
+
+    Returns:
+        True if the heatmap ``z``/``x`` were replaced.
+    """
+    for trace in plotly_dict.get("data", []):
+        if trace.get("type") != "heatmap":
+            continue
+        meta = (trace.get("meta") or {}).get("kymflow_pyramid")
+        if not meta or not meta.get("transpose"):
+            return False
+        row_range = None
+        if x_range is not None and dim0_arange.size > 1:
+            rows = np.arange(dim0_arange.size)
+            row_range = (
+                float(np.interp(min(x_range), dim0_arange, rows)),
+                float(np.interp(max(x_range), dim0_arange, rows)) + 1.0,
+            )
+        view = pyramid.view(row_range, max_rows=int(meta.get("viewport_px", DEFAULT_VIEWPORT_PX)))
+        trace["z"] = view.z.transpose()
+        trace["x"] = _rows_to_dim0(view.rows, dim0_arange)
+        meta["factor"] = int(view.factor)
+        return True
+    return False
+
+
+def update_line_decimation(
+    plotly_dict: dict,
+    x: np.ndarray,
+    y: np.ndarray,
+    x_range: Optional[list[float]],
+    row: int = 2,
+) -> bool:
+    """Re-decimate the line trace of subplot ``row`` for a new visible x-range.
+
+    Only applies to traces built with ``viewport_px`` (they carry
+    ``meta.kymflow_decimate``).
+
+    Args:
+        plotly_dict: Plotly figure dictionary (from fig.to_dict()).
+        x: Full-resolution x values of the trace (see :func:`get_roi_line_values`).
+        y: Full-resolution y values of the trace.
+        x_range: Visible ``[min, max]`` x-range, or ``None`` for all data.
+        row: Subplot row number (1-based) holding the trace.
+
+    Returns:
+        True if a trace was re-decimated.
+    """
+    xaxis = f"x{row if row > 1 else ''}"
+    for trace in plotly_dict.get("data", []):
+        if trace.get("type") not in ("scatter", "scattergl"):
+            continue
+        if trace.get("xaxis", "x") != xaxis:
+            continue
+        if update_decimated_trace(trace, x, y, x_range):
+            return True
+    return False
+
+
+def update_xaxis_range_v2(
+    plotly_dict: dict,
+    x_range: list[float],
+    *,
+    pyramid: Optional[ImagePyramid] = None,
+    dim0_arange: Optional[np.ndarray] = None,
+    line_xy: Optional[tuple[np.ndarray, np.ndarray]] = None,
+) -> None:  # pragma: no cover
     """Update the x-axis range for both subplots in a plotly figure dict representation.
     
     Args:
         plotly_dict: Plotly figure dictionary (from fig.to_dict()).
         x_range: List of two floats [min, max] for the x-axis range.
+        pyramid: Optional image pyramid of the displayed channel. When given
+            (with ``dim0_arange``), the heatmap (or server-rendered tile) is
+            re-tiled at the resolution matching the new range via
+            :func:`update_heatmap_tile` / :func:`update_image_tile`.
+        dim0_arange: Physical dim0 coordinates (``kf.get_dim_arange(0)``).
+        line_xy: Optional full-resolution ``(x, y)`` of the row-2 line trace.
+            When given, the trace is re-decimated for the new range via
+            :func:`update_line_decimation`.
     """
     if 'layout' not in plotly_dict:
         return
+
+    if pyramid is not None and dim0_arange is not None:
+        if not update_heatmap_tile(plotly_dict, pyramid, np.asarray(dim0_arange), x_range):
+            update_image_tile(plotly_dict, pyramid, np.asarray(dim0_arange), x_range)
+    if line_xy is not None:
+        update_line_decimation(plotly_dict, line_xy[0], line_xy[1], x_range)
     
     layout = plotly_dict['layout']
     
@@ -874,6 +1239,31 @@ def update_yaxis_range_v2(plotly_dict: dict, y_range: list[float], row: int = 1)
         layout[yaxis_key]['range'] = y_range
 
 
+def update_heatmap_display_v2(
+    plotly_dict: dict,
+    colorscale: Optional[str] = None,
+    zmin: Optional[int] = None,
+    zmax: Optional[int] = None,
+) -> None:
+    """Update heatmap colorscale and contrast in a plotly figure dict representation.
+
+    Args:
+        plotly_dict: Plotly figure dictionary (from fig.to_dict()).
+        colorscale: Plotly colorscale name, or None to keep the current one.
+        zmin: Minimum intensity for display, or None to keep the current value.
+        zmax: Maximum intensity for display, or None to keep the current value.
+    """
+    for trace in plotly_dict.get("data", []):
+        if trace.get("type") != "heatmap":
+            continue
+        if colorscale is not None:
+            trace["colorscale"] = get_colorscale(colorscale)
+        if zmin is not None:
+            trace["zmin"] = zmin
+        if zmax is not None:
+            trace["zmax"] = zmax
+
+
 # ============================================================================
 # CRUD functions for kym event rects in plotly dict
 # ============================================================================
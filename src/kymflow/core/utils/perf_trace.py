@@ -0,0 +1,288 @@
+"""Lightweight performance tracing (UI-agnostic).
+
+:class:`TraceRecorder` collects timed spans (name, category, start, duration,
+thread, parent span). From them it reports per-name latency statistics
+(count, p50, p95, max), rebuilds nested call trees, and exports a Chrome trace
+(``chrome://tracing`` / Perfetto JSON) of the session.
+
+The GUI EventBus records one span per emit and one per handler call when the
+process-wide recorder from :func:`get_trace_recorder` is enabled, either
+programmatically or with the ``KYMFLOW_PERF_TRACE`` environment variable.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from kymflow.core.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Environment variable: a JSON path enables tracing and names the export file.
+TRACE_ENV_VAR = "KYMFLOW_PERF_TRACE"
+
+
+@dataclass(frozen=True)
+class TraceSpan:
+    """One timed span.
+
+    Attributes:
+        name: Span name (e.g. handler qualname or event type).
+        cat: Category (e.g. "emit", "handler").
+        start_s: Start time in seconds (``time.perf_counter``).
+        dur_s: Duration in seconds.
+        tid: Thread id the span ran on.
+        span_id: Unique id of this span.
+        parent_id: Id of the enclosing span, or None for a root span.
+        args: Extra key/values shown in the trace viewer.
+    """
+
+    name: str
+    cat: str
+    start_s: float
+    dur_s: float
+    tid: int
+    span_id: int
+    parent_id: Optional[int] = None
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """Latency summary of all spans with one name (times in milliseconds)."""
+
+    count: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    total_ms: float
+
+
+@dataclass
+class TraceNode:
+    """A span and the spans nested in it (see TraceRecorder.trees)."""
+
+    span: TraceSpan
+    children: List["TraceNode"] = field(default_factory=list)
+
+
+class TraceRecorder:
+    """Thread-safe recorder of timed spans.
+
+    Recording is a no-op until :meth:`enable` is called. Only the most recent
+    ``max_spans`` spans are kept.
+
+    Args:
+        max_spans: Maximum number of spans kept in memory.
+    """
+
+    def __init__(self, max_spans: int = 200_000) -> None:
+        self.enabled: bool = False
+        self._spans: Deque[TraceSpan] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._local = threading.local()
+        self._t0 = time.perf_counter()
+
+    def enable(self, enabled: bool = True) -> None:
+        """Turn recording on (or off)."""
+        self.enabled = enabled
+
+    def clear(self) -> None:
+        """Drop all recorded spans."""
+        with self._lock:
+            self._spans.clear()
+
+    def new_span_id(self) -> int:
+        """Return a fresh span id (for spans recorded with :meth:`record`)."""
+        with self._lock:
+            self._next_id += 1
+            return self._next_id
+
+    def current_span_id(self) -> Optional[int]:
+        """Id of the innermost open :meth:`span` on this thread, or None."""
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else None
+
+    def record(
+        self,
+        name: str,
+        cat: str,
+        start_s: float,
+        dur_s: float,
+        *,
+        span_id: Optional[int] = None,
+        parent_id: Optional[int] = None,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a finished span (ignored while disabled).
+
+        Args:
+            name: Span name.
+            cat: Category.
+            start_s: Start time from ``time.perf_counter()``.
+            dur_s: Duration in seconds.
+            span_id: Id from :meth:`new_span_id`; a new one is used if None.
+            parent_id: Enclosing span id.
+            args: Extra values for the trace viewer.
+        """
+        if not self.enabled:
+            return
+        if span_id is None:
+            span_id = self.new_span_id()
+        span = TraceSpan(
+            name=name,
+            cat=cat,
+            start_s=start_s,
+            dur_s=dur_s,
+            tid=threading.get_ident(),
+            span_id=span_id,
+            parent_id=parent_id,
+            args=dict(args or {}),
+        )
+        with self._lock:
+            self._spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, cat: str = "code", **args: Any) -> Iterator[None]:
+        """Time the enclosed block; nested spans on the same thread become children."""
+        if not self.enabled:
+            yield
+            return
+        span_id = self.new_span_id()
+        parent_id = self.current_span_id()
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(span_id)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stack.pop()
+            self.record(
+                name,
+                cat,
+                start,
+                time.perf_counter() - start,
+                span_id=span_id,
+                parent_id=parent_id,
+                args=args,
+            )
+
+    def spans(self) -> List[TraceSpan]:
+        """Return a copy of the recorded spans, oldest first."""
+        with self._lock:
+            return list(self._spans)
+
+    def stats(self, cat: Optional[str] = None) -> Dict[str, LatencyStats]:
+        """Return latency statistics per span name.
+
+        Args:
+            cat: Only include spans of this category (None: all).
+
+        Returns:
+            Mapping of span name to LatencyStats, slowest total first.
+        """
+        durations: Dict[str, List[float]] = {}
+        for span in self.spans():
+            if cat is None or span.cat == cat:
+                durations.setdefault(span.name, []).append(span.dur_s)
+        result: Dict[str, LatencyStats] = {}
+        for name, values in durations.items():
+            ms = np.asarray(values) * 1000.0
+            p50, p95 = np.percentile(ms, [50, 95])
+            result[name] = LatencyStats(
+                count=int(ms.size),
+                p50_ms=float(p50),
+                p95_ms=float(p95),
+                max_ms=float(ms.max()),
+                total_ms=float(ms.sum()),
+            )
+        return dict(sorted(result.items(), key=lambda kv: kv[1].total_ms, reverse=True))
+
+    def format_stats(self, cat: Optional[str] = None, limit: int = 30) -> str:
+        """Return :meth:`stats` as a plain-text table."""
+        lines = [f"{'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'total ms':>10}  name"]
+        for name, s in list(self.stats(cat).items())[:limit]:
+            lines.append(
+                f"{s.count:>7} {s.p50_ms:>9.2f} {s.p95_ms:>9.2f} {s.max_ms:>9.2f} {s.total_ms:>10.1f}  {name}"
+            )
+        return "\n".join(lines)
+
+    def trees(self) -> List[TraceNode]:
+        """Rebuild nested span trees from parent ids, roots in start order.
+
+        Spans whose parent was dropped (``max_spans``) become roots.
+        """
+        spans = sorted(self.spans(), key=lambda s: s.start_s)
+        nodes = {span.span_id: TraceNode(span) for span in spans}
+        roots: List[TraceNode] = []
+        for span in spans:
+            parent = nodes.get(span.parent_id) if span.parent_id is not None else None
+            (parent.children if parent is not None else roots).append(nodes[span.span_id])
+        return roots
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the spans as a Chrome trace (``traceEvents`` of complete events)."""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        for span in self.spans():
+            args = {key: _json_safe(value) for key, value in span.args.items()}
+            args["span_id"] = span.span_id
+            if span.parent_id is not None:
+                args["parent_id"] = span.parent_id
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.cat,
+                    "ph": "X",
+                    "ts": (span.start_s - self._t0) * 1e6,
+                    "dur": span.dur_s * 1e6,
+                    "pid": pid,
+                    "tid": span.tid,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: str | Path) -> Path:
+        """Write :meth:`to_chrome_trace` as JSON and return the path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+        logger.info(f"Wrote {len(self._spans)} trace spans to {path}")
+        return path
+
+
+def _json_safe(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+_recorder = TraceRecorder()
+
+
+def get_trace_recorder() -> TraceRecorder:
+    """Return the process-wide TraceRecorder."""
+    return _recorder
+
+
+def trace_path_from_env() -> Optional[Path]:
+    """Return the export path from ``KYMFLOW_PERF_TRACE``, or None if unset."""
+    raw = os.getenv(TRACE_ENV_VAR, "").strip()
+    if not raw or raw.lower() in {"0", "false", "no", "off"}:
+        return None
+    return Path(raw).expanduser()
@@ -23,6 +23,7 @@ os.environ["NICEGUI_STORAGE_PATH"] = str(Path(user_config_dir("kymflow", None))
 from nicegui import ui, app
 
 from kymflow.core.utils.logging import get_logger, setup_logging
+from kymflow.core.utils.perf_trace import get_trace_recorder, trace_path_from_env
 from kymflow.gui_v2.app_context import AppContext
 from kymflow.gui_v2.app_config import AppConfig
 from kymflow.gui_v2._pywebview import (
@@ -46,6 +47,29 @@ logger = get_logger(__name__)
 # Configure logging at module import (runs in uvicorn worker)
 setup_logging(level="DEBUG")
 
+
+def _install_perf_trace() -> None:
+    """Enable EventBus tracing when KYMFLOW_PERF_TRACE names a JSON file.
+
+    On shutdown the handler latency table is logged and a Chrome trace
+    (open in chrome://tracing or Perfetto) is written to that file.
+    """
+    trace_path = trace_path_from_env()
+    if trace_path is None:
+        return
+    recorder = get_trace_recorder()
+    recorder.enable()
+    logger.info(f"Performance tracing enabled, trace file: {trace_path}")
+
+    def _save_perf_trace() -> None:
+        logger.info("EventBus handler latency:\n" + recorder.format_stats("handler"))
+        recorder.save_chrome_trace(trace_path)
+
+    app.on_shutdown(_save_perf_trace)
+
+
+_install_perf_trace()
+
 # Shared application context (singleton, process-level)
 # AppContext.__init__ will check if we're in a worker process and skip initialization
 # context = AppContext()
@@ -218,6 +242,8 @@ def main(*, reload: bool | None = None, native_bool: bool | None = None) -> None
       - KYMFLOW_GUI_RELOAD: 1/0
       - HOST: bind host (Render commonly uses 0.0.0.0)
       - PORT: bind port (Render sets this)
+      - KYMFLOW_PERF_TRACE: path of a Chrome trace JSON written on shutdown
+        (enables EventBus handler tracing)
 
     If ``native_bool`` is passed explicitly, ``KYMFLOW_GUI_NATIVE`` is set so
     :func:`~kymflow.gui_v2.runtime_mode.is_native_mode` matches ``ui.run(native=...)``.
@@ -3,19 +3,39 @@
 This module provides an EventBus implementation that creates separate bus instances
 per NiceGUI client (browser tab/window), ensuring event subscriptions don't leak
 across client sessions.
+
+Coalescing (:meth:`EventBus.coalesce`) keeps the GUI responsive when events
+arrive faster than views can render: events of a registered type are queued
+latest-wins and delivered once per event-loop tick (or interval), so a burst of
+slider/drag updates results in one refresh. It falls back to plain synchronous
+delivery when no event loop is running (e.g. in unit tests).
 """
 
 from __future__ import annotations
 
-# import asyncio
+import asyncio
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, DefaultDict, Dict, List, Literal, Tuple, Type, TypeVar
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 import inspect
 
 from nicegui import ui, background_tasks, context
+from nicegui.slot import Slot
 
 from kymflow.core.utils.logging import get_logger
+from kymflow.core.utils.perf_trace import get_trace_recorder
 
 logger = get_logger(__name__)
 
@@ -40,17 +60,56 @@ class BusConfig:
     trace: bool = False
 
 
+@dataclass(frozen=True, slots=True)
+class CoalescePolicy:
+    """How bursts of one event type are coalesced (see EventBus.coalesce).
+
+    Attributes:
+        phase: Only events with this phase are coalesced; None coalesces all phases.
+        interval_s: Delay before pending events are delivered; 0 delivers on the
+            next event-loop tick.
+        key: Optional function mapping an event to a slot key. Events with
+            different keys are kept separately; by default there is one slot per
+            event type and phase.
+    """
+
+    phase: EventPhase | None = None
+    interval_s: float = 0.0
+    key: Callable[[Any], Hashable] | None = None
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _current_client() -> Any:
+    """Return the current NiceGUI client, or None without a client context.
+
+    Reads the slot stack directly: ``context.client`` would create a pseudo
+    client when called outside of a page.
+    """
+    stack = Slot.get_stack()
+    return stack[-1].parent.client if stack else None
+
+
 class EventBus:
     """A typed event bus for explicit GUI signal flow with per-client isolation.
 
     Each client (browser tab/window) gets its own EventBus instance to prevent
     cross-client event leakage. Events are routed synchronously to all subscribers
-    for a specific event type.
+    for a specific event type, except for coalesced event types (see module
+    docstring).
 
     Attributes:
         _config: Bus configuration (trace mode).
         _subs: Map from event type to list of handler functions.
         _client_id: Client identifier for this bus instance.
+        _coalesce: Coalescing policy per event type.
+        _pending: Latest pending event per coalescing slot, in arrival order.
     """
 
     def __init__(self, client_id: str, config: BusConfig | None = None) -> None:
@@ -69,6 +128,10 @@ class EventBus:
         self._client_id: str = client_id
         self._emit_seq: int = 0
         self._emit_stack: List[int] = []
+        self._coalesce: Dict[Type[Any], CoalescePolicy] = {}
+        self._pending: Dict[Tuple[Any, ...], Any] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._flush_client: Any = None
         logger.debug(f"[bus] Created EventBus for client {client_id}")
 
     def subscribe(
@@ -199,6 +262,28 @@ class EventBus:
                 f"remaining_handlers={len(handlers)})"
             )
 
+    def coalesce(
+        self,
+        event_type: Type[Any],
+        *,
+        phase: EventPhase | None = None,
+        interval_s: float = 0.0,
+        key: Callable[[Any], Hashable] | None = None,
+    ) -> None:
+        """Coalesce bursts of ``event_type`` into the latest event per tick.
+
+        Only use this for events that describe a complete value (selection,
+        display parameters, bounds), never for relative commands where every
+        event counts.
+
+        Args:
+            event_type: Event type to coalesce.
+            phase: Only coalesce events with this phase (None: all phases).
+            interval_s: Delay before delivery; 0 delivers on the next loop tick.
+            key: Optional slot key function (see CoalescePolicy).
+        """
+        self._coalesce[event_type] = CoalescePolicy(phase=phase, interval_s=interval_s, key=key)
+
     def emit(self, event: Any) -> None:
         """Emit an event to all subscribed handlers.
 
@@ -207,9 +292,65 @@ class EventBus:
         was subscribed with a phase filter. If a handler raises an exception,
         it is logged but doesn't prevent other handlers from receiving the event.
 
+        Events of a coalesced type (see coalesce()) are queued instead and
+        delivered on the next tick, latest-wins. Pending coalesced events are
+        always delivered before any other event so ordering is preserved.
+
         Args:
             event: The event instance to emit (type determines which handlers receive it).
         """
+        policy = self._coalesce.get(type(event))
+        event_phase = getattr(event, "phase", None)
+        if policy is not None and policy.phase in (None, event_phase):
+            loop = _running_loop()
+            if loop is not None:
+                slot = (
+                    type(event),
+                    event_phase,
+                    policy.key(event) if policy.key is not None else None,
+                )
+                # Latest wins; re-insert so slots stay in arrival order.
+                self._pending.pop(slot, None)
+                self._pending[slot] = event
+                self._schedule_flush(loop, policy.interval_s)
+                return
+        elif self._pending:
+            self.flush()
+        self._dispatch(event)
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop, interval_s: float) -> None:
+        if self._flush_handle is not None:
+            return
+        self._flush_client = _current_client()
+        if interval_s > 0:
+            self._flush_handle = loop.call_later(interval_s, self._flush_from_loop)
+        else:
+            self._flush_handle = loop.call_soon(self._flush_from_loop)
+
+    def _flush_from_loop(self) -> None:
+        self._flush_handle = None
+        client, self._flush_client = self._flush_client, None
+        if client is None:
+            self.flush()
+            return
+        try:
+            with client:
+                self.flush()
+        except Exception:
+            logger.exception(f"[bus] Coalesced flush failed (client={self._client_id})")
+
+    def flush(self) -> None:
+        """Deliver all pending coalesced events now, in arrival order."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        while self._pending:
+            pending, self._pending = self._pending, {}
+            for event in pending.values():
+                self._dispatch(event)
+
+    def _dispatch(self, event: Any) -> None:
+        """Deliver ``event`` to its subscribed handlers (see emit())."""
         etype = type(event)
         all_handlers = self._subs.get(etype, [])
 
@@ -244,81 +385,96 @@ class EventBus:
         emit_start = time.perf_counter()
         self._emit_stack.append(emit_id)
 
-        try:
-            if _do_debug or self._config.trace:
-                print('')
-                logger.debug(
-                    f"evbus recieved phase={phase_text} event={etype.__name__} "
-                    f"eid={emit_id} depth={depth} pid={parent_text} n_handlers={len(filtered_handlers)}"
-                )
-
-            for handler, phase in filtered_handlers:
-                # Defensive guard: skip any non-callable handlers so a bad subscription
-                # entry cannot crash the entire bus.
-                if handler is None or not callable(handler):
-                    logger.error(
-                        f"[bus] Skipping non-callable handler {handler!r} for {etype.__name__} "
-                        f"(phase={phase}, client={self._client_id})"
-                    )
-                    continue
-
-                name = getattr(handler, "__qualname__", repr(handler))
+        recorder = get_trace_recorder()
+        with recorder.span(etype.__name__, "emit", phase=phase_text, eid=emit_id, client=self._client_id):
+            try:
                 if _do_debug or self._config.trace:
-                    logger.warning(
-                        f"evbus call phase={phase_text} event={etype.__name__} "
-                        f"eid={emit_id} depth={depth} pid={parent_text} handler={name}"
+                    print('')
+                    logger.debug(
+                        f"evbus recieved phase={phase_text} event={etype.__name__} "
+                        f"eid={emit_id} depth={depth} pid={parent_text} n_handlers={len(filtered_handlers)}"
                     )
 
-                try:
-                    # Async handler path: capture current handler, event, and client in default
-                    # arguments to avoid late-binding closure bugs when scheduling the task.
-                    if inspect.iscoroutinefunction(handler):
-                        if _do_debug or self._config.trace:
-                            logger.warning(
-                                f"evbus call phase={phase_text} event={etype.__name__} "
-                                f"eid={emit_id} depth={depth} pid={parent_text} handler={name} async=true"
-                            )
-
-                        current_client = context.client
-
-                        async def task_with_context(
-                            h=handler,
-                            ev=event,
-                            client=current_client,
-                        ):
-                            # Re-enter the NiceGUI client context and invoke the handler.
-                            with client:
-                                await h(ev)
-
-                        background_tasks.create(task_with_context())
-
-                    else:
-                        _start = time.perf_counter()
-
-                        # Synchronous handlers are invoked inline.
-                        handler(event)
-
-                        _elapsed_s = time.perf_counter() - _start
-                        if (_do_debug or self._config.trace) and _elapsed_s > 0.001:
-                            logger.warning(
-                                f"evbus took phase={phase_text} event={etype.__name__} "
-                                f"eid={emit_id} depth={depth} pid={parent_text} "
-                                f"handler={name} ms={_elapsed_s * 1000:.3f}"
-                            )
-
-                except Exception:
-                    logger.exception(
-                        f"evbus err phase={phase_text} event={etype.__name__} "
-                        f"eid={emit_id} depth={depth} pid={parent_text} handler={name}"
+                for handler, phase in filtered_handlers:
+                    # Defensive guard: skip any non-callable handlers so a bad subscription
+                    # entry cannot crash the entire bus.
+                    if handler is None or not callable(handler):
+                        logger.error(
+                            f"[bus] Skipping non-callable handler {handler!r} for {etype.__name__} "
+                            f"(phase={phase}, client={self._client_id})"
+                        )
+                        continue
+
+                    name = getattr(handler, "__qualname__", repr(handler))
+                    if _do_debug or self._config.trace:
+                        logger.warning(
+                            f"evbus call phase={phase_text} event={etype.__name__} "
+                            f"eid={emit_id} depth={depth} pid={parent_text} handler={name}"
+                        )
+
+                    try:
+                        # Async handler path: capture current handler, event, and client in default
+                        # arguments to avoid late-binding closure bugs when scheduling the task.
+                        if inspect.iscoroutinefunction(handler):
+                            if _do_debug or self._config.trace:
+                                logger.warning(
+                                    f"evbus call phase={phase_text} event={etype.__name__} "
+                                    f"eid={emit_id} depth={depth} pid={parent_text} handler={name} async=true"
+                                )
+
+                            current_client = context.client
+
+                            async def task_with_context(
+                                h=handler,
+                                ev=event,
+                                client=current_client,
+                            ):
+                                # Re-enter the NiceGUI client context and invoke the handler.
+                                # Recorded directly rather than via span(): other tasks run
+                                # on this thread while the handler awaits.
+                                start = time.perf_counter()
+                                try:
+                                    with client:
+                                        await h(ev)
+                                finally:
+                                    get_trace_recorder().record(
+                                        getattr(h, "__qualname__", repr(h)),
+                                        "async_handler",
+                                        start,
+                                        time.perf_counter() - start,
+                                        args={"event": type(ev).__name__},
+                                    )
+
+                            background_tasks.create(task_with_context())
+
+                        else:
+                            _start = time.perf_counter()
+
+                            # Synchronous handlers are invoked inline.
+                            with recorder.span(name, "handler", event=etype.__name__, phase=phase_text):
+                                handler(event)
+
+                            _elapsed_s = time.perf_counter() - _start
+                            if (_do_debug or self._config.trace) and _elapsed_s > 0.001:
+                                logger.warning(
+                                    f"evbus took phase={phase_text} event={etype.__name__} "
+                                    f"eid={emit_id} depth={depth} pid={parent_text} "
+                                    f"handler={name} ms={_elapsed_s * 1000:.3f}"
+                                )
+
+                    except Exception:
+                        logger.exception(
+                            f"evbus err phase={phase_text} event={etype.__name__} "
+                            f"eid={emit_id} depth={depth} pid={parent_text} handler={name}"
+                        )
+            finally:
+                _ = self._emit_stack.pop()
+                if _do_debug or self._config.trace:
+                    emit_elapsed_ms = (time.perf_counter() - emit_start) * 1000
+                    logger.debug(
+                        f"    -->> evbus done phase={phase_text} event={etype.__name__} "
+                        f"eid={emit_id} depth={depth} pid={parent_text} -->> took ms={emit_elapsed_ms:.3f}"
                     )
-        finally:
-            _ = self._emit_stack.pop()
-            if _do_debug or self._config.trace:
-                emit_elapsed_ms = (time.perf_counter() - emit_start) * 1000
-                logger.debug(
-                    f"    -->> evbus done phase={phase_text} event={etype.__name__} "
-                    f"eid={emit_id} depth={depth} pid={parent_text} -->> took ms={emit_elapsed_ms:.3f}"
-                )
 
     def clear(self) -> None:
         """Clear all subscriptions from this bus.
@@ -328,6 +484,10 @@ class EventBus:
         """
         count = sum(len(handlers) for handlers in self._subs.values())
         self._subs.clear()
+        self._pending.clear()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         logger.debug(f"[bus] Cleared {count} subscriptions (client={self._client_id})")
 
 
@@ -350,6 +510,22 @@ def get_client_id() -> str:
     return "default"
 
 
+def configure_default_coalescing(bus: EventBus) -> None:
+    """Register the app's coalesced event types on ``bus``.
+
+    Only events carrying a complete value are coalesced: contrast/colorscale
+    changes (slider drags) and ROI bound edits (ROI drags, one slot per file and
+    ROI). Relative commands such as KymScrollXEvent are delivered one by one.
+
+    Args:
+        bus: EventBus to configure.
+    """
+    from kymflow.gui_v2.events import EditRoi, ImageDisplayChange
+
+    bus.coalesce(ImageDisplayChange)
+    bus.coalesce(EditRoi, key=lambda e: (e.path, e.roi_id))
+
+
 def get_event_bus(config: BusConfig | None = None) -> EventBus:
     """Get or create an EventBus for the current NiceGUI client.
 
@@ -371,6 +547,7 @@ def get_event_bus(config: BusConfig | None = None) -> EventBus:
     # Get existing bus or create new one
     if client_id not in _CLIENT_BUSES:
         _CLIENT_BUSES[client_id] = EventBus(client_id, config)
+        configure_default_coalescing(_CLIENT_BUSES[client_id])
         logger.info(f"[bus] Created new EventBus for client {client_id}")
 
     return _CLIENT_BUSES[client_id]
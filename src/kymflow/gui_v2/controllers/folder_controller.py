@@ -383,6 +383,22 @@ class FolderController:
             cancel_previous=False,
         )
 
+    def apply_folder_changes(self) -> None:
+        """Timer callback: apply files added, removed or changed on disk since the last call."""
+        applied = self._app_state.apply_folder_changes()
+        if applied is None:
+            return
+        parts = [
+            f"{len(paths)} {label}"
+            for paths, label in (
+                (applied.added, "added"),
+                (applied.removed, "removed"),
+                (applied.modified, "reloaded"),
+            )
+            if paths
+        ]
+        set_footer_status(self._bus, "Folder changed: " + ", ".join(parts), level="info")
+
     def _format_progress_message(self, msg: ProgressMessage) -> str:
         """Format ProgressMessage for user-facing UI."""
         if msg.phase == "scan":
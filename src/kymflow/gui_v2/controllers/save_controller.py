@@ -178,6 +178,7 @@ class SaveController:
             success = await run.io_bound(kym_analysis.save_analysis)
 
             if success:
+                self._app_state.acknowledge_saved(kym_file)
                 self._app_state.files.update_radon_report_for_image(kym_file)
                 self._app_state.files.update_velocity_event_for_image(kym_file)
                 self._bus.emit(RadonReportUpdated())
@@ -234,6 +235,7 @@ class SaveController:
                     try:
                         success = await run.io_bound(kym_analysis.save_analysis)
                         if success:
+                            self._app_state.acknowledge_saved(kf)
                             defer_cache_updates.append(kf)
                             saved_count += 1
                         else:
@@ -84,6 +84,9 @@ from nicewidgets.plot_pool_widget.plot_state import PlotState, PlotType
 
 logger = get_logger(__name__)
 
+# Seconds between applying folder watcher changes to the file list.
+FOLDER_WATCH_APPLY_INTERVAL_S = 1.0
+
 if TYPE_CHECKING:
     pass
 
@@ -992,6 +995,8 @@ class HomePage(BasePage):
                     self._ensure_setup()
                     # build() creates fresh UI elements in the new container context
                     self.build()
+                    # Apply files added/removed/changed on disk (folder watcher runs in a thread)
+                    ui.timer(FOLDER_WATCH_APPLY_INTERVAL_S, self._folder_controller.apply_folder_changes)
 
             def _toggle_drawer_splitter() -> None:
                 if splitter.value > collapsed_threshold:
@@ -13,6 +13,8 @@ from typing import Any, Callable, List, Optional, TYPE_CHECKING
 
 from kymflow.core.image_loaders.kym_image import KymImage
 from kymflow.core.image_loaders.kym_image_list import KymImageList
+from kymflow.core.image_loaders.folder_watch import FolderChanges, FolderWatcher
+from kymflow.core.image_loaders.prefetch import NeighborPrefetcher
 from kymflow.core.utils.progress import ProgressCallback
 from kymflow.gui_v2.events_legacy import ImageDisplayOrigin, SelectionOrigin
 from kymflow.core.plotting.theme import ThemeMode
@@ -89,6 +91,12 @@ class AppState:
         # folder_depth will be initialized from app_config in AppContext.__init__
         # Default to 4 if app_config is not available yet
         self.folder_depth: int = 4
+
+        # Warms the files next to the selection for next/prev navigation
+        self.prefetcher = NeighborPrefetcher()
+
+        # Reports filesystem changes of the loaded folder (see apply_folder_changes)
+        self.folder_watcher: Optional[FolderWatcher] = None
         
         # Callback registries (like grid_gpt.py pattern)
         self._file_list_changed_handlers: List[FileListChangedHandler] = []
@@ -189,7 +197,9 @@ class AppState:
 
     def _apply_loaded_files(self, files: KymImageList, selected_path: Path) -> None:
         """Apply loaded files to UI state and fire handlers (UI-thread only)."""
+        self.prefetcher.cancel()
         self.files = files
+        self._restart_folder_watcher()
         mode = self.files._get_mode() if hasattr(self.files, "_get_mode") else "?"
         logger.info(
             f"channelfix2026 Loaded files: len={len(self.files)}, mode={mode}, radon_cache_len={len(getattr(self.files, '_radon_report_cache', {}))}"
@@ -214,6 +224,68 @@ class AppState:
         else:
             self.select_file(None)
     
+    def _restart_folder_watcher(self) -> None:
+        """Watch the loaded folder for changes (folder mode only)."""
+        if self.folder_watcher is not None:
+            self.folder_watcher.stop()
+            self.folder_watcher = None
+        if self.files._get_mode() != "folder":
+            return
+        try:
+            self.folder_watcher = FolderWatcher(self.files)
+            self.folder_watcher.start()
+        except Exception:
+            logger.exception("Could not start folder watcher")
+            self.folder_watcher = None
+
+    def apply_folder_changes(self) -> Optional[FolderChanges]:
+        """Apply filesystem changes reported by the folder watcher (UI thread).
+
+        Added, removed and modified files are applied to ``files`` in place and
+        file_list_changed handlers fire once. The selection is kept; if the
+        selected file was removed the first file is selected, if it was
+        reloaded the new instance is selected.
+
+        Returns:
+            The applied changes, or None if there were none.
+        """
+        if self.folder_watcher is None:
+            return None
+        changes = self.folder_watcher.pop_changes()
+        if not changes:
+            return None
+        applied = self.files.apply_folder_changes(changes)
+        if not applied:
+            return None
+
+        for handler in list(self._file_list_changed_handlers):
+            try:
+                handler()
+            except Exception:
+                logger.exception("Error in file_list_changed handler")
+
+        selected = self.selected_file
+        selected_path = Path(selected.path) if selected is not None and selected.path is not None else None
+        if selected_path is not None and selected_path in applied.removed:
+            self.select_file(self.files[0] if len(self.files) > 0 else None)
+        elif selected_path is not None and selected_path in applied.modified:
+            selected_roi_id = self.selected_roi_id
+            self.select_file(self.files.find_by_path(selected_path))
+            if selected_roi_id is not None and self.selected_file is not None:
+                if selected_roi_id in self.selected_file.rois.get_roi_ids():
+                    self.select_roi(selected_roi_id)
+        elif selected is None and len(self.files) > 0:
+            self.select_file(self.files[0])
+        else:
+            # Neighbours in the navigation order may have changed
+            self.prefetcher.schedule(list(self.files), selected, self.selected_channel)
+        return applied
+
+    def acknowledge_saved(self, kym_file: KymImage) -> None:
+        """Tell the folder watcher that ``kym_file`` was just saved by this app."""
+        if self.folder_watcher is not None:
+            self.folder_watcher.acknowledge(kym_file)
+
     def select_file(
         self,
         kym_file: Optional[KymImage],
@@ -253,6 +325,11 @@ class AppState:
                 handler(kym_file, origin)
             except Exception:
                 logger.exception("Error in selection_changed handler")
+
+        # Prefetch the neighbours in the navigation order (cancels the previous window).
+        # A newly selected file starts on its first channel, so that is what the
+        # neighbours will display as well.
+        self.prefetcher.schedule(list(self.files), kym_file, self.selected_channel)
     
     def get_file_by_path_or_selected(self, path: str | Path | None) -> Optional[KymImage]:
         """Get file by path, falling back to selected_file if path is None or not found.
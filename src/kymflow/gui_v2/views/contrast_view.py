@@ -16,7 +16,8 @@ from nicegui import ui
 
 from kymflow.core.image_loaders.kym_image import KymImage
 from kymflow.core.plotting.colorscales import COLORSCALE_OPTIONS
-from kymflow.core.plotting.image_plots import histogram_plot_plotly
+from kymflow.core.plotting.image_histogram import ImageHistogram, get_image_histogram
+from kymflow.core.plotting.image_plots import histogram_plot_plotly, update_histogram_markers
 from kymflow.core.plotting.theme import ThemeMode
 from kymflow.gui_v2.events_legacy import ImageDisplayOrigin
 from kymflow.gui_v2.state import ImageDisplayParams
@@ -54,6 +55,8 @@ class ContrastView:
         _max_value_label: Max value label (created in render()).
         _current_file: Currently selected file (for histogram).
         _current_image: Current image data (for histogram).
+        _histogram: Cached intensity histogram of the current image.
+        _histogram_fig: Figure dict last sent to the histogram plot.
         _theme: Current theme mode.
         _display_params: Current image display parameters.
         _updating_programmatically: Flag to prevent feedback loops.
@@ -79,6 +82,8 @@ class ContrastView:
         # State
         self._current_file: Optional[KymImage] = None
         self._current_image: Optional[np.ndarray] = None
+        self._histogram: Optional[ImageHistogram] = None
+        self._histogram_fig: Optional[dict] = None
         self._theme: ThemeMode = ThemeMode.DARK
         self._display_params: Optional[ImageDisplayParams] = None
         self._updating_programmatically: bool = False
@@ -94,6 +99,7 @@ class ContrastView:
         self._colorscale_select = None
         self._log_checkbox = None
         self._histogram_plot = None
+        self._histogram_fig = None
         self._min_slider = None
         self._max_slider = None
         self._min_value_label = None
@@ -128,7 +134,7 @@ class ContrastView:
                 render_once=False,
                 clear_on_close=True,
                 show_spinner=True,
-                on_clear=lambda: setattr(self, "_histogram_plot", None),
+                on_clear=self._clear_histogram_plot,
             ),
         )
 
@@ -181,6 +187,7 @@ class ContrastView:
 
         if file is None:
             self._current_image = None
+            self._histogram = None
             self._updating_programmatically = True
             try:
                 if self._min_slider is not None:
@@ -198,19 +205,21 @@ class ContrastView:
             self._update_histogram()
             return
 
-        # Load image
+        # Load image and its (cached) histogram
         try:
             image = file.get_img_slice(channel=1)
             self._current_image = image
+            self._histogram = get_image_histogram(file, 1) if image is not None else None
         except Exception as e:
             logger.warning(f"Failed to load image for contrast widget: {e}")
             self._current_image = None
+            self._histogram = None
             self._update_histogram()
             return
 
         if image is not None:
-            # Calculate max value
-            image_max = int(np.max(image))
+            # Max value comes from the cached histogram (no pass over the pixels)
+            image_max = int(self._histogram.image_max) if self._histogram is not None else int(np.max(image))
 
             # Reset sliders
             self._updating_programmatically = True
@@ -267,8 +276,8 @@ class ContrastView:
         finally:
             self._updating_programmatically = False
 
-        # Update histogram
-        self._update_histogram()
+        # Move the zmin/zmax markers
+        self._update_histogram_markers()
 
     def set_theme(self, theme: ThemeMode) -> None:
         """Update theme.
@@ -286,26 +295,57 @@ class ContrastView:
         self._theme = theme
         self._update_histogram()
 
-    def _update_histogram(self) -> None:
-        """Update histogram plot with current settings."""
-        if self._histogram_plot is None:
-            return
+    def _clear_histogram_plot(self) -> None:
+        """Forget the histogram plot when its lazy section is cleared."""
+        self._histogram_plot = None
+        self._histogram_fig = None
 
-        image = self._current_image
+    def _marker_settings(self) -> tuple[int, int, bool]:
+        """Return (zmin, zmax, log_scale) for the histogram markers."""
         zmin = self._display_params.zmin if self._display_params and self._display_params.zmin is not None else 0
         zmax = self._display_params.zmax if self._display_params and self._display_params.zmax is not None else 255
-        log_scale = self._log_checkbox.value if self._log_checkbox is not None else True
-        theme = self._theme
+        log_scale = bool(self._log_checkbox.value) if self._log_checkbox is not None else True
+        return zmin, zmax, log_scale
+
+    def _update_histogram(self) -> None:
+        """Rebuild the histogram plot (new file or theme)."""
+        if self._histogram_plot is None:
+            return
 
+        zmin, zmax, log_scale = self._marker_settings()
         fig_dict = histogram_plot_plotly(
-            image=image,
+            image=self._current_image,
             zmin=zmin,
             zmax=zmax,
             log_scale=log_scale,
-            theme=theme,
+            theme=self._theme,
+            histogram=self._histogram,
         )
         try:
             self._histogram_plot.update_figure(fig_dict)
+            self._histogram_fig = fig_dict
+        except RuntimeError as e:
+            if "deleted" not in str(e).lower():
+                raise
+            # Client deleted, silently ignore
+
+    def _update_histogram_markers(self) -> None:
+        """Move the zmin/zmax lines and y-scale of the shown histogram.
+
+        Only layout keys are sent to the client (``Plotly.relayout``); the bars
+        and the pixel data are not touched.
+        """
+        if self._histogram_plot is None:
+            return
+        if self._histogram_fig is None or not hasattr(self._histogram_plot, "run_plot_method"):
+            self._update_histogram()
+            return
+
+        zmin, zmax, log_scale = self._marker_settings()
+        # The dict is the plot's figure object, so the server side stays in sync.
+        relayout = update_histogram_markers(self._histogram_fig, zmin=zmin, zmax=zmax, log_scale=log_scale)
+        try:
+            self._histogram_plot.run_plot_method("relayout", relayout)
         except RuntimeError as e:
             if "deleted" not in str(e).lower():
                 raise
@@ -369,11 +409,11 @@ class ContrastView:
             origin=ImageDisplayOrigin.CONTRAST_WIDGET,
         )
         self._emit_intent(params)
-        self._update_histogram()
+        self._update_histogram_markers()
 
     def _on_log_toggle(self) -> None:
         """Handle log scale checkbox toggle."""
-        self._update_histogram()
+        self._update_histogram_markers()
 
     def _emit_intent(self, params: ImageDisplayParams) -> None:
         """Emit ImageDisplayChange(phase="intent") event."""
@@ -103,6 +103,10 @@ class FileTableBindings:
         # logger.debug("FileTableBindings._on_file_list_changed: files=%s", len(e.files))
         
         safe_call(self._table.set_files, e.files)
+        # Added/removed files reload the grid, which drops its row selection
+        path = self._current_selected_path
+        if path is not None and path in self._table._files_by_path:  # noqa: SLF001
+            safe_call(self._table.set_selected_paths, [path], origin=SelectionOrigin.EXTERNAL)
 
     def _on_selected_file_changed(self, e: FileSelection) -> None:
         """Handle selected file change event.
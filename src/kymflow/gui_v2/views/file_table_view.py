@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import Callable, Iterable, List, Optional, TYPE_CHECKING, cast
 
 from kymflow.core.image_loaders.kym_image import KymImage
+from kymflow.core.image_loaders.kym_image_rows import KymImageRowModel
 from nicegui import ui
 from kymflow.gui_v2.client_utils import safe_call
 from kymflow.gui_v2.events import FileSelection, MetadataUpdate, AnalysisUpdate, SelectionOrigin
@@ -28,6 +29,10 @@ OnAnalysisUpdate = Callable[[AnalysisUpdate], None]
 
 logger = get_logger(__name__)
 
+# Analysis columns are filled this many rows per timer tick after set_files().
+ANALYSIS_FILL_BATCH = 200
+ANALYSIS_FILL_INTERVAL_S = 0.05
+
 def _col(
     field: str,
     header: Optional[str] = None,
@@ -149,7 +154,8 @@ class FileTableView:
         _selection_mode: Selection mode ("single" or "multiple").
         _grid: CustomAgGrid instance (created in render()).
         _suppress_emit: Flag to prevent event emission during programmatic selection.
-        _pending_rows: Rows buffered before render() is called.
+        _row_model: Versioned rows; header columns are built in set_files(),
+            analysis columns are filled in batches by a UI timer.
     """
 
     def __init__(
@@ -179,10 +185,16 @@ class FileTableView:
 
         # Keep latest rows so if FileListChanged arrives before render(),
         # we can populate when render() happens.
-        self._pending_rows: Rows = []
+        self._row_model = KymImageRowModel()
+        self._fill_timer: Optional[ui.timer] = None
         self._files: list[KymImage] = []
         self._files_by_path: dict[str, KymImage] = {}
 
+    @property
+    def _pending_rows(self) -> Rows:
+        """Current rows in display order (analysis columns may still be None)."""
+        return self._row_model.rows()
+
     def _get_blinded(self) -> bool:
         """Return blinded setting from AppContext, or False if unavailable."""
         return (
@@ -225,6 +237,8 @@ class FileTableView:
 
         # self._grid_container = ui.column().classes("w-full flex-1 min-h-0 min-w-0 flex flex-col overflow-hidden")
         self._create_grid(self._pending_rows)
+        self._row_model.pop_changed_rows()
+        self._fill_timer = ui.timer(ANALYSIS_FILL_INTERVAL_S, self._fill_analysis_batch)
         self._update_interaction_state()
 
     def set_context_menu_builder(self, builder: Optional[Callable[[], None]]) -> None:
@@ -267,7 +281,13 @@ class FileTableView:
         self._grid.on_cell_edited(self._on_cell_edited)
 
     def set_files(self, files: Iterable[KymImage]) -> None:
-        """Update table contents from KymImage list."""
+        """Update table contents from KymImage list.
+
+        Only header columns are computed here, and only for new or invalidated
+        files; analysis columns are filled afterwards by _fill_analysis_batch().
+        The grid is reloaded when the set or order of files changed, otherwise
+        just the rows whose values changed are sent.
+        """
         files_list = list(files)
         
         # logger.info(f'files_list:{len(files_list)}')
@@ -276,37 +296,39 @@ class FileTableView:
         self._files_by_path = {
             str(f.path): f for f in files_list if getattr(f, "path", None) is not None
         }
-        blinded = self._get_blinded()
-        rows: Rows = [
-            f.getRowDict(blinded=blinded)
-            for f in files_list
-        ]
-        rows_unchanged = rows == self._pending_rows
-        
-        # logger.info(f'=== rows: {len(rows)}')
-        
-        # for _row in rows:
-        #     logger.info(f'  {_row}')
-        
-        # logger.info(f'rows_unchanged:{rows_unchanged}')
+        structure_changed = self._row_model.set_files(files_list, blinded=self._get_blinded())
+        if self._grid is None:
+            return
+        if structure_changed:
+            self._grid.set_data(self._pending_rows)
+            self._row_model.pop_changed_rows()
+        else:
+            self._send_changed_rows()
 
-        self._pending_rows = rows
-        if rows_unchanged and self._grid is not None:
-            # logger.debug("rows unchanged -->> skip refresh")
+    def _send_changed_rows(self) -> None:
+        """Forward rows changed in the row model to the grid."""
+        rows = self._row_model.pop_changed_rows()
+        if self._grid is None or not hasattr(self._grid, "update_row"):
             return
-        
-        # logger.error(f'self._grid_container:{self._grid_container}')
+        for row in rows:
+            path = row.get("path")
+            if path is not None:
+                self._grid.update_row(str(path), row)  # type: ignore[arg-type]
 
-        if self._grid is not None:
-            self._grid.set_data(rows)
+    def _fill_analysis_batch(self) -> None:
+        """Timer callback: compute the next batch of analysis columns."""
+        if self._grid is None:
+            return
+        if self._row_model.fill_analysis(ANALYSIS_FILL_BATCH):
+            self._send_changed_rows()
 
     def update_row_for_file(self, file: KymImage) -> None:
         """Update a single table row for the given KymImage in-place.
 
         This recomputes the row dict for ``file`` and, if the grid is active
         and the file is present in the current table, forwards the update to
-        the underlying CustomAgGrid_v2 instance. Internal caches such as
-        ``_pending_rows`` and ``_files_by_path`` are kept in sync.
+        the underlying CustomAgGrid_v2 instance. The row model and
+        ``_files_by_path`` are kept in sync.
         """
         if self._grid is None:
             return
@@ -329,22 +351,11 @@ class FileTableView:
         if self._grid is None:
             return
 
-        # Update pending_rows cache
-        updated = False
-        for i, existing in enumerate(self._pending_rows):
-            if str(existing.get("path")) == str(path):
-                self._pending_rows[i] = dict(row)
-                updated = True
-                break
-
-        if not updated:
-            # If the row is not currently present (e.g. table filtered or empty),
-            # do not attempt to update the grid.
+        # If the row is not currently present (e.g. table filtered or empty),
+        # do not attempt to update the grid.
+        if not self._row_model.set_row(str(path), row):
             return
-
-        # Forward to CustomAgGrid_v2 for in-place row update
-        if hasattr(self._grid, "update_row"):
-            self._grid.update_row(path, row)  # type: ignore[arg-type]
+        self._send_changed_rows()
 
     async def get_displayed_kym_images_async(self) -> list[KymImage]:
         """Return ``KymImage`` instances for rows visible after the grid filter.
@@ -374,12 +385,16 @@ class FileTableView:
     def refresh_rows(self) -> None:
         """Refresh table rows from cached files (used after metadata updates).
         
-        Note: This method calls set_files() which calls _grid.set_data(), which
-        clears the selection. The caller should restore the selection after calling
-        this method.
+        All rows are invalidated: header columns are rebuilt now and analysis
+        columns by the fill timer; only rows whose values changed are sent.
+
+        Note: If the file list itself changed, set_files() calls _grid.set_data(),
+        which clears the selection. The caller should restore the selection after
+        calling this method.
         """
         if not self._files:
             return
+        self._row_model.invalidate_all()
         self.set_files(self._files)
 
     def set_selected_paths(self, paths: list[str], *, origin: SelectionOrigin) -> None:
@@ -540,6 +555,9 @@ class FileTableView:
         Returns:
             TSV-formatted string with one header row (keys) and one row per dict.
         """
+        # Copy complete rows, not placeholders for analysis still being filled.
+        if self._row_model.fill_analysis():
+            self._send_changed_rows()
         if not self._pending_rows:
             return ""
 
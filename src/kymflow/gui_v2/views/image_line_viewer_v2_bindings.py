@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from typing import Callable
 
-from nicegui import run
-
 from kymflow.gui_v2.bus import EventBus
 from kymflow.gui_v2.client_utils import safe_call
 from kymflow.gui_v2.events import (
@@ -62,6 +60,8 @@ class ImageLineViewerV2Bindings:
         # immediately following ROISelection(state) echo from AppState.
         self._last_file_selection_roi_id: int | None = None
 
+        # The view prepares file data in a worker thread and drops superseded
+        # selections itself, so this handler stays on the event loop.
         bus.subscribe_state(FileSelection, self._on_file_selection_changed)
         bus.subscribe_state(FileChanged, self._on_file_changed)
         bus.subscribe_state(ROISelection, self._on_roi_changed)
@@ -97,17 +97,14 @@ class ImageLineViewerV2Bindings:
         self._bus.unsubscribe_intent(KymScrollXEvent, self._on_kym_scroll_x)
         self._subscribed = False
 
-    async def _on_file_selection_changed(self, e: FileSelection) -> None:
+    def _on_file_selection_changed(self, e: FileSelection) -> None:
         """Update view with full selection state (file, channel, roi_id) from the event.
         ROI is set as part of set_selected_file; ROISelection is handled in _on_roi_changed.
-        Heavy Plotly updates run off main loop via run.io_bound."""
-        def _do_on_file_selection_changed() -> None:
-            safe_call(self._view.set_selected_file, e.file, e.channel, e.roi_id)
-            # Remember ROI applied as part of FileSelection so we can ignore the
-            # redundant ROISelection(state) that follows from AppState.
-            self._last_file_selection_roi_id = e.roi_id
-
-        await run.io_bound(_do_on_file_selection_changed)
+        The view loads and converts the file data off the event loop."""
+        safe_call(self._view.set_selected_file, e.file, e.channel, e.roi_id)
+        # Remember ROI applied as part of FileSelection so we can ignore the
+        # redundant ROISelection(state) that follows from AppState.
+        self._last_file_selection_roi_id = e.roi_id
 
     def _on_file_changed(self, e: FileChanged) -> None:
         """Handle FileChanged state events and refresh ROIs when needed.
@@ -10,8 +10,10 @@ Phase 6: ROI edit (ROIEvent UPDATE → EditRoi); recursion fix (suppress ROI sel
 
 from __future__ import annotations
 
-from typing import Callable, Literal, Optional
-from nicegui import ui
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Callable, Literal, Optional
+from nicegui import background_tasks, run, ui
 
 from kymflow.core.image_loaders.kym_image import KymImage
 from kymflow.core.image_loaders.roi import RectROI, RoiBounds
@@ -124,6 +126,17 @@ def _rectroi_to_region_of_interest(roi_id: int, rect: RectROI):
     )
 
 
+@dataclass
+class _FileSwitchData:
+    """Widget inputs for one file, prepared off the event loop (see _prepare_file_switch)."""
+
+    manager: Any
+    rois: Any
+    velocity_x: Any = None
+    velocity_y: Any = None
+    events: Optional[list] = None
+
+
 class ImageLineViewerV2View:
     """V2 view composing ImageRoiWidget and LinePlotWidget.
 
@@ -168,6 +181,11 @@ class ImageLineViewerV2View:
         self._kym_event_range_path: Optional[str] = None
         # Combined widget instance (ImageLineCombinedWidget); set in render().
         self._combined = None
+        # Shown while a selected file is prepared in a worker thread.
+        self._loading_label: Optional[ui.label] = None
+        # Bumped by every file switch; results of superseded switches are dropped.
+        self._switch_generation = 0
+        self._switch_pending = False
 
     def render(self) -> None:
         """Create the viewer UI: ImageRoiWidget + LinePlotWidget in a column."""
@@ -185,6 +203,8 @@ class ImageLineViewerV2View:
         # Important for nested splitters: allow children to fully shrink.
         self._container = ui.column().classes("w-full h-full min-h-0")
         with self._container:
+            self._loading_label = ui.label("").classes("text-xs text-gray-500")
+            self._loading_label.set_visibility(False)
             theme_str = _to_nicewidgets_theme(self._theme)
 
             def on_channel_event(ev: ChannelEvent) -> None:
@@ -348,6 +368,8 @@ class ImageLineViewerV2View:
 
         if kf is None:
             # No file: clear line + events and leave image placeholder.
+            self._switch_generation += 1
+            self._set_switch_pending(False)
             self._combined.clear_for_no_roi()
             return
 
@@ -359,68 +381,130 @@ class ImageLineViewerV2View:
     def _switch_file_to_current_state(self) -> None:
         """Drive the combined widget to represent the current file/ROI state.
 
-        This batches image data, ROIs, velocity line, and velocity events into a
-        single ``switch_file`` call on ``ImageLineCombinedWidget`` to avoid
-        duplicated Plotly updates. Public view APIs remain unchanged; this
-        helper is an internal implementation detail invoked from
-        ``_refresh_from_state``.
-
-        Args:
-            None. Uses ``self._current_file``, ``self._current_roi_id``, and
-            ``self._current_channel`` as implicit inputs.
-
-        Returns:
-            None. Updates the underlying combined widget in place.
+        Prepares the widget inputs and applies them synchronously; a file switch
+        still waiting for its worker thread is superseded.
         """
         if self._combined is None or self._current_file is None:
             return
+        self._switch_generation += 1
+        self._set_switch_pending(False)
+        data = self._prepare_file_switch(
+            self._current_file,
+            self._current_channel,
+            self._current_roi_id,
+            self._event_filter,
+        )
+        self._apply_file_switch(data)
 
-        kf = self._current_file
+    @staticmethod
+    def _prepare_file_switch(
+        kf: KymImage,
+        channel: Optional[int],
+        roi_id: Optional[int],
+        event_filter: Optional[dict[str, bool]],
+    ) -> _FileSwitchData:
+        """Build the image, ROI, velocity and event inputs for ``switch_file``.
 
-        active_ch = self._current_channel if self._current_channel is not None else 1
+        Only reads the model (no widget access), so it can run in a worker thread.
+
+        Args:
+            kf: File to show.
+            channel: Selected channel (None: channel 1 for the image, no events).
+            roi_id: Selected ROI, or None.
+            event_filter: Event type filter, or None for all events.
+
+        Returns:
+            _FileSwitchData for :meth:`_apply_file_switch`.
+        """
+        active_ch = channel if channel is not None else 1
+        try:
+            kf.load_channel(active_ch)
+        except Exception as exc:
+            logger.error(
+                "ImageLineViewerV2View failed to load channel=%s: %s",
+                active_ch,
+                exc,
+            )
         manager, rois = kymimage_to_channel_manager(kf, channel=active_ch)
+        data = _FileSwitchData(manager=manager, rois=rois)
 
         # Derive velocity trace for the current ROI using existing logic.
-        time_arr = None
-        vel_arr = None
-        if self._current_roi_id is not None:
+        if roi_id is not None:
             kym_analysis = kf.get_kym_analysis()
             radon = kym_analysis.get_analysis_object("RadonAnalysis")
-            channel = radon.get_channel_for_roi(self._current_roi_id) if radon else None
-            if radon is not None and channel is not None and radon.has_analysis(self._current_roi_id, channel):
-                time_arr = radon.get_analysis_value(self._current_roi_id, channel, "time")
-                vel_arr = radon.get_analysis_value(self._current_roi_id, channel, "velocity")
+            roi_channel = radon.get_channel_for_roi(roi_id) if radon else None
+            if radon is not None and roi_channel is not None and radon.has_analysis(roi_id, roi_channel):
+                data.velocity_x = radon.get_analysis_value(roi_id, roi_channel, "time")
+                data.velocity_y = radon.get_analysis_value(roi_id, roi_channel, "velocity")
 
         # Derive events for the current ROI/channel using existing logic.
-        acq_events = None
-        if self._current_roi_id is not None and self._current_channel is not None:
+        if roi_id is not None and channel is not None:
             kym_analysis = kf.get_kym_analysis()
-            if self._event_filter:
-                events_raw = kym_analysis.get_velocity_events_filtered(
-                    self._current_roi_id, self._current_channel, self._event_filter
-                )
+            if event_filter:
+                events_raw = kym_analysis.get_velocity_events_filtered(roi_id, channel, event_filter)
             else:
-                events_raw = kym_analysis.get_velocity_events(self._current_roi_id, self._current_channel)
+                events_raw = kym_analysis.get_velocity_events(roi_id, channel)
             # Avoid forcing Plotly set_events([]) when ROI/channel aren't ready.
             # `switch_file(..., events=None)` keeps the initial "clear" behavior
             # without triggering an extra update.
             events_list = velocity_events_to_acq_image_events(events_raw) or []
-            acq_events = events_list if events_list else None
+            data.events = events_list if events_list else None
+        return data
 
+    def _apply_file_switch(self, data: _FileSwitchData) -> None:
+        """Push prepared inputs to the combined widget (event loop only)."""
+        if self._combined is None:
+            return
         # Single combined update for image + line + events (including ROI selection).
         selected_roi_name = str(self._current_roi_id) if self._current_roi_id is not None else None
         self._combined.switch_file(
-            manager,
-            rois,
-            velocity_x=time_arr,
-            velocity_y=vel_arr,
-            events=acq_events,
+            data.manager,
+            data.rois,
+            velocity_x=data.velocity_x,
+            velocity_y=data.velocity_y,
+            events=data.events,
             reset_axes=True,
             selected_roi_name=selected_roi_name,
         )
 
         # Re-apply display params and contrast state (selection is handled in switch_file).
-        self._apply_display_params_and_selection(manager)
+        self._apply_display_params_and_selection(data.manager)
+
+    def _set_switch_pending(self, pending: bool, kf: Optional[KymImage] = None) -> None:
+        """Show or hide the loading placeholder for a file switch in progress."""
+        self._switch_pending = pending
+        if self._loading_label is None:
+            return
+        if pending:
+            name = getattr(getattr(kf, "path", None), "name", None) or "file"
+            self._loading_label.set_text(f"Loading {name}...")
+        self._loading_label.set_visibility(pending)
+
+    async def _switch_file_in_background(
+        self,
+        generation: int,
+        kf: KymImage,
+        channel: Optional[int],
+        roi_id: Optional[int],
+    ) -> None:
+        """Prepare a file switch in a worker thread and apply it if still current."""
+        try:
+            data = await run.io_bound(
+                self._prepare_file_switch, kf, channel, roi_id, self._event_filter
+            )
+        except Exception:
+            logger.exception("ImageLineViewerV2View failed to prepare %s", getattr(kf, "path", kf))
+            data = None
+        if generation != self._switch_generation:
+            logger.debug("Dropping superseded file switch for %s", getattr(kf, "path", kf))
+            return
+        safe_call(self._set_switch_pending, False)
+        if data is None:
+            return
+        safe_call(self._apply_file_switch, data)
+        if self._current_roi_id != roi_id:
+            # ROI changed while the file was being prepared.
+            safe_call(self._set_selected_roi_impl, self._current_roi_id)
 
     def _apply_display_params_and_selection(self, manager) -> None:
         """Re-apply colorscale/contrast, ROI selection, and contrast state.
@@ -753,20 +837,29 @@ class ImageLineViewerV2View:
         channel: Optional[int],
         roi_id: Optional[int],
     ) -> None:
-        if file is not None:
-            ch = channel if channel is not None else 1
-            try:
-                file.load_channel(ch)
-            except Exception as exc:
-                logger.error(
-                    "ImageLineViewerV2View failed to load channel=%s: %s",
-                    ch,
-                    exc,
-                )
+        """Switch files; data is prepared in a worker thread when a loop is running.
+
+        A loading placeholder is shown at once, and the widget is updated on the
+        event loop when the data is ready, unless another selection came first.
+        """
         self._current_file = file
         self._current_channel = channel
         self._current_roi_id = roi_id
-        self._refresh_from_state()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            in_loop = False
+        else:
+            in_loop = True
+        if file is None or self._combined is None or not in_loop:
+            self._refresh_from_state()
+            return
+        self._switch_generation += 1
+        self._set_switch_pending(True, file)
+        background_tasks.create(
+            self._switch_file_in_background(self._switch_generation, file, channel, roi_id),
+            name="image_line_viewer_switch_file",
+        )
 
     def set_selected_roi(self, roi_id: Optional[int]) -> None:
         """Update plot for new ROI."""
@@ -775,7 +868,8 @@ class ImageLineViewerV2View:
     def _set_selected_roi_impl(self, roi_id: Optional[int]) -> None:
         """Select ROI by roi_id. Name must match adapter convention (str(roi_id))."""
         self._current_roi_id = roi_id
-        if self._combined is None:
+        if self._combined is None or self._switch_pending:
+            # A pending file switch applies the latest ROI when it lands.
             return
 
         name: str | None = str(roi_id) if roi_id is not None else None
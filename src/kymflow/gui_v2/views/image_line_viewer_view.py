@@ -4,6 +4,11 @@ This module provides a view component that displays a combined kymograph image
 and velocity plot using Plotly. The view emits ROISelection events when users
 select ROIs from the dropdown, but does not subscribe to events (that's handled
 by ImageLineViewerBindings).
+
+The app shows :class:`~kymflow.gui_v2.views.image_line_viewer_v2_view.ImageLineViewerV2View`
+instead, whose figures are built by nicewidgets. Incremental figure patching
+(restyle/relayout instead of resending the figure) is implemented for this
+view only.
 """
 
 from __future__ import annotations
@@ -26,7 +31,18 @@ from kymflow.core.plotting import (
     update_yaxis_range_v2,
     select_kym_event_rect,
 )
-from kymflow.core.plotting.line_plots import refresh_kym_event_rects
+from kymflow.core.plotting.figure_patch import FigurePatch, diff_figure, snapshot_figure
+from kymflow.core.plotting.image_pyramid import ImagePyramid, get_image_pyramid
+from kymflow.core.plotting.line_plots import (
+    get_roi_line_values,
+    refresh_kym_event_rects,
+    update_heatmap_display_v2,
+    update_heatmap_tile,
+    update_image_tile,
+    update_image_tile_display,
+    update_line_decimation,
+)
+from kymflow.core.plotting.image_tiles import find_tile_image
 from kymflow.core.plotting.theme import ThemeMode
 from kymflow.gui_v2.state import ImageDisplayParams
 from kymflow.gui_v2.client_utils import safe_call
@@ -94,6 +110,17 @@ class ImageLineViewerView:
         self._current_figure: Optional[go.Figure] = None
         self._current_figure_dict: Optional[dict] = None
         self._uirevision: int = 0
+        # Heatmap pyramid of the displayed channel (re-tiled on x-range changes)
+        self._image_pyramid: Optional[ImagePyramid] = None
+        self._dim0_arange = None
+        # Full-resolution (time, velocity) of the decimated line trace
+        self._line_xy: Optional[tuple] = None
+        # Snapshot of the figure dict the client currently shows (diffed on update)
+        self._client_figure: Optional[dict] = None
+        # File the current figure dict was built for (view state carried over on re-render)
+        self._rendered_file: Optional[KymImage] = None
+        # "heatmap" (browser colormaps values) or "tile" (server-rendered image tiles)
+        self._image_render: Literal["heatmap", "tile"] = "heatmap"
         
         # Filter state (stored instead of reading from checkboxes)
         self._remove_outliers: bool = False
@@ -134,6 +161,7 @@ class ImageLineViewerView:
         # This ensures we create fresh elements in the new container context
         self._plot = None
         self._plot_container = None
+        self._client_figure = None
 
         # Plot container fills available height so nested splitters can resize vertically.
         self._plot_container = ui.column().classes("w-full h-full")
@@ -149,13 +177,53 @@ class ImageLineViewerView:
             self._plot.on("plotly_relayout", self._on_plotly_relayout)
 
     def ui_plotly_update_figure(self, fig: go.Figure | None = None) -> None:
-        """Update the plotly plot with a new figure."""
-        
-        # logger.info('XXX DO NOT CALL THIS A LOT -->> SLOW')
+        """Push ``self._current_figure_dict`` to the client.
 
+        Diffs the dict against what the client already shows and sends only the
+        changed trace attributes / layout keys (``Plotly.restyle`` /
+        ``Plotly.relayout``), so unchanged heatmap pixels are not re-sent. Falls
+        back to a full ``update_figure`` when the trace structure changed.
+        """
+        new_dict = self._current_figure_dict
+        if self._plot is None or new_dict is None:
+            return
 
-        self._plot.update_figure(self._current_figure_dict)
-        # self._plot.update()
+        patch = None
+        if self._client_figure is not None and hasattr(self._plot, "run_plot_method"):
+            patch = diff_figure(self._client_figure, new_dict)
+
+        if patch is None or patch.full:
+            self._plot.update_figure(new_dict)
+        elif not patch.is_empty:
+            self._apply_figure_patch(patch)
+            self._sync_plot_figure(new_dict)
+        self._client_figure = snapshot_figure(new_dict)
+
+    def _apply_figure_patch(self, patch: FigurePatch) -> None:
+        """Send a figure patch to the client with plotly.js restyle/relayout."""
+        plot = self._plot
+        if plot is None:
+            return
+        for trace_index, changes in patch.restyles:
+            # restyle takes one value per target trace, so wrap each value.
+            update = {attr: [value] for attr, value in changes.items()}
+            plot.run_plot_method("restyle", update, [trace_index])
+        if patch.relayout:
+            plot.run_plot_method("relayout", patch.relayout)
+
+    def _sync_plot_figure(self, new_dict: dict) -> None:
+        """Make the element's server-side figure match a patched client.
+
+        The element's ``options`` prop is the figure dict object last passed to
+        ``update_figure``; refill that object in place so a later full update
+        or reconnect sends the current figure, without sending anything now.
+        """
+        shown = self._plot.figure if self._plot is not None else None
+        if shown is new_dict or not isinstance(shown, dict):
+            return
+        shown.clear()
+        shown.update(new_dict)
+        self._current_figure_dict = shown
 
     def _on_plotly_relayout(self, e: GenericEventArguments) -> None:
         """
@@ -193,8 +261,28 @@ class ImageLineViewerView:
             x0 = payload['xaxis2.range[0]']
             x1 = payload['xaxis2.range[1]']
             logger.warning(f'setting x range for _scroll_x_impl() prev/next window: [{x0}, {x1}]')
-            # needed for _scroll_x_impl()
-            update_xaxis_range_v2(self._current_figure_dict, [x0, x1])
+            # needed for _scroll_x_impl(); also swaps in heatmap tiles for the new range
+            self._set_x_range([x0, x1])
+            if (self._image_pyramid is not None or self._line_xy is not None) and self._plot is not None:
+                self.ui_plotly_update_figure()
+        elif payload.get('xaxis2.autorange') or payload.get('xaxis.autorange'):
+            # Autoscale (double-click): go back to the coarse full-range heatmap
+            if self._current_figure_dict is not None and (
+                self._image_pyramid is not None or self._line_xy is not None
+            ):
+                if self._image_pyramid is not None and self._dim0_arange is not None:
+                    if not update_heatmap_tile(
+                        self._current_figure_dict, self._image_pyramid, self._dim0_arange, None
+                    ):
+                        update_image_tile(
+                            self._current_figure_dict, self._image_pyramid, self._dim0_arange, None
+                        )
+                if self._line_xy is not None:
+                    update_line_decimation(
+                        self._current_figure_dict, self._line_xy[0], self._line_xy[1], None
+                    )
+                if self._plot is not None:
+                    self.ui_plotly_update_figure()
             # be careful here, this should be ok but leave out in case we need 
             # user set xaxis range for kym event
             # return
@@ -555,7 +643,7 @@ class ImageLineViewerView:
                     x_max = min(x_max, float(duration))
             
             # Use dict-based update
-            update_xaxis_range_v2(self._current_figure_dict, [x_min, x_max])
+            self._set_x_range([x_min, x_max])
             try:
                 self.ui_plotly_update_figure()
             except RuntimeError as ex:
@@ -669,12 +757,36 @@ class ImageLineViewerView:
             plot_rois=plot_rois,
             selected_event_id=self._selected_event_id,
             event_filter=self._event_filter,
+            image_render=self._image_render,
         )
 
         # Store figure reference
         self._set_uirevision(fig)
         self._current_figure = fig
-        self._current_figure_dict = fig.to_dict()  # abb 20260209
+        prev_figure_dict = self._current_figure_dict
+        same_file = kf is not None and kf is self._rendered_file
+        self._rendered_file = kf
+        fig_dict = fig.to_dict()
+        self._current_figure_dict = fig_dict  # abb 20260209
+        self._image_pyramid = get_image_pyramid(kf, 1) if kf is not None else None
+        try:
+            self._dim0_arange = kf.get_dim_arange(0) if kf is not None else None
+        except ValueError:
+            self._image_pyramid = None
+            self._dim0_arange = None
+        self._line_xy = None
+        if kf is not None and roi_id is not None:
+            t, v = get_roi_line_values(
+                kf.get_kym_analysis(),
+                roi_id,
+                "velocity",
+                self._remove_outliers,
+                median_filter_size,
+            )
+            if t is not None:
+                self._line_xy = (t, v)
+        if same_file and prev_figure_dict is not None:
+            self._carry_over_view_state(prev_figure_dict, fig_dict)
 
         # Detect grid changes (1 row vs 2 rows) and rebuild plot if needed
         num_rows = 2 if getattr(fig.layout, "yaxis2", None) is not None else 1
@@ -691,6 +803,74 @@ class ImageLineViewerView:
                 raise
             # Client deleted, silently ignore
 
+    def _carry_over_view_state(self, prev: dict, new: dict) -> None:
+        """Keep the current x-range and heatmap tile when re-rendering the same file.
+
+        A rebuilt figure has the full-range heatmap and no axis ranges; copying
+        them from the previous dict means only what actually changed (line
+        trace, overlays, theme) is patched to the client, and image pixels are
+        not re-sent on ROI/event/theme changes.
+        """
+        prev_layout = prev.get("layout") or {}
+        new_layout = new.get("layout") or {}
+        x_range = None
+        for axis in ("xaxis", "xaxis2"):
+            prev_axis = prev_layout.get(axis) or {}
+            if "range" in prev_axis and axis in new_layout:
+                new_layout[axis]["range"] = prev_axis["range"]
+                x_range = prev_axis["range"]
+
+        prev_tile = find_tile_image(prev)
+        new_tile = find_tile_image(new)
+        if prev_tile is not None and new_tile is not None:
+            prev_meta = (prev.get("data") or [{}])[0].get("meta", {}).get("kymflow_tile") or {}
+            new_meta = (new.get("data") or [{}])[0].get("meta", {}).get("kymflow_tile") or {}
+            keys = ("channel", "viewport_px", "transpose", "colorscale", "zmin", "zmax", "format")
+            if prev_meta and all(prev_meta.get(k) == new_meta.get(k) for k in keys):
+                new_tile.clear()
+                new_tile.update(prev_tile)
+                new_meta.update(prev_meta)
+
+        prev_heatmap = next((t for t in prev.get("data", []) if t.get("type") == "heatmap"), None)
+        new_heatmap = next((t for t in new.get("data", []) if t.get("type") == "heatmap"), None)
+        if prev_heatmap is not None and new_heatmap is not None:
+            prev_meta = dict((prev_heatmap.get("meta") or {}).get("kymflow_pyramid") or {})
+            new_meta = dict((new_heatmap.get("meta") or {}).get("kymflow_pyramid") or {})
+            prev_meta.pop("factor", None)
+            new_meta.pop("factor", None)
+            if prev_meta and prev_meta == new_meta:
+                for key in ("z", "x", "y", "meta"):
+                    if key in prev_heatmap:
+                        new_heatmap[key] = prev_heatmap[key]
+
+        if x_range is not None and self._line_xy is not None:
+            update_line_decimation(new, self._line_xy[0], self._line_xy[1], x_range)
+
+    def set_image_render(self, mode: Literal["heatmap", "tile"]) -> None:
+        """Choose how the kymograph image row is rendered and re-render.
+
+        Args:
+            mode: ``"heatmap"`` (Plotly colormaps values in the browser) or
+                ``"tile"`` (server colormaps the visible window into a
+                compressed image; best for very long kymographs).
+        """
+        if mode == self._image_render:
+            return
+        self._image_render = mode
+        safe_call(self._render_combined)
+
+    def _set_x_range(self, x_range: list[float]) -> None:
+        """Set the shared x-axis range, re-tiling the heatmap and re-decimating the line."""
+        if self._current_figure_dict is None:
+            return
+        update_xaxis_range_v2(
+            self._current_figure_dict,
+            x_range,
+            pyramid=self._image_pyramid,
+            dim0_arange=self._dim0_arange,
+            line_xy=self._line_xy,
+        )
+
     def _set_uirevision(self, fig: go.Figure) -> None:
         """Apply the current uirevision to the figure."""
         fig.layout.uirevision = f"kymflow-plot-{self._uirevision}"
@@ -724,7 +904,7 @@ class ImageLineViewerView:
 
         # Reset x-axis (time) for both subplots (they're shared)
         x_range = [0.0, float(duration_seconds)]
-        update_xaxis_range_v2(self._current_figure_dict, x_range)
+        self._set_x_range(x_range)
 
         # Reset y-axis (position) for image subplot only (row 1)
         y_range = [0.0, space_um]
@@ -838,7 +1018,7 @@ class ImageLineViewerView:
             # OLD: update_xaxis_range(fig, list(preserved_range))
             # NEW: Use dict-based update
             if self._current_figure_dict is not None and self._plot is not None:
-                update_xaxis_range_v2(self._current_figure_dict, list(preserved_range))
+                self._set_x_range(list(preserved_range))
                 try:
                     self.ui_plotly_update_figure()
                 except RuntimeError as e:
@@ -859,7 +1039,7 @@ class ImageLineViewerView:
         self._pending_range_zoom = None
         # OLD: update_xaxis_range(fig, [x_min, x_max])
         # NEW: Use dict-based update
-        update_xaxis_range_v2(self._current_figure_dict, [x_min, x_max])
+        self._set_x_range([x_min, x_max])
         try:
             self.ui_plotly_update_figure()
         except RuntimeError as e:
@@ -967,7 +1147,7 @@ class ImageLineViewerView:
                 new_min = max(new_max - width, time_min)
 
         # 5. Apply and push to client
-        update_xaxis_range_v2(self._current_figure_dict, [new_min, new_max])
+        self._set_x_range([new_min, new_max])
         try:
             self.ui_plotly_update_figure()
         except RuntimeError as e:
@@ -991,6 +1171,25 @@ class ImageLineViewerView:
         # Update contrast (zmin/zmax)
         update_contrast(fig, zmin=display_params.zmin, zmax=display_params.zmax)
 
+        # Mirror into the dict that is pushed to the client (restyle only)
+        if self._current_figure_dict is not None:
+            update_heatmap_display_v2(
+                self._current_figure_dict,
+                colorscale=display_params.colorscale,
+                zmin=display_params.zmin,
+                zmax=display_params.zmax,
+            )
+            if self._image_pyramid is not None and self._dim0_arange is not None:
+                # Server-rendered tile: re-encode only the visible window
+                update_image_tile_display(
+                    self._current_figure_dict,
+                    self._image_pyramid,
+                    self._dim0_arange,
+                    colorscale=display_params.colorscale,
+                    zmin=display_params.zmin,
+                    zmax=display_params.zmax,
+                )
+
         # Update the plot with modified figure (preserves zoom via uirevision)
         try:
             # self._plot.update_figure(fig)
@@ -93,3 +93,78 @@ def test_batch_process_backend_rejects_df_tasks():
     task = HRBatchTask(df=df, source_id="in_memory_df")
     with pytest.raises(ValueError, match="csv_path only"):
         run_hr_batch([task], backend="process")
+
+
+def test_from_roi_arrays_matches_df_results(monkeypatch):
+    monkeypatch.setattr(hrp, "estimate_heart_rate_global", _fake_estimator)
+    df = _make_df()
+    t = df["time"].to_numpy()
+    v = df["velocity"].to_numpy()
+
+    from_arrays = hrp.HeartRateAnalysis.from_roi_arrays({1: (t, v)})
+    from_df = hrp.HeartRateAnalysis(df)
+    assert from_arrays.roi_ids == from_df.roi_ids == [1]
+    t_arr, _v_arr = from_arrays.get_time_velocity(1)
+    assert np.shares_memory(t_arr, t)
+
+    r_arr = from_arrays.run_roi(1, cfg={"do_segments": False})
+    r_df = from_df.run_roi(1, cfg={"do_segments": False})
+    assert r_arr.lomb is not None and r_df.lomb is not None
+    assert r_arr.lomb.bpm == r_df.lomb.bpm
+    assert r_arr.n_total == r_df.n_total
+    pd.testing.assert_frame_equal(from_arrays.df, from_df.df, check_dtype=False)
+
+
+def test_batch_process_backend_supports_roi_arrays_tasks():
+    t = np.arange(0.0, 10.0, 0.01)
+    v = np.sin(2.0 * np.pi * 7.0 * t)
+    tasks = [
+        HRBatchTask(roi_arrays={1: (t, v), 2: (t, 0.5 * v)}, source_id="arrays_a"),
+        HRBatchTask(roi_arrays={3: (t, v)}, source_id="arrays_b", roi_ids=[3]),
+    ]
+    cfg = hrp.HRAnalysisConfig(do_segments=False)
+    proc = run_hr_batch(tasks, default_cfg=cfg, backend="process", n_workers=2)
+    thread = run_hr_batch(tasks, default_cfg=cfg, backend="thread", n_workers=1)
+
+    assert [r.source_id for r in proc] == ["arrays_a", "arrays_b"]
+    assert sorted(proc[0].per_roi) == [1, 2]
+    assert sorted(proc[1].per_roi) == [3]
+    for p, q in zip(proc, thread):
+        for rid, res in p.per_roi.items():
+            assert res.lomb is not None
+            assert res.lomb.bpm == q.per_roi[rid].lomb.bpm
+
+
+def test_batch_task_requires_exactly_one_input():
+    with pytest.raises(ValueError, match="Exactly one"):
+        HRBatchTask(df=_make_df(), roi_arrays={1: (np.zeros(3), np.zeros(3))})
+
+
+def _counting_estimator(calls):
+    def _est(time_s, velocity, *, method, **kwargs):
+        calls.append(method)
+        return _fake_estimator(time_s, velocity, method=method, **kwargs)
+
+    return _est
+
+
+def test_run_roi_reuses_result_for_identical_inputs(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(hrp, "estimate_heart_rate_global", _counting_estimator(calls))
+    analysis = hrp.HeartRateAnalysis(_make_df())
+
+    first = analysis.run_roi(1, cfg={"do_segments": False})
+    assert first.input_hash is not None
+    assert analysis.run_roi(1, cfg={"do_segments": False}) is first
+    assert len(calls) == 2
+
+    changed_cfg = analysis.run_roi(1, cfg={"do_segments": False, "outlier_k_mad": 3.5})
+    assert changed_cfg is not first
+    assert changed_cfg.input_hash != first.input_hash
+    assert len(calls) == 4
+
+    analysis.run_roi(1, cfg={"do_segments": False, "outlier_k_mad": 3.5}, use_cache=False)
+    assert len(calls) == 6
+
+    analysis.run_roi(1, cfg={"do_segments": False, "outlier_k_mad": 3.5}, methods=["welch"])
+    assert len(calls) == 7
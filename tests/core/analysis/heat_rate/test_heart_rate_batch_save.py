@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 import numpy as np
@@ -88,3 +89,41 @@ def test_batch_run_and_save_invalid_roi_reports_error(tmp_path, monkeypatch):
     assert out[0].ok is False
     assert out[0].saved_json_path is None
     assert "not found" in out[0].error.lower()
+
+
+def test_batch_run_and_save_reuses_unchanged_roi_results(tmp_path, monkeypatch):
+    calls: list[str] = []
+
+    def _counting(time_s, velocity, *, method, **kwargs):
+        calls.append(method)
+        return _fake_estimator(time_s, velocity, method=method, **kwargs)
+
+    monkeypatch.setattr(hrp, "estimate_heart_rate_global", _counting)
+    cfg = hrp.HRAnalysisConfig(do_segments=False)
+    paths = [_write_two_roi_csv(tmp_path, "a.csv"), _write_two_roi_csv(tmp_path, "b.csv")]
+
+    out = batch_run_and_save(paths, cfg=cfg, backend="serial")
+    assert all(r.ok for r in out)
+    assert len(calls) == 8
+    saved = json.loads(out[0].saved_json_path.read_text(encoding="utf-8"))
+    assert saved["per_roi"]["1"]["results"]["input_hash"]
+
+    # Edit one ROI in one file: only that ROI is recomputed, b.json is untouched.
+    calls.clear()
+    mtime_b = out[1].saved_json_path.stat().st_mtime_ns
+    lines = paths[0].read_text(encoding="utf-8").splitlines()
+    t_str, _v_str, rid_str = lines[11].split(",")
+    lines[11] = f"{t_str},5.0,{rid_str}"
+    paths[0].write_text("\n".join(lines) + "\n", encoding="utf-8")
+    out = batch_run_and_save(paths, cfg=cfg, backend="serial")
+    assert all(r.ok for r in out)
+    assert len(calls) == 2
+    assert out[1].saved_json_path.stat().st_mtime_ns == mtime_b
+
+    calls.clear()
+    batch_run_and_save(paths, cfg=hrp.HRAnalysisConfig(do_segments=False, outlier_k_mad=3.5), backend="serial")
+    assert len(calls) == 8
+
+    calls.clear()
+    batch_run_and_save(paths, cfg=cfg, backend="serial", use_cache=False)
+    assert len(calls) == 8
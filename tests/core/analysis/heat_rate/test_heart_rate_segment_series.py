@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+from kymflow.core.analysis.heart_rate.heart_rate_analysis import (
+    estimate_heart_rate_global,
+    estimate_heart_rate_segment_series,
+    lombscargle_power_windows,
+)
+
+
+def _synthetic_trace(fs: float = 200.0, duration_s: float = 30.0, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration_s * fs)) / fs
+    f_hz = 7.0 + 0.4 * np.sin(2.0 * np.pi * t / duration_s)
+    v = 2.0 + np.sin(2.0 * np.pi * np.cumsum(f_hz) / fs) + 0.2 * rng.standard_normal(t.size)
+    return t, v
+
+
+def _reference_series(t, v, *, method, win=6.0, step=1.0, min_frac=0.5, **kwargs):
+    """Per-window loop equivalent to the original implementation."""
+    finite = np.isfinite(t) & np.isfinite(v)
+    t_start = float(np.nanmin(t[finite]))
+    t_end = float(np.nanmax(t[finite]))
+    centers, bpm, snr, bc = [], [], [], []
+    left = t_start
+    while (left + win) <= (t_end + 1e-9):
+        m = (t >= left) & (t < left + win)
+        if np.any(m):
+            centers.append(left + 0.5 * win)
+            frac = float(np.mean(np.isfinite(t[m]) & np.isfinite(v[m])))
+            est = None
+            if frac >= min_frac:
+                est, _dbg = estimate_heart_rate_global(t[m], v[m], method=method, **kwargs)
+            bpm.append(np.nan if est is None else est.bpm)
+            snr.append(np.nan if est is None else est.snr)
+            bc.append(np.nan if est is None else est.band_concentration)
+        left += step
+    return np.asarray(centers), np.asarray(bpm), np.asarray(snr), np.asarray(bc)
+
+
+@pytest.mark.parametrize("method", ["lombscargle", "welch"])
+def test_segment_series_matches_per_window_estimates(method):
+    t, v = _synthetic_trace()
+    kwargs = {"peak_half_width_hz": 0.6}
+    centers, bpm, snr, bc = _reference_series(t, v, method=method, **kwargs)
+
+    out = estimate_heart_rate_segment_series(t, v, method=method, **kwargs)
+
+    np.testing.assert_allclose(out["t_center"], centers)
+    np.testing.assert_allclose(out["bpm"], bpm, rtol=1e-6)
+    np.testing.assert_allclose(out["snr"], snr, rtol=1e-4)
+    np.testing.assert_allclose(out["band_concentration"], bc, rtol=1e-4, atol=1e-9)
+    assert np.nanmedian(out["bpm"]) == pytest.approx(420.0, abs=30.0)
+
+
+def test_lombscargle_power_windows_matches_scipy_with_gaps():
+    t, v = _synthetic_trace(duration_s=10.0)
+    v = v.copy()
+    v[300:340] = np.nan
+    starts = np.array([0, 250, 900])
+    ends = np.array([1200, 1450, 2000])
+    f_grid = np.linspace(4.0, 10.0, 64)
+
+    power = lombscargle_power_windows(t, v, starts, ends, f_grid)
+
+    assert power.shape == (3, 64)
+    for row, (s, e) in enumerate(zip(starts, ends)):
+        tw, vw = t[s:e], v[s:e]
+        m = np.isfinite(vw)
+        expected = signal.lombscargle(
+            tw[m], vw[m] - np.mean(vw[m]), 2.0 * np.pi * f_grid, normalize=True
+        )
+        np.testing.assert_allclose(power[row], expected, rtol=1e-7, atol=1e-10)
+
+
+def test_segment_series_low_valid_fraction_is_nan_and_unsorted_time_ok():
+    t, v = _synthetic_trace()
+    v = v.copy()
+    v[2000:2900] = np.nan
+    order = np.random.default_rng(1).permutation(t.size)
+
+    out = estimate_heart_rate_segment_series(t[order], v[order], method="lombscargle")
+    ref = estimate_heart_rate_segment_series(t, v, method="lombscargle")
+
+    low = out["valid_frac"] < 0.5
+    assert np.any(low)
+    assert np.all(np.isnan(out["bpm"][low]))
+    np.testing.assert_allclose(out["bpm"], ref["bpm"])
+
+
+def test_segment_series_unknown_method_raises():
+    t, v = _synthetic_trace(duration_s=8.0)
+    with pytest.raises(ValueError):
+        estimate_heart_rate_segment_series(t, v, method="fft")
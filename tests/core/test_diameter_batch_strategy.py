@@ -0,0 +1,102 @@
+"""Tests for :class:`~kymflow.core.kym_analysis_batch.diameter_batch_strategy.DiameterBatchStrategy`."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from kymflow.core.analysis.diameter_analysis import generate_synthetic_kymograph
+from kymflow.core.analysis.diameter_analysis.diameter_analysis import load_diameter_analysis
+from kymflow.core.kym_analysis_batch.diameter_batch_strategy import DiameterBatchStrategy
+from kymflow.core.kym_analysis_batch.kym_analysis_batch import KymAnalysisBatch
+from kymflow.core.kym_analysis_batch.types import AnalysisBatchKind, BatchFileOutcome
+
+
+def _make_kf(path: Path, *, roi_ids: list[int]) -> MagicMock:
+    synth = generate_synthetic_kymograph(n_time=60, n_space=64, seed=1)
+    img = synth["kymograph"]
+    kf = MagicMock()
+    kf.path = path
+    kf.header.shape = img.shape
+    kf.header.voxels = (synth["seconds_per_line"], synth["um_per_pixel"])
+    kf.getChannelData.return_value = img
+    kf.rois.get_roi_ids.return_value = list(roi_ids)
+    roi = MagicMock()
+    roi.bounds.dim0_start = 0
+    roi.bounds.dim0_stop = img.shape[0]
+    roi.bounds.dim1_start = 0
+    roi.bounds.dim1_stop = img.shape[1]
+    kf.rois.get.return_value = roi
+    return kf
+
+
+def test_diameter_batch_strategy_runs_and_saves(tmp_path: Path) -> None:
+    kf = _make_kf(tmp_path / "a.tif", roi_ids=[1])
+    strategy = DiameterBatchStrategy(roi_mode="existing", roi_id=1, channel=1)
+    out = strategy.process_file(kf, cancel_event=threading.Event())
+    assert out.outcome == BatchFileOutcome.OK
+    assert out.kind == AnalysisBatchKind.DIAMETER
+    assert (tmp_path / "a.diameter.json").exists()
+    bundle, _params, bounds, _warnings = load_diameter_analysis(tmp_path / "a.tif")
+    assert list(bundle.runs) == [(1, 1)]
+    assert len(bundle.runs[(1, 1)]) == 60
+    assert bounds[(1, 1)] == (0, 60, 0, 64)
+
+
+def test_diameter_batch_strategy_skips_saved_roi_unless_overwrite(tmp_path: Path) -> None:
+    kf = _make_kf(tmp_path / "a.tif", roi_ids=[1])
+    DiameterBatchStrategy(roi_mode="existing", roi_id=1, channel=1).process_file(
+        kf, cancel_event=threading.Event()
+    )
+    out = DiameterBatchStrategy(roi_mode="existing", roi_id=1, channel=1).process_file(
+        kf, cancel_event=threading.Event()
+    )
+    assert out.outcome == BatchFileOutcome.SKIPPED
+    assert "saved diameter analysis" in out.message
+
+    out = DiameterBatchStrategy(
+        roi_mode="existing", roi_id=1, channel=1, overwrite=True
+    ).process_file(kf, cancel_event=threading.Event())
+    assert out.outcome == BatchFileOutcome.OK
+
+
+def test_diameter_batch_strategy_fails_on_unreadable_sidecar(tmp_path: Path) -> None:
+    kf = _make_kf(tmp_path / "a.tif", roi_ids=[1])
+    sidecar = tmp_path / "a.diameter.json"
+    sidecar.write_text("{not json", encoding="utf-8")
+    out = DiameterBatchStrategy(
+        roi_mode="existing", roi_id=1, channel=1, overwrite=True
+    ).process_file(kf, cancel_event=threading.Event())
+    assert out.outcome == BatchFileOutcome.FAILED
+    assert "unreadable diameter sidecar" in out.message
+    assert sidecar.read_text(encoding="utf-8") == "{not json"
+    kf.getChannelData.assert_not_called()
+
+
+def test_diameter_batch_strategy_skips_missing_roi(tmp_path: Path) -> None:
+    kf = _make_kf(tmp_path / "a.tif", roi_ids=[2])
+    strategy = DiameterBatchStrategy(roi_mode="existing", roi_id=1, channel=1)
+    out = strategy.process_file(kf, cancel_event=threading.Event())
+    assert out.outcome == BatchFileOutcome.SKIPPED
+    assert "not in file" in out.message
+    kf.getChannelData.assert_not_called()
+
+
+def test_diameter_batch_strategy_cancelled_returns_cancelled(tmp_path: Path) -> None:
+    kf = _make_kf(tmp_path / "a.tif", roi_ids=[1])
+    ev = threading.Event()
+    ev.set()
+    out = DiameterBatchStrategy(roi_mode="existing", roi_id=1, channel=1).process_file(
+        kf, cancel_event=ev
+    )
+    assert out.outcome == BatchFileOutcome.CANCELLED
+    assert not (tmp_path / "a.diameter.json").exists()
+
+
+def test_diameter_batch_runner_reports_elapsed(tmp_path: Path) -> None:
+    files = [_make_kf(tmp_path / f"{name}.tif", roi_ids=[1]) for name in ("a", "b", "c")]
+    strategy = DiameterBatchStrategy(roi_mode="existing", roi_id=1, channel=1)
+    out = KymAnalysisBatch(files, strategy, max_parallel_files=2).run()
+    assert [r.outcome for r in out] == [BatchFileOutcome.OK] * 3
+    assert all(r.elapsed_s is not None and r.elapsed_s >= 0.0 for r in out)
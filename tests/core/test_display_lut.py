@@ -0,0 +1,71 @@
+"""Tests for :mod:`kymflow.core.plotting.display_lut`."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+
+import numpy as np
+import pytest
+
+import kymflow.core.plotting.display_lut as display_lut
+from kymflow.core.plotting.display_lut import (
+    intensity_range,
+    stretch_lut,
+    stretch_to_indices,
+)
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+def test_lut_matches_float_stretch(dtype: type) -> None:
+    rng = np.random.default_rng(0)
+    z = rng.integers(0, np.iinfo(dtype).max, size=(64, 48), endpoint=True).astype(dtype)
+    expected = display_lut._stretch_float(z, 17, 201.5, 256)
+    out = stretch_to_indices(z, 17, 201.5)
+    assert out.dtype == np.uint8 and out.shape == z.shape
+    np.testing.assert_array_equal(out, expected)
+    assert stretch_lut(dtype, 17, 201.5) is stretch_lut(dtype, 17, 201.5)
+
+
+def test_float_images_and_flat_contrast() -> None:
+    z = np.array([[-1.0, 0.5, 2.0]])
+    np.testing.assert_array_equal(stretch_to_indices(z, 0.0, 1.0), [[0, 128, 255]])
+    assert stretch_lut(np.float32, 0, 1) is None
+    np.testing.assert_array_equal(
+        stretch_to_indices(np.array([[5, 9]], dtype=np.uint16), 7, 7), [[0, 0]]
+    )
+
+
+def test_large_offset_float_image_keeps_all_levels() -> None:
+    z = 1e8 + np.arange(256, dtype=np.float64)
+    out = stretch_to_indices(z, z.min(), z.max())
+    np.testing.assert_array_equal(out, np.arange(256))
+
+
+def test_intensity_range_cached_for_read_only_views() -> None:
+    display_lut._range_cache.clear()
+    data = np.arange(24, dtype=np.uint16).reshape(2, 3, 4)
+    assert intensity_range(data[1]) == (12.0, 23.0)
+    assert len(display_lut._range_cache) == 0  # writeable data may change
+
+    data.flags.writeable = False
+    assert intensity_range(data[1]) == (12.0, 23.0)
+    # A new view of the same memory hits the cache.
+    assert intensity_range(data[1]) == (12.0, 23.0)
+    assert len(display_lut._range_cache) == 1
+
+
+def test_intensity_range_cache_does_not_keep_arrays_alive() -> None:
+    display_lut._range_cache.clear()
+    data = np.arange(24, dtype=np.uint16).reshape(2, 3, 4)
+    data.flags.writeable = False
+    assert intensity_range(data[0]) == (0.0, 11.0)
+    ref = weakref.ref(data)
+    del data
+    gc.collect()
+    assert ref() is None
+
+    other = np.ones((2, 2), dtype=np.uint8)
+    other.flags.writeable = False
+    intensity_range(other)
+    assert len(display_lut._range_cache) == 1  # the dead entry was dropped
@@ -0,0 +1,88 @@
+"""Tests for :mod:`kymflow.core.plotting.figure_patch`."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from kymflow.core.image_loaders.kym_image import KymImage
+from kymflow.core.plotting.figure_patch import diff_figure, snapshot_figure
+from kymflow.core.plotting.line_plots import (
+    add_kym_event_rect,
+    plot_image_line_plotly_v3,
+    update_heatmap_display_v2,
+    update_xaxis_range_v2,
+)
+from kymflow.core.plotting.theme import ThemeMode
+
+
+def _kym_image() -> KymImage:
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 255, size=(400, 32)).astype(np.uint16)
+    return KymImage(path=None, img_data=img)
+
+
+def test_identical_figures_give_empty_patch() -> None:
+    kf = _kym_image()
+    a = plot_image_line_plotly_v3(kf, transpose=True).to_dict()
+    b = plot_image_line_plotly_v3(kf, transpose=True).to_dict()
+    assert diff_figure(a, b).is_empty
+
+
+def test_theme_change_patches_layout_without_heatmap_pixels() -> None:
+    kf = _kym_image()
+    light = plot_image_line_plotly_v3(kf, transpose=True, theme=ThemeMode.LIGHT).to_dict()
+    dark = plot_image_line_plotly_v3(kf, transpose=True, theme=ThemeMode.DARK).to_dict()
+    patch = diff_figure(light, dark)
+    assert not patch.full
+    assert "template" in patch.relayout
+    assert patch.relayout["paper_bgcolor"] == dark["layout"]["paper_bgcolor"]
+    for _index, changes in patch.restyles:
+        assert "z" not in changes
+
+
+def test_in_place_dict_edits_show_up_against_snapshot() -> None:
+    kf = _kym_image()
+    fig_dict = plot_image_line_plotly_v3(kf, transpose=True).to_dict()
+    shown = snapshot_figure(fig_dict)
+
+    update_xaxis_range_v2(fig_dict, [0.1, 0.2])
+    update_heatmap_display_v2(fig_dict, zmin=5, zmax=50)
+    patch = diff_figure(shown, fig_dict)
+    assert not patch.full
+    assert patch.relayout == {"xaxis.range": [0.1, 0.2], "xaxis2.range": [0.1, 0.2]}
+    assert patch.restyles == [(0, {"zmin": 5, "zmax": 50})]
+
+    shown = snapshot_figure(fig_dict)
+    n_shapes = len(fig_dict["layout"].get("shapes", []))
+    add_kym_event_rect(
+        fig_dict,
+        _Event(),
+        (0.0, 1.0),
+        row=2,
+    )
+    patch = diff_figure(shown, fig_dict)
+    assert list(patch.relayout) == ["shapes"]
+    assert len(patch.relayout["shapes"]) == n_shapes + 1
+    assert not patch.restyles
+
+
+def test_structural_change_requires_full_update() -> None:
+    kf = _kym_image()
+    fig_dict = plot_image_line_plotly_v3(kf, transpose=True).to_dict()
+    shown = snapshot_figure(fig_dict)
+    fig_dict["data"].append({"type": "scatter", "x": [0, 1], "y": [0, 1]})
+    assert diff_figure(shown, fig_dict).full
+
+    removed = snapshot_figure(shown)
+    del removed["layout"]["dragmode"]
+    patch = diff_figure(shown, removed)
+    assert patch.relayout == {"dragmode": None}
+
+
+class _Event:
+    """Minimal velocity event for ``add_kym_event_rect``."""
+
+    event_type = "User Added"
+    t_start = 0.2
+    t_end = 0.4
+    _uuid = "evt-1"
@@ -0,0 +1,82 @@
+"""Tests for :mod:`kymflow.core.utils.file_walk`."""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+import kymflow.core.utils.file_walk as file_walk
+from kymflow.core.image_loaders.acq_image_list import AcqImageList
+from kymflow.core.utils.file_walk import iter_files
+from kymflow.core.utils.progress import CancelledError, ProgressMessage
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    (tmp_path / "a.tif").write_bytes(b"")
+    (tmp_path / "B.TIF").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"")
+    deep = tmp_path / "d1" / "d2" / "d3"
+    deep.mkdir(parents=True)
+    (tmp_path / "d1" / "c.tif").write_bytes(b"")
+    (tmp_path / "d1" / "d2" / "d.tif").write_bytes(b"")
+    (deep / "e.tif").write_bytes(b"")
+    return tmp_path
+
+
+def _names(paths) -> list[str]:
+    return sorted(p.name for p in paths)
+
+
+def test_iter_files_depth_and_suffix(tree: Path) -> None:
+    assert _names(iter_files(tree, max_depth=0, suffixes={".tif"})) == ["B.TIF", "a.tif"]
+    assert _names(iter_files(tree, max_depth=1, suffixes={"tif"})) == ["B.TIF", "a.tif", "c.tif"]
+    assert len(list(iter_files(tree, max_depth=None))) == 6
+    assert list(iter_files(tree, max_depth=-1)) == []
+
+
+def test_iter_files_prunes_deeper_directories(tree: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    listed: list[str] = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        listed.append(os.path.basename(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(file_walk.os, "scandir", counting_scandir)
+    list(iter_files(tree, max_depth=1))
+    assert sorted(listed) == sorted([tree.name, "d1"])
+
+
+def test_iter_files_symlink_loop(tree: Path) -> None:
+    (tree / "d1" / "loop").symlink_to(tree, target_is_directory=True)
+    assert len(list(iter_files(tree, max_depth=None))) == 6
+    assert len(list(iter_files(tree, max_depth=None, follow_symlinks=True))) == 6
+
+
+def test_iter_files_cancel(tree: Path) -> None:
+    cancel_event = threading.Event()
+    cancel_event.set()
+    with pytest.raises(CancelledError):
+        list(iter_files(tree, max_depth=None, cancel_event=cancel_event))
+
+
+def test_collect_paths_streams_scan_progress(
+    tree: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("kymflow.core.image_loaders.acq_image_list._SCAN_PROGRESS_EVERY", 2)
+    messages: list[ProgressMessage] = []
+    paths = AcqImageList.collect_paths_from_folder(
+        tree,
+        depth=2,
+        file_extension="tif",
+        ignore_file_stub="B",
+        follow_symlinks=False,
+        progress_cb=messages.append,
+    )
+    assert _names(paths) == ["a.tif", "c.tif"]
+    assert [m.done for m in messages] == [0, 2, 2]
+    assert messages[1].total is None and messages[-1].total == 2
@@ -0,0 +1,105 @@
+"""Tests for :mod:`kymflow.core.image_loaders.folder_catalog`."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import kymflow.core.image_loaders.kym_image as kym_image_module
+from kymflow.core.image_loaders.folder_catalog import CATALOG_FILENAME, FolderCatalog
+from kymflow.core.image_loaders.kym_image_list import KymImageList
+from kymflow.core.image_loaders.roi import RoiBounds
+
+_OLYMPUS_TXT = "\n".join(
+    [
+        '"Channel Dimension"\t"2 [Ch]"',
+        '"X Dimension"\t"38, 0.0 - 10.796 [um], 0.284 [um/pixel]"',
+        '"T Dimension"\t"1, 0.000 - 35.099 [s], Interval FreeRun"',
+        '"Image Size"\t"38 * 30000 [pixel]"',
+        '"Date"\t"11/02/2022 12:54:17.359 PM"',
+        '"Bits/Pixel"\t"12 [bits]"',
+    ]
+)
+
+
+@pytest.fixture
+def folder(tmp_path: Path) -> Path:
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.txt").write_text(_OLYMPUS_TXT, encoding="utf-8")
+        (tmp_path / f"{name}_C001T001.tif").touch()
+        (tmp_path / f"{name}_C002T001.tif").touch()
+    return tmp_path.resolve()
+
+
+def _fail_parse(*args, **kwargs):
+    raise AssertionError("Olympus header parsed despite catalog hit")
+
+
+def test_reopen_hydrates_from_catalog(folder: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = KymImageList(folder, depth=1)
+    assert first.catalog is not None and first.catalog.misses == 2
+    kf = first.find_by_path(folder / "a_C001T001.tif")
+    kf.update_experiment_metadata(note="from json")
+    kf.rois.create_roi(bounds=RoiBounds(dim0_start=10, dim0_stop=100, dim1_start=2, dim1_stop=20))
+    assert kf.save_metadata()
+    assert (folder / ".kymflow_hidden" / CATALOG_FILENAME).is_file()
+
+    # Saving the metadata changed a dependency of "a" only.
+    second = KymImageList(folder, depth=1)
+    assert (second.catalog.hits, second.catalog.misses) == (1, 1)
+
+    monkeypatch.setattr(kym_image_module, "_readOlympusHeader", _fail_parse)
+    third = KymImageList(folder, depth=1)
+    assert (third.catalog.hits, third.catalog.misses) == (2, 0)
+    kf = third.find_by_path(folder / "a_C001T001.tif")
+    assert kf.header.shape == (30000, 38)
+    assert kf.getChannelPath(2) == folder / "a_C002T001.tif"
+    assert kf.experiment_metadata.note == "from json"
+    assert [roi.bounds.dim0_stop for roi in kf.rois] == [100]
+
+
+def test_changed_sidecar_invalidates_entry(folder: Path) -> None:
+    KymImageList(folder, depth=1)
+    txt = folder / "b.txt"
+    txt.write_text(_OLYMPUS_TXT.replace("38 * 30000", "38 * 20000"), encoding="utf-8")
+    st = txt.stat()
+    os.utime(txt, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    klist = KymImageList(folder, depth=1)
+    assert (klist.catalog.hits, klist.catalog.misses) == (1, 1)
+    assert klist.find_by_path(folder / "b_C001T001.tif").header.shape == (20000, 38)
+
+
+def test_new_sibling_channel_invalidates_entry(folder: Path) -> None:
+    (folder / "b_C002T001.tif").unlink()
+    klist = KymImageList(folder, depth=1)
+    assert klist.find_by_path(folder / "b_C001T001.tif").getChannelPath(2) is None
+
+    (folder / "b_C002T001.tif").touch()
+    klist = KymImageList(folder, depth=1)
+    assert (klist.catalog.hits, klist.catalog.misses) == (1, 1)
+    assert klist.find_by_path(folder / "b_C001T001.tif").getChannelPath(2) == folder / "b_C002T001.tif"
+
+
+def test_prune_and_unreadable_database(folder: Path) -> None:
+    klist = KymImageList(folder, depth=1)
+    for path in folder.glob("b_*.tif"):
+        path.unlink()
+    klist.load()
+    assert sorted(p.name for p in klist.catalog.paths()) == ["a_C001T001.tif"]
+    klist.catalog.close()
+
+    db_path = folder / ".kymflow_hidden" / CATALOG_FILENAME
+    db_path.write_bytes(b"not a database" * 100)
+    catalog = FolderCatalog.for_folder(folder)
+    assert catalog.enabled and catalog.paths() == []
+    catalog.close()
+
+
+def test_catalog_can_be_disabled(folder: Path) -> None:
+    klist = KymImageList(folder, depth=1, folder_catalog=False)
+    assert klist.catalog is None
+    assert len(klist) == 2
+    assert not (folder / ".kymflow_hidden" / CATALOG_FILENAME).exists()
@@ -0,0 +1,116 @@
+"""Tests for :mod:`kymflow.core.image_loaders.folder_watch`."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from kymflow.core.image_loaders.folder_watch import FolderChanges, FolderWatcher
+from kymflow.core.image_loaders.kym_image_list import KymImageList
+
+_OLYMPUS_TXT = "\n".join(
+    [
+        '"Channel Dimension"\t"1 [Ch]"',
+        '"X Dimension"\t"38, 0.0 - 10.796 [um], 0.284 [um/pixel]"',
+        '"T Dimension"\t"1, 0.000 - 35.099 [s], Interval FreeRun"',
+        '"Image Size"\t"38 * 30000 [pixel]"',
+        '"Date"\t"11/02/2022 12:54:17.359 PM"',
+        '"Bits/Pixel"\t"12 [bits]"',
+    ]
+)
+
+
+def _add_acquisition(folder: Path, name: str) -> Path:
+    (folder / f"{name}.txt").write_text(_OLYMPUS_TXT, encoding="utf-8")
+    tif = folder / f"{name}.tif"
+    tif.touch()
+    return tif
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def klist(tmp_path: Path) -> KymImageList:
+    folder = tmp_path.resolve()
+    for name in ("a", "b", "d"):
+        _add_acquisition(folder, name)
+    return KymImageList(folder, depth=1)
+
+
+def test_changes_are_applied_incrementally(klist: KymImageList) -> None:
+    folder = klist.folder
+    watcher = FolderWatcher(klist, use_native=False)
+    assert not watcher.poll()  # baseline
+
+    a, b, d = klist.images
+    (folder / "b.tif").unlink()
+    c = _add_acquisition(folder, "c")
+    txt = folder / "d.txt"
+    txt.write_text(_OLYMPUS_TXT.replace("38 * 30000", "38 * 20000"), encoding="utf-8")
+    _bump_mtime(txt)
+
+    changes = watcher.poll()
+    assert changes.added == [c]
+    assert changes.removed == [folder / "b.tif"]
+    assert changes.modified == [folder / "d.tif"]
+
+    applied = klist.apply_folder_changes(changes)
+    assert applied.added == [c] and applied.removed == [folder / "b.tif"]
+    assert [Path(image.path).name for image in klist.images] == ["a.tif", "c.tif", "d.tif"]
+    assert klist.images[0] is a  # untouched image is not rebuilt
+    assert klist.images[2] is not d and klist.images[2].header.shape == (20000, 38)
+    assert not watcher.poll()
+
+
+def test_unsaved_image_is_kept_and_acknowledge(klist: KymImageList) -> None:
+    folder = klist.folder
+    watcher = FolderWatcher(klist, use_native=False)
+    watcher.poll()
+
+    a = klist.images[0]
+    a.update_experiment_metadata(note="unsaved")
+    (folder / "a.tif").unlink()
+    applied = klist.apply_folder_changes(watcher.poll())
+    assert not applied and klist.images[0] is a
+
+    # A save by this process is not reported back as a modification.
+    b = klist.images[1]
+    b.update_experiment_metadata(note="saved")
+    assert b.save_metadata()
+    watcher.acknowledge(b)
+    assert not watcher.poll().modified
+
+
+def test_merge_folds_newer_changes() -> None:
+    p, q = Path("/x/p.tif"), Path("/x/q.tif")
+    changes = FolderChanges(added=[p], removed=[q])
+    changes.merge(FolderChanges(added=[q], removed=[p]))
+    assert changes == FolderChanges(added=[], removed=[], modified=[q])
+
+
+def test_background_thread_collects_changes(klist: KymImageList) -> None:
+    watcher = FolderWatcher(klist, interval_s=0.05, use_native=False)
+    watcher.start()
+    try:
+        time.sleep(0.2)
+        new_tif = _add_acquisition(klist.folder, "e")
+        deadline = time.monotonic() + 10
+        changes = FolderChanges()
+        while time.monotonic() < deadline and not changes:
+            time.sleep(0.05)
+            changes = watcher.pop_changes()
+        assert changes.added == [new_tif]
+    finally:
+        watcher.stop()
+
+
+def test_watcher_requires_folder_mode(tmp_path: Path) -> None:
+    tif = _add_acquisition(tmp_path, "a")
+    with pytest.raises(ValueError):
+        FolderWatcher(KymImageList(tif))
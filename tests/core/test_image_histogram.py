@@ -0,0 +1,79 @@
+"""Tests for :mod:`kymflow.core.plotting.image_histogram` and the histogram plot."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+
+import numpy as np
+import pytest
+
+from kymflow.core.image_loaders.kym_image import KymImage
+from kymflow.core.plotting.image_histogram import compute_image_histogram, get_image_histogram
+from kymflow.core.plotting.image_plots import histogram_plot_plotly, update_histogram_markers
+
+
+@pytest.mark.parametrize(
+    ("dtype", "lo", "hi"),
+    [
+        (np.uint8, 0, 256),
+        (np.uint16, 100, 4000),
+        (np.int16, -300, 300),
+        (np.uint64, 5, 90),
+        # Narrow span at a large offset: counts must not scale with the magnitude.
+        (np.uint32, 3_000_000_000, 3_000_005_000),
+        (np.int64, 1 << 40, (1 << 40) + 777),
+        (np.float32, 0, 1),
+    ],
+)
+@pytest.mark.parametrize("bins", [7, 256, 1000])
+def test_histogram_matches_numpy(dtype, lo: int, hi: int, bins: int) -> None:
+    rng = np.random.default_rng(0)
+    if np.issubdtype(dtype, np.floating):
+        img = rng.random((300, 77)).astype(dtype)
+    else:
+        img = rng.integers(lo, hi, size=(300, 77)).astype(dtype)
+    hist = compute_image_histogram(img, bins=bins)
+    counts, edges = np.histogram(img, bins=bins)
+    np.testing.assert_array_equal(hist.counts, counts)
+    np.testing.assert_allclose(hist.bin_edges, edges)
+    assert hist.image_min == float(img.min()) and hist.image_max == float(img.max())
+
+
+def test_histogram_constant_image() -> None:
+    img = np.full((5, 5), 7, dtype=np.uint16)
+    counts, _edges = np.histogram(img, bins=256)
+    np.testing.assert_array_equal(compute_image_histogram(img).counts, counts)
+
+
+def test_get_image_histogram_is_cached() -> None:
+    img = np.arange(1000, dtype=np.uint16).reshape(100, 10)
+    kf = KymImage(path=None, img_data=img)
+    first = get_image_histogram(kf, 1)
+    assert first is not None
+    assert get_image_histogram(kf, 1) is first
+    assert first.counts.sum() == img.size
+
+
+def test_get_image_histogram_cache_does_not_keep_images_alive() -> None:
+    kf = KymImage(path=None, img_data=np.arange(1000, dtype=np.uint16).reshape(100, 10))
+    assert get_image_histogram(kf, 1) is not None
+    alive = weakref.ref(kf.get_img_slice(channel=1))
+    del kf
+    gc.collect()
+    assert alive() is None
+
+
+def test_histogram_markers_update_layout_only() -> None:
+    img = np.arange(1000, dtype=np.uint16).reshape(100, 10)
+    hist = compute_image_histogram(img)
+    fig = histogram_plot_plotly(None, zmin=0, zmax=255, histogram=hist)
+    assert fig["layout"]["xaxis"]["range"] == [0.0, 999.0]
+    bars = fig["data"][0]
+
+    relayout = update_histogram_markers(fig, zmin=10, zmax=500, log_scale=False)
+    assert relayout["yaxis.type"] == "linear"
+    assert [s["x0"] for s in relayout["shapes"]] == [10, 500]
+    assert [a["text"] for a in fig["layout"]["annotations"]] == ["Min", "Max"]
+    assert fig["layout"]["yaxis"]["type"] == "linear"
+    assert fig["data"][0] is bars
@@ -0,0 +1,155 @@
+"""Tests for :mod:`kymflow.core.plotting.image_pyramid` and heatmap tiling."""
+
+from __future__ import annotations
+
+import base64
+import gc
+import weakref
+from pathlib import Path
+
+import numpy as np
+
+import kymflow.core.plotting.image_pyramid as image_pyramid
+from kymflow.core.image_loaders.kym_image import KymImage
+from kymflow.core.plotting.image_pyramid import (
+    ImagePyramid,
+    get_image_pyramid,
+    pyramid_cache_path,
+)
+from kymflow.core.plotting.line_plots import plot_image_line_plotly_v3, update_heatmap_tile
+
+
+def _make_image(n_rows: int = 20001, n_cols: int = 32) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    img = rng.integers(100, 200, size=(n_rows, n_cols)).astype(np.uint16)
+    img[int(n_rows * 0.6), 7] = 60000  # single bright pixel must survive decimation
+    img[int(n_rows * 0.04), 3] = 0
+    return img
+
+
+def _as_array(value) -> np.ndarray:
+    """Decode a plotly ``to_dict`` array (typed-array spec or plain list)."""
+    if isinstance(value, dict) and "bdata" in value:
+        arr = np.frombuffer(base64.b64decode(value["bdata"]), dtype=value["dtype"])
+        shape = value.get("shape")
+        if shape:
+            arr = arr.reshape([int(x) for x in str(shape).split(",")])
+        return arr
+    return np.asarray(value)
+
+
+class _FileBackedImage:
+    """Minimal stand-in exposing the attributes ``get_image_pyramid`` uses."""
+
+    def __init__(self, path: Path, image: np.ndarray) -> None:
+        self.path = path
+        self._image = image
+
+    def get_img_slice(self, slice_num: int = 0, channel: int = 1) -> np.ndarray:
+        return self._image
+
+
+def test_pyramid_levels_preserve_extremes() -> None:
+    img = _make_image()
+    pyramid = ImagePyramid(img)
+    factors = pyramid.factors()
+    assert factors[0] == 1 and factors[1] == 2
+    for f in factors[1:]:
+        level = pyramid.level(f)
+        assert level.shape[0] % 2 == 0
+        assert level.shape[0] >= img.shape[0] / f
+        np.testing.assert_array_equal(level[0::2].min(axis=0), img.min(axis=0))
+        np.testing.assert_array_equal(level[1::2].max(axis=0), img.max(axis=0))
+    # Pair i of level f covers source rows [2*i*f, 2*(i+1)*f).
+    level = pyramid.level(8)
+    np.testing.assert_array_equal(level[2], img[16:32].min(axis=0))
+    np.testing.assert_array_equal(level[3], img[16:32].max(axis=0))
+
+
+def test_pyramid_view_picks_level_for_viewport() -> None:
+    img = _make_image()
+    pyramid = ImagePyramid(img)
+
+    full = pyramid.view(max_rows=1000)
+    assert full.factor == 32
+    assert full.z.shape[0] <= 1000 + 8
+    assert full.z.max() == 60000
+
+    zoomed = pyramid.view((12000, 12800), max_rows=1000)
+    assert zoomed.factor == 1
+    assert zoomed.rows[0] <= 12000 and zoomed.rows[-1] >= 12799
+    np.testing.assert_array_equal(zoomed.z, img[int(zoomed.rows[0]) : int(zoomed.rows[-1]) + 1])
+
+    mid = pyramid.view((0, 5000), max_rows=1000)
+    assert mid.factor == 8
+    assert mid.rows[0] <= 0 + 8 and mid.rows[-1] >= 5000 - 8
+
+
+def test_get_image_pyramid_disk_cache(tmp_path: Path) -> None:
+    img = _make_image(n_rows=4001)
+    path = tmp_path / "kym.tif"
+    path.write_bytes(b"placeholder")
+    kf = _FileBackedImage(path, img)
+
+    pyramid = get_image_pyramid(kf, 1)
+    assert pyramid is not None
+    factors = pyramid.factors()
+    cache_file = pyramid_cache_path(path, 1)
+    assert cache_file.parent.name == ".kymflow_hidden"
+    assert cache_file.is_file()
+
+    reloaded = ImagePyramid(img, cache_path=cache_file, cache_key=pyramid._cache_key)  # noqa: SLF001
+    assert reloaded._load_cached() is not None  # noqa: SLF001
+    assert reloaded.factors() == factors
+    np.testing.assert_array_equal(reloaded.level(factors[-1]), pyramid.level(factors[-1]))
+
+    stale = ImagePyramid(img, cache_path=cache_file, cache_key="other")
+    assert stale._load_cached() is None  # noqa: SLF001
+
+
+def test_get_image_pyramid_memory_cache_does_not_keep_images_alive() -> None:
+    kf = _FileBackedImage(Path("unused.tif"), _make_image(n_rows=4001))
+    first = get_image_pyramid(kf, 1, use_disk_cache=False)
+    assert first is not None
+    levels = first.factors()
+    second = get_image_pyramid(kf, 1, use_disk_cache=False)
+    assert second is not None and second._store is first._store  # noqa: SLF001
+    assert second.factors() == levels
+
+    store = first._store  # noqa: SLF001
+    alive = weakref.ref(kf._image)
+    del first, second
+    kf._image = _make_image(n_rows=4001)  # reload
+    gc.collect()
+    assert alive() is None
+    assert store.levels is None
+    reloaded = get_image_pyramid(kf, 1, use_disk_cache=False)
+    assert reloaded is not None and reloaded._store is not store  # noqa: SLF001
+    assert len([k for k in image_pyramid._memory_cache if k[0] == "unused.tif"]) == 1  # noqa: SLF001
+
+
+def test_plot_image_line_sends_decimated_heatmap_and_retiles() -> None:
+    img = _make_image()
+    kf = KymImage(path=None, img_data=img)
+
+    fig = plot_image_line_plotly_v3(kf, transpose=True, viewport_px=1000)
+    plot_dict = fig.to_dict()
+    heatmap = plot_dict["data"][0]
+    assert heatmap["type"] == "heatmap"
+    z = _as_array(heatmap["z"])
+    assert z.shape[0] == img.shape[1]
+    assert z.shape[1] <= 1008
+    assert z.max() == 60000
+
+    dim0 = kf.get_dim_arange(0)
+    pyramid = get_image_pyramid(kf, 1)
+    assert pyramid is not None
+    x_range = [float(dim0[12000]), float(dim0[12500])]
+    assert update_heatmap_tile(plot_dict, pyramid, dim0, x_range)
+    heatmap = plot_dict["data"][0]
+    x = np.asarray(heatmap["x"])
+    assert x[0] <= x_range[0] and x[-1] >= x_range[1]
+    assert heatmap["meta"]["kymflow_pyramid"]["factor"] == 1
+
+    full = plot_image_line_plotly_v3(kf, transpose=True, viewport_px=None).to_dict()
+    assert _as_array(full["data"][0]["z"]).shape == (img.shape[1], img.shape[0])
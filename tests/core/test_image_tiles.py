@@ -0,0 +1,94 @@
+"""Tests for :mod:`kymflow.core.plotting.image_tiles` and tile-mode figures."""
+
+from __future__ import annotations
+
+import base64
+import io
+
+import numpy as np
+from PIL import Image
+
+from kymflow.core.image_loaders.kym_image import KymImage
+from kymflow.core.plotting.image_pyramid import get_image_pyramid
+from kymflow.core.plotting.image_tiles import (
+    apply_lut,
+    colorscale_lut,
+    find_tile_image,
+    tile_layout_image,
+)
+from kymflow.core.plotting.line_plots import (
+    plot_image_line_plotly_v3,
+    update_image_tile_display,
+    update_xaxis_range_v2,
+)
+
+
+def _decode(source: str) -> np.ndarray:
+    payload = source.split(",", 1)[1]
+    return np.asarray(Image.open(io.BytesIO(base64.b64decode(payload))).convert("RGB"))
+
+
+def test_colorscale_lut_endpoints() -> None:
+    gray = colorscale_lut("Gray")  # resolves to Plotly "Greys" (white -> black)
+    assert gray.shape == (256, 3) and gray.dtype == np.uint8
+    np.testing.assert_array_equal(gray[0], [255, 255, 255])
+    np.testing.assert_array_equal(gray[-1], [0, 0, 0])
+    inverted = colorscale_lut("inverted_grays")
+    np.testing.assert_array_equal(inverted[0], [255, 255, 255])
+    viridis = colorscale_lut("Viridis")
+    np.testing.assert_array_equal(viridis[0], [0x44, 0x01, 0x54])
+
+
+def test_apply_lut_clips_to_contrast() -> None:
+    lut = colorscale_lut([[0, "rgb(0,0,0)"], [1, "rgb(255,255,255)"]])
+    z = np.array([[0, 10, 55, 100, 500]], dtype=np.uint16)
+    rgb = apply_lut(z, 10, 100, lut)
+    assert rgb.shape == (1, 5, 3)
+    np.testing.assert_array_equal(rgb[0, :, 0], [0, 0, 128, 255, 255])
+
+
+def test_tile_layout_image_orientation_and_extent() -> None:
+    z = np.zeros((4, 6))
+    z[0, 0] = 1.0  # heatmap row 0 is the bottom row
+    image = tile_layout_image(
+        z,
+        np.arange(6) * 2.0,
+        np.arange(4) * 0.5,
+        colorscale=[[0, "rgb(0,0,0)"], [1, "rgb(255,255,255)"]],
+        zmin=0.0,
+        zmax=1.0,
+    )
+    assert image["x"] == -1.0 and image["sizex"] == 12.0
+    assert image["y"] == 1.75 and image["sizey"] == 2.0
+    rgb = _decode(image["source"])
+    assert rgb.shape == (4, 6, 3)
+    assert rgb[-1, 0, 0] == 255 and rgb[0, 0, 0] == 0
+
+
+def test_tile_mode_figure_retiles_and_recolors() -> None:
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 4000, size=(20000, 16)).astype(np.uint16)
+    kf = KymImage(path=None, img_data=img)
+    plot_dict = plot_image_line_plotly_v3(
+        kf, transpose=True, image_render="tile", viewport_px=500
+    ).to_dict()
+
+    assert all(t["type"] != "heatmap" for t in plot_dict["data"])
+    meta = plot_dict["data"][0]["meta"]["kymflow_tile"]
+    assert meta["zmin"] == float(img.min()) and meta["zmax"] == float(img.max())
+    tile = find_tile_image(plot_dict)
+    assert tile is not None
+    assert _decode(tile["source"]).shape[1] <= 508
+
+    dim0 = kf.get_dim_arange(0)
+    pyramid = get_image_pyramid(kf, 1)
+    x_range = [float(dim0[5000]), float(dim0[5200])]
+    update_xaxis_range_v2(plot_dict, x_range, pyramid=pyramid, dim0_arange=dim0)
+    tile = find_tile_image(plot_dict)
+    assert meta["factor"] == 1 and meta["x_range"] == x_range
+    assert tile["x"] <= x_range[0] and tile["x"] + tile["sizex"] >= x_range[1]
+    zoomed_source = tile["source"]
+
+    assert update_image_tile_display(plot_dict, pyramid, dim0, zmin=0, zmax=10)
+    assert meta["zmax"] == 10 and meta["x_range"] == x_range
+    assert find_tile_image(plot_dict)["source"] != zoomed_source
@@ -0,0 +1,69 @@
+"""Import-time regression test: core modules must not import GUI/plotting/analysis stacks.
+
+Scripts and spawned multiprocessing workers import ``kym_image`` and
+``kym_flow_radon``; Plotly, NiceGUI and scikit-image are only imported when used.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Top-level packages that must not be imported by the script below.
+HEAVY_PACKAGES = ("plotly", "nicegui", "skimage", "kymflow.gui_v2")
+
+_SCRIPT = """
+import numpy as np
+import kymflow.core.image_loaders.kym_image as kym_image
+import kymflow.core.analysis.kym_flow_radon  # multiprocessing worker module
+import kymflow.core.plotting.display_lut
+kym_image.KymImage(path=None, img_data=np.zeros((8, 8), dtype=np.uint16))
+"""
+
+
+def _imported_modules(script: str) -> list[str]:
+    """Run ``script`` under ``python -X importtime`` and return the imported module names."""
+    src = str(Path(__file__).resolve().parents[2] / "src")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH")) if p)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    # Lines look like: "import time:       123 |        456 |   package.module"
+    return [
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.count("|") == 2
+    ]
+
+
+def test_core_imports_do_not_pull_heavy_packages() -> None:
+    modules = _imported_modules(_SCRIPT)
+    assert "kymflow.core.image_loaders.kym_image" in modules
+    heavy = sorted(
+        name
+        for name in modules
+        if any(name == pkg or name.startswith(pkg + ".") for pkg in HEAVY_PACKAGES)
+    )
+    assert heavy == []
+
+
+def test_plotting_package_imports_lazily() -> None:
+    pytest.importorskip("plotly")
+    _imported_modules(
+        "import sys\n"
+        "import kymflow.core.plotting as plotting\n"
+        "assert 'line_plot_plotly' in dir(plotting)\n"
+        "assert 'plotly' not in sys.modules\n"
+        "from kymflow.core.plotting import line_plot_plotly\n"
+        "assert 'kymflow.core.plotting.line_plots' in sys.modules\n"
+    )
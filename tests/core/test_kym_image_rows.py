@@ -0,0 +1,87 @@
+"""Tests for :mod:`kymflow.core.image_loaders.kym_image_rows`."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import tifffile
+
+from kymflow.core.image_loaders.kym_image import ANALYSIS_ROW_FIELDS, KymImage
+from kymflow.core.image_loaders.kym_image_rows import KymImageRowModel, row_key
+
+
+@pytest.fixture
+def kym_files(tmp_path: Path) -> list[KymImage]:
+    folder = tmp_path / "cond" / "date"
+    folder.mkdir(parents=True)
+    files = []
+    for i in range(5):
+        path = folder / f"kym{i}.tif"
+        tifffile.imwrite(path, np.zeros((20, 10), dtype=np.uint16))
+        files.append(KymImage(path))
+    return files
+
+
+def test_row_dict_split_matches_full_row(kym_files: list[KymImage]) -> None:
+    kf = kym_files[0]
+    full = kf.getRowDict()
+    header = kf.getRowDict(include_analysis=False)
+    assert list(header) == list(full)
+    assert all(header[field] is None for field in ANALYSIS_ROW_FIELDS)
+    assert {**header, **kf.getAnalysisRowDict()} == full
+
+
+def test_header_rows_now_analysis_in_batches(kym_files: list[KymImage]) -> None:
+    model = KymImageRowModel()
+    assert model.set_files(kym_files)
+    rows = model.rows()
+    assert [r["File Name"] for r in rows] == [f"kym{i}.tif" for i in range(5)]
+    assert all(r["accepted"] is None for r in rows)
+    assert len(model.pop_changed_rows()) == 5
+
+    assert model.pending_analysis() == 5
+    assert model.fill_analysis(2) == 2
+    changed = model.pop_changed_rows()
+    assert [r["File Name"] for r in changed] == ["kym0.tif", "kym1.tif"]
+    assert model.fill_analysis() == 3
+    assert model.pending_analysis() == 0
+    assert [r for r in model.rows()] == [kf.getRowDict() for kf in kym_files]
+
+
+def test_only_invalidated_rows_are_recomputed(kym_files: list[KymImage]) -> None:
+    model = KymImageRowModel()
+    model.set_files(kym_files)
+    model.fill_analysis()
+    model.pop_changed_rows()
+
+    # Same objects in the same order: nothing to rebuild or send.
+    assert not model.set_files(kym_files)
+    assert model.pop_changed_rows() == [] and model.pending_analysis() == 0
+
+    target = kym_files[3]
+    key = row_key(target)
+    version = model.version(key)
+    target.experiment_metadata.note = "edited"
+    target.get_kym_analysis().set_accepted(False)
+    model.invalidate(key)
+    assert model.version(key) == version + 1
+    changed = model.pop_changed_rows()
+    assert [r["note"] for r in changed] == ["edited"]
+    assert changed[0]["accepted"] is True  # stale until analysis is refilled
+    assert model.fill_analysis() == 1
+    assert model.pop_changed_rows()[0]["accepted"] is False
+
+
+def test_blinded_change_and_reorder(kym_files: list[KymImage]) -> None:
+    model = KymImageRowModel()
+    model.set_files(kym_files)
+    model.pop_changed_rows()
+    assert not model.set_files(kym_files, blinded=True)
+    assert len(model.pop_changed_rows()) == 5
+    assert all(r["File Name"] != "kym0.tif" for r in model.rows())
+
+    assert model.set_files(list(reversed(kym_files[1:])), blinded=True)
+    assert len(model) == 4
+    assert model.row(row_key(kym_files[0])) is None
@@ -0,0 +1,83 @@
+"""Tests for :mod:`kymflow.core.plotting.decimation`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from kymflow.core.plotting.decimation import (
+    decimate_xy,
+    decimation_meta,
+    lttb_indices,
+    minmax_indices,
+    update_decimated_trace,
+)
+from kymflow.core.plotting.line_plots import update_line_decimation
+
+
+def _trace(n: int = 200_001) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    x = np.arange(n) * 0.001
+    y = np.sin(x) + 0.1 * rng.standard_normal(n)
+    y[123_456] = 25.0  # single spike must survive
+    y[7_000] = -25.0
+    y[50_000:50_100] = np.nan  # gap must survive
+    return x, y
+
+
+def test_minmax_keeps_extremes_and_gaps() -> None:
+    x, y = _trace()
+    xd, yd = decimate_xy(x, y, viewport_px=500)
+    assert xd.size <= 3 * 500 + 2
+    assert np.nanmax(yd) == 25.0 and np.nanmin(yd) == -25.0
+    assert np.all(np.diff(xd) > 0)
+    assert xd[0] == x[0] and xd[-1] == x[-1]
+    gap = np.flatnonzero(np.isnan(yd))
+    assert gap.size >= 1
+    assert 50.0 <= xd[gap[0]] < 50.1
+
+    # Every bucket's min and max are present.
+    edges = np.linspace(0, y.size, 501).astype(int)
+    for i in (0, 123, 499):
+        seg = y[edges[i] : edges[i + 1]]
+        assert np.nanmin(seg) in yd and np.nanmax(seg) in yd
+
+
+def test_minmax_indices_small_input_unchanged() -> None:
+    y = np.array([1.0, np.nan, 3.0])
+    np.testing.assert_array_equal(minmax_indices(y, 10), [0, 1, 2])
+    x, y2 = decimate_xy(np.arange(3.0), y, viewport_px=10)
+    np.testing.assert_array_equal(x, [0.0, 1.0, 2.0])
+
+
+def test_lttb_picks_spike_and_preserves_gap() -> None:
+    x, y = _trace()
+    idx = lttb_indices(x, y, 1000)
+    assert 1000 <= idx.size <= 1000 + 1000
+    assert 123_456 in idx and 7_000 in idx
+    assert idx[0] == 0 and idx[-1] == y.size - 1
+    assert np.isnan(y[idx]).any()
+
+
+def test_decimate_to_x_range_and_update_trace() -> None:
+    x, y = _trace()
+    xd, yd = decimate_xy(x, y, viewport_px=200, x_range=[100.0, 101.0])
+    assert xd[0] <= 100.0 and xd[-1] >= 101.0
+    assert xd[1] >= 100.0 - 0.001 and xd[-2] <= 101.0 + 0.001
+    assert xd.size <= 3 * 200 + 2
+
+    trace = {"type": "scattergl", "xaxis": "x2", "meta": decimation_meta(100)}
+    plot_dict = {"data": [{"type": "heatmap"}, trace], "layout": {}}
+    assert update_line_decimation(plot_dict, x, y, [10.0, 20.0])
+    assert trace["x"][0] <= 10.0 and trace["x"][-1] >= 20.0
+    assert update_line_decimation(plot_dict, x, y, None)
+    assert trace["x"][-1] == x[-1]
+
+    plain = {"type": "scatter"}
+    assert not update_decimated_trace(plain, x, y, None)
+    assert "x" not in plain
+
+    with pytest.raises(ValueError):
+        decimate_xy(x, y[:-1])
+    with pytest.raises(ValueError):
+        decimate_xy(x, y, method="nope")  # type: ignore[arg-type]
@@ -0,0 +1,92 @@
+"""Tests for :mod:`kymflow.core.image_loaders.olympus_header.olympus_txt_fields`."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import kymflow.core.image_loaders.olympus_header.olympus_txt_fields as txt_fields
+from kymflow.core.image_loaders.olympus_header.read_olympus_header import _readOlympusHeader
+from kymflow.core.image_loaders.olympus_header.read_olympus_header_2 import read_olympus_header_2
+from kymflow.core.image_loaders.image_loader_plugins.olympus_txt_kym import read_olympus_txt_dict
+
+_OLYMPUS_TXT = "\r\n".join(
+    [
+        '"[General]"\t""',
+        '"Date"\t"11/02/2022 12:54:17.359 PM"',
+        '"[Dimensions]"\t""',
+        '"X Dimension"\t"38, 0.0 - 10.796 [um], 0.284 [um/pixel]"',
+        '"Channel Dimension"\t"2 [Ch]"',
+        '"T Dimension"\t"1, 0.000 - 35.099 [s], Interval FreeRun"',
+        '"[Image]"\t""',
+        '"Image Size"\t"38 * 30000 [pixel]"',
+        '"[Reference Image]"\t""',
+        '"Image Size"\t"512 * 512 [pixel]"',
+        '"[Channel 1]"\t""',
+        '"Bits/Pixel"\t"12 [bits]"',
+        '"[Channel 2]"\t""',
+        '"Bits/Pixel"\t"16 [bits]"',
+    ]
+)
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    txt_fields.clear_olympus_txt_cache()
+    yield
+    txt_fields.clear_olympus_txt_cache()
+
+
+@pytest.fixture
+def txt(tmp_path: Path) -> Path:
+    path = tmp_path / "cell 01.txt"
+    path.write_text(_OLYMPUS_TXT, encoding="utf-8")
+    return path
+
+
+def test_fields_are_parsed(txt: Path) -> None:
+    assert txt_fields.read_olympus_txt_fields(txt) == {
+        "dateStr": "11/02/2022",
+        "timeStr": "12:54:17",
+        "olympusDateTimeCombined": "11/02/2022 12:54:17.359 PM",
+        "umPerPixel": 0.284,
+        "numChannels": 2,
+        "durImage_sec": 35.099,
+        "pixelsPerLine": 38,
+        "numLines": 30000,
+        "bitsPerPixel": 12,
+    }
+    assert txt_fields.read_olympus_txt_fields(txt.with_name("missing.txt")) is None
+
+
+def test_all_call_sites_share_one_parse(txt: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    parse = txt_fields._parse_olympus_txt
+    monkeypatch.setattr(txt_fields, "_parse_olympus_txt", lambda p: calls.append(p) or parse(p))
+    for name in ("cell 01_C001T001.tif", "cell 01_C002T001.tif"):
+        (txt.parent / name).touch()
+
+    ch1 = _readOlympusHeader(str(txt.parent / "cell 01_C001T001.tif"))
+    ch2 = read_olympus_txt_dict(txt.parent / "cell 01_C002T001.tif")
+    summary = read_olympus_header_2(txt)
+    assert len(calls) == 1
+
+    assert ch1["secondsPerLine"] == pytest.approx(35.099 / 30000)
+    assert sorted(ch1["tifChannelPaths"]) == [1, 2]
+    assert "olympusDateTimeCombined" not in ch1
+    assert ch2["olympusDateTimeCombined"] == "11/02/2022 12:54:17.359 PM"
+    assert summary["numChannels"] == 2 and summary["bitsPerPixel"] == 12
+
+    # Results are copies of the cached entry.
+    ch1["numLines"] = -1
+    assert txt_fields.read_olympus_txt_fields(txt)["numLines"] == 30000
+
+
+def test_changed_file_is_parsed_again(txt: Path) -> None:
+    assert txt_fields.read_olympus_txt_fields(txt)["numLines"] == 30000
+    txt.write_text(_OLYMPUS_TXT.replace("38 * 30000", "38 * 20000"), encoding="utf-8")
+    st = txt.stat()
+    os.utime(txt, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert txt_fields.read_olympus_txt_fields(txt)["numLines"] == 20000
@@ -0,0 +1,65 @@
+"""Tests for :mod:`kymflow.core.utils.perf_trace`."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from kymflow.core.utils.perf_trace import TraceRecorder
+
+
+def test_disabled_recorder_records_nothing() -> None:
+    recorder = TraceRecorder()
+    with recorder.span("work"):
+        pass
+    recorder.record("x", "handler", time.perf_counter(), 0.1)
+    assert recorder.spans() == []
+
+
+def test_stats_percentiles() -> None:
+    recorder = TraceRecorder()
+    recorder.enable()
+    t0 = time.perf_counter()
+    for ms in range(1, 101):
+        recorder.record("slow", "handler", t0, ms / 1000)
+    recorder.record("fast", "handler", t0, 0.001)
+    recorder.record("other", "emit", t0, 1.0)
+
+    stats = recorder.stats("handler")
+    assert list(stats) == ["slow", "fast"]
+    slow = stats["slow"]
+    assert slow.count == 100
+    assert abs(slow.p50_ms - 50.5) < 1e-6
+    assert abs(slow.p95_ms - 95.05) < 1e-6
+    assert abs(slow.max_ms - 100.0) < 1e-6
+    assert "slow" in recorder.format_stats("handler")
+
+
+def test_nested_spans_build_trees_and_chrome_trace(tmp_path: Path) -> None:
+    recorder = TraceRecorder()
+    recorder.enable()
+    with recorder.span("FileSelection", "emit"):
+        with recorder.span("Bindings.on_file", "handler", event="FileSelection"):
+            with recorder.span("ROISelection", "emit"):
+                pass
+    with recorder.span("ThemeChanged", "emit"):
+        pass
+
+    roots = recorder.trees()
+    assert [r.span.name for r in roots] == ["FileSelection", "ThemeChanged"]
+    handler = roots[0].children[0]
+    assert handler.span.name == "Bindings.on_file"
+    assert [c.span.name for c in handler.children] == ["ROISelection"]
+
+    path = recorder.save_chrome_trace(tmp_path / "trace.json")
+    trace = json.loads(path.read_text())
+    events = trace["traceEvents"]
+    assert len(events) == 4
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+    by_name = {e["name"]: e for e in events}
+    assert by_name["Bindings.on_file"]["args"]["event"] == "FileSelection"
+    assert (
+        by_name["ROISelection"]["args"]["parent_id"]
+        == by_name["Bindings.on_file"]["args"]["span_id"]
+    )
@@ -0,0 +1,122 @@
+"""Tests for :mod:`kymflow.core.image_loaders.prefetch`."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pytest
+import tifffile
+
+from kymflow.core.image_loaders.kym_image import KymImage
+from kymflow.core.image_loaders.prefetch import NeighborPrefetcher, neighbor_order
+from kymflow.core.plotting.image_histogram import get_image_histogram
+from kymflow.core.plotting.image_pyramid import get_image_pyramid, pyramid_cache_path
+
+
+@pytest.fixture
+def kym_files(tmp_path: Path) -> list[KymImage]:
+    files = []
+    for i in range(6):
+        path = tmp_path / f"kym{i}.tif"
+        tifffile.imwrite(path, np.full((3000, 8), i, dtype=np.uint16))
+        files.append(KymImage(path))
+    return files
+
+
+def test_neighbor_order() -> None:
+    assert neighbor_order(10, 5, 2) == [6, 4, 7, 3]
+    assert neighbor_order(3, 0, 2) == [1, 2]
+    assert neighbor_order(3, 1, 0) == []
+
+
+def test_unload_channel_keeps_in_memory_data(kym_files: list[KymImage]) -> None:
+    kf = kym_files[0]
+    assert kf.load_channel(1)
+    assert kf.unload_channel(1)
+    assert kf.getChannelData(1) is None
+    assert kf.load_channel(1) and kf.getChannelData(1)[0, 0] == 0
+
+    synthetic = KymImage(path=None, img_data=np.zeros((4, 4), dtype=np.uint16))
+    assert not synthetic.unload_channel(1)
+    assert synthetic.getChannelData(1) is not None
+
+
+def test_prefetch_window_moves_and_releases(kym_files: list[KymImage]) -> None:
+    prefetcher = NeighborPrefetcher(neighbors=1)
+    try:
+        prefetcher.schedule(kym_files, kym_files[2])
+        assert prefetcher.wait_idle(10)
+        for i in (1, 3):
+            assert kym_files[i].getChannelData(1) is not None
+            assert prefetcher.is_prefetched(kym_files[i])
+            # Only channel data is loaded; no pyramid levels are written
+            assert not pyramid_cache_path(kym_files[i].path, 1).exists()
+        assert kym_files[4].getChannelData(1) is None
+
+        # Step to the prefetched next file: it is adopted by the display and
+        # files that left the window are released.
+        kym_files[3].load_channel(1)
+        prefetcher.schedule(kym_files, kym_files[3])
+        assert prefetcher.wait_idle(10)
+        assert not prefetcher.is_prefetched(kym_files[3])
+        assert kym_files[3].getChannelData(1) is not None
+        assert kym_files[1].getChannelData(1) is None
+        assert kym_files[4].getChannelData(1) is not None
+
+        prefetcher.cancel()
+        assert kym_files[4].getChannelData(1) is None
+        assert prefetcher.prefetched_bytes() == 0
+    finally:
+        prefetcher.close()
+
+
+def test_prefetch_respects_memory_budget(kym_files: list[KymImage]) -> None:
+    one_file = 3000 * 8 * 2
+    prefetcher = NeighborPrefetcher(neighbors=2, max_bytes=one_file)
+    try:
+        prefetcher.schedule(kym_files, kym_files[2])
+        assert prefetcher.wait_idle(10)
+        assert prefetcher.prefetched_bytes() <= one_file
+        assert kym_files[3].getChannelData(1) is not None  # nearest first
+        assert all(kym_files[i].getChannelData(1) is None for i in (0, 1, 4))
+    finally:
+        prefetcher.close()
+
+
+def test_prefetch_loads_only_the_displayed_channel(kym_files: list[KymImage], tmp_path: Path) -> None:
+    for i, kf in enumerate(kym_files):
+        path = tmp_path / f"kym{i}_ch2.tif"
+        tifffile.imwrite(path, np.full((3000, 8), 10 + i, dtype=np.uint16))
+        kf.addColorChannel(2, None, path=path, load_image=True)
+        assert kf.unload_channel(2)
+    prefetcher = NeighborPrefetcher(neighbors=1)
+    try:
+        prefetcher.schedule(kym_files, kym_files[2], channel=2)
+        assert prefetcher.wait_idle(10)
+        for i in (1, 3):
+            assert kym_files[i].getChannelData(2) is not None
+            assert kym_files[i].getChannelData(1) is None
+    finally:
+        prefetcher.close()
+
+
+def test_prefetch_release_frees_channel_data(kym_files: list[KymImage]) -> None:
+    prefetcher = NeighborPrefetcher(neighbors=1)
+    try:
+        prefetcher.schedule(kym_files, kym_files[2])
+        assert prefetcher.wait_idle(10)
+        data = kym_files[3].getChannelData(1)
+        assert data is not None
+        # Display caches built from the prefetched data must not pin it
+        get_image_pyramid(kym_files[3], 1)
+        get_image_histogram(kym_files[3], 1)
+        ref = weakref.ref(data)
+        del data
+        prefetcher.cancel()
+        gc.collect()
+        assert ref() is None
+    finally:
+        prefetcher.close()
@@ -1047,6 +1047,74 @@ def test_hit_test_rois() -> None:
     logger.info("  - hit_test_rois() works correctly")
 
 
+
+def test_roiset_bounds_array_tracks_edits() -> None:
+    """Test that RoiSet.bounds_array stays in sync with create/edit/delete."""
+    test_image = np.zeros((100, 200), dtype=np.uint8)
+    acq_image = AcqImage(path=None, img_data=test_image)
+    rois = acq_image.rois
+
+    roi1 = rois.create_roi(bounds=RoiBounds(dim0_start=10, dim0_stop=50, dim1_start=10, dim1_stop=50))
+    roi2 = rois.create_roi(bounds=RoiBounds(dim0_start=40, dim0_stop=90, dim1_start=40, dim1_stop=300))
+    roi3 = rois.create_roi(bounds=RoiBounds(dim0_start=95, dim0_stop=99, dim1_start=0, dim1_stop=5))
+    np.testing.assert_array_equal(
+        rois.bounds_array, [[10, 50, 10, 50], [40, 90, 40, 200], [95, 99, 0, 5]]
+    )
+    assert not rois.bounds_array.flags.writeable
+
+    rois.edit_roi(roi1.id, bounds=RoiBounds(dim0_start=0, dim0_stop=20, dim1_start=0, dim1_stop=20))
+    rois.delete(roi3.id)
+    np.testing.assert_array_equal(rois.bounds_array, [[0, 20, 0, 20], [40, 90, 40, 200]])
+    assert rois.hit_test(10, 10) == (roi1, "moving")
+    assert _hit_test_matches_loop(rois, acq_image)
+
+    assert rois.find_overlapping(RoiBounds(dim0_start=15, dim0_stop=45, dim1_start=15, dim1_stop=45)) == [roi1, roi2]
+    # Touching edges do not overlap.
+    assert rois.find_overlapping(RoiBounds(dim0_start=20, dim0_stop=40, dim1_start=0, dim1_stop=200)) == []
+    assert rois.find_overlapping(roi2.bounds, exclude_id=roi2.id) == []
+
+    # Direct edits are picked up by revalidate_all() and refresh_bounds().
+    roi1.bounds = RoiBounds(dim0_start=5, dim0_stop=-5, dim1_start=0, dim1_stop=20)
+    assert rois.revalidate_all() == 1
+    assert roi1.bounds == RoiBounds(dim0_start=0, dim0_stop=5, dim1_start=0, dim1_stop=20)
+    np.testing.assert_array_equal(rois.bounds_array[0], [0, 5, 0, 20])
+
+    reloaded = RoiSet.from_list(rois.to_list(), acq_image)
+    np.testing.assert_array_equal(reloaded.bounds_array, rois.bounds_array)
+    assert rois.clear() == 2
+    assert rois.bounds_array.shape == (0, 4)
+    assert rois.hit_test(10, 10) == (None, None)
+
+
+def _hit_test_matches_loop(rois: RoiSet, acq_image: AcqImage) -> bool:
+    """Compare RoiSet.hit_test with a per-ROI reference implementation."""
+    from kymflow.core.image_loaders.roi import point_in_roi
+
+    def reference(dim0: int, dim1: int, tol: int):
+        for roi in reversed(rois.as_list()):
+            b = roi.bounds
+            in0 = b.dim0_start <= dim0 <= b.dim0_stop
+            in1 = b.dim1_start <= dim1 <= b.dim1_stop
+            if abs(dim1 - b.dim1_start) <= tol and in0:
+                return roi, "resizing_dim1_start"
+            if abs(dim1 - b.dim1_stop) <= tol and in0:
+                return roi, "resizing_dim1_stop"
+            if abs(dim0 - b.dim0_start) <= tol and in1:
+                return roi, "resizing_dim0_start"
+            if abs(dim0 - b.dim0_stop) <= tol and in1:
+                return roi, "resizing_dim0_stop"
+            if point_in_roi(b, dim0, dim1):
+                return roi, "moving"
+        return None, None
+
+    height, width = acq_image.get_image_bounds().height, acq_image.get_image_bounds().width
+    return all(
+        rois.hit_test(dim0, dim1, 3) == reference(dim0, dim1, 3)
+        for dim0 in range(-5, height + 5, 3)
+        for dim1 in range(-5, width + 5, 7)
+    )
+
+
 def test_roi_calculate_image_stats() -> None:
     """Test ROI.calculate_image_stats() method."""
     logger.info("Testing ROI.calculate_image_stats()")
@@ -0,0 +1,137 @@
+"""Tests for memoized ROI image stats (:func:`kymflow.core.image_loaders.roi.roi_image_stats`)."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pytest
+import tifffile
+
+import kymflow.core.image_loaders.roi as roi_module
+from kymflow.core.image_loaders.acq_image import AcqImage
+from kymflow.core.image_loaders.kym_image import KymImage
+from kymflow.core.image_loaders.kym_image_list import KymImageList
+from kymflow.core.image_loaders.roi import ROI, RoiBounds, roi_image_stats
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    roi_module.clear_roi_stats_cache()
+    yield
+    roi_module.clear_roi_stats_cache()
+
+
+@pytest.fixture
+def count_region_stats(monkeypatch: pytest.MonkeyPatch) -> list[tuple]:
+    calls: list[tuple] = []
+    region_stats = roi_module._region_stats
+    monkeypatch.setattr(
+        roi_module, "_region_stats", lambda region: calls.append(region.shape) or region_stats(region)
+    )
+    return calls
+
+
+def _write_kym(path: Path, seed: int) -> np.ndarray:
+    """Write a 500x40 kymograph and an Olympus header so its shape is known unloaded."""
+    data = np.random.default_rng(seed).integers(0, 4096, size=(500, 40), dtype=np.uint16)
+    tifffile.imwrite(path, data)
+    path.with_suffix(".txt").write_text(
+        "\r\n".join(
+            [
+                '"Date"\t"11/02/2022 12:54:17.359 PM"',
+                '"X Dimension"\t"40, 0.0 - 11.36 [um], 0.284 [um/pixel]"',
+                '"Channel Dimension"\t"1 [Ch]"',
+                '"T Dimension"\t"1, 0.000 - 0.5 [s], Interval FreeRun"',
+                '"Image Size"\t"40 * 500 [pixel]"',
+                '"Bits/Pixel"\t"12 [bits]"',
+            ]
+        ),
+        encoding="utf-8",
+    )
+    return data
+
+
+def test_chunked_stats_match_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(roi_module, "_STATS_CHUNK_PIXELS", 7 * 40)
+    region = np.random.default_rng(1).normal(1000.0, 50.0, size=(101, 40))
+    lo, hi, mean, std = roi_module._region_stats(region)
+    assert (lo, hi) == (int(region.min()), int(region.max()))
+    assert mean == pytest.approx(region.mean(), rel=1e-12)
+    assert std == pytest.approx(region.std(), rel=1e-9)
+    with pytest.raises(ValueError, match="empty"):
+        roi_module._region_stats(region[:0])
+
+
+def test_in_memory_stats_cached_only_when_read_only(count_region_stats: list[tuple]) -> None:
+    data = np.arange(100, dtype=np.uint16).reshape(10, 10)
+    acq_image = AcqImage(path=None, img_data=data)
+    roi = ROI(id=1, bounds=RoiBounds(dim0_start=2, dim0_stop=4, dim1_start=0, dim1_stop=10))
+    roi_image_stats(acq_image, roi)
+    roi_image_stats(acq_image, roi)
+    assert len(count_region_stats) == 2
+
+    data.flags.writeable = False
+    assert roi_image_stats(acq_image, roi) == (20, 39, 29.5, pytest.approx(np.arange(20, 40).std()))
+    roi_image_stats(acq_image, roi)
+    assert len(count_region_stats) == 3
+
+
+def test_in_memory_stats_cache_does_not_keep_arrays_alive(count_region_stats: list[tuple]) -> None:
+    data = np.arange(100, dtype=np.uint16).reshape(10, 10)
+    data.flags.writeable = False
+    acq_image = AcqImage(path=None, img_data=data[::-1])  # cache the view's base array
+    roi = ROI(id=1, bounds=RoiBounds(dim0_start=2, dim0_stop=4, dim1_start=0, dim1_stop=10))
+    roi_image_stats(acq_image, roi)
+    roi_image_stats(acq_image, roi)
+    assert len(count_region_stats) == 1 and len(roi_module._stats_cache) == 1
+
+    alive = weakref.ref(data)
+    del acq_image, data
+    gc.collect()
+    assert alive() is None
+    with roi_module._stats_cache_lock:
+        roi_module._purge_finalized()
+    assert len(roi_module._stats_cache) == 0
+
+
+def test_kym_image_stats_use_memmap_and_revision(tmp_path: Path, count_region_stats: list[tuple]) -> None:
+    data = _write_kym(tmp_path / "kym.tif", seed=0)
+    kf = KymImage(tmp_path / "kym.tif")
+
+    roi = kf.rois.create_roi(bounds=RoiBounds(dim0_start=100, dim0_stop=300, dim1_start=5, dim1_stop=25))
+    region = data[100:300, 5:25]
+    assert kf.getChannelData(1) is None  # stats were read without loading the image
+    assert (roi.img_min, roi.img_max) == (int(region.min()), int(region.max()))
+    assert roi.img_mean == pytest.approx(region.mean())
+    assert roi.img_std == pytest.approx(region.std())
+
+    roi.calculate_image_stats(kf)
+    assert len(count_region_stats) == 1
+
+    kf.rois.edit_roi(roi.id, bounds=RoiBounds(dim0_start=0, dim0_stop=10, dim1_start=0, dim1_stop=40))
+    assert roi.revision == 1 and len(count_region_stats) == 2
+    assert roi.img_max == int(data[:10].max())
+
+
+def test_image_list_batch_and_radon_report(tmp_path: Path) -> None:
+    expected = {}
+    for i in range(3):
+        data = _write_kym(tmp_path / f"kym{i}.tif", seed=i)
+        expected[f"kym{i}.tif"] = int(data[:50].max())
+    klist = KymImageList(tmp_path, depth=1)
+    for image in klist:
+        roi = image.rois.create_roi(bounds=RoiBounds(dim0_start=0, dim0_stop=50, dim1_start=0, dim1_stop=40))
+        roi.img_min = roi.img_max = roi.img_mean = roi.img_std = None
+
+    reports = [r for image in klist for r in image.get_kym_analysis().get_radon_report()]
+    assert len(reports) == 3
+    assert all(r.img_max == expected[Path(r.path).name] for r in reports)
+
+    assert klist.calculate_roi_image_stats(max_workers=2) == 3
+    assert klist.calculate_roi_image_stats() == 0
+    for image in klist:
+        assert image.getChannelData(1) is None
+        assert image.rois.get(1).img_max == expected[image.path.name]
@@ -0,0 +1,142 @@
+"""Tests for run-length stall detection in :mod:`kymflow.core.analysis.stall_analysis`."""
+
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+import pytest
+
+from kymflow.core.analysis.stall_analysis import (
+    Stall,
+    StallAnalysis,
+    StallAnalysisParams,
+    detect_stalls,
+    detect_stalls_batch,
+)
+
+
+def _reference_detect_stalls(
+    velocity: np.ndarray,
+    refactory_bins: int,
+    min_stall_duration: int = 1,
+    end_stall_non_nan_bins: int = 1,
+    start_bin: int | None = None,
+) -> List[Stall]:
+    """Original per-sample loop implementation, kept as the equivalence oracle."""
+    stalls: List[Stall] = []
+    n = int(len(velocity))
+    i = 0
+    last_stall_stop_idx = -refactory_bins - 1
+    offset = int(start_bin) if start_bin is not None else 0
+    while i < n:
+        if not np.isnan(velocity[i]):
+            i += 1
+            continue
+        if (i - last_stall_stop_idx) <= refactory_bins:
+            i += 1
+            continue
+        stall_start_idx = i
+        non_nan_run = 0
+        i += 1
+        while i < n:
+            if np.isnan(velocity[i]):
+                non_nan_run = 0
+            else:
+                non_nan_run += 1
+                if non_nan_run >= end_stall_non_nan_bins:
+                    break
+            i += 1
+        if i >= n:
+            stall_stop_idx = n - 1
+        else:
+            stall_stop_idx = i - non_nan_run
+        if stall_stop_idx - stall_start_idx + 1 >= min_stall_duration:
+            stalls.append(
+                Stall(bin_start=offset + stall_start_idx, bin_stop=offset + stall_stop_idx)
+            )
+            last_stall_stop_idx = stall_stop_idx
+        if i < n:
+            i = stall_stop_idx + non_nan_run
+        else:
+            i = n
+    return stalls
+
+
+def _random_trace(rng: np.random.Generator, n: int) -> np.ndarray:
+    v = rng.standard_normal(n)
+    v[rng.random(n) < rng.uniform(0.0, 1.0)] = np.nan
+    return v
+
+
+def test_detect_stalls_bridges_short_non_nan_runs() -> None:
+    nan = np.nan
+    v = np.array([1.0, nan, nan, 2.0, nan, 3.0, 4.0, 5.0, nan, 6.0])
+    assert detect_stalls(v, refactory_bins=0) == [
+        Stall(1, 2),
+        Stall(4, 4),
+        Stall(8, 8),
+    ]
+    assert detect_stalls(v, refactory_bins=0, end_stall_non_nan_bins=2) == [
+        Stall(1, 4),
+        Stall(8, 9),
+    ]
+    assert detect_stalls(v, refactory_bins=3, end_stall_non_nan_bins=2, start_bin=100) == [
+        Stall(101, 104),
+        Stall(108, 109),
+    ]
+    # Bin 8 is within the refractory period of the stall ending at bin 4.
+    assert detect_stalls(v, refactory_bins=4, end_stall_non_nan_bins=2) == [Stall(1, 4)]
+
+
+def test_detect_stalls_matches_reference_loop() -> None:
+    rng = np.random.default_rng(0)
+    for _ in range(3000):
+        v = _random_trace(rng, int(rng.integers(0, 50)))
+        refactory = int(rng.integers(0, 6))
+        min_dur = int(rng.integers(1, 6))
+        end_run = int(rng.integers(1, 5))
+        start_bin = None if rng.random() < 0.5 else int(rng.integers(0, 100))
+        expected = _reference_detect_stalls(v, refactory, min_dur, end_run, start_bin)
+        assert detect_stalls(v, refactory, min_dur, end_run, start_bin) == expected
+
+
+@pytest.mark.parametrize("refactory,min_dur,end_run", [(0, 1, 1), (3, 2, 2), (6, 1, 3)])
+def test_detect_stalls_batch_matches_per_trace(refactory: int, min_dur: int, end_run: int) -> None:
+    rng = np.random.default_rng(1)
+    traces = [_random_trace(rng, int(rng.integers(0, 80))) for _ in range(200)]
+    start_bins = [None if k % 3 == 0 else int(k) for k in range(len(traces))]
+    out = detect_stalls_batch(traces, refactory, min_dur, end_run, start_bins=start_bins)
+    assert out == [
+        _reference_detect_stalls(v, refactory, min_dur, end_run, sb)
+        for v, sb in zip(traces, start_bins)
+    ]
+
+
+def test_detect_stalls_batch_does_not_join_across_traces() -> None:
+    nan = np.nan
+    a = np.array([1.0, nan, nan])
+    b = np.array([nan, 2.0])
+    out = detect_stalls_batch([a, np.array([]), b], refactory_bins=5, end_stall_non_nan_bins=3)
+    assert out == [[Stall(1, 2)], [], [Stall(0, 1)]]
+    assert detect_stalls_batch([], refactory_bins=0) == []
+
+
+def test_detect_stalls_batch_validates_inputs() -> None:
+    with pytest.raises(ValueError, match="start_bins"):
+        detect_stalls_batch([np.zeros(3)], refactory_bins=0, start_bins=[0, 1])
+    with pytest.raises(ValueError, match="1D"):
+        detect_stalls_batch([np.zeros((2, 2))], refactory_bins=0)
+    with pytest.raises(ValueError, match="end_stall_non_nan_bins"):
+        detect_stalls(np.zeros(3), refactory_bins=0, end_stall_non_nan_bins=0)
+
+
+def test_stall_analysis_run_batch() -> None:
+    params = StallAnalysisParams(refactory_bins=1, min_stall_duration=2)
+    v = np.array([np.nan, np.nan, 1.0, np.nan, 1.0, np.nan, np.nan])
+    results = StallAnalysis.run_batch([v, v[::-1]], params, start_bins=[10, None])
+    assert [r.stalls for r in results] == [
+        StallAnalysis.run(v, params, start_bin=10).stalls,
+        StallAnalysis.run(v[::-1], params).stalls,
+    ]
+    assert all(r.params == params for r in results)
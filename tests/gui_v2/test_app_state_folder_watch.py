@@ -0,0 +1,50 @@
+"""Tests for AppState.apply_folder_changes (folder watcher → incremental file list)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import tifffile
+
+from kymflow.core.image_loaders.folder_watch import FolderWatcher
+from kymflow.gui_v2.state import AppState
+
+
+@pytest.fixture
+def app_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AppState:
+    # Drive the watcher with poll() instead of its background thread.
+    monkeypatch.setattr(FolderWatcher, "start", lambda self: None)
+    for name in ("a", "b"):
+        tifffile.imwrite(tmp_path / f"{name}.tif", np.zeros((50, 10), dtype=np.uint16))
+    state = AppState()
+    state.load_path(tmp_path.resolve(), depth=1)
+    assert state.folder_watcher is not None
+    state.folder_watcher.poll()  # baseline
+    return state
+
+
+def test_added_file_keeps_selection(app_state: AppState, tmp_path: Path) -> None:
+    list_changed: list[int] = []
+    app_state.on_file_list_changed(lambda: list_changed.append(len(app_state.files)))
+    selected = app_state.selected_file
+
+    tifffile.imwrite(tmp_path / "c.tif", np.zeros((50, 10), dtype=np.uint16))
+    app_state.folder_watcher.poll()
+    applied = app_state.apply_folder_changes()
+
+    assert applied is not None and [p.name for p in applied.added] == ["c.tif"]
+    assert list_changed == [3]
+    assert app_state.selected_file is selected
+    assert app_state.apply_folder_changes() is None
+
+
+def test_removed_selected_file_selects_first(app_state: AppState, tmp_path: Path) -> None:
+    assert Path(app_state.selected_file.path).name == "a.tif"
+    (tmp_path / "a.tif").unlink()
+    app_state.folder_watcher.poll()
+    app_state.apply_folder_changes()
+
+    assert [Path(f.path).name for f in app_state.files] == ["b.tif"]
+    assert Path(app_state.selected_file.path).name == "b.tif"
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from dataclasses import dataclass
+from types import SimpleNamespace
 
 import pytest
 
+import kymflow.gui_v2.bus as bus_module
+from kymflow.core.utils.perf_trace import get_trace_recorder
 from kymflow.gui_v2.bus import BusConfig, EventBus
 from kymflow.gui_v2.events import FileSelection, SelectionOrigin
 
@@ -237,3 +242,92 @@ def test_bus_unsubscribe_noop_on_missing(bus: EventBus) -> None:
 
     bus.unsubscribe(FileSelection, handler)
 
+
+@pytest.mark.asyncio
+async def test_bus_coalesces_latest_event_per_tick(bus: EventBus) -> None:
+    """Coalesced events are delivered latest-wins on the next loop tick."""
+    received: list[int] = []
+    bus.coalesce(BusTestEvent)
+    bus.subscribe(BusTestEvent, lambda e: received.append(e.value))
+
+    for value in range(5):
+        bus.emit(BusTestEvent(value=value))
+    assert received == []
+    await asyncio.sleep(0)
+    assert received == [4]
+
+
+@pytest.mark.asyncio
+async def test_bus_flushes_coalesced_before_other_events(bus: EventBus) -> None:
+    """Pending coalesced events are delivered before any non-coalesced event."""
+    order: list[str] = []
+    bus.coalesce(BusTestEvent)
+    bus.subscribe(BusTestEvent, lambda e: order.append(f"test{e.value}"))
+    bus.subscribe_state(FileSelection, lambda e: order.append("file"))
+
+    bus.emit(BusTestEvent(value=1))
+    bus.emit(BusTestEvent(value=2))
+    bus.emit(
+        FileSelection(path=None, file=None, origin=SelectionOrigin.FILE_TABLE, phase="state")
+    )
+    assert order == ["test2", "file"]
+
+
+def test_bus_without_loop_delivers_synchronously(bus: EventBus) -> None:
+    """Without a running loop, coalesced events are delivered inline."""
+    received: list[int] = []
+    bus.coalesce(BusTestEvent)
+    bus.subscribe(BusTestEvent, lambda e: received.append(e.value))
+    bus.emit(BusTestEvent(value=7))
+    assert received == [7]
+
+
+def test_bus_records_emit_and_handler_spans(bus: EventBus) -> None:
+    """With tracing enabled, nested emits hang under the handler that emitted them."""
+    recorder = get_trace_recorder()
+    recorder.clear()
+    recorder.enable()
+    try:
+        def outer(_event: BusTestEvent) -> None:
+            bus.emit(
+                FileSelection(path=None, file=None, origin=SelectionOrigin.FILE_TABLE, phase="state")
+            )
+
+        bus.subscribe(BusTestEvent, outer)
+        bus.subscribe_state(FileSelection, lambda _e: None)
+        bus.emit(BusTestEvent(value=1))
+    finally:
+        recorder.enable(False)
+
+    (root,) = recorder.trees()
+    assert root.span.name == "BusTestEvent" and root.span.cat == "emit"
+    (handler,) = root.children
+    assert handler.span.cat == "handler" and handler.span.name.endswith("outer")
+    assert [c.span.name for c in handler.children] == ["FileSelection"]
+    assert "test_bus_records_emit_and_handler_spans.<locals>.outer" in recorder.stats("handler")
+    recorder.clear()
+
+
+@pytest.mark.asyncio
+async def test_bus_records_span_for_failing_async_handler(bus: EventBus, monkeypatch) -> None:
+    """An async handler that raises is still recorded."""
+    tasks: list = []
+    monkeypatch.setattr(bus_module, "context", SimpleNamespace(client=contextlib.nullcontext()))
+    monkeypatch.setattr(bus_module.background_tasks, "create", tasks.append)
+
+    async def failing(_event: BusTestEvent) -> None:
+        raise RuntimeError("boom")
+
+    recorder = get_trace_recorder()
+    recorder.clear()
+    recorder.enable()
+    try:
+        bus.subscribe(BusTestEvent, failing)
+        bus.emit(BusTestEvent(value=1))
+        with pytest.raises(RuntimeError, match="boom"):
+            await tasks[0]
+    finally:
+        recorder.enable(False)
+
+    assert [s.cat for s in recorder.spans()] == ["emit", "async_handler"]
+    recorder.clear()
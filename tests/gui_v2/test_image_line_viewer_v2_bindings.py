@@ -39,8 +39,7 @@ def mock_bus() -> MagicMock:
     return MagicMock()
 
 
-@pytest.mark.asyncio
-async def test_file_selection_calls_view(
+def test_file_selection_calls_view(
     mock_v2_view: MagicMock, mock_bus: MagicMock
 ) -> None:
     """FileSelection(state) calls set_selected_file with full selection state."""
@@ -53,10 +52,13 @@ async def test_file_selection_calls_view(
         origin=SelectionOrigin.FILE_TABLE,
         phase="state",
     )
-    await bindings._on_file_selection_changed(event)
+    bindings._on_file_selection_changed(event)
     # v2 view set_selected_file receives (file, channel, roi_id); channel is None
     # in this test to keep focus on ROI selection behavior.
     mock_v2_view.set_selected_file.assert_called_once_with(file_mock, None, 1)
+    mock_bus.subscribe_state.assert_any_call(
+        FileSelection, bindings._on_file_selection_changed
+    )
 
 
 def test_roi_selection_calls_view(mock_v2_view: MagicMock, mock_bus: MagicMock) -> None:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -254,3 +255,33 @@ def test_refresh_rois_for_current_file_no_file_clears_widget(
 
     mock_widget.set_rois.assert_called_once_with({})
     mock_widget.set_selected_roi.assert_called_once_with(None)
+
+
+def test_superseded_file_switch_is_dropped(v2_view: ImageLineViewerV2View) -> None:
+    """A file switch prepared for an older selection is not applied."""
+    v2_view._combined = MagicMock()
+    kym = _make_synthetic_kym()
+    stale = v2_view._switch_generation
+    v2_view._switch_generation += 1
+    prepared = AsyncMock(return_value=MagicMock())
+    with patch("kymflow.gui_v2.views.image_line_viewer_v2_view.run.io_bound", new=prepared):
+        asyncio.run(v2_view._switch_file_in_background(stale, kym, 1, None))
+        v2_view._combined.switch_file.assert_not_called()
+
+        asyncio.run(v2_view._switch_file_in_background(v2_view._switch_generation, kym, 1, None))
+    v2_view._combined.switch_file.assert_called_once()
+    assert v2_view._switch_pending is False
+
+
+def test_set_selected_file_without_loop_switches_synchronously(
+    v2_view: ImageLineViewerV2View,
+) -> None:
+    """Outside an event loop the file is prepared and applied immediately."""
+    v2_view._combined = MagicMock()
+    v2_view._image_roi_widget = MagicMock()
+    kym = _make_synthetic_kym()
+
+    v2_view.set_selected_file(kym, 1, None)
+
+    v2_view._combined.switch_file.assert_called_once()
+    assert v2_view._current_file is kym